@@ -1,11 +1,20 @@
 """Main JSON interface views."""
 
 import collections
+import contextvars
+import copy
 import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Optional
 
 from django.conf import settings
-from django.db import connection, transaction
+from django.db import close_old_connections, connection, transaction
 from django.http import JsonResponse
 from django.utils.translation import gettext_lazy as _
 
@@ -24,6 +33,7 @@ import InvenTree.version
 from common.settings import get_global_setting
 from InvenTree import helpers
 from InvenTree.auth_overrides import registration_enabled
+from InvenTree.database import worker_threads_allowed
 from InvenTree.mixins import ListCreateAPI
 from InvenTree.sso import sso_registration_enabled
 from plugin.serializers import MetadataSerializer
@@ -751,6 +761,11 @@ class APISearchView(GenericAPIView):
     permission_classes = [InvenTree.permissions.IsAuthenticatedOrReadScope]
     serializer_class = APISearchViewSerializer
 
+    # Worker threads are shared between all search requests of this process
+    executor: Optional[ThreadPoolExecutor] = None
+    executor_workers = 0
+    executor_lock = threading.Lock()
+
     def get_result_types(self):
         """Construct a list of search types we can return."""
         import build.api
@@ -785,8 +800,148 @@ class APISearchView(GenericAPIView):
             'customer': {'is_customer': True},
         }
 
+    def get_search_workers(self) -> int:
+        """Return the number of worker threads available for performing searches.
+
+        Searches are performed serially if worker threads cannot query the database
+        (e.g. SQLite, or from within an atomic block).
+        """
+        if not worker_threads_allowed():
+            return 1
+
+        try:
+            return int(get_global_setting('INVENTREE_SEARCH_WORKERS', 1))
+        except (TypeError, ValueError):
+            return 1
+
+    def get_search_timeout(self) -> int:
+        """Return the time budget (in seconds) for searching each model."""
+        try:
+            return int(get_global_setting('INVENTREE_SEARCH_TIMEOUT', 10))
+        except (TypeError, ValueError):
+            return 10
+
+    def search_model(self, request, cls, params, *args, **kwargs):
+        """Perform a search query against a single model type.
+
+        Arguments:
+            request: The original search request
+            cls: The API list view class to query
+            params: The query parameters for this search
+        """
+        view = cls()
+
+        # Indicate that only lightweight search results are required
+        view.search_mode = True
+
+        # Override regular query params with specific ones for this search request.
+        # A separate request object is used for each search, so they can be performed concurrently
+        search_request = copy.copy(request)
+        search_request._request = copy.copy(request._request)
+        search_request._request.GET = params
+
+        view.request = search_request
+        view.format_kwarg = 'format'
+
+        # Check permissions and update results dict with particular query
+        model = view.serializer_class.Meta.model
+
+        try:
+            if check_user_permission(request.user, model, 'view'):
+                return view.list(search_request, *args, **kwargs).data
+            else:
+                return {'error': _('User does not have permission to view this model')}
+        except Exception as exc:
+            return {'error': str(exc)}
+
+    @classmethod
+    def get_executor(cls, workers: int) -> ThreadPoolExecutor:
+        """Return the (long-lived) executor used to perform searches concurrently.
+
+        The executor is shared between all search requests of this process, so that at most
+        INVENTREE_SEARCH_WORKERS additional database connections are held, and re-used.
+        It is replaced if the number of workers changes.
+        """
+        with cls.executor_lock:
+            if cls.executor is None or cls.executor_workers != workers:
+                if cls.executor is not None:
+                    cls.executor.shutdown(wait=False)
+
+                cls.executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix='inventree-search'
+                )
+                cls.executor_workers = workers
+
+            return cls.executor
+
+    @contextmanager
+    def statement_timeout(self, timeout: float):
+        """Cancel long-running queries once the time budget has expired.
+
+        - PostgreSQL: statement_timeout
+        - MySQL: max_execution_time (MariaDB: max_statement_time)
+        - Queries are not cancelled for SQLite (which performs searches serially)
+
+        The timeout is not applied within an atomic block,
+        where a cancelled query would abort the entire transaction.
+        """
+        if connection.in_atomic_block:
+            yield
+            return
+
+        if connection.vendor == 'postgresql':
+            statements = (
+                ('SET statement_timeout = %s', [max(1, int(timeout * 1000))]),
+                ('RESET statement_timeout', []),
+            )
+        elif connection.vendor == 'mysql' and connection.mysql_is_mariadb:
+            statements = (
+                ('SET SESSION max_statement_time = %s', [max(0.001, timeout)]),
+                ('SET SESSION max_statement_time = DEFAULT', []),
+            )
+        elif connection.vendor == 'mysql':
+            statements = (
+                ('SET SESSION max_execution_time = %s', [max(1, int(timeout * 1000))]),
+                ('SET SESSION max_execution_time = DEFAULT', []),
+            )
+        else:
+            yield
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(*statements[0])
+
+        try:
+            yield
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute(*statements[1])
+
+    def search_model_thread(self, deadline: float, *args, **kwargs):
+        """Perform a search query from a worker thread, with its own database connection.
+
+        The connection of each worker thread is re-used (subject to CONN_MAX_AGE),
+        and queries are cancelled once the deadline has passed.
+        """
+        close_old_connections()
+
+        try:
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+                return {'error': _('Search timed out')}
+
+            with self.statement_timeout(remaining):
+                return self.search_model(*args, **kwargs)
+        finally:
+            close_old_connections()
+
     def post(self, request, *args, **kwargs):
-        """Perform search query against available models."""
+        """Perform search query against available models.
+
+        Independent model searches are performed concurrently,
+        if the INVENTREE_SEARCH_WORKERS setting allows.
+        """
         data = request.data
 
         results = {}
@@ -806,11 +961,18 @@ class APISearchView(GenericAPIView):
 
         search_filters = self.get_result_filters()
 
+        # Construct a list of search queries to perform
+        searches = {}
+
         for key, cls in self.get_result_types().items():
             # Only return results which are specifically requested
             if key in data:
                 params = data[key]
 
+                # Ignore if the params are wrong
+                if type(params) is not dict:
+                    continue
+
                 for k, v in pass_through_params.items():
                     params[k] = request.data.get(k, v)
 
@@ -822,31 +984,59 @@ class APISearchView(GenericAPIView):
                 # Enforce json encoding
                 params['format'] = 'json'
 
-                # Ignore if the params are wrong
-                if type(params) is not dict:
-                    continue
+                searches[key] = (cls, params)
 
-                view = cls()
+        workers = max(1, min(self.get_search_workers(), len(searches)))
+        timeout = self.get_search_timeout()
 
-                # Override regular query params with specific ones for this search request
-                request._request.GET = params
-                view.request = request
-                view.format_kwarg = 'format'
+        # Allow enough time for each worker to process its share of the searches
+        deadline = time.monotonic() + timeout * math.ceil(len(searches) / workers)
 
-                # Check permissions and update results dict with particular query
-                model = view.serializer_class.Meta.model
+        if workers == 1:
+            for key, (cls, params) in searches.items():
+                remaining = deadline - time.monotonic()
 
-                try:
-                    if check_user_permission(request.user, model, 'view'):
-                        results[key] = view.list(request, *args, **kwargs).data
-                    else:
-                        results[key] = {
-                            'error': _(
-                                'User does not have permission to view this model'
-                            )
-                        }
-                except Exception as exc:
-                    results[key] = {'error': str(exc)}
+                # Skip any remaining searches once the time budget has expired
+                if remaining <= 0:
+                    results[key] = {'error': _('Search timed out')}
+                    continue
+
+                with self.statement_timeout(remaining):
+                    results[key] = self.search_model(
+                        request, cls, params, *args, **kwargs
+                    )
+
+            return Response(results)
+
+        executor = self.get_executor(workers)
+
+        # Each thread runs in a copy of the current context (e.g. selected tenant)
+        futures = {
+            key: executor.submit(
+                contextvars.copy_context().run,
+                self.search_model_thread,
+                deadline,
+                request,
+                cls,
+                params,
+                *args,
+                **kwargs,
+            )
+            for key, (cls, params) in searches.items()
+        }
+
+        for key, future in futures.items():
+            try:
+                results[key] = future.result(
+                    timeout=max(0, deadline - time.monotonic())
+                )
+            except FuturesTimeoutError:
+                # Searches which have not started are cancelled,
+                # and running queries are cancelled by the database
+                future.cancel()
+                results[key] = {'error': _('Search timed out')}
+            except Exception as exc:
+                results[key] = {'error': str(exc)}
 
         return Response(results)
 
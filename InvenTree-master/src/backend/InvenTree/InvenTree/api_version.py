@@ -1,11 +1,26 @@
 """InvenTree API version information."""
 
 # InvenTree API version
-INVENTREE_API_VERSION = 431
+INVENTREE_API_VERSION = 436
 """Increment this API version number whenever there is a significant change to the API that any clients need to know about."""
 
 INVENTREE_API_TEXT = """
 
+v436 -> 2026-10-19
+    - Part API endpoints read stock quantities from a cached summary table (pass "fresh=true" for live values)
+
+v435 -> 2026-10-19
+    - Search API endpoint returns lightweight results (expensive Part and StockItem annotations are omitted)
+
+v434 -> 2026-10-19
+    - Adds "progress" and "total" fields to the DataImportSession API endpoint
+
+v433 -> 2026-10-19
+    - Adds "barcode/batch/" API endpoint for scanning multiple barcodes in a single request
+
+v432 -> 2026-10-19
+    - Adds "collate" field to the ReportTemplate API endpoint
+
 v431 -> 2025-12-14 : https://github.com/inventree/InvenTree/pull/11006
     - Remove duplicate "address" field on the Company API endpoint
     - Make "primary_address" field optional on the Company API endpoint
@@ -1,10 +1,13 @@
 """Helper functions for converting between units."""
 
+import functools
 import logging
 import re
+from decimal import Decimal
 from hashlib import md5
 from typing import Optional
 
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
@@ -18,6 +21,12 @@ _UNIT_REG_CACHE_KEY = 'unit_registry_hash'
 _unit_registry = None
 _unit_registry_hash: str = ''
 
+# Maximum number of (value, unit) conversions which are memoized
+CONVERSION_CACHE_SIZE = 4096
+
+# Plain numeric values (e.g. '10', '-0.5', '1.2e-3') which do not need to be parsed by pint
+NUMERIC_PATTERN = re.compile(r'^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$')
+
 logger = structlog.get_logger('inventree')
 
 # Disable log output for Pint library
@@ -50,9 +59,17 @@ def get_unit_registry_hash():
     registry_hash = get_session_cache(_UNIT_REG_CACHE_KEY)
 
     if registry_hash is None:
-        registry_hash = get_global_setting(
-            '_UNIT_REGISTRY_HASH', create=False, backup_value=''
-        )
+        # Next, look in the shared cache
+        registry_hash = cache.get(_UNIT_REG_CACHE_KEY)
+
+        if registry_hash is None:
+            # Finally, fall back to the (persistent) global setting
+            registry_hash = get_global_setting(
+                '_UNIT_REGISTRY_HASH', create=False, backup_value=''
+            )
+
+            if registry_hash:
+                cache.set(_UNIT_REG_CACHE_KEY, registry_hash, None)
 
         if registry_hash:
             set_session_cache(_UNIT_REG_CACHE_KEY, registry_hash)
@@ -72,10 +89,16 @@ def set_unit_registry_hash(registry_hash: str):
     if not can_cache_registry():
         return
 
-    # Save to both the global settings and the session cache
-    set_global_setting('_UNIT_REGISTRY_HASH', registry_hash)
     set_session_cache(_UNIT_REG_CACHE_KEY, registry_hash)
 
+    if cache.get(_UNIT_REG_CACHE_KEY) == registry_hash:
+        # Registry is unchanged (e.g. loaded at startup by another process)
+        return
+
+    # Save to both the shared cache and the global settings
+    cache.set(_UNIT_REG_CACHE_KEY, registry_hash, None)
+    set_global_setting('_UNIT_REGISTRY_HASH', registry_hash)
+
 
 def get_unit_registry():
     """Return a custom instance of the Pint UnitRegistry."""
@@ -94,6 +117,21 @@ def get_unit_registry():
     return _unit_registry
 
 
+def create_unit_registry() -> pint.UnitRegistry:
+    """Create a new pint UnitRegistry instance.
+
+    The parsed unit definitions are cached on disk by pint,
+    so that each process does not need to parse the definition files again.
+    """
+    try:
+        return pint.UnitRegistry(
+            autoconvert_offset_to_baseunit=True, cache_folder=':auto:'
+        )
+    except Exception:
+        # Cache folder may not be writable
+        return pint.UnitRegistry(autoconvert_offset_to_baseunit=True)
+
+
 def reload_unit_registry():
     """Reload the unit registry from the database.
 
@@ -107,7 +145,11 @@ def reload_unit_registry():
 
     _unit_registry = None
 
-    reg = pint.UnitRegistry(autoconvert_offset_to_baseunit=True)
+    # Discard any memoized conversions
+    convert_physical_magnitude.cache_clear()
+    is_valid_unit.cache_clear()
+
+    reg = create_unit_registry()
 
     # Aliases for temperature units
     reg.define('@alias degC = Celsius')
@@ -213,6 +255,49 @@ def convert_value(value, unit):
     return value
 
 
+def parse_numeric(value) -> Optional[float]:
+    """Return the provided value as a float, if it is a plain number.
+
+    Returns None if the value is not a plain number (e.g. it includes units).
+    """
+    if isinstance(value, bool):
+        return None
+
+    if isinstance(value, (int, float, Decimal)):
+        return float(value)
+
+    value = str(value).strip()
+
+    if NUMERIC_PATTERN.match(value):
+        return float(value)
+
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def is_valid_unit(unit: str, registry_hash: str = '') -> bool:
+    """Determine if the provided unit is defined in the unit registry.
+
+    The registry hash is included in the arguments to memoize the result against the current registry.
+    """
+    ureg = get_unit_registry()
+
+    try:
+        return unit in ureg
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+def convert_physical_magnitude(value: str, unit: str, registry_hash: str = '') -> float:
+    """Convert the provided value to the specified unit, and return the magnitude.
+
+    Results are memoized, as the same (value, unit) pairs are often converted repeatedly.
+    The registry hash is included in the arguments to memoize the result against the current registry.
+    """
+    return _convert_physical_value(value, unit, strip_units=True)
+
+
 def convert_physical_value(value: str, unit: Optional[str] = None, strip_units=True):
     """Validate that the provided value is a valid physical quantity.
 
@@ -229,15 +314,36 @@ def convert_physical_value(value: str, unit: Optional[str] = None, strip_units=T
     """
     ureg = get_unit_registry()
 
+    unit = str(unit).strip() if unit else ''
+
     # Check that the provided unit is available in the unit registry
-    if unit:
-        try:
-            valid = unit in ureg
-        except Exception:
-            valid = False
+    if unit and not is_valid_unit(unit, _unit_registry_hash):
+        raise ValidationError(_(f'Invalid unit provided ({unit})'))
 
-        if not valid:
-            raise ValidationError(_(f'Invalid unit provided ({unit})'))
+    # Fast path: plain numeric values are not parsed by pint
+    # A dimensionless number has the same magnitude in any target unit
+    magnitude = parse_numeric(value) if value else None
+
+    if magnitude is not None:
+        if strip_units:
+            return magnitude
+        elif unit:
+            return ureg.Quantity(magnitude, unit)
+        return ureg.Quantity(magnitude)
+
+    if strip_units:
+        value = str(value).strip() if value else ''
+        return convert_physical_magnitude(value, unit, _unit_registry_hash)
+
+    return _convert_physical_value(value, unit, strip_units=strip_units)
+
+
+def _convert_physical_value(value: str, unit: str, strip_units=True):
+    """Convert the provided value to a physical quantity, using the unit registry.
+
+    Refer to convert_physical_value for details.
+    """
+    ureg = get_unit_registry()
 
     original = str(value).strip()
 
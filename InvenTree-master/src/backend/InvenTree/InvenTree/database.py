@@ -0,0 +1,213 @@
+"""Helper functions for managing database connections and connection pools."""
+
+import logging
+from typing import Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger('inventree')
+
+# Default pool size of psycopg_pool (max_size defaults to min_size)
+DEFAULT_POOL_SIZE = 4
+
+# Processes of the background worker cluster which use the database, in addition to the workers
+# (the sentinel / scheduler, the task pusher and the result monitor)
+BACKGROUND_CLUSTER_PROCESSES = 3
+
+# Global settings which perform queries from additional worker threads (each with a separate connection)
+WORKER_THREAD_SETTINGS = ['INVENTREE_SEARCH_WORKERS', 'INVENTREE_IMPORT_WORKERS']
+
+# Pool statistics which are reported as gauges (current values)
+POOL_GAUGES = {
+    'pool_size': ('Number of connections managed by the pool', '{connection}'),
+    'pool_available': ('Number of idle connections in the pool', '{connection}'),
+    'requests_waiting': ('Number of requests waiting for a connection', '{request}'),
+}
+
+# Pool statistics which are reported as counters (cumulative values)
+POOL_COUNTERS = {
+    'requests_num': ('Number of connections requested from the pool', '{request}'),
+    'requests_queued': (
+        'Number of requests which had to wait for a connection',
+        '{request}',
+    ),
+    'requests_wait_ms': ('Total time spent waiting for a connection', 'ms'),
+    'requests_errors': ('Number of requests which failed or timed out', '{request}'),
+    'usage_ms': ('Total time connections were used by the application', 'ms'),
+    'connections_num': ('Number of connections opened to the server', '{connection}'),
+}
+
+
+def worker_thread_connections() -> int:
+    """Return the number of additional connections which worker threads of a single process may open.
+
+    Searches (INVENTREE_SEARCH_WORKERS) and data import validation (INVENTREE_IMPORT_WORKERS)
+    may be performed in worker threads, each of which holds a separate connection.
+    Note: The settings are read when this is called (i.e. when the server starts).
+    """
+    from common.settings import get_global_setting
+
+    count = 0
+
+    for key in WORKER_THREAD_SETTINGS:
+        try:
+            workers = int(get_global_setting(key, 1, create=False))
+        except (TypeError, ValueError):
+            workers = 1
+
+        if workers > 1:
+            count += workers
+
+    return count
+
+
+def connections_per_process(alias: str = DEFAULT_DB_ALIAS) -> int:
+    """Return the maximum number of connections a single process may open.
+
+    Without pooling, each process holds one connection, plus one for each worker thread.
+    With pooling, the worker threads share the connections of the pool.
+    """
+    pool = settings.DATABASES[alias].get('OPTIONS', {}).get('pool')
+
+    if not pool:
+        return 1 + worker_thread_connections()
+
+    if pool is True:
+        return DEFAULT_POOL_SIZE
+
+    return int(pool.get('max_size') or pool.get('min_size') or DEFAULT_POOL_SIZE)
+
+
+def background_connections(alias: str = DEFAULT_DB_ALIAS) -> int:
+    """Return the maximum number of connections which the background worker cluster may open."""
+    q_workers = int(getattr(settings, 'Q_CLUSTER', {}).get('workers', 1))
+
+    return (q_workers + BACKGROUND_CLUSTER_PROCESSES) * connections_per_process(alias)
+
+
+def validate_worker_count(workers: int, alias: str = DEFAULT_DB_ALIAS) -> int:
+    """Return the number of server processes which fit within the database connection limit.
+
+    Connections held by the background worker cluster are also counted against DB_MAX_CONNECTIONS.
+
+    Arguments:
+        workers: The requested number of processes
+        alias: The database to validate against
+
+    Returns:
+        The requested number of processes, reduced (if required) so that the server and
+        background worker connections do not exceed DB_MAX_CONNECTIONS
+
+    Raises:
+        ImproperlyConfigured: If not even a single server process fits within the limit
+    """
+    max_connections = getattr(settings, 'DB_MAX_CONNECTIONS', None)
+
+    if not max_connections:
+        return workers
+
+    per_process = connections_per_process(alias)
+    available = max_connections - background_connections(alias)
+    allowed = available // per_process
+
+    if allowed < 1:
+        raise ImproperlyConfigured(
+            f'Database limit of {max_connections} connections is too low: '
+            f'background workers require {background_connections(alias)} connections, '
+            f'and each server process requires {per_process} connections'
+        )
+
+    if workers > allowed:
+        logger.error(
+            '%s workers with %s connections each exceed the %s database connections available (after background workers) - reducing to %s workers',
+            workers,
+            per_process,
+            available,
+            allowed,
+        )
+        return allowed
+
+    return workers
+
+
+def worker_threads_allowed(alias: str = DEFAULT_DB_ALIAS) -> bool:
+    """Return True if database queries can be performed from separate worker threads.
+
+    - SQLite does not handle concurrent connections
+    - Within an atomic block, uncommitted data are not visible to other connections
+    """
+    conn = connections[alias]
+
+    return conn.vendor != 'sqlite' and not conn.in_atomic_block
+
+
+def get_pool(alias: str = DEFAULT_DB_ALIAS):
+    """Return the connection pool for a database, if one has been created.
+
+    Note: The 'pool' property of the connection is not used, as it creates the pool.
+    """
+    pools = getattr(type(connections[alias]), '_connection_pools', None)
+
+    return pools.get(alias) if pools else None
+
+
+def close_connections():
+    """Close all database connections and connection pools of the current process.
+
+    Connections must not be shared with forked processes, so this is called
+    before server processes are forked.
+    """
+    connections.close_all()
+
+    for alias in settings.DATABASES:
+        if get_pool(alias) is not None:
+            connections[alias].close_pool()
+
+
+def get_pool_stats(alias: str = DEFAULT_DB_ALIAS) -> Optional[dict]:
+    """Return the statistics of a connection pool, or None if there is no pool."""
+    pool = get_pool(alias)
+
+    return pool.get_stats() if pool is not None else None
+
+
+def setup_pool_metrics(alias: str = DEFAULT_DB_ALIAS):  # pragma: no cover
+    """Report connection pool usage through OpenTelemetry metrics.
+
+    Metrics are observed from the pool statistics whenever they are exported,
+    so nothing is reported until the pool has been created.
+    """
+    from opentelemetry import metrics  # type: ignore[import]
+    from opentelemetry.metrics import Observation  # type: ignore[import]
+
+    meter = metrics.get_meter('inventree.db.pool')
+    attributes = {'db.alias': alias}
+
+    def observe(key):
+        def callback(options):
+            stats = get_pool_stats(alias)
+
+            if stats is None:
+                return []
+
+            return [Observation(stats.get(key, 0), attributes)]
+
+        return callback
+
+    for key, (description, unit) in POOL_GAUGES.items():
+        meter.create_observable_gauge(
+            f'db.pool.{key}',
+            callbacks=[observe(key)],
+            unit=unit,
+            description=description,
+        )
+
+    for key, (description, unit) in POOL_COUNTERS.items():
+        meter.create_observable_counter(
+            f'db.pool.{key}',
+            callbacks=[observe(key)],
+            unit=unit,
+            description=description,
+        )
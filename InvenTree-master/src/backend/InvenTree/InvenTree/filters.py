@@ -28,7 +28,26 @@ class InvenTreeDateFilter(rest_filters.DateFilter):
 
 
 class InvenTreeSearchFilter(filters.SearchFilter):
-    """Custom search filter which allows adjusting of search terms dynamically."""
+    """Custom search filter which allows adjusting of search terms dynamically.
+
+    If a search index is available for the queried model (refer to common.search),
+    the search is performed against the index, and the results are ranked.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        """Filter the queryset using the search index, if available."""
+        from common.search import get_search_index
+
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+
+        if search_fields and search_terms:
+            index = get_search_index(queryset.model)
+
+            if index is not None and index.supports(search_fields):
+                return index.search(queryset, search_fields, search_terms)
+
+        return super().filter_queryset(request, queryset, view)
 
     def get_search_fields(self, view, request):
         """Return a set of search fields for the request, adjusted based on request params.
@@ -524,26 +524,20 @@ def DownloadFile(
     return response
 
 
-def increment_serial_number(serial, part=None):
-    """Given a serial number, (attempt to) generate the *next* serial number.
+def serial_number_incrementer(part=None):
+    """Return a function which increments serial numbers for the provided part.
 
-    Note: This method is exposed to custom plugins.
+    The available plugins (and their method signatures) are determined once,
+    so that a large sequence of serial numbers can be generated efficiently.
 
     Arguments:
-        serial: The serial number which should be incremented
         part: Optional part object to provide additional context for incrementing the serial number
-
-    Returns:
-        incremented value, or None if incrementing could not be performed.
     """
     from InvenTree.exceptions import log_error
     from plugin import PluginMixinEnum, registry
 
-    # Ensure we start with a string value
-    if serial is not None:
-        serial = str(serial).strip()
+    plugins = []
 
-    # First, let any plugins attempt to increment the serial number
     for plugin in registry.with_mixin(PluginMixinEnum.VALIDATION):
         try:
             if not hasattr(plugin, 'increment_serial_number'):
@@ -552,18 +546,48 @@ def increment_serial_number(serial, part=None):
             signature = inspect.signature(plugin.increment_serial_number)
 
             # Note: 2024-08-21 - The 'part' parameter has been added to the signature
-            if 'part' in signature.parameters:
-                result = plugin.increment_serial_number(serial, part=part)
-            else:
-                result = plugin.increment_serial_number(serial)
-            if result is not None:
-                return str(result)
+            plugins.append((plugin, 'part' in signature.parameters))
         except Exception:
             log_error('increment_serial_number', plugin=plugin.slug)
 
-    # If we get to here, no plugins were able to "increment" the provided serial value
-    # Attempt to perform increment according to some basic rules
-    return increment(serial)
+    def incrementer(serial):
+        """Increment the provided serial number."""
+        # Ensure we start with a string value
+        if serial is not None:
+            serial = str(serial).strip()
+
+        # First, let any plugins attempt to increment the serial number
+        for plugin, with_part in plugins:
+            try:
+                if with_part:
+                    result = plugin.increment_serial_number(serial, part=part)
+                else:
+                    result = plugin.increment_serial_number(serial)
+                if result is not None:
+                    return str(result)
+            except Exception:
+                log_error('increment_serial_number', plugin=plugin.slug)
+
+        # If we get to here, no plugins were able to "increment" the provided serial value
+        # Attempt to perform increment according to some basic rules
+        return increment(serial)
+
+    return incrementer
+
+
+def increment_serial_number(serial, part=None):
+    """Given a serial number, (attempt to) generate the *next* serial number.
+
+    Note: This method is exposed to custom plugins.
+
+    Arguments:
+        serial: The serial number which should be incremented
+        part: Optional part object to provide additional context for incrementing the serial number
+
+    Returns:
+        incremented value, or None if incrementing could not be performed.
+    """
+    return serial_number_incrementer(part)(serial)
 
 
 def extract_serial_numbers(
@@ -588,8 +612,10 @@ def extract_serial_numbers(
         starting_value: Provide a starting value for the sequence (or None)
         part: Part that should be used as context
     """
+    increment_serial = serial_number_incrementer(part)
+
     if starting_value is None:
-        starting_value = increment_serial_number(None, part=part)
+        starting_value = increment_serial(None)
 
     try:
         expected_quantity = int(expected_quantity)
@@ -606,12 +632,12 @@ def extract_serial_numbers(
     if len(input_string) == 0:
         raise ValidationError([_('Empty serial number string')])
 
-    next_value = increment_serial_number(starting_value, part=part)
+    next_value = increment_serial(starting_value)
 
     # Substitute ~ character with latest value
     while '~' in input_string and next_value:
         input_string = input_string.replace('~', str(next_value), 1)
-        next_value = increment_serial_number(next_value, part=part)
+        next_value = increment_serial(next_value)
 
     # Split input string by whitespace or comma (,) characters
     groups = re.split(r'[\s,]+', input_string)
@@ -619,6 +645,9 @@ def extract_serial_numbers(
     serials = []
     errors = []
 
+    # Set of extracted serials, for efficient duplicate checks
+    found = set()
+
     def add_error(error: str):
         """Helper function for adding an error message."""
         if error not in errors:
@@ -632,10 +661,11 @@ def extract_serial_numbers(
         if len(serial) == 0:
             return
 
-        if serial in serials:
+        if serial in found:
             add_error(_('Duplicate serial') + f': {serial}')
         else:
             serials.append(serial)
+            found.add(serial)
 
     # If the user has supplied the correct number of serials, do not split into groups
     if len(groups) == expected_quantity:
@@ -669,17 +699,19 @@ def extract_serial_numbers(
                     continue
 
                 group_items = []
+                group_set = set()
 
                 count = 0
 
                 a_next = a
 
-                while a_next is not None and a_next not in group_items:
+                while a_next is not None and a_next not in group_set:
                     group_items.append(a_next)
+                    group_set.add(a_next)
                     count += 1
 
                     # Progress to the 'next' sequential value
-                    a_next = str(increment_serial_number(a_next))
+                    a_next = str(increment_serial(a_next))
 
                     if a_next == b:
                         # Successfully got to the end of the range
@@ -722,6 +754,7 @@ def extract_serial_numbers(
             items = group.split('+')
 
             sequence_items = []
+            sequence_set = set()
             counter = 0
             sequence_count = max(0, expected_quantity - len(serials))
 
@@ -741,11 +774,12 @@ def extract_serial_numbers(
             # Keep incrementing up to the specified quantity
             while (
                 value is not None
-                and value not in sequence_items
+                and value not in sequence_set
                 and counter < sequence_count
             ):
                 sequence_items.append(value)
-                value = increment_serial_number(value)
+                sequence_set.add(value)
+                value = increment_serial(value)
                 counter += 1
 
             if len(sequence_items) == sequence_count:
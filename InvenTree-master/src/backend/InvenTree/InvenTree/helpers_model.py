@@ -14,10 +14,10 @@ from django.utils.translation import gettext_lazy as _
 import requests
 import requests.exceptions
 import structlog
-from djmoney.contrib.exchange.models import convert_money
 from djmoney.money import Money
 from PIL import Image
 
+from common.currency import convert_currency
 from common.notifications import (
     InvenTreeNotificationBodies,
     NotificationBody,
@@ -221,7 +221,7 @@ def render_currency(
         # Attempt to convert to the provided currency
         # If cannot be done, leave the original
         try:
-            money = convert_money(money, currency)
+            money = convert_currency(money, currency)
         except Exception:
             pass
 
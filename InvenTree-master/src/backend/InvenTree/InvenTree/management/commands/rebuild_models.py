@@ -29,7 +29,7 @@ class Command(BaseCommand):
 
             from part.models import Part
 
-            Part.objects.rebuild()
+            Part._tree_manager.rebuild()
         except Exception:
             logger.info('Error rebuilding Part objects')
 
@@ -39,7 +39,7 @@ class Command(BaseCommand):
 
             from part.models import PartCategory
 
-            PartCategory.objects.rebuild()
+            PartCategory._tree_manager.rebuild()
         except Exception:
             logger.info('Error rebuilding PartCategory objects')
 
@@ -49,7 +49,7 @@ class Command(BaseCommand):
 
             from stock.models import StockItem
 
-            StockItem.objects.rebuild()
+            StockItem._tree_manager.rebuild()
         except Exception:
             logger.info('Error rebuilding StockItem objects')
 
@@ -59,7 +59,7 @@ class Command(BaseCommand):
 
             from stock.models import StockLocation
 
-            StockLocation.objects.rebuild()
+            StockLocation._tree_manager.rebuild()
         except Exception:
             logger.info('Error rebuilding StockLocation objects')
 
@@ -69,6 +69,6 @@ class Command(BaseCommand):
 
             from build.models import Build
 
-            Build.objects.rebuild()
+            Build._tree_manager.rebuild()
         except Exception:
             logger.info('Error rebuilding Build objects')
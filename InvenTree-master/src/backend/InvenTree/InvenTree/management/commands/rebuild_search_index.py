@@ -0,0 +1,45 @@
+"""Custom management command to rebuild the search index.
+
+- Required once after installation, to enable indexed search
+- May be required after importing a new dataset, or bulk data changes
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+import structlog
+
+logger = structlog.get_logger('inventree')
+
+
+class Command(BaseCommand):
+    """Rebuild the search index for all (or selected) model types."""
+
+    def add_arguments(self, parser):
+        """Add custom arguments for this command."""
+        parser.add_argument(
+            'models',
+            nargs='*',
+            type=str,
+            help='Model types to rebuild (e.g. part.part) - defaults to all indexed models',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Rebuild the search index."""
+        from common.search import SEARCH_INDEX_REGISTRY, get_installed_backend
+
+        if get_installed_backend() is None:
+            raise CommandError(
+                'Indexed search is not available for the configured database'
+            )
+
+        model_types = kwargs.get('models') or list(SEARCH_INDEX_REGISTRY.keys())
+
+        for model_type in model_types:
+            index = SEARCH_INDEX_REGISTRY.get(model_type.lower())
+
+            if index is None:
+                raise CommandError(f"No search index for model type '{model_type}'")
+
+            logger.info("Rebuilding search index for '%s'", index.model_type)
+            count = index.rebuild()
+            logger.info("Created %s search entries for '%s'", count, index.model_type)
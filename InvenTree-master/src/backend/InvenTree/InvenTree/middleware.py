@@ -19,7 +19,7 @@ from error_report.middleware import ExceptionProcessor
 from common.settings import get_global_setting
 from InvenTree.cache import create_session_cache, delete_session_cache
 from InvenTree.config import CONFIG_LOOKUPS, inventreeInstaller
-from users.models import ApiToken
+from tenancy.resolver import Principal, resolve_principal
 
 logger = structlog.get_logger('inventree')
 
@@ -111,17 +111,14 @@ class AuthRequiredMiddleware:
         if token := get_token_from_request(request):
             request.token = token
             # Does the provided token match a valid user?
-            try:
-                token = ApiToken.objects.get(key=token)
-
-                if token.active and token.user:
-                    # Provide the user information to the request
-                    request.user = token.user
-                    return True
-            except ApiToken.DoesNotExist:  # pragma: no cover
-                logger.warning(
-                    'Access denied for unknown token %s', token
-                )  # pragma: no cover
+            principal = resolve_principal(request)
+
+            if principal is not None and principal.kind == Principal.API_TOKEN:
+                # Provide the user information to the request
+                request.user = principal.user
+                return True
+
+            logger.warning('Access denied for unknown token %s', token)
 
         return False
 
@@ -258,6 +258,34 @@ class OutputOptionsMixin:
 
         return serializer
 
+    def get_serializer_prefetches(self):
+        """Return the related fields to prefetch for the serializer fields included in the response.
+
+        This allows the queryset to be annotated for only those fields which are requested.
+        Returns None if the included fields cannot be determined (e.g. when exporting data).
+        """
+        request = getattr(self, 'request', None)
+
+        if request is None:
+            return None
+
+        if getattr(self, 'is_exporting', None) and self.is_exporting():
+            return None
+
+        serializer_class = self.get_serializer_class()
+
+        if not issubclass(serializer_class, FilterableSerializerMixin):
+            return None
+
+        kwargs = {}
+
+        if self.output_options:
+            kwargs = self.output_options.format_params(request.query_params)
+
+        return serializer_class.get_field_prefetches(
+            kwargs, getattr(request, 'query_params', {})
+        )
+
 
 class SerializerContextMixin:
     """Mixin to add context to serializer."""
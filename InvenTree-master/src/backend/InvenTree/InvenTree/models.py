@@ -2,6 +2,7 @@
 
 from collections.abc import Callable
 from datetime import datetime
+from functools import partial
 from string import Formatter
 from typing import Any, Optional
 
@@ -10,7 +11,8 @@ from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import models, transaction
-from django.db.models import QuerySet
+from django.db.models import Max, QuerySet, Value
+from django.db.models.functions import Concat, Length, Substr
 from django.db.models.signals import post_save
 from django.db.transaction import TransactionManagementError
 from django.dispatch import receiver
@@ -524,6 +526,15 @@ class InvenTreeParameterMixin(InvenTreePermissionCheckMixin, models.Model):
         'common.Parameter', content_type_field='model_type', object_id_field='model_id'
     )
 
+    # Related fields which are pre-fetched when serializing parameters
+    PARAMETER_PREFETCH_FIELDS = [
+        'parameters_list',
+        'parameters_list__model_type',
+        'parameters_list__updated_by',
+        'parameters_list__template',
+        'parameters_list__template__model_type',
+    ]
+
     @staticmethod
     def annotate_parameters(queryset: QuerySet) -> QuerySet:
         """Annotate a queryset with pre-fetched parameters.
@@ -535,11 +546,7 @@ class InvenTreeParameterMixin(InvenTreePermissionCheckMixin, models.Model):
             Annotated queryset
         """
         return queryset.prefetch_related(
-            'parameters_list',
-            'parameters_list__model_type',
-            'parameters_list__updated_by',
-            'parameters_list__template',
-            'parameters_list__template__model_type',
+            *InvenTreeParameterMixin.PARAMETER_PREFETCH_FIELDS
         )
 
     @property
@@ -688,6 +695,10 @@ class InvenTreeAttachmentMixin(InvenTreePermissionCheckMixin):
         Attachment.objects.create(**kwargs)
 
 
+# Maximum time (seconds) for which a scheduled tree rebuild is considered pending
+TREE_REBUILD_TIMEOUT = 600
+
+
 class InvenTreeTree(ContentTypeMixin, MPTTModel):
     """Provides an abstracted self-referencing tree model, based on the MPTTModel class.
 
@@ -785,7 +796,7 @@ class InvenTreeTree(ContentTypeMixin, MPTTModel):
             next_tree_id += 1
 
         # 3. Rebuild the model tree(s) as required
-        #  - If any partial rebuilds fail, we will rebuild the entire tree
+        #  - If any partial rebuilds fail, we will rebuild all trees for this tenant
 
         result = True
 
@@ -795,8 +806,8 @@ class InvenTreeTree(ContentTypeMixin, MPTTModel):
                     result = False
 
         if not result:
-            # Rebuild the entire tree (expensive!!!)
-            self.__class__.objects.rebuild()
+            # Rebuild all trees for this tenant (expensive!!!)
+            self.rebuild_tenant_trees()
 
     def handle_tree_delete(self, delete_children=False, delete_items=False):
         """Delete a single instance of the tree, based on provided kwargs.
@@ -935,7 +946,7 @@ class InvenTreeTree(ContentTypeMixin, MPTTModel):
         If a failure occurs, log the error and return False.
         """
         try:
-            self.__class__.objects.partial_rebuild(tree_id)
+            self.__class__._tree_manager.partial_rebuild(tree_id)
             return True
         except Exception as e:
             # This is a critical error, explicitly report to sentry
@@ -950,6 +961,74 @@ class InvenTreeTree(ContentTypeMixin, MPTTModel):
             )
             return False
 
+    def rebuild_tenant_trees(self):
+        """Rebuild all trees which belong to the same tenant as this node.
+
+        For models which are not tenant-scoped, the entire model tree is rebuilt.
+        """
+        manager = self.__class__._tree_manager
+        tenant_id = getattr(self, 'tenant_id', None)
+
+        if tenant_id and hasattr(manager, 'rebuild_for_tenant'):
+            manager.rebuild_for_tenant(tenant_id)
+        else:
+            manager.rebuild()
+
+    @classmethod
+    def tree_rebuild_key(cls, tree_id: int) -> str:
+        """Return the cache key used to coalesce scheduled rebuilds of the given tree."""
+        return f'tree_rebuild_{cls._meta.label_lower}_{tree_id}'
+
+    @classmethod
+    def clear_tree_rebuild(cls, tree_id: int) -> None:
+        """Mark any scheduled rebuild of the given tree as started."""
+        from django.core.cache import cache
+
+        cache.delete(cls.tree_rebuild_key(tree_id))
+
+    @classmethod
+    def schedule_tree_rebuild(cls, *tree_ids: int) -> None:
+        """Schedule a rebuild of the specified trees, after a bulk operation.
+
+        Bulk operations (e.g. bulk_create or queryset updates) bypass the tree updates
+        performed in save(), so the affected trees must be rebuilt afterwards:
+
+        - If the background worker is not running, the trees are rebuilt immediately
+        - Otherwise, a background task is offloaded for each tree (once the transaction is committed)
+        - Multiple requests to rebuild the same tree are coalesced until the task starts
+        """
+        from InvenTree.status import is_worker_running
+        from InvenTree.tasks import rebuild_tree
+
+        tree_ids = sorted({tree_id for tree_id in tree_ids if tree_id})
+
+        if len(tree_ids) == 0:
+            return
+
+        if not is_worker_running():
+            for tree_id in tree_ids:
+                rebuild_tree(cls._meta.label, tree_id)
+            return
+
+        for tree_id in tree_ids:
+            transaction.on_commit(partial(cls.offload_tree_rebuild, tree_id))
+
+    @classmethod
+    def offload_tree_rebuild(cls, tree_id: int) -> None:
+        """Offload a background rebuild of the given tree, unless one is already pending."""
+        from django.core.cache import cache
+
+        from InvenTree.tasks import offload_task, rebuild_tree
+
+        key = cls.tree_rebuild_key(tree_id)
+
+        if not cache.add(key, True, TREE_REBUILD_TIMEOUT):
+            # A rebuild of this tree is already pending
+            return
+
+        if not offload_task(rebuild_tree, cls._meta.label, tree_id, group='inventree'):
+            cache.delete(key)
+
     def delete_items(self, cascade: bool = False):
         """Delete any 'items' which exist under this node in the tree.
 
@@ -984,13 +1063,15 @@ class InvenTreeTree(ContentTypeMixin, MPTTModel):
 
     @classmethod
     def getNextTreeID(cls) -> int:
-        """Return the next available tree_id for this model class."""
-        instance = cls.objects.order_by('-tree_id').first()
+        """Return the next available tree_id for this model class.
 
-        if instance:
-            return instance.tree_id + 1
-        else:
-            return 1
+        Note that tree_id values are unique across all tenants.
+        """
+        max_tree_id = cls._base_manager.aggregate(max_tree_id=Max('tree_id'))[
+            'max_tree_id'
+        ]
+
+        return (max_tree_id or 0) + 1
 
 
 class PathStringMixin(models.Model):
@@ -1064,7 +1145,11 @@ class PathStringMixin(models.Model):
                 self.get_descendants(include_self=False).values_list('pk', flat=True)
             )
 
-            self.rebuild_lower_nodes(lower_nodes)
+            self.rebuild_lower_nodes(
+                lower_nodes,
+                old_prefix=f'{old_pathstring}/',
+                new_prefix=f'{pathstring}/',
+            )
 
     def delete(self, *args, **kwargs):
         """Custom delete method for PathStringMixin.
@@ -1086,24 +1171,69 @@ class PathStringMixin(models.Model):
             self.get_descendants(include_self=False).values_list('pk', flat=True)
         )
 
+        # Lower nodes are moved up to the parent of this node
+        parent = self.parent
+
         # Delete this node - after which we expect the tree structure will be updated
         super().delete(*args, **kwargs)
 
         # Rebuild the pathstring for lower nodes
-        self.rebuild_lower_nodes(lower_nodes)
+        self.rebuild_lower_nodes(
+            lower_nodes,
+            old_prefix=f'{self.pathstring}/',
+            new_prefix=f'{parent.pathstring}/' if parent else '',
+        )
 
     def __str__(self):
         """String representation of a category is the full path to that category."""
         return f'{self.pathstring} - {self.description}'
 
-    def rebuild_lower_nodes(self, lower_nodes: list[int]):
+    def rebuild_lower_nodes(
+        self,
+        lower_nodes: list[int],
+        old_prefix: Optional[str] = None,
+        new_prefix: Optional[str] = None,
+    ):
         """Rebuild the pathstring for lower nodes in the tree.
 
+        Arguments:
+            lower_nodes: List of node ID values to update
+            old_prefix: The pathstring prefix to be replaced (optional)
+            new_prefix: The replacement pathstring prefix (optional)
+
         - This is used when the pathstring for this node is updated, and we need to update all lower nodes.
-        - We use a bulk-update to update the pathstring for all lower nodes in the tree.
+        - If the prefix is provided, the lower nodes are updated with a single UPDATE query
+        - Any nodes which cannot be updated by prefix (e.g. truncated paths) are rebuilt individually
         """
         nodes = self.__class__.objects.filter(pk__in=lower_nodes)
 
+        if old_prefix is not None and new_prefix is not None and lower_nodes:
+            max_chars = self._meta.get_field('pathstring').max_length
+
+            # Length of a truncated pathstring (see InvenTree.helpers.constructPathString)
+            truncated = 2 * int(max_chars / 2 - 2) + 3
+
+            nodes = nodes.alias(path_length=Length('pathstring'))
+
+            prefixed = (
+                nodes
+                .filter(pathstring__startswith=old_prefix)
+                .filter(path_length__lte=max_chars + len(old_prefix) - len(new_prefix))
+                .exclude(path_length=truncated)
+            )
+
+            # Nodes which must be rebuilt individually
+            nodes = nodes.exclude(pk__in=prefixed.values('pk'))
+            nodes = list(nodes)
+
+            prefixed.update(
+                pathstring=Concat(
+                    Value(new_prefix),
+                    Substr('pathstring', len(old_prefix) + 1),
+                    output_field=models.CharField(),
+                )
+            )
+
         nodes_to_update = []
 
         for node in nodes:
@@ -1352,9 +1482,15 @@ class InvenTreeBarcodeMixin(models.Model):
             else:
                 return False
 
+        from plugin.base.barcodes.helper import invalidate_barcode_hash
+
         if barcode_data is not None:
             self.barcode_data = barcode_data
 
+        # Invalidate any cached resolutions for the old and new barcode hash
+        invalidate_barcode_hash(self.barcode_hash)
+        invalidate_barcode_hash(barcode_hash)
+
         self.barcode_hash = barcode_hash
 
         if save:
@@ -1364,6 +1500,10 @@ class InvenTreeBarcodeMixin(models.Model):
 
     def unassign_barcode(self):
         """Unassign custom barcode from this model."""
+        from plugin.base.barcodes.helper import invalidate_barcode_hash
+
+        invalidate_barcode_hash(self.barcode_hash)
+
         self.barcode_data = ''
         self.barcode_hash = ''
 
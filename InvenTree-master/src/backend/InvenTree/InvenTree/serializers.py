@@ -57,6 +57,7 @@ def enable_filter(
     default_include: bool = False,
     filter_name: Optional[str] = None,
     filter_by_query: bool = True,
+    prefetch_fields: Optional[list] = None,
 ):
     """Decorator for marking a serializer field as filterable.
 
@@ -67,6 +68,7 @@ def enable_filter(
         default_include (bool): If True, the field will be included by default unless explicitly excluded. If False, the field will be excluded by default unless explicitly included.
         filter_name (str, optional): The name of the filter parameter to use in the URL. If None, the function name of the (decorated) function will be used.
         filter_by_query (bool): If True, also look for filter parameters in the request query parameters.
+        prefetch_fields (list, optional): Related fields (or Prefetch objects, or callables which return them) required to render this field. These are only prefetched if the field is included in the serializer output.
 
     Returns:
         The decorated serializer field, marked as filterable.
@@ -83,6 +85,7 @@ def enable_filter(
         'default': default_include,
         'filter_name': filter_name if filter_name else func.field_name,
         'filter_by_query': filter_by_query,
+        'prefetch_fields': list(prefetch_fields or []),
     }
     return func
 
@@ -134,14 +137,32 @@ class FilterableSerializerMixin:
             query_params = dict(getattr(context.get('request', {}), 'query_params', {}))
 
         # Remove filter args from kwargs to avoid issues with super().__init__
+        self.filter_target_values = self.resolve_filter_values(
+            self.filter_targets, kwargs, query_params
+        )
+
+        # Ensure this mixin is not broadly applied as it is expensive on scale (total CI time increased by 21% when running all coverage tests)
+        if len(self.filter_targets) == 0 and not self.no_filters:
+            raise Exception(
+                'INVE-I2: No filter targets found in fields, remove `PathScopedMixin`'
+            )
+
+    @classmethod
+    def resolve_filter_values(
+        cls, filter_targets: dict[str, dict], kwargs: dict, query_params: dict
+    ) -> dict[str, bool]:
+        """Determine the requested value for each filterable field.
+
+        Filter arguments are removed from the provided kwargs and query parameters.
+        """
         popped_kwargs = {}  # store popped kwargs as a arg might be reused for multiple fields
         tgs_vals: dict[str, bool] = {}
-        for k, v in self.filter_targets.items():
+        for k, v in filter_targets.items():
             pop_ref = v['filter_name'] or k
             val = kwargs.pop(pop_ref, popped_kwargs.get(pop_ref))
 
             # Optionally also look in query parameters
-            if val is None and self.filter_on_query and v.get('filter_by_query', True):
+            if val is None and cls.filter_on_query and v.get('filter_by_query', True):
                 val = query_params.pop(pop_ref, None)
                 if isinstance(val, list) and len(val) == 1:
                     val = val[0]
@@ -151,14 +172,58 @@ class FilterableSerializerMixin:
             tgs_vals[k] = (
                 str2bool(val) if isinstance(val, (str, int, float)) else val
             )  # Support for various filtering style for backwards compatibility
-        self.filter_target_values = tgs_vals
+        return tgs_vals
 
-        # Ensure this mixin is not broadly applied as it is expensive on scale (total CI time increased by 21% when running all coverage tests)
-        if len(self.filter_targets) == 0 and not self.no_filters:
-            raise Exception(
-                'INVE-I2: No filter targets found in fields, remove `PathScopedMixin`'
+    @classmethod
+    def get_field_prefetches(
+        cls, kwargs: Optional[dict] = None, query_params: Optional[dict] = None
+    ) -> list:
+        """Return the related fields which need to be prefetched for the filterable fields of this serializer.
+
+        The included fields are resolved from the provided serializer kwargs and query parameters
+        (as per `gather_filters`), without the expense of constructing the serializer itself.
+
+        Arguments:
+            kwargs: Keyword arguments which would be passed to the serializer
+            query_params: Query parameters for the request
+
+        If neither argument is provided, the prefetches required by *all* filterable fields are returned.
+        """
+        filter_targets = {
+            str(k): a._kwargs.get('is_filterable_vals', {})
+            for k, a in getattr(cls, '_declared_fields', {}).items()
+            if getattr(a, '_kwargs', {}).get('is_filterable', None)
+        }
+
+        if kwargs is None and query_params is None:
+            values = dict.fromkeys(filter_targets, True)
+        else:
+            values = cls.resolve_filter_values(
+                filter_targets, dict(kwargs or {}), dict(query_params or {})
             )
 
+        prefetches = []
+
+        for k, v in filter_targets.items():
+            value = values.get(k)
+
+            if value is None:
+                value = bool(v.get('default', False))
+
+            # Skip any fields which will be removed from the serializer
+            if value is not True:
+                continue
+
+            for prefetch in v.get('prefetch_fields', []):
+                # Prefetch objects may be constructed on demand (e.g. for tenant scoped querysets)
+                if callable(prefetch):
+                    prefetch = prefetch()
+
+                if prefetch not in prefetches:
+                    prefetches.append(prefetch)
+
+        return prefetches
+
     def do_filtering(self) -> None:
         """Do the actual filtering."""
         # This serializer might not contain filters or we do not want to pop fields while generating the schema
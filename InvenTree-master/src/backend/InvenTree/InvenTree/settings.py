@@ -818,6 +818,57 @@ if 'postgres' in DB_ENGINE:  # pragma: no cover
             else IsolationLevel.READ_COMMITTED
         )
 
+    # Server-side connection pooling (requires psycopg 3 and psycopg_pool)
+    # Ref: https://docs.djangoproject.com/en/5.2/ref/databases/#connection-pool
+    # Each process (e.g. gunicorn worker) maintains its own pool of connections
+    if 'pool' not in db_options and get_boolean_setting(
+        'INVENTREE_DB_POOL', 'database.pool', False
+    ):
+        from django.db.backends.postgresql.psycopg_any import (  # type: ignore[unresolved-import]
+            is_psycopg3,
+        )
+
+        try:
+            from psycopg_pool import ConnectionPool
+        except ImportError:
+            ConnectionPool = None
+
+        if not is_psycopg3 or ConnectionPool is None:
+            logger.warning(
+                'Database pooling requires psycopg 3 with psycopg_pool - pooling disabled'
+            )
+        else:
+            pool_options = {
+                'min_size': int(
+                    get_setting(
+                        'INVENTREE_DB_POOL_MIN_SIZE', 'database.pool_min_size', 2
+                    )
+                ),
+                'max_size': int(
+                    get_setting(
+                        'INVENTREE_DB_POOL_MAX_SIZE', 'database.pool_max_size', 4
+                    )
+                ),
+                # Seconds to wait for a connection from the pool, before raising an error
+                'timeout': float(
+                    get_setting(
+                        'INVENTREE_DB_POOL_TIMEOUT', 'database.pool_timeout', 10
+                    )
+                ),
+            }
+
+            pool_options['max_size'] = max(
+                pool_options['min_size'], pool_options['max_size']
+            )
+
+            # Check connections when they are taken from the pool
+            if get_boolean_setting(
+                'INVENTREE_DB_CONN_HEALTH_CHECKS', 'database.conn_health_checks', True
+            ):
+                pool_options['check'] = ConnectionPool.check_connection
+
+            db_options['pool'] = pool_options
+
 # Specific options for MySql / MariaDB backend
 elif 'mysql' in DB_ENGINE:  # pragma: no cover
     # TODO TCP time outs and keepalives
@@ -849,6 +900,52 @@ elif 'sqlite' in DB_ENGINE:
 # Provide OPTIONS dict back to the database configuration dict
 db_config['OPTIONS'] = db_options
 
+# Remove configuration keys which are not passed to the database backend
+for key in [
+    'POOL',
+    'POOL_MIN_SIZE',
+    'POOL_MAX_SIZE',
+    'POOL_TIMEOUT',
+    'MAX_CONNECTIONS',
+    'CONN_MAX_AGE',
+    'CONN_HEALTH_CHECKS',
+]:
+    db_config.pop(key, None)
+
+"""
+Persistent database connections.
+Ref: https://docs.djangoproject.com/en/5.2/ref/databases/#persistent-connections
+
+- Connections are re-used between requests (for up to CONN_MAX_AGE seconds)
+- A negative value keeps connections open indefinitely
+- Pooled connections are managed by the pool, and cannot also be persistent
+"""
+
+if db_options.get('pool'):
+    DB_CONN_MAX_AGE = 0
+else:
+    DB_CONN_MAX_AGE = int(
+        get_setting(
+            'INVENTREE_DB_CONN_MAX_AGE',
+            'database.conn_max_age',
+            0 if 'sqlite' in DB_ENGINE else 60,
+        )
+    )
+
+db_config['CONN_MAX_AGE'] = None if DB_CONN_MAX_AGE < 0 else DB_CONN_MAX_AGE
+
+# Check that persistent connections are still usable, before they are re-used
+db_config['CONN_HEALTH_CHECKS'] = get_boolean_setting(
+    'INVENTREE_DB_CONN_HEALTH_CHECKS', 'database.conn_health_checks', True
+)
+
+# Maximum number of connections the database server accepts from this instance
+# Used to validate the number of server processes against the connections per process,
+# after reserving connections for the background worker cluster
+DB_MAX_CONNECTIONS = get_setting(
+    'INVENTREE_DB_MAX_CONNECTIONS', 'database.max_connections', None, int
+)
+
 # Set testing options for the database
 db_config['TEST'] = {'CHARSET': 'utf8'}
 
@@ -1476,6 +1573,9 @@ TESTING_TABLE_EVENTS = False
 # Flag to allow pricing recalculations during testing
 TESTING_PRICING = False
 
+# Flag to allow caching of custom states during testing
+TESTING_CUSTOM_STATES = False
+
 # Global settings overrides
 # If provided, these values will override any "global" settings (and prevent them from being set)
 GLOBAL_SETTINGS_OVERRIDES = get_setting(
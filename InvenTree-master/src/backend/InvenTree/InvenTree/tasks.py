@@ -590,7 +590,11 @@ def update_exchange_rates(force: bool = False):
     try:
         from djmoney.contrib.exchange.models import Rate
 
-        from common.currency import currency_code_default, currency_codes
+        from common.currency import (
+            clear_exchange_rates,
+            currency_code_default,
+            currency_codes,
+        )
         from InvenTree.exchange import InvenTreeExchange
     except AppRegistryNotReady:  # pragma: no cover
         # Apps not yet loaded!
@@ -621,6 +625,9 @@ def update_exchange_rates(force: bool = False):
             currency__in=currency_codes()
         ).delete()
 
+        # Ensure that the updated rates are used for any further conversions
+        clear_exchange_rates()
+
         # Record successful task execution
         record_task_success('update_exchange_rates')
 
@@ -767,6 +774,42 @@ def email_user(user_id: int, subject: str, message: str) -> None:
         send_email(subject, message, [email])
 
 
+@tracer.start_as_current_span('rebuild_tree')
+def rebuild_tree(model_label: str, tree_id: int) -> bool:
+    """Rebuild a single tree for the specified tree model.
+
+    This task is scheduled by InvenTreeTree.schedule_tree_rebuild (after bulk operations).
+
+    Arguments:
+        model_label: The label of the tree model (e.g. 'stock.StockItem')
+        tree_id: The ID of the tree to rebuild
+
+    Returns:
+        bool: True if the partial tree rebuild was successful, False otherwise.
+
+    - If the partial rebuild fails, all trees for the same tenant are rebuilt.
+    """
+    from django.apps import apps
+
+    model = apps.get_model(model_label)
+
+    # Allow further rebuilds of this tree to be scheduled
+    model.clear_tree_rebuild(tree_id)
+
+    node = model._base_manager.filter(tree_id=tree_id).first()
+
+    if node is None:
+        # The tree no longer exists
+        return True
+
+    if node.partial_rebuild(tree_id):
+        logger.info('Rebuilt %s tree for tree_id: %s', model_label, tree_id)
+        return True
+
+    node.rebuild_tenant_trees()
+    return False
+
+
 @tracer.start_as_current_span('run_oauth_maintenance')
 @scheduled_task(ScheduledTask.DAILY)
 def run_oauth_maintenance():
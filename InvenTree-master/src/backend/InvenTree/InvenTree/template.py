@@ -8,13 +8,37 @@ from django.template.loaders.cached import Loader as CachedLoader
 
 
 class InvenTreeTemplateLoader(CachedLoader):
-    """Custom template loader which bypasses cache for PDF export."""
+    """Custom template loader which revalidates the cache for PDF export."""
+
+    def __init__(self, engine, loaders):
+        """Initialize the loader, with a separate cache for uploaded report templates."""
+        super().__init__(engine, loaders)
+
+        # Uploaded templates, keyed by path -> (file revision, compiled template)
+        self.report_template_cache = {}
+
+    def reset(self):
+        """Reset the template cache (including uploaded report templates)."""
+        super().reset()
+        self.report_template_cache.clear()
+
+    @staticmethod
+    def get_file_revision(path: str):
+        """Return a value which changes whenever the provided template file is modified."""
+        try:
+            stat = os.stat(path)
+        except (OSError, TypeError, ValueError):
+            return None
+
+        return (stat.st_mtime_ns, stat.st_size)
 
     def get_template(self, template_name, skip=None):
         """Return a template object for the given template name.
 
-        Any custom report or label templates will be forced to reload (without cache).
-        This ensures that generated PDF reports / labels are always up-to-date.
+        Any custom report or label templates (and snippets) are revalidated against the file on disk,
+        and reloaded whenever the file has been modified.
+        This ensures that generated PDF reports / labels are always up-to-date,
+        without re-parsing the template for every single item which is printed.
         """
         # List of template patterns to skip cache for
         skip_cache_dirs = [
@@ -28,8 +52,18 @@ class InvenTreeTemplateLoader(CachedLoader):
 
         template_path = str(template.name)
 
-        # If the template matches any of the skip patterns, reload it without cache
+        # If the template matches any of the skip patterns, check if it needs to be reloaded
         if any(template_path.startswith(d) for d in skip_cache_dirs):
+            revision = self.get_file_revision(getattr(template.origin, 'name', None))
+
+            cached = self.report_template_cache.get(template_path)
+
+            if revision is not None and cached and cached[0] == revision:
+                return cached[1]
+
             template = BaseLoader.get_template(self, template_name, skip)
 
+            if revision is not None:
+                self.report_template_cache[template_path] = (revision, template)
+
         return template
@@ -1,14 +1,18 @@
 """Low level tests for the InvenTree API."""
 
+import time
 from base64 import b64encode
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest import mock
 
 from django.urls import reverse
 
 from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
 
-from InvenTree.api import read_license_file
+import part.api
+from InvenTree.api import APISearchView, read_license_file
 from InvenTree.api_version import INVENTREE_API_VERSION
 from InvenTree.unit_test import InvenTreeAPITestCase, InvenTreeTestCase
 from InvenTree.version import inventreeApiText, parse_version_text
@@ -503,6 +507,79 @@ class SearchTests(InvenTreeAPITestCase):
                     result['error'], 'User does not have permission to view this model'
                 )
 
+    def search_view(self, data: dict):
+        """Perform a search request directly against the search view."""
+        request = APIRequestFactory().post('/api/search/', data, format='json')
+        force_authenticate(request, user=self.user)
+
+        return APISearchView.as_view()(request)
+
+    def test_search_mode(self):
+        """Test that lightweight results are returned for search queries."""
+        response = self.search_view({
+            'search': 'chair',
+            'limit': 3,
+            'part': {},
+            'stockitem': {},
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['part']['count'], 5)
+
+        for result in response.data['part']['results']:
+            # Annotations required for rendering the search results
+            self.assertIsNotNone(result['total_in_stock'])
+            self.assertIsNotNone(result['ordering'])
+
+            # Expensive annotations are skipped
+            self.assertIsNone(result['allocated_to_sales_orders'])
+            self.assertIsNone(result['required_for_build_orders'])
+
+        self.assertIn('count', response.data['stockitem'])
+
+    def test_concurrent_search(self):
+        """Test that separate searches are performed (and time out) independently."""
+
+        def search_model(view, request, cls, params, *args, **kwargs):
+            if params['search'] == 'slow' and cls is part.api.PartList:
+                time.sleep(2)
+
+            return {'query': params['search'], 'view': cls.__name__}
+
+        with (
+            mock.patch.object(APISearchView, 'get_search_workers', return_value=2),
+            mock.patch.object(APISearchView, 'get_search_timeout', return_value=1),
+            mock.patch.object(APISearchView, 'search_model', search_model),
+        ):
+            response = self.search_view({'search': 'fast', 'part': {}, 'build': {}})
+
+            self.assertEqual(
+                response.data['part'], {'query': 'fast', 'view': 'PartList'}
+            )
+            self.assertEqual(
+                response.data['build'], {'query': 'fast', 'view': 'BuildList'}
+            )
+
+            # The worker threads are re-used between requests
+            executor = APISearchView.executor
+
+            response = self.search_view({'search': 'slow', 'part': {}, 'build': {}})
+
+            self.assertEqual(response.data['part'], {'error': 'Search timed out'})
+            self.assertEqual(response.data['build']['view'], 'BuildList')
+            self.assertIs(APISearchView.executor, executor)
+
+        # Searches performed serially are also limited by the time budget
+        with (
+            mock.patch.object(APISearchView, 'get_search_workers', return_value=1),
+            mock.patch.object(APISearchView, 'get_search_timeout', return_value=1),
+            mock.patch.object(APISearchView, 'search_model', search_model),
+        ):
+            response = self.search_view({'search': 'slow', 'part': {}, 'stockitem': {}})
+
+            self.assertEqual(response.data['part']['view'], 'PartList')
+            self.assertEqual(response.data['stockitem'], {'error': 'Search timed out'})
+
 
 class GeneralApiTests(InvenTreeAPITestCase):
     """Tests for various api endpoints."""
@@ -19,7 +19,7 @@ from django.utils import timezone
 
 import pint.errors
 from djmoney.contrib.exchange.exceptions import MissingRate
-from djmoney.contrib.exchange.models import Rate, convert_money
+from djmoney.contrib.exchange.models import ExchangeBackend, Rate, convert_money
 from djmoney.money import Money
 from maintenance_mode.core import get_maintenance_mode, set_maintenance_mode
 from sesame.utils import get_user
@@ -39,7 +39,7 @@ from InvenTree.unit_test import InvenTreeTestCase, in_env_context
 from part.models import Part, PartCategory
 from stock.models import StockItem, StockLocation
 
-from . import config, helpers, ready, schema, status, version
+from . import config, database, helpers, ready, schema, status, version
 from .tasks import offload_task
 
 
@@ -459,6 +459,51 @@ class ConversionTest(TestCase):
             q = InvenTree.conversion.convert_physical_value(val, 'henry / km')
             self.assertAlmostEqual(q, expected, 2)
 
+    def test_numeric_fast_path(self):
+        """Test that plain numeric values are converted without parsing by pint."""
+        tests = ['3', '-3', '+2.5', '.5', '5.', '1.23E-3', '-12.3e3', 7, 2.5]
+
+        for val in tests:
+            self.assertEqual(InvenTree.conversion.parse_numeric(val), float(str(val)))
+
+            # The fast path must match the result from pint
+            for unit in [None, 'm', 'W', '°C']:
+                expected = InvenTree.conversion._convert_physical_value(
+                    str(val), unit or ''
+                )
+
+                self.assertAlmostEqual(
+                    InvenTree.conversion.convert_physical_value(val, unit), expected, 6
+                )
+
+        for val in ['3k', '3 m', '1/2', '1e', 'e3', '1K2', '', True]:
+            self.assertIsNone(InvenTree.conversion.parse_numeric(val))
+
+    def test_memoized_conversion(self):
+        """Test that repeated conversions are memoized."""
+        InvenTree.conversion.reload_unit_registry()
+
+        convert = InvenTree.conversion.convert_physical_magnitude
+
+        for _ in range(3):
+            q = InvenTree.conversion.convert_physical_value('3.3 kW', 'W')
+            self.assertAlmostEqual(q, 3300, 3)
+
+        info = convert.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 2)
+
+        # Invalid values are not memoized
+        for _ in range(2):
+            with self.assertRaises(ValidationError):
+                InvenTree.conversion.convert_physical_value('3.3 kW', 'm')
+
+        self.assertEqual(convert.cache_info().currsize, 1)
+
+        # Reloading the registry discards memoized conversions
+        InvenTree.conversion.reload_unit_registry()
+        self.assertEqual(convert.cache_info().currsize, 0)
+
 
 class ValidatorTest(TestCase):
     """Simple tests for custom field validators."""
@@ -1159,6 +1204,57 @@ class CurrencyTests(TestCase):
         with self.assertRaises(MissingRate):
             convert_money(Money(100, 'GBP'), 'ZWL')
 
+    def test_cached_rates(self):
+        """Test currency conversion using the cached exchange rates."""
+        from common.currency import (
+            clear_exchange_rates,
+            convert_currency,
+            exchange_rates,
+            sum_money,
+        )
+
+        clear_exchange_rates()
+
+        with self.assertRaises(MissingRate):
+            convert_currency(Money(100, 'USD'), 'AUD')
+
+        # No conversion is required for the same currency
+        self.assertEqual(convert_currency(Money(100, 'USD'), 'USD'), Money(100, 'USD'))
+
+        backend = ExchangeBackend.objects.create(
+            name='InvenTreeExchange', base_currency='USD'
+        )
+
+        Rate.objects.bulk_create([
+            Rate(currency=currency, value=value, backend=backend)
+            for currency, value in {'AUD': 1.5, 'CAD': 1.7, 'USD': 1.0}.items()
+        ])
+
+        # The cached rates are invalidated when the exchange backend is updated
+        for source, target in [('USD', 'AUD'), ('AUD', 'USD'), ('AUD', 'CAD')]:
+            self.assertEqual(
+                convert_currency(Money(100, source), target),
+                convert_money(Money(100, source), target),
+            )
+
+        with self.assertRaises(MissingRate):
+            convert_currency(Money(100, 'GBP'), 'USD')
+
+        self.assertEqual(
+            sum_money(
+                [Money(150, 'AUD'), None, Money(50, 'USD'), Money(150, 'AUD')], 'USD'
+            ),
+            Money(250, 'USD'),
+        )
+
+        # Outside of testing, the rates are only checked periodically
+        with override_settings(TESTING=False):
+            exchange_rates()
+
+            with self.assertNumQueries(0):
+                for _ in range(10):
+                    convert_currency(Money(100, 'CAD'), 'AUD')
+
 
 class TestStatus(TestCase):
     """Unit tests for status functions."""
@@ -1865,3 +1961,57 @@ class URLCompatibilityTest(InvenTreeTestCase):
             response = self.client.get(old_url)
             self.assertEqual(response.status_code, 302)
             self.assertEqual(response['Location'], new_url)
+
+
+class DatabaseConnectionTest(TestCase):
+    """Unit tests for database connection helpers."""
+
+    @override_settings(Q_CLUSTER={'workers': 2})
+    def test_worker_count(self):
+        """Server workers are limited to the available database connections."""
+        from common.settings import set_global_setting
+
+        options = settings.DATABASES['default']['OPTIONS']
+
+        with mock.patch.dict(options):
+            options.pop('pool', None)
+            self.assertEqual(database.connections_per_process(), 1)
+            self.assertEqual(database.background_connections(), 5)
+
+            with override_settings(DB_MAX_CONNECTIONS=None):
+                self.assertEqual(database.validate_worker_count(9), 9)
+
+            # Background worker connections are also counted
+            with override_settings(DB_MAX_CONNECTIONS=10):
+                self.assertEqual(database.validate_worker_count(9), 5)
+
+            # Worker threads each hold a separate connection
+            set_global_setting('INVENTREE_SEARCH_WORKERS', 4)
+            set_global_setting('INVENTREE_IMPORT_WORKERS', 2)
+            self.assertEqual(database.connections_per_process(), 7)
+
+            with override_settings(DB_MAX_CONNECTIONS=100):
+                self.assertEqual(database.validate_worker_count(9), 9)
+                self.assertEqual(database.validate_worker_count(20), 9)
+
+            options['pool'] = True
+            self.assertEqual(database.connections_per_process(), 4)
+
+            options['pool'] = {'min_size': 2, 'max_size': 8}
+            self.assertEqual(database.connections_per_process(), 8)
+            self.assertEqual(database.background_connections(), 40)
+
+            with override_settings(DB_MAX_CONNECTIONS=100):
+                self.assertEqual(database.validate_worker_count(9), 7)
+                self.assertEqual(database.validate_worker_count(3), 3)
+
+            # Not even a single server process fits within the limit
+            with (
+                override_settings(DB_MAX_CONNECTIONS=45),
+                self.assertRaises(django_exceptions.ImproperlyConfigured),
+            ):
+                database.validate_worker_count(9)
+
+        # No pool is created for the test database
+        self.assertIsNone(database.get_pool())
+        self.assertIsNone(database.get_pool_stats())
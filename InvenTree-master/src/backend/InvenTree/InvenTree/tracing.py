@@ -182,6 +182,11 @@ def setup_instruments(db_engine: str):  # pragma: no cover
             )
         except ModuleNotFoundError:
             pass
+
+        # Connection pool usage (only reported if pooling is enabled)
+        from InvenTree.database import setup_pool_metrics
+
+        setup_pool_metrics()
     elif 'mysql' in db_engine:
         try:
             from opentelemetry.instrumentation.pymysql import PyMySQLInstrumentor
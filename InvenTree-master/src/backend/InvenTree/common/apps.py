@@ -25,6 +25,11 @@ class CommonConfig(AppConfig):
 
         setAppLoaded(self.name)
 
+        # Connect the signals which maintain the search index
+        from common.search import connect_signals
+
+        connect_signals()
+
         if InvenTree.ready.isRunningMigrations():  # pragma: no cover
             return
 
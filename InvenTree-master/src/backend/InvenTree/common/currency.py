@@ -2,12 +2,18 @@
 
 import decimal
 import math
+import threading
+import time
+from collections.abc import Iterable
 from typing import Optional
 
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
 import structlog
+from djmoney.contrib.exchange.exceptions import MissingRate
+from djmoney.money import Money
 from moneyed import CURRENCIES
 
 import InvenTree.helpers
@@ -228,3 +234,137 @@ def get_price(
         cost = pb_cost * quantity
         return InvenTree.helpers.normalize(cost + instance.base_cost)
     return None
+
+
+# Process-wide cache of exchange rates (relative to the exchange backend base currency)
+_exchange_rates = {'version': None, 'checked': None, 'rates': {}}
+_exchange_rates_lock = threading.Lock()
+
+# Interval (in seconds) between checks for exchange rates updated by other processes
+EXCHANGE_RATE_CHECK_INTERVAL = 60
+
+
+def clear_exchange_rates() -> None:
+    """Invalidate the cached exchange rates for this process."""
+    with _exchange_rates_lock:
+        _exchange_rates['version'] = None
+        _exchange_rates['checked'] = None
+        _exchange_rates['rates'] = {}
+
+
+def exchange_rates() -> dict:
+    """Return a table of all exchange rates, relative to the base currency of the exchange backend.
+
+    The rates are loaded from the database once, and cached for this process.
+    The cache is versioned against the 'last_update' timestamp of the exchange backend,
+    which is checked (at most) every EXCHANGE_RATE_CHECK_INTERVAL seconds.
+
+    Returns:
+        A dict of {currency code: rate}
+    """
+    from djmoney.contrib.exchange.models import (
+        ExchangeBackend,
+        Rate,
+        get_default_backend_name,
+    )
+
+    now = time.monotonic()
+
+    with _exchange_rates_lock:
+        checked = _exchange_rates['checked']
+
+        # Note: When testing, the database changes between tests - always check the version
+        if (
+            checked is not None
+            and not settings.TESTING
+            and now - checked < EXCHANGE_RATE_CHECK_INTERVAL
+        ):
+            return _exchange_rates['rates']
+
+        backend_name = get_default_backend_name()
+
+        backend = (
+            ExchangeBackend.objects
+            .filter(name=backend_name)
+            .values('base_currency', 'last_update')
+            .first()
+        )
+
+        version = (
+            (backend['base_currency'], backend['last_update']) if backend else None
+        )
+
+        if checked is None or version != _exchange_rates['version']:
+            rates = {}
+
+            if backend:
+                rates = dict(
+                    Rate.objects.filter(backend=backend_name).values_list(
+                        'currency', 'value'
+                    )
+                )
+                rates.setdefault(backend['base_currency'], decimal.Decimal(1))
+
+            _exchange_rates['version'] = version
+            _exchange_rates['rates'] = rates
+
+        _exchange_rates['checked'] = now
+
+        return _exchange_rates['rates']
+
+
+def exchange_rate(source: str, target: str) -> decimal.Decimal:
+    """Return the exchange rate between two currencies, using the cached exchange rates.
+
+    Raises:
+        MissingRate: If no exchange rate is available
+    """
+    source, target = str(source), str(target)
+
+    if source == target:
+        return decimal.Decimal(1)
+
+    rates = exchange_rates()
+
+    if not rates.get(source) or target not in rates:
+        raise MissingRate(f'Rate {source} -> {target} does not exist')
+
+    return rates[target] / rates[source]
+
+
+def convert_currency(value: Money, currency: str) -> Money:
+    """Convert a Money value into the specified currency, using the cached exchange rates.
+
+    This is a drop-in replacement for djmoney's convert_money function,
+    which does not query the database for each conversion.
+
+    Raises:
+        MissingRate: If no exchange rate is available
+    """
+    return Money(value.amount * exchange_rate(value.currency, currency), currency)
+
+
+def sum_money(values: Iterable[Optional[Money]], currency: str) -> Money:
+    """Sum a collection of Money values, converting the total into the specified currency.
+
+    Values are first summed in their own currency, and then each subtotal is converted once.
+    Empty (None) values are ignored.
+
+    Raises:
+        MissingRate: If no exchange rate is available for any of the provided currencies
+    """
+    subtotals = {}
+
+    for value in values:
+        if value is None:
+            continue
+
+        code = str(value.currency)
+        subtotals[code] = subtotals.get(code, 0) + value.amount
+
+    total = Money(0, currency)
+
+    for code, amount in subtotals.items():
+        total += Money(amount * exchange_rate(code, currency), currency)
+
+    return total
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.9 on 2026-10-19 11:05
+
+from django.db import migrations, models
+
+import common.search
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0041_auto_20251203_1244'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_type', models.CharField(help_text='Type of the indexed model', max_length=100, verbose_name='Model type')),
+                ('model_id', models.PositiveIntegerField(help_text='ID of the indexed model instance', verbose_name='Model ID')),
+                ('field', models.CharField(blank=True, help_text='Search field which provided the value', max_length=250, verbose_name='Field')),
+                ('value', models.TextField(blank=True, help_text='Searchable value', verbose_name='Value')),
+            ],
+            options={
+                'verbose_name': 'Search Entry',
+                'verbose_name_plural': 'Search Entries',
+                'indexes': [models.Index(fields=['model_type', 'model_id'], name='common_sear_model_t_909a53_idx')],
+            },
+        ),
+        migrations.RunPython(
+            common.search.install_search_index,
+            reverse_code=common.search.uninstall_search_index,
+        ),
+    ]
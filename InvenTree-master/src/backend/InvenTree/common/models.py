@@ -43,7 +43,6 @@ import structlog
 from anymail.signals import inbound, tracking
 from django_q.signals import post_spawn
 from djmoney.contrib.exchange.exceptions import MissingRate
-from djmoney.contrib.exchange.models import convert_money
 from opentelemetry import trace
 from rest_framework.exceptions import PermissionDenied
 from taggit.managers import TaggableManager
@@ -58,6 +57,7 @@ import InvenTree.ready
 import InvenTree.tasks
 import InvenTree.validators
 import users.models
+from common.currency import convert_currency
 from common.setting.type import InvenTreeSettingsKeyType, SettingsKeyType
 from common.settings import get_global_setting, global_setting_overrides
 from generic.enums import StringEnum
@@ -1360,7 +1360,7 @@ class PriceBreak(MetaMixin):
             currency_code: The currency code to convert to (e.g "USD" or "AUD")
         """
         try:
-            converted = convert_money(self.price, currency_code)
+            converted = convert_currency(self.price, currency_code)
         except MissingRate:
             logger.warning(
                 'No currency conversion rate available for %s -> %s',
@@ -2199,6 +2199,25 @@ class InvenTreeCustomUserStateModel(models.Model):
                 return cls
 
 
+@receiver(
+    post_save, sender=InvenTreeCustomUserStateModel, dispatch_uid='custom_state_saved'
+)
+@receiver(
+    post_delete,
+    sender=InvenTreeCustomUserStateModel,
+    dispatch_uid='custom_state_deleted',
+)
+def after_custom_state_updated(sender, instance, **kwargs):
+    """Callback when a custom state is updated or deleted."""
+    # Force reload of the custom state registry
+    from generic.states.custom import custom_states
+
+    custom_states.invalidate()
+
+    # Invalidate again once committed, in case the old states were re-cached in the meantime
+    transaction.on_commit(custom_states.invalidate)
+
+
 class SelectionList(InvenTree.models.MetadataMixin, InvenTree.models.InvenTreeModel):
     """Class which represents a list of selectable items for parameters.
 
@@ -2889,6 +2908,28 @@ class DataOutput(models.Model):
 
     errors = models.JSONField(blank=True, null=True)
 
+    # Number of progress updates written to the database over the course of a job
+    PROGRESS_STEPS = 20
+
+    def update_progress(self, progress: int, force: bool = False):
+        """Update the progress of the data output generation process.
+
+        For large jobs, writing every single increment to the database is wasteful,
+        so the progress value is only saved in coarse steps (~5% of the total).
+
+        Arguments:
+            progress (int): The current progress value
+            force (bool, optional): Save the progress value regardless of step size. Defaults to False.
+        """
+        step = max(1, (self.total or 0) // self.PROGRESS_STEPS)
+
+        if progress == self.progress:
+            return
+
+        if force or progress >= self.total or progress - self.progress >= step:
+            self.progress = progress
+            self.save(update_fields=['progress'])
+
     def mark_complete(self, progress: int = 100, output: Optional[ContentFile] = None):
         """Mark the data output generation process as complete.
 
@@ -2923,6 +2964,49 @@ class DataOutput(models.Model):
         self.save()
 
 
+class SearchEntry(models.Model):
+    """A single searchable value in the search index.
+
+    Each indexed model instance is represented by one entry for each value of each
+    indexed search field (including the values of related fields, e.g. the SKU of each supplier part).
+    Database-specific indexes for these entries are created by the migration (refer to common.search).
+
+    Attributes:
+        model_type: The type of the indexed model (e.g. 'part.part')
+        model_id: The ID of the indexed model instance
+        field: The search field which provided the value (e.g. 'category__name')
+        value: The searchable value
+    """
+
+    class Meta:
+        """Metaclass options."""
+
+        verbose_name = _('Search Entry')
+        verbose_name_plural = _('Search Entries')
+        indexes = [models.Index(fields=['model_type', 'model_id'])]
+
+    model_type = models.CharField(
+        max_length=100,
+        verbose_name=_('Model type'),
+        help_text=_('Type of the indexed model'),
+    )
+
+    model_id = models.PositiveIntegerField(
+        verbose_name=_('Model ID'), help_text=_('ID of the indexed model instance')
+    )
+
+    field = models.CharField(
+        max_length=250,
+        blank=True,
+        verbose_name=_('Field'),
+        help_text=_('Search field which provided the value'),
+    )
+
+    value = models.TextField(
+        blank=True, verbose_name=_('Value'), help_text=_('Searchable value')
+    )
+
+
 # region Email
 class Priority(models.IntegerChoices):
     """Enumeration for defining email priority levels."""
@@ -0,0 +1,766 @@
+"""Indexed search for API list endpoints.
+
+The InvenTreeSearchFilter performs a separate 'icontains' (or regex) lookup for each search field,
+many of which span joined tables (e.g. the name of the part category, or the SKU of each supplier part).
+For the models registered here, the values of the search fields are instead stored in a single
+SearchEntry table, which is indexed according to the database backend:
+
+- PostgreSQL: trigram (GIN) indexes on the search values, and a generated tsvector column for ranking
+- SQLite: an FTS5 'shadow' table (using the trigram tokenizer), maintained by triggers
+
+Search index entries are maintained as indexed model instances (and related instances) are changed.
+Index updates are only scheduled if one of the fields which the index depends on has changed.
+Changes which bypass model signals (e.g. bulk queryset updates) are picked up by the
+'rebuild_search_index' management command.
+
+Until the index for a particular model has been built, searches fall back to the standard search filter.
+"""
+
+import time
+from typing import Optional
+
+from django.apps import apps
+from django.db import connection, transaction
+from django.db.models import Case, F, FloatField, OuterRef, Subquery, Sum, Value, When
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.db.utils import OperationalError, ProgrammingError
+
+import structlog
+
+import InvenTree.ready
+import InvenTree.tasks
+
+logger = structlog.get_logger('inventree')
+
+# Search fields which are indexed, for each model type
+# Fields must match (or be a superset of) the 'search_fields' of the corresponding API endpoints
+SEARCH_INDEXES = {
+    'company.company': ['name', 'description', 'website', 'tax_id'],
+    'part.part': [
+        'name',
+        'description',
+        'IPN',
+        'revision',
+        'keywords',
+        'category__name',
+        'manufacturer_parts__MPN',
+        'supplier_parts__SKU',
+        'tags__name',
+        'tags__slug',
+    ],
+    'part.partcategory': ['name', 'description', 'pathstring'],
+    'stock.stockitem': [
+        'serial',
+        'batch',
+        'location__name',
+        'part__name',
+        'part__IPN',
+        'part__description',
+        'supplier_part__SKU',
+        'supplier_part__supplier__name',
+        'supplier_part__manufacturer_part__MPN',
+        'supplier_part__manufacturer_part__manufacturer__name',
+        'tags__name',
+        'tags__slug',
+    ],
+    'stock.stocklocation': [
+        'name',
+        'description',
+        'pathstring',
+        'tags__name',
+        'tags__slug',
+    ],
+}
+
+# Field value which marks the search index for a model type as complete
+READY_FIELD = ''
+
+# Number of model instances which are indexed in a single pass
+INDEX_BATCH_SIZE = 500
+
+# Time (seconds) for which a missing search index is remembered, before checking again
+READY_CHECK_INTERVAL = 60
+
+# Tables used by the SQLite backend
+SQLITE_FTS_TABLE = 'common_searchentry_fts'
+
+
+class SearchBackend:
+    """Database-specific search operations.
+
+    The base class performs unindexed lookups against the SearchEntry table.
+    """
+
+    vendor = None
+
+    def install(self, schema_editor):
+        """Create the database-specific search index (called from a migration)."""
+
+    def uninstall(self, schema_editor):
+        """Remove the database-specific search index (called from a migration)."""
+
+    def is_installed(self) -> bool:
+        """Return True if the database-specific search index is present."""
+        return False
+
+    def match(self, entries, lookup: str, term: str):
+        """Filter the provided entries against a single search term."""
+        return entries.filter(**{f'value__{lookup}': term})
+
+    def rank(self, lookup: str, term: str):
+        """Return an expression which ranks each matching entry against the search term."""
+        if lookup != 'icontains':
+            return Value(0.0)
+
+        return Case(
+            When(value__iexact=term, then=Value(2.0)),
+            When(value__istartswith=term, then=Value(1.0)),
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+
+
+class PostgresSearchBackend(SearchBackend):
+    """Search index for PostgreSQL databases.
+
+    - 'icontains' and regex lookups are served by trigram (GIN) indexes
+    - Entries are additionally ranked against a generated tsvector column
+    """
+
+    vendor = 'postgresql'
+
+    def install(self, schema_editor):
+        """Create the trigram and tsvector indexes."""
+        try:
+            with transaction.atomic(using=schema_editor.connection.alias):
+                schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        except (OperationalError, ProgrammingError):
+            logger.warning(
+                'Could not enable the pg_trgm extension - search index not installed'
+            )
+            return
+
+        for statement in [
+            "ALTER TABLE common_searchentry ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (to_tsvector('simple', value)) STORED",
+            'CREATE INDEX common_searchentry_vector ON common_searchentry USING gin (search_vector)',
+            'CREATE INDEX common_searchentry_trgm ON common_searchentry USING gin (value gin_trgm_ops)',
+            'CREATE INDEX common_searchentry_upper_trgm ON common_searchentry USING gin (UPPER(value) gin_trgm_ops)',
+        ]:
+            schema_editor.execute(statement)
+
+    def uninstall(self, schema_editor):
+        """Remove the trigram and tsvector indexes."""
+        for statement in [
+            'DROP INDEX IF EXISTS common_searchentry_upper_trgm',
+            'DROP INDEX IF EXISTS common_searchentry_trgm',
+            'DROP INDEX IF EXISTS common_searchentry_vector',
+            'ALTER TABLE common_searchentry DROP COLUMN IF EXISTS search_vector',
+        ]:
+            schema_editor.execute(statement)
+
+    def is_installed(self) -> bool:
+        """Check for the generated tsvector column."""
+        with connection.cursor() as cursor:
+            columns = connection.introspection.get_table_description(
+                cursor, 'common_searchentry'
+            )
+
+        return any(column.name == 'search_vector' for column in columns)
+
+    def rank(self, lookup: str, term: str):
+        """Rank entries by text search relevance, in addition to exact and prefix matches."""
+        if lookup != 'icontains':
+            return super().rank(lookup, term)
+
+        return super().rank(lookup, term) + RawSQL(
+            "ts_rank(search_vector, plainto_tsquery('simple', %s))",
+            [term],
+            output_field=FloatField(),
+        )
+
+
+class SqliteSearchBackend(SearchBackend):
+    """Search index for SQLite databases.
+
+    - An FTS5 table (using the trigram tokenizer) shadows the SearchEntry table
+    - The FTS5 table is kept in sync by triggers on the SearchEntry table
+    - 'icontains' lookups of at least three characters are served by the FTS5 table
+    """
+
+    vendor = 'sqlite'
+
+    # The trigram tokenizer only indexes terms of at least three characters
+    MIN_TERM_LENGTH = 3
+
+    def install(self, schema_editor):
+        """Create the FTS5 table and triggers."""
+        try:
+            schema_editor.execute(
+                f"CREATE VIRTUAL TABLE {SQLITE_FTS_TABLE} USING fts5(value, content='common_searchentry', content_rowid='id', tokenize='trigram')"
+            )
+        except OperationalError:
+            logger.warning(
+                'SQLite FTS5 trigram tokenizer not available - search index not installed'
+            )
+            return
+
+        for statement in [
+            f'CREATE TRIGGER common_searchentry_ai AFTER INSERT ON common_searchentry BEGIN INSERT INTO {SQLITE_FTS_TABLE}(rowid, value) VALUES (new.id, new.value); END',
+            f"CREATE TRIGGER common_searchentry_ad AFTER DELETE ON common_searchentry BEGIN INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, value) VALUES ('delete', old.id, old.value); END",
+            f"CREATE TRIGGER common_searchentry_au AFTER UPDATE ON common_searchentry BEGIN INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, value) VALUES ('delete', old.id, old.value); INSERT INTO {SQLITE_FTS_TABLE}(rowid, value) VALUES (new.id, new.value); END",
+        ]:
+            schema_editor.execute(statement)
+
+    def uninstall(self, schema_editor):
+        """Remove the FTS5 table and triggers."""
+        for statement in [
+            'DROP TRIGGER IF EXISTS common_searchentry_ai',
+            'DROP TRIGGER IF EXISTS common_searchentry_ad',
+            'DROP TRIGGER IF EXISTS common_searchentry_au',
+            f'DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}',
+        ]:
+            schema_editor.execute(statement)
+
+    def is_installed(self) -> bool:
+        """Check for the FTS5 table."""
+        with connection.cursor() as cursor:
+            return SQLITE_FTS_TABLE in connection.introspection.table_names(cursor)
+
+    def match(self, entries, lookup: str, term: str):
+        """Use the FTS5 table for substring matches."""
+        if lookup != 'icontains' or len(term) < self.MIN_TERM_LENGTH:
+            return super().match(entries, lookup, term)
+
+        # Quote the term, so that it is matched as a literal string
+        phrase = '"' + term.replace('"', '""') + '"'
+
+        return entries.filter(
+            pk__in=RawSQL(
+                f'SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH %s',
+                [phrase],
+            )
+        )
+
+
+SEARCH_BACKENDS = {
+    backend.vendor: backend
+    for backend in [PostgresSearchBackend(), SqliteSearchBackend()]
+}
+
+_backend_installed: Optional[bool] = None
+
+
+def get_backend(vendor: Optional[str] = None) -> Optional[SearchBackend]:
+    """Return the search backend for the provided database vendor (or the default connection)."""
+    return SEARCH_BACKENDS.get(vendor or connection.vendor)
+
+
+def get_installed_backend() -> Optional[SearchBackend]:
+    """Return the search backend for the default database, if the search index is installed."""
+    global _backend_installed
+
+    backend = get_backend()
+
+    if backend is None:
+        return None
+
+    if _backend_installed is None:
+        try:
+            _backend_installed = backend.is_installed()
+        except (OperationalError, ProgrammingError):
+            return None
+
+    return backend if _backend_installed else None
+
+
+def install_search_index(apps, schema_editor):
+    """Create the database-specific search index (migration operation)."""
+    if backend := get_backend(schema_editor.connection.vendor):
+        backend.install(schema_editor)
+
+
+def uninstall_search_index(apps, schema_editor):
+    """Remove the database-specific search index (migration operation)."""
+    if backend := get_backend(schema_editor.connection.vendor):
+        backend.uninstall(schema_editor)
+
+
+class SearchIndex:
+    """Search index for a single model type."""
+
+    def __init__(self, model_type: str, fields: list[str]):
+        """Initialize the search index for the provided model type and search fields."""
+        self.model_type = model_type
+        self.fields = fields
+        self.ready_checked = None
+
+    @property
+    def model(self):
+        """Return the indexed model class."""
+        return apps.get_model(self.model_type)
+
+    def entries(self):
+        """Return a queryset of all search entries for this index."""
+        from common.models import SearchEntry
+
+        return SearchEntry.objects.filter(model_type=self.model_type)
+
+    def is_ready(self) -> bool:
+        """Return True if the search index for this model type has been built.
+
+        A positive result is remembered for the lifetime of the process.
+        """
+        if self.ready_checked is True:
+            return True
+
+        now = time.monotonic()
+
+        if self.ready_checked and now - self.ready_checked < READY_CHECK_INTERVAL:
+            return False
+
+        if self.entries().filter(field=READY_FIELD).exists():
+            self.ready_checked = True
+        else:
+            self.ready_checked = now
+
+        return self.ready_checked is True
+
+    def supports(self, search_fields: list[str]) -> bool:
+        """Return True if the provided search fields can be served from this index.
+
+        Only plain ('icontains') or regex ('$') lookups are supported.
+        """
+        return all(field.removeprefix('$') in self.fields for field in search_fields)
+
+    def build_entries(self, ids) -> list:
+        """Construct the search entries for the provided model instances."""
+        from common.models import SearchEntry
+
+        queryset = self.model._base_manager.filter(pk__in=ids).order_by()
+        entries = []
+
+        for field in self.fields:
+            for pk, value in queryset.values_list('pk', field).distinct():
+                if value is None or value == '':
+                    continue
+
+                entries.append(
+                    SearchEntry(
+                        model_type=self.model_type,
+                        model_id=pk,
+                        field=field,
+                        value=str(value),
+                    )
+                )
+
+        return entries
+
+    def update(self, ids) -> int:
+        """Update the search entries for the provided model instances.
+
+        Returns:
+            The number of search entries which were created
+        """
+        from common.models import SearchEntry
+
+        if not self.is_ready():
+            return 0
+
+        ids = list(ids)
+        count = 0
+
+        for idx in range(0, len(ids), INDEX_BATCH_SIZE):
+            chunk = ids[idx : idx + INDEX_BATCH_SIZE]
+
+            with transaction.atomic():
+                self.entries().filter(model_id__in=chunk).exclude(
+                    field=READY_FIELD
+                ).delete()
+                count += len(SearchEntry.objects.bulk_create(self.build_entries(chunk)))
+
+        return count
+
+    def rebuild(self) -> int:
+        """Rebuild the search index for all instances of this model type.
+
+        Returns:
+            The number of search entries which were created
+        """
+        from common.models import SearchEntry
+
+        ids = list(self.model._base_manager.order_by('pk').values_list('pk', flat=True))
+
+        count = 0
+
+        with transaction.atomic():
+            self.entries().delete()
+
+            for idx in range(0, len(ids), INDEX_BATCH_SIZE):
+                entries = self.build_entries(ids[idx : idx + INDEX_BATCH_SIZE])
+                count += len(SearchEntry.objects.bulk_create(entries))
+
+            SearchEntry.objects.create(
+                model_type=self.model_type, model_id=0, field=READY_FIELD
+            )
+
+        self.ready_checked = True
+
+        return count
+
+    def search(self, queryset, search_fields: list[str], search_terms: list[str]):
+        """Filter (and rank) the provided queryset against the search index.
+
+        As with the standard search filter, each term must match at least one of the search fields.
+        Matching results are annotated with a 'search_rank' value, which is higher for:
+
+        - Matches against earlier search fields (e.g. 'name' ranks above 'description')
+        - Exact and prefix matches
+        - Text search relevance (PostgreSQL only)
+        """
+        backend = get_installed_backend()
+
+        regex = any(field.startswith('$') for field in search_fields)
+        lookup = 'iregex' if regex else 'icontains'
+        fields = [field.removeprefix('$') for field in search_fields]
+
+        entries = self.entries().filter(field__in=fields)
+
+        weight = Case(
+            *[
+                When(field=field, then=Value(float(len(fields) - idx)))
+                for idx, field in enumerate(fields)
+            ],
+            default=Value(0.0),
+            output_field=FloatField(),
+        )
+
+        rank = Value(0.0)
+
+        for term in search_terms:
+            matches = backend.match(entries, lookup, term)
+
+            queryset = queryset.filter(pk__in=matches.values('model_id'))
+
+            term_rank = Subquery(
+                matches
+                .filter(model_id=OuterRef('pk'))
+                .order_by()
+                .values('model_id')
+                .annotate(rank=Sum(weight + backend.rank(lookup, term)))
+                .values('rank')[:1],
+                output_field=FloatField(),
+            )
+
+            rank = rank + Coalesce(term_rank, Value(0.0))
+
+        return queryset.annotate(search_rank=rank).order_by(F('search_rank').desc())
+
+
+SEARCH_INDEX_REGISTRY = {
+    model_type: SearchIndex(model_type, fields)
+    for model_type, fields in SEARCH_INDEXES.items()
+}
+
+
+def get_search_index(model) -> Optional[SearchIndex]:
+    """Return the search index for the provided model, if it is available for searching."""
+    return get_available_index(model._meta.label_lower)
+
+
+def get_available_index(model_type: str) -> Optional[SearchIndex]:
+    """Return the search index for the provided model type, if it has been installed and built."""
+    index = SEARCH_INDEX_REGISTRY.get(model_type)
+
+    if index is None or get_installed_backend() is None:
+        return None
+
+    try:
+        if not index.is_ready():
+            return None
+    except (OperationalError, ProgrammingError):
+        return None
+
+    return index
+
+
+def get_dependencies() -> dict[str, list[tuple[str, str]]]:
+    """Return the related model types which affect each search index.
+
+    Returns:
+        A dict of {related model type: [(indexed model type, lookup), ...]}
+        where 'lookup' filters the indexed model by the primary key of the related model
+    """
+    dependencies = {}
+
+    for model_type, fields in SEARCH_INDEXES.items():
+        model = apps.get_model(model_type)
+
+        for field in fields:
+            path = field.split('__')
+            current = model
+
+            for idx in range(len(path) - 1):
+                current = current._meta.get_field(path[idx]).related_model
+                lookup = '__'.join(path[: idx + 1])
+
+                dependency = (model_type, lookup)
+                related = dependencies.setdefault(current._meta.label_lower, [])
+
+                if dependency not in related:
+                    related.append(dependency)
+
+    return dependencies
+
+
+_dependencies = None
+
+
+def dependencies_for(model) -> list[tuple[str, str]]:
+    """Return the (indexed model type, lookup) pairs affected by the provided model."""
+    global _dependencies
+
+    if _dependencies is None:
+        _dependencies = get_dependencies()
+
+    return _dependencies.get(model._meta.label_lower, [])
+
+
+def get_tracked_fields() -> dict[str, dict[tuple[str, Optional[str]], set[str]]]:
+    """Return the database fields which affect each search index, for each model type.
+
+    Returns:
+        A dict of {model type: {(indexed model type, lookup): {field attname, ...}}}
+        where 'lookup' is None for the fields of the indexed model itself
+    """
+    tracked = {}
+
+    def track(model, key, attname):
+        tracked.setdefault(model._meta.label_lower, {}).setdefault(key, set()).add(
+            attname
+        )
+
+    for model_type, fields in SEARCH_INDEXES.items():
+        model = apps.get_model(model_type)
+
+        for field in fields:
+            path = field.split('__')
+            current = model
+
+            for idx, name in enumerate(path):
+                field_obj = current._meta.get_field(name)
+                key = (model_type, '__'.join(path[:idx]) or None)
+
+                # Tags (many-to-many) are tracked by the m2m_changed signal
+                if field_obj.concrete and not field_obj.many_to_many:
+                    track(current, key, field_obj.attname)
+
+                if idx == len(path) - 1:
+                    break
+
+                related = field_obj.related_model
+
+                # Reverse relations are changed by the foreign key of the related model
+                if field_obj.auto_created and not field_obj.concrete:
+                    track(
+                        related,
+                        (model_type, '__'.join(path[: idx + 1])),
+                        field_obj.field.attname,
+                    )
+
+                current = related
+
+    return tracked
+
+
+_tracked_fields = None
+
+
+def tracked_fields_for(model) -> dict[tuple[str, Optional[str]], set[str]]:
+    """Return the tracked fields of the provided model, for each affected search index."""
+    global _tracked_fields
+
+    if _tracked_fields is None:
+        _tracked_fields = get_tracked_fields()
+
+    return _tracked_fields.get(model._meta.label_lower, {})
+
+
+def offload_update(model_type: str, ids=None, lookup: Optional[str] = None, value=None):
+    """Update the search index for the specified instances, once the transaction is committed.
+
+    No task is offloaded if the search index is not installed, or has not yet been built
+    (the index is populated in full when it is built).
+    """
+    from common.tasks import update_search_index
+
+    if get_available_index(model_type) is None:
+        return
+
+    transaction.on_commit(
+        lambda: InvenTree.tasks.offload_task(
+            update_search_index,
+            model_type,
+            ids=ids,
+            lookup=lookup,
+            value=value,
+            group='search',
+        )
+    )
+
+
+def index_signals_enabled() -> bool:
+    """Return True if search index signals should be processed."""
+    return not (
+        InvenTree.ready.isImportingData() or InvenTree.ready.isRunningMigrations()
+    )
+
+
+def available_tracked_fields(model) -> set[str]:
+    """Return the tracked fields of the provided model which affect an available search index.
+
+    Saving a change to any of these fields (via the save signals) updates the search index.
+    """
+    if not index_signals_enabled():
+        return set()
+
+    return set().union(
+        *(
+            attnames
+            for (model_type, _lookup), attnames in tracked_fields_for(model).items()
+            if get_available_index(model_type)
+        )
+    )
+
+
+def before_model_saved(sender, instance, raw=False, **kwargs):
+    """Record the tracked field values of an existing instance, before it is saved.
+
+    The values are only loaded if one of the affected search indexes is available.
+    """
+    if raw or instance._state.adding or not instance.pk:
+        return
+
+    if not index_signals_enabled():
+        return
+
+    tracked = tracked_fields_for(sender)
+
+    if not any(get_available_index(model_type) for model_type, _lookup in tracked):
+        return
+
+    fields = set().union(*tracked.values())
+
+    instance._search_index_values = (
+        sender._base_manager.filter(pk=instance.pk).values(*fields).first()
+    )
+
+
+def after_model_saved(sender, instance, raw=False, **kwargs):
+    """Update the search index when an indexed (or related) model instance is saved.
+
+    If the previous values of the instance were recorded, only the search indexes
+    which depend on a changed field are updated.
+    """
+    if raw or not index_signals_enabled():
+        return
+
+    previous = instance.__dict__.pop('_search_index_values', None)
+    tracked = tracked_fields_for(sender)
+
+    def changed(model_type, lookup=None) -> bool:
+        if previous is None:
+            return True
+
+        return any(
+            previous.get(attname) != getattr(instance, attname)
+            for attname in tracked.get((model_type, lookup), [])
+        )
+
+    model_type = sender._meta.label_lower
+
+    if model_type in SEARCH_INDEXES and changed(model_type):
+        if 'pathstring' in SEARCH_INDEXES[model_type] and (
+            previous is None or previous.get('pathstring') != instance.pathstring
+        ):
+            # The pathstring of any child items may also have changed
+            offload_update(model_type, lookup='tree_id', value=instance.tree_id)
+        else:
+            offload_update(model_type, ids=[instance.pk])
+
+    for indexed_type, lookup in dependencies_for(sender):
+        if changed(indexed_type, lookup):
+            offload_update(indexed_type, lookup=lookup, value=instance.pk)
+
+
+def before_model_deleted(sender, instance, **kwargs):
+    """Update the search index for any indexed instances which relate to a deleted instance."""
+    if not index_signals_enabled():
+        return
+
+    for indexed_type, lookup in dependencies_for(sender):
+        index = SEARCH_INDEX_REGISTRY[indexed_type]
+
+        if not index.is_ready():
+            continue
+
+        ids = list(
+            index.model._base_manager
+            .filter(**{lookup: instance.pk})
+            .values_list('pk', flat=True)
+            .distinct()
+        )
+
+        if ids:
+            offload_update(indexed_type, ids=ids)
+
+
+def after_model_deleted(sender, instance, **kwargs):
+    """Remove a deleted instance from the search index."""
+    if not index_signals_enabled():
+        return
+
+    if sender._meta.label_lower in SEARCH_INDEXES:
+        offload_update(sender._meta.label_lower, ids=[instance.pk])
+
+
+def after_tags_changed(sender, instance, action, reverse=False, **kwargs):
+    """Update the search index when the tags of an indexed instance are changed."""
+    if reverse or action not in ['post_add', 'post_remove', 'post_clear']:
+        return
+
+    if not index_signals_enabled():
+        return
+
+    model_type = instance._meta.label_lower
+
+    if model_type in SEARCH_INDEXES:
+        offload_update(model_type, ids=[instance.pk])
+
+
+def connect_signals():
+    """Connect the signals which maintain the search index.
+
+    Signals are only connected for the indexed models, and the related models which they depend on.
+    """
+    from taggit.models import TaggedItem
+
+    for model_type in {*SEARCH_INDEXES.keys(), *get_dependencies().keys()}:
+        model = apps.get_model(model_type)
+        uid = f'search_index_{model_type}'
+
+        pre_save.connect(before_model_saved, sender=model, dispatch_uid=uid)
+        post_save.connect(after_model_saved, sender=model, dispatch_uid=uid)
+        pre_delete.connect(before_model_deleted, sender=model, dispatch_uid=uid)
+        post_delete.connect(after_model_deleted, sender=model, dispatch_uid=uid)
+
+    m2m_changed.connect(
+        after_tags_changed, sender=TaggedItem, dispatch_uid='search_index_tags'
+    )
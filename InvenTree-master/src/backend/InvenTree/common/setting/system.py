@@ -345,6 +345,31 @@ SYSTEM_SETTINGS: dict[str, InvenTreeSettingsKeyType] = {
         'default': False,
         'validator': bool,
     },
+    'INVENTREE_IMPORT_WORKERS': {
+        'name': _('Data Import Workers'),
+        'description': _(
+            'Number of worker threads used to validate imported data rows in parallel'
+        ),
+        'default': 1,
+        'validator': [int, MinValueValidator(1), MaxValueValidator(16)],
+    },
+    'INVENTREE_SEARCH_WORKERS': {
+        'name': _('Search Workers'),
+        'description': _(
+            'Number of worker threads used to search separate models in parallel'
+        ),
+        'default': 1,
+        'validator': [int, MinValueValidator(1), MaxValueValidator(16)],
+    },
+    'INVENTREE_SEARCH_TIMEOUT': {
+        'name': _('Search Timeout'),
+        'description': _(
+            'Maximum time allowed for searching each model, before the search results are discarded'
+        ),
+        'units': _('seconds'),
+        'default': 10,
+        'validator': [int, MinValueValidator(1), MaxValueValidator(300)],
+    },
     'BARCODE_ENABLE': {
         'name': _('Barcode Support'),
         'description': _('Enable barcode scanner support in the web interface'),
@@ -609,6 +634,23 @@ SYSTEM_SETTINGS: dict[str, InvenTreeSettingsKeyType] = {
         'default': 30,
         'validator': [int, MinValueValidator(0)],
     },
+    'PRICING_UPDATE_BATCH_SIZE': {
+        'name': _('Pricing Update Batch Size'),
+        'description': _(
+            'Number of parts for which pricing is recalculated in each background task'
+        ),
+        'default': 500,
+        'validator': [int, MinValueValidator(1), MaxValueValidator(10000)],
+    },
+    'PRICING_UPDATE_BATCH_DELAY': {
+        'name': _('Pricing Update Delay'),
+        'description': _(
+            'Minimum delay between consecutive pricing update batches (zero to disable)'
+        ),
+        'units': _('seconds'),
+        'default': 0,
+        'validator': [int, MinValueValidator(0), MaxValueValidator(600)],
+    },
     'PART_INTERNAL_PRICE': {
         'name': _('Internal Prices'),
         'description': _('Enable internal prices for parts'),
@@ -661,6 +703,14 @@ SYSTEM_SETTINGS: dict[str, InvenTreeSettingsKeyType] = {
         'default': 'A4',
         'choices': report.helpers.report_page_size_options,
     },
+    'REPORT_RENDER_WORKERS': {
+        'name': _('Report Render Workers'),
+        'description': _(
+            'Number of worker processes used to render separate PDF reports in parallel'
+        ),
+        'default': 1,
+        'validator': [int, MinValueValidator(1), MaxValueValidator(16)],
+    },
     'PARAMETER_ENFORCE_UNITS': {
         'name': _('Enforce Parameter Units'),
         'description': _(
@@ -2,6 +2,7 @@
 
 import os
 from datetime import timedelta
+from typing import Optional
 
 from django.conf import settings
 from django.core.exceptions import AppRegistryNotReady
@@ -174,6 +175,57 @@ def delete_old_notes_images():
             os.remove(os.path.join(notes_dir, image))
 
 
+@tracer.start_as_current_span('log_barcode_scan')
+def log_barcode_scan(
+    data: str,
+    user_id: Optional[int] = None,
+    endpoint: Optional[str] = None,
+    response=None,
+    result: bool = False,
+    context=None,
+):
+    """Store the result of a barcode scan in the database.
+
+    This task is offloaded from the barcode API endpoints,
+    so that scanning is not slowed down by writing (and pruning) the scan history.
+
+    Arguments:
+        data: The scanned barcode data
+        user_id: ID of the user who scanned the barcode
+        endpoint: URL endpoint which processed the barcode
+        response: Response data from the barcode scan (JSON encodable)
+        result: Was the barcode scan successful?
+        context: Context data for the barcode scan (JSON encodable)
+    """
+    from common.models import BarcodeScanResult
+    from common.settings import get_global_setting
+
+    # Ensure data is not too long
+    data = data[: BarcodeScanResult.BARCODE_SCAN_MAX_LEN]
+
+    BarcodeScanResult.objects.create(
+        data=data,
+        user_id=user_id,
+        endpoint=endpoint,
+        response=response,
+        result=result,
+        context=context,
+    )
+
+    # Ensure that we do not store too many scans
+    max_scans = int(get_global_setting('BARCODE_RESULTS_MAX_NUM', create=False))
+    num_scans = BarcodeScanResult.objects.count()
+
+    if num_scans > max_scans:
+        n = num_scans - max_scans
+        old_scan_ids = list(
+            BarcodeScanResult.objects.all()
+            .order_by('timestamp')
+            .values_list('pk', flat=True)[:n]
+        )
+        BarcodeScanResult.objects.filter(pk__in=old_scan_ids).delete()
+
+
 @tracer.start_as_current_span('rebuild_parameters')
 def rebuild_parameters(template_id):
     """Rebuild all parameters for a given template.
@@ -204,3 +256,30 @@ def rebuild_parameters(template_id):
 
     if n > 0:
         logger.info("Rebuilt %s parameters for template '%s'", n, template.name)
+
+
+def update_search_index(model_type: str, ids=None, lookup=None, value=None):
+    """Update the search index for the specified model instances.
+
+    Arguments:
+        model_type: The indexed model type (e.g. 'part.part')
+        ids: List of model instance IDs to update
+        lookup: Alternatively, a lookup which selects the model instances to update
+        value: The value for the provided lookup
+    """
+    from common.search import SEARCH_INDEX_REGISTRY
+
+    index = SEARCH_INDEX_REGISTRY.get(model_type)
+
+    if index is None or not index.is_ready():
+        return
+
+    if lookup:
+        ids = (
+            index.model._base_manager
+            .filter(**{lookup: value})
+            .values_list('pk', flat=True)
+            .distinct()
+        )
+
+    index.update(ids or [])
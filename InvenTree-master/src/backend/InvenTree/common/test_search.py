@@ -0,0 +1,157 @@
+"""Tests for the indexed search backend."""
+
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from common.models import SearchEntry
+from common.search import (
+    SEARCH_INDEX_REGISTRY,
+    after_model_saved,
+    before_model_saved,
+    get_search_index,
+)
+from InvenTree.filters import InvenTreeSearchFilter
+from part.api import CategoryList, PartList
+from part.models import Part, PartCategory
+from stock.api import StockList
+from stock.models import StockItem
+
+
+class SearchIndexTest(TestCase):
+    """Tests for the search index, and the InvenTreeSearchFilter."""
+
+    fixtures = [
+        'category',
+        'part',
+        'location',
+        'company',
+        'manufacturer_part',
+        'supplier_part',
+        'stock',
+    ]
+
+    def tearDown(self):
+        """Reset the (process-level) ready state of each search index."""
+        for index in SEARCH_INDEX_REGISTRY.values():
+            index.ready_checked = None
+
+        super().tearDown()
+
+    def search(self, view, model, **params):
+        """Return the list of IDs returned by the search filter."""
+        request = Request(APIRequestFactory().get('/', params))
+        queryset = InvenTreeSearchFilter().filter_queryset(
+            request, model._base_manager.all(), view()
+        )
+        return list(queryset.values_list('pk', flat=True))
+
+    def test_search(self):
+        """Search results from the index match the standard search filter."""
+        queries = [
+            {'search': 'M2x4'},
+            {'search': 'resistor'},
+            {'search': 'res 0805'},
+            {'search': 'mech'},
+            {'search': 'ACME'},
+            {'search': '10'},
+            {'search': 'elec'},
+            {'search': 'wid', 'search_regex': True},
+            {'search': '^R', 'search_regex': True},
+        ]
+
+        views = [(PartList, Part), (StockList, StockItem), (CategoryList, PartCategory)]
+
+        self.assertIsNone(get_search_index(Part))
+
+        expected = [
+            [set(self.search(view, model, **query)) for query in queries]
+            for view, model in views
+        ]
+
+        call_command('rebuild_search_index')
+
+        self.assertIsNotNone(get_search_index(Part))
+        self.assertTrue(
+            SearchEntry.objects.filter(
+                model_type='part.part', field='supplier_parts__SKU'
+            ).exists()
+        )
+
+        for (view, model), results in zip(views, expected):
+            for query, result in zip(queries, results):
+                self.assertEqual(set(self.search(view, model, **query)), result, query)
+
+        # Search fields which are not indexed fall back to the standard filter
+        self.assertEqual(
+            set(self.search(PartList, Part, search='M2x4', search_notes=True)),
+            expected[0][0],
+        )
+
+    def test_ranking(self):
+        """Matches against earlier search fields are ranked first."""
+        call_command('rebuild_search_index', 'part.part')
+
+        part = Part._base_manager.get(pk=1)
+        other = Part._base_manager.get(pk=2)
+
+        Part._base_manager.filter(pk=other.pk).update(
+            description=f'Similar to {part.name}'
+        )
+
+        SEARCH_INDEX_REGISTRY['part.part'].update([other.pk])
+
+        results = self.search(PartList, Part, search=part.name)
+
+        self.assertIn(other.pk, results)
+        self.assertEqual(results[0], part.pk)
+
+    def test_index_updates(self):
+        """Index updates are only offloaded if the search index is available."""
+        part = Part.objects.first()
+
+        def save_part(**values):
+            """Signal that the part was saved, and return the mocked offload_task function."""
+            with (
+                mock.patch('InvenTree.tasks.offload_task') as offload,
+                self.captureOnCommitCallbacks(execute=True),
+            ):
+                before_model_saved(Part, part)
+
+                for key, value in values.items():
+                    setattr(part, key, value)
+
+                after_model_saved(Part, part)
+
+            return offload
+
+        # The search index has not been built
+        save_part().assert_not_called()
+
+        call_command('rebuild_search_index')
+
+        # Only changes to indexed fields update the search index
+        save_part(minimum_stock=10).assert_not_called()
+
+        offload = save_part(name='Renamed part')
+        updated = {
+            (call.args[1], call.kwargs['lookup']) for call in offload.call_args_list
+        }
+        self.assertEqual(updated, {('part.part', None), ('stock.stockitem', 'part')})
+
+        # Without recorded values, the instance (and dependent indexes) are updated
+        with (
+            mock.patch('InvenTree.tasks.offload_task') as offload,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            after_model_saved(Part, part)
+
+        self.assertTrue(offload.called)
+
+        # The search index is not installed
+        with mock.patch('common.search.get_installed_backend', return_value=None):
+            save_part(name='Another name').assert_not_called()
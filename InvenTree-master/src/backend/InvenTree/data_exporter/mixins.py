@@ -1,10 +1,11 @@
 """Mixin classes for the exporter app."""
 
 from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from django.core.exceptions import ValidationError
-from django.core.files.base import ContentFile
+from django.core.files import File
 from django.utils.translation import gettext_lazy as _
 
 import structlog
@@ -15,6 +16,7 @@ from taggit.serializers import TagListSerializerField
 
 import data_exporter.serializers
 import data_exporter.tasks
+import data_exporter.writers
 import InvenTree.exceptions
 from common.models import DataOutput
 from InvenTree.helpers import str2bool
@@ -209,6 +211,34 @@ class DataExportSerializerMixin:
 
         return dataset.export(file_format)
 
+    def write_export_file(
+        self, data: Iterable[dict], headers: OrderedDict, file_format
+    ) -> File:
+        """Write the exported data to a temporary file in the specified format.
+
+        Unlike export_to_file(), rows are written to the file incrementally,
+        so the exported data does not need to be held in memory.
+
+        Arguments:
+            data: Iterable of serialized rows to export
+            headers: The headers to use for the exported data {field: label}
+            file_format: The file format to export to
+
+        Returns:
+            File object (rewound) containing the exported data
+        """
+        field_names = list(headers.keys())
+
+        writer = data_exporter.writers.get_export_writer(
+            file_format, list(headers.values())
+        )
+
+        writer.write_rows(
+            [self.get_nested_value(row, f) for f in field_names] for row in data
+        )
+
+        return writer.close()
+
 
 class DataExportViewMixin:
     """An API view mixin for directly exporting selected data.
@@ -340,7 +370,6 @@ class DataExportViewMixin:
         output.total = queryset.count()
         output.save()
 
-        data = None
         serializer = serializer_class(context=context, exporting=True)
         serializer.initial_data = queryset
 
@@ -362,7 +391,7 @@ class DataExportViewMixin:
             raise ValidationError(export_error)
 
         # The provided plugin is responsible for exporting the data
-        # The returned data *must* be a list of dict objects
+        # The returned data *must* be an iterable of dict objects (e.g. a list, or a generator)
         try:
             data = export_plugin.export_data(
                 queryset, serializer_class, headers, export_context, output
@@ -376,34 +405,77 @@ class DataExportViewMixin:
 
             raise ValidationError(export_error)
 
-        if not isinstance(data, list):
+        if isinstance(data, (str, bytes, dict)) or not isinstance(data, Iterable):
             raise ValidationError(
                 _('Data export plugin returned incorrect data format')
             )
 
-        # Augment / update the headers (if required)
-        if hasattr(export_plugin, 'update_headers'):
-            try:
-                headers = export_plugin.update_headers(headers, export_context)
-            except Exception as e:
-                InvenTree.exceptions.log_error(
-                    'update_headers', plugin=export_plugin.slug
-                )
-
-                output.mark_failure(error=str(e))
+        data = self.track_export_progress(data, output)
 
-                raise ValidationError(export_error)
+        spool = None
 
-        # Now, export the data to file
         try:
-            datafile = serializer.export_to_file(data, headers, export_format)
+            if self.export_headers_fixed(export_plugin):
+                # Headers are known in advance, so rows are written as they are generated
+                headers = export_plugin.update_headers(headers, export_context)
+            else:
+                # Headers may depend on the exported data (e.g. parameter columns),
+                # so all rows must be generated before the file can be written.
+                # Rows are spooled to disk, rather than being held in memory.
+                spool = data_exporter.writers.RowSpool()
+                spool.extend(data)
+                data = spool
+
+                try:
+                    headers = export_plugin.update_headers(headers, export_context)
+                except Exception as e:
+                    InvenTree.exceptions.log_error(
+                        'update_headers', plugin=export_plugin.slug
+                    )
+
+                    output.mark_failure(error=str(e))
+
+                    raise ValidationError(export_error)
+
+            # Now, export the data to file
+            datafile = serializer.write_export_file(data, headers, export_format)
+        except ValidationError:
+            raise
         except Exception as e:
-            InvenTree.exceptions.log_error('export_to_file', plugin=export_plugin.slug)
+            InvenTree.exceptions.log_error('export_data', plugin=export_plugin.slug)
             output.mark_failure(error=str(e))
-            raise ValidationError(_('Error occurred during data export'))
+            raise ValidationError(export_error)
+        finally:
+            if spool is not None:
+                spool.close()
 
         # Update the output object with the exported data
-        output.mark_complete(output=ContentFile(datafile, filename))
+        try:
+            datafile.name = filename
+            output.mark_complete(output=datafile)
+        finally:
+            datafile.close()
+
+    @staticmethod
+    def export_headers_fixed(export_plugin) -> bool:
+        """Determine if the export headers are known before any data is exported.
+
+        If the plugin overrides the update_headers() method,
+        the headers may depend on the exported data.
+        """
+        from plugin.mixins import DataExportMixin
+
+        return (
+            getattr(type(export_plugin), 'update_headers', None)
+            is DataExportMixin.update_headers
+        )
+
+    @staticmethod
+    def track_export_progress(data: Iterable[dict], output: DataOutput) -> Iterator:
+        """Update the progress of the DataOutput object as rows are exported."""
+        for idx, row in enumerate(data):
+            yield row
+            output.update_progress(min(idx + 1, output.total))
 
     def get(self, request, *args, **kwargs):
         """Override the GET method to determine export options."""
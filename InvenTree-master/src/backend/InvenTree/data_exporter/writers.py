@@ -0,0 +1,230 @@
+"""Incremental file writers for the exporter app.
+
+Exported data is written row-by-row to a temporary file,
+so that large exports do not need to be held in memory.
+"""
+
+import csv
+import datetime
+import io
+import pickle
+import tempfile
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.core.files import File
+from django.utils.translation import gettext_lazy as _
+
+import tablib
+
+
+class ExportWriter:
+    """Base class for writing exported data to a temporary file.
+
+    Usage:
+        writer = get_export_writer('csv', headers)
+        writer.write_row([...])
+        datafile = writer.close()
+    """
+
+    def __init__(self, headers: list):
+        """Initialize the writer with the provided header labels."""
+        self.file = tempfile.TemporaryFile()
+        self.headers = [str(header) for header in headers]
+
+    def write_row(self, row: list) -> None:
+        """Write a single row of data to the file."""
+        raise NotImplementedError  # pragma: no cover
+
+    def write_rows(self, rows: Iterable[list]) -> None:
+        """Write multiple rows of data to the file."""
+        for row in rows:
+            self.write_row(row)
+
+    def close(self) -> File:
+        """Finish writing, and return the (rewound) temporary file."""
+        self.file.seek(0)
+        return File(self.file)
+
+
+class CSVExportWriter(ExportWriter):
+    """Write exported data to a delimited text file."""
+
+    def __init__(self, headers: list, delimiter: str = ','):
+        """Initialize the CSV writer, and write the header row."""
+        super().__init__(headers)
+
+        self.stream = io.TextIOWrapper(self.file, encoding='utf-8', newline='')
+        self.writer = csv.writer(self.stream, delimiter=delimiter)
+        self.writer.writerow(self.headers)
+
+    def write_row(self, row: list) -> None:
+        """Write a single row of data to the file."""
+        self.writer.writerow(row)
+
+    def close(self) -> File:
+        """Flush the text stream, and return the underlying binary file."""
+        self.stream.flush()
+        self.stream.detach()
+
+        return super().close()
+
+
+class XLSXExportWriter(ExportWriter):
+    """Write exported data to an Excel workbook.
+
+    The workbook is created in 'write-only' mode, which streams rows to disk.
+    """
+
+    # Types which can be written directly to a worksheet cell
+    CELL_TYPES = (
+        str,
+        int,
+        float,
+        Decimal,
+        bool,
+        datetime.date,
+        datetime.time,
+        datetime.timedelta,
+    )
+
+    def __init__(self, headers: list):
+        """Initialize the workbook, and write the header row."""
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+
+        super().__init__(headers)
+
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet(title='Data')
+        self.sheet.freeze_panes = 'A2'
+
+        bold = Font(bold=True)
+        header_row = []
+
+        for header in self.headers:
+            cell = WriteOnlyCell(self.sheet, value=self.cell_value(header))
+            cell.font = bold
+            header_row.append(cell)
+
+        self.sheet.append(header_row)
+
+    def cell_value(self, value):
+        """Convert a value to a type which can be written to a worksheet cell."""
+        from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+        if value is None:
+            return None
+
+        if not isinstance(value, self.CELL_TYPES):
+            value = str(value)
+
+        if isinstance(value, str):
+            value = ILLEGAL_CHARACTERS_RE.sub('', value)
+
+        return value
+
+    def write_row(self, row: list) -> None:
+        """Write a single row of data to the worksheet."""
+        self.sheet.append([self.cell_value(value) for value in row])
+
+    def close(self) -> File:
+        """Save the workbook to the temporary file."""
+        self.workbook.save(self.file)
+
+        return super().close()
+
+
+class TablibExportWriter(ExportWriter):
+    """Fallback writer for formats which cannot be written incrementally.
+
+    Data is collected in a tablib dataset, and written to file when the writer is closed.
+    """
+
+    def __init__(self, headers: list, file_format: str):
+        """Initialize the dataset with the provided header labels."""
+        super().__init__(headers)
+
+        self.file_format = file_format
+        self.dataset = tablib.Dataset(headers=self.headers)
+
+    def write_row(self, row: list) -> None:
+        """Append a single row of data to the dataset."""
+        self.dataset.append(row)
+
+    def close(self) -> File:
+        """Export the dataset to the temporary file."""
+        try:
+            data = self.dataset.export(self.file_format)
+        except tablib.UnsupportedFormat:
+            raise ValidationError(_('Unsupported export file format'))
+
+        if isinstance(data, str):
+            data = data.encode()
+
+        self.file.write(data)
+
+        return super().close()
+
+
+def get_export_writer(file_format: str, headers: list) -> ExportWriter:
+    """Return an export writer for the specified file format.
+
+    Arguments:
+        file_format: The file format to export to (e.g. 'csv')
+        headers: List of header labels for the exported data
+    """
+    file_format = str(file_format).strip().lower()
+
+    if file_format == 'csv':
+        return CSVExportWriter(headers)
+    elif file_format == 'tsv':
+        return CSVExportWriter(headers, delimiter='\t')
+    elif file_format == 'xlsx':
+        return XLSXExportWriter(headers)
+
+    return TablibExportWriter(headers, file_format)
+
+
+class RowSpool:
+    """Temporary on-disk storage for exported data rows.
+
+    Used when the export headers cannot be determined until all rows have been generated.
+    Rows are pickled to a temporary file, and can then be iterated (multiple times).
+    """
+
+    def __init__(self):
+        """Create the temporary file."""
+        self.file = tempfile.TemporaryFile()
+        self.count = 0
+
+    def extend(self, rows: Iterable[dict]) -> None:
+        """Add rows to the spool."""
+        self.file.seek(0, io.SEEK_END)
+
+        pickler = pickle.Pickler(self.file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        for row in rows:
+            pickler.dump(row)
+            # Prevent the pickler memo from keeping every row alive
+            pickler.clear_memo()
+            self.count += 1
+
+    def __len__(self) -> int:
+        """Return the number of spooled rows."""
+        return self.count
+
+    def __iter__(self) -> Iterator[dict]:
+        """Iterate through the spooled rows."""
+        self.file.seek(0)
+
+        unpickler = pickle.Unpickler(self.file)
+
+        for _idx in range(self.count):
+            yield unpickler.load()
+
+    def close(self) -> None:
+        """Close (and delete) the temporary file."""
+        self.file.close()
@@ -129,24 +129,11 @@ class AllStatusViews(StatusView):
         # Find all inherited status classes
         status_classes = inheritors(StatusCode)
 
-        # Pre-fetch all custom values from the database
-        # This reduces the number of queries required
-        from common.models import InvenTreeCustomUserStateModel
-
-        custom_states_map = {}
-        for state in InvenTreeCustomUserStateModel.objects.all():
-            key = state.reference_status
-            if key not in custom_states_map:
-                custom_states_map[key] = []
-            custom_states_map[key].append(state)
-
         for cls in status_classes:
             cls_data = {'status_class': cls.__name__, 'values': cls.dict(custom=False)}
 
-            # Extend with custom values (from pre-cached queryset)
-            custom_states = custom_states_map.get(cls.__name__, [])
-
-            for item in custom_states:
+            # Extend with custom values (from the cached custom state registry)
+            for item in cls.custom_values():
                 label = str(item.name)
                 if label not in cls_data['values']:
                     cls_data['values'][label] = {
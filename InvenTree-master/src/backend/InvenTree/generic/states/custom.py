@@ -1,9 +1,21 @@
 """Helper functions for custom status labels."""
 
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+import structlog
+
+from InvenTree.cache import get_session_cache, set_session_cache
 from InvenTree.helpers import inheritors
 
 from .states import ColorEnum, StatusCode
 
+logger = structlog.get_logger('inventree')
+
 
 def get_custom_status_labels(include_custom: bool = True):
     """Return a dict of custom status labels."""
@@ -26,3 +38,140 @@ def get_logical_value(value, model: str):
     from common.models import InvenTreeCustomUserStateModel
 
     return InvenTreeCustomUserStateModel.objects.get(key=value, model__model=model)
+
+
+# Shared cache key which stores the current version of the custom states
+CUSTOM_STATES_VERSION_KEY = 'inventree-custom-states-version'
+
+# Maximum age (seconds) of the custom states, in case the cache is not shared between processes
+CUSTOM_STATES_MAX_AGE = 300
+
+
+class CustomStateSet:
+    """Set of custom states which extend a particular status class.
+
+    Provides dictionary lookups by key, logical key, name and label.
+    """
+
+    def __init__(self, states=None):
+        """Index the provided custom states."""
+        self.states = []
+        self.by_key = {}
+        self.by_logical_key = {}
+        self.by_name = {}
+        self.by_label = {}
+
+        for state in states or []:
+            self.add(state)
+
+    def add(self, state):
+        """Add a custom state to this set."""
+        self.states.append(state)
+        self.by_key[state.key] = state
+        self.by_logical_key.setdefault(state.logical_key, []).append(state)
+        self.by_name[state.name] = state
+        self.by_label[state.label] = state
+
+
+class CustomStateRegistry:
+    """Process-level registry of all custom states.
+
+    - All custom states are loaded from the database with a single query
+    - The registry is reloaded when the version key in the shared cache changes
+    - The version key is changed whenever a custom state is saved or deleted
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self.lock = threading.Lock()
+        self.version = None
+        self.loaded = 0
+        self.status_classes = {}
+        self.models = {}
+
+    def current_version(self) -> str:
+        """Return the current version of the custom states.
+
+        The version is read from the shared cache at most once per request.
+        """
+        version = get_session_cache(CUSTOM_STATES_VERSION_KEY)
+
+        if version is None:
+            version = cache.get(CUSTOM_STATES_VERSION_KEY)
+
+            if version is None:
+                cache.add(CUSTOM_STATES_VERSION_KEY, uuid.uuid4().hex, None)
+                version = cache.get(CUSTOM_STATES_VERSION_KEY)
+
+            set_session_cache(CUSTOM_STATES_VERSION_KEY, version)
+
+        return version
+
+    def invalidate(self):
+        """Invalidate the custom states for all processes."""
+        version = uuid.uuid4().hex
+
+        cache.set(CUSTOM_STATES_VERSION_KEY, version, None)
+        set_session_cache(CUSTOM_STATES_VERSION_KEY, version)
+
+        with self.lock:
+            self.version = None
+
+    def load(self):
+        """Load all custom states from the database, if the registry is out of date."""
+        from common.models import InvenTreeCustomUserStateModel
+
+        # Custom states are not cached during testing, as database changes are rolled back
+        caching = not settings.TESTING or settings.TESTING_CUSTOM_STATES
+
+        version = self.current_version() if caching else None
+
+        now = time.monotonic()
+
+        with self.lock:
+            if (
+                caching
+                and version is not None
+                and version == self.version
+                and now - self.loaded < CUSTOM_STATES_MAX_AGE
+            ):
+                return
+
+            status_classes = {}
+            models = {}
+
+            try:
+                states = list(
+                    InvenTreeCustomUserStateModel.objects.select_related('model')
+                )
+            except Exception:
+                # Database may not be ready (e.g. during migrations)
+                logger.warning('Failed to load custom states from the database')
+                return
+
+            for state in states:
+                if state.reference_status not in status_classes:
+                    status_classes[state.reference_status] = CustomStateSet()
+
+                status_classes[state.reference_status].add(state)
+
+                if state.model:
+                    models.setdefault(state.model.model, CustomStateSet()).add(state)
+
+            self.status_classes = status_classes
+            self.models = models
+            self.version = version
+            self.loaded = now
+
+    def for_status_class(self, reference_status: str) -> CustomStateSet:
+        """Return the set of custom states for the provided status class name."""
+        self.load()
+        return self.status_classes.get(reference_status) or CustomStateSet()
+
+    def for_model(self, model_name: str) -> CustomStateSet:
+        """Return the set of custom states for the provided model name."""
+        self.load()
+        return self.models.get(model_name) or CustomStateSet()
+
+
+custom_states = CustomStateRegistry()
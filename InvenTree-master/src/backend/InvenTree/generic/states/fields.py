@@ -51,7 +51,7 @@ class CustomChoiceField(serializers.ChoiceField):
 
     def get_field_info(self, field, field_info):
         """Return the field information for the given item."""
-        from common.models import InvenTreeCustomUserStateModel
+        from .custom import custom_states
 
         # Static choices
         choices = [
@@ -62,11 +62,9 @@ class CustomChoiceField(serializers.ChoiceField):
             for choice_value, choice_name in field.choices.items()
         ]
         # Dynamic choices from InvenTreeCustomUserStateModel
-        objs = InvenTreeCustomUserStateModel.objects.filter(
-            model__model=field.choice_mdl._meta.model_name
-        )
+        objs = custom_states.for_model(field.choice_mdl._meta.model_name).states
         dyn_choices = [
-            {'value': choice.key, 'display_name': choice.label} for choice in objs.all()
+            {'value': choice.key, 'display_name': choice.label} for choice in objs
         ]
 
         if dyn_choices:
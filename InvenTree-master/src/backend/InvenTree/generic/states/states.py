@@ -118,12 +118,22 @@ class StatusCode(BaseEnum):
         except Exception:
             return None
 
+    @classmethod
+    def custom_states(cls):
+        """Return the (cached) set of user-defined custom states for this status class."""
+        from .custom import custom_states
+
+        return custom_states.for_status_class(cls.__name__)
+
     @classmethod
     def custom_values(cls):
         """Return all user-defined custom values for this status class."""
-        if query := cls.custom_queryset():
-            return list(query)
-        return []
+        return list(cls.custom_states().states)
+
+    @classmethod
+    def custom_value(cls, key):
+        """Return the user-defined custom value for the provided key (or None)."""
+        return cls.custom_states().by_key.get(key)
 
     @classmethod
     def values(cls, key=None):
@@ -284,11 +294,9 @@ class StatusCodeMixin:
         """
         if self.status_class:
             # Check that the current 'logical key' actually matches the current status code
-            custom_values = self.status_class.custom_queryset().filter(
-                logical_key=self.get_status(), key=self.get_custom_status()
-            )
+            custom_value = self.status_class.custom_value(self.get_custom_status())
 
-            if not custom_values.exists():
+            if custom_value is None or custom_value.logical_key != self.get_status():
                 # No match - null out the custom value
                 setattr(self, f'{self.STATUS_FIELD}_custom_key', None)
 
@@ -321,11 +329,10 @@ class StatusCodeMixin:
 
         base_values = self.status_class.values()
 
-        custom_value_set = (
-            self.status_class.custom_values()
-            if custom_values is None
-            else custom_values
-        )
+        if custom_values is None:
+            custom_value_map = self.status_class.custom_states().by_key
+        else:
+            custom_value_map = {item.key: item for item in custom_values}
 
         custom_field = f'{self.STATUS_FIELD}_custom_key'
 
@@ -336,14 +343,11 @@ class StatusCodeMixin:
             setattr(self, self.STATUS_FIELD, status)
             setattr(self, custom_field, None)
             result = True
-        else:
-            for item in custom_value_set:
-                if item.key == status:
-                    # Set the status to a 'custom' value
-                    setattr(self, self.STATUS_FIELD, item.logical_key)
-                    setattr(self, custom_field, item.key)
-                    result = True
-                    break
+        elif item := custom_value_map.get(status):
+            # Set the status to a 'custom' value
+            setattr(self, self.STATUS_FIELD, item.logical_key)
+            setattr(self, custom_field, item.key)
+            result = True
 
         if not result:
             logger.warning(f'Failed to set status {status} for class {self.__class__}')
@@ -1,6 +1,7 @@
 """Tests for the generic states module."""
 
 from django.contrib.contenttypes.models import ContentType
+from django.test import override_settings
 from django.test.client import RequestFactory
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
@@ -12,6 +13,7 @@ from generic.states import ColorEnum
 from InvenTree.unit_test import InvenTreeAPITestCase, InvenTreeTestCase
 
 from .api import StatusView
+from .custom import custom_states
 from .states import StatusCode
 
 
@@ -224,6 +226,50 @@ class GeneralStateTest(InvenTreeTestCase):
             str(e.exception), "`<class 'object'>` not a valid StatusCode class"
         )
 
+    @override_settings(TESTING_CUSTOM_STATES=True)
+    def test_custom_state_registry(self):
+        """Test that custom states are cached, and reloaded when modified."""
+        from stock.status_codes import StockStatus
+
+        custom_states.invalidate()
+
+        self.assertEqual(StockStatus.custom_values(), [])
+
+        state = InvenTreeCustomUserStateModel.objects.create(
+            key=11,
+            name='OK_ADVANCED',
+            label='OK - adv.',
+            color='secondary',
+            logical_key=10,
+            model=ContentType.objects.get(model='stockitem'),
+            reference_status='StockStatus',
+        )
+
+        # The registry is reloaded after the custom state is saved
+        with self.assertNumQueries(1):
+            self.assertEqual(StockStatus.custom_value(11), state)
+
+        # Subsequent lookups do not hit the database
+        with self.assertNumQueries(0):
+            self.assertEqual(len(StockStatus.custom_values()), 1)
+            self.assertEqual(StockStatus.items(custom=True)[-1], (11, 'OK - adv.'))
+
+            states = StockStatus.custom_states()
+            self.assertEqual(states.by_logical_key[10], [state])
+            self.assertEqual(states.by_label['OK - adv.'], state)
+            self.assertEqual(states.by_name['OK_ADVANCED'], state)
+
+            self.assertEqual(custom_states.for_model('stockitem').states, [state])
+
+        # The registry is invalidated again once the change is committed
+        with self.captureOnCommitCallbacks() as callbacks:
+            state.delete()
+
+        self.assertIn(custom_states.invalidate, callbacks)
+
+        self.assertIsNone(StockStatus.custom_value(11))
+        self.assertEqual(StockStatus.custom_values(), [])
+
 
 class ApiTests(InvenTreeAPITestCase):
     """Test the API for the generic states module."""
@@ -1,10 +1,13 @@
 """Gunicorn configuration script for InvenTree web server."""
 
 import multiprocessing
+import os
 
 bind = '0.0.0.0:8000'
 
-workers = multiprocessing.cpu_count() * 2 + 1
+workers = int(
+    os.environ.get('INVENTREE_GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1)
+)
 
 max_requests = 1000
 max_requests_jitter = 50
@@ -13,6 +16,20 @@ max_requests_jitter = 50
 preload_app = True
 
 
+def when_ready(server):
+    """Limit the number of workers to the available database connections."""
+    from InvenTree.database import validate_worker_count
+
+    server.num_workers = validate_worker_count(server.num_workers)
+
+
+def pre_fork(server, worker):
+    """Close database connections opened while preloading, so they are not shared with workers."""
+    from InvenTree.database import close_connections
+
+    close_connections()
+
+
 def post_fork(server, worker):
     """Post-fork hook to set up logging for each worker."""
     from django.conf import settings
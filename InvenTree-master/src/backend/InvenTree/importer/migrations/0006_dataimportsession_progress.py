@@ -0,0 +1,31 @@
+# Generated by Django 5.2.9 on 2026-10-19 06:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("importer", "0005_dataimportsession_update_records"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dataimportsession",
+            name="progress",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Number of data rows which have been imported",
+                verbose_name="Progress",
+            ),
+        ),
+        migrations.AddField(
+            model_name="dataimportsession",
+            name="total",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Total number of data rows in the data file",
+                verbose_name="Total",
+            ),
+        ),
+    ]
@@ -1,13 +1,17 @@
 """Model definitions for the 'importer' app."""
 
+import contextvars
 import json
+import time
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.core.validators import FileExtensionValidator
-from django.db import models
+from django.db import connections, models, transaction
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
@@ -38,10 +42,15 @@ class DataImportSession(models.Model):
         field_defaults: JSONField for field default values - provides a backup value for a field
         field_overrides: JSONField for field override values - used to force a value for a field
         field_filters: JSONField for field filter values - optional field API filters
+        progress: Number of data rows which have been imported (resume checkpoint)
+        total: Total number of data rows in the data file
     """
 
     ID_FIELD_LABEL = 'id'
 
+    # Number of rows which are validated and written to the database together
+    IMPORT_CHUNK_SIZE = 250
+
     class ModelChoices(RenderChoices):
         """Model choices for data import sessions."""
 
@@ -127,6 +136,18 @@ class DataImportSession(models.Model):
         help_text=_('If enabled, existing records will be updated with new data'),
     )
 
+    progress = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('Progress'),
+        help_text=_('Number of data rows which have been imported'),
+    )
+
+    total = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_('Total'),
+        help_text=_('Total number of data rows in the data file'),
+    )
+
     @property
     def field_mapping(self) -> dict:
         """Construct a dict of field mappings for this import session.
@@ -272,54 +293,152 @@ class DataImportSession(models.Model):
 
         # Mark the import task status as "IMPORTING"
         self.status = DataImportStatusCode.IMPORTING.value
+        self.progress = 0
+        self.total = 0
         self.save()
 
         offload_task(importer.tasks.import_data, self.pk, group='importer')
 
     def import_data(self) -> None:
-        """Perform the data import process for this session."""
-        # Clear any existing data rows
-        self.rows.all().delete()
+        """Perform the data import process for this session.
 
-        df = importer.operations.load_data_file(self.data_file)
+        The data file is streamed, and rows are extracted, validated and written to the database
+        in chunks of IMPORT_CHUNK_SIZE rows. After each chunk is written, the 'progress' field is updated.
 
-        if df is None:
-            # TODO: Log an error message against the import session
-            logger.error('Failed to load data file')
-            return
+        This serves as a checkpoint: if the import is interrupted (e.g. the background worker times out),
+        running the import again resumes from the last completed chunk.
+        To avoid hitting the worker timeout in the first place, the import is re-scheduled
+        as a new background task once a time limit is exceeded.
+        """
+        from InvenTree.tasks import offload_task
 
-        headers = df.headers
+        if self.status == DataImportStatusCode.IMPORTING.value and self.progress > 0:
+            # Resume from the last checkpoint, discarding any rows past the checkpoint
+            self.rows.filter(row_index__gte=self.progress).delete()
+        else:
+            # Clear any existing data rows
+            self.rows.all().delete()
+            self.status = DataImportStatusCode.IMPORTING.value
+            self.progress = 0
+            self.total = importer.operations.count_data_rows(self.data_file)
+            self.save()
 
-        imported_rows = []
+        rows = importer.operations.iter_data_file(self.data_file)
 
-        field_mapping = self.field_mapping
-        available_fields = self.available_fields()
+        try:
+            headers = importer.operations.format_column_names(next(rows, None) or [])
 
-        # Iterate through each "row" in the data file, and create a new DataImportRow object
-        for idx, row in enumerate(df):
-            row_data = dict(zip(headers, row, strict=False))
+            # Exit the import loop after this time, and re-schedule the remaining rows
+            deadline = time.monotonic() + 0.75 * settings.Q_CLUSTER['timeout']
 
-            # Skip completely empty rows
-            if not any(row_data.values()):
-                continue
+            chunk = []
+            checkpoint = processed = self.progress
+
+            for idx, row in enumerate(rows):
+                if idx < checkpoint:
+                    continue
+
+                processed = idx + 1
+
+                row_data = dict(zip(headers, row, strict=False))
+
+                # Skip completely empty rows
+                if any(row_data.values()):
+                    chunk.append(
+                        DataImportRow(session=self, row_data=row_data, row_index=idx)
+                    )
+
+                if len(chunk) >= self.IMPORT_CHUNK_SIZE:
+                    self.import_rows(chunk, checkpoint=processed)
+                    chunk = []
+
+                    if time.monotonic() > deadline:
+                        logger.info(
+                            'Data import session %s: re-scheduling after %s rows',
+                            self.pk,
+                            self.progress,
+                        )
+                        offload_task(
+                            importer.tasks.import_data, self.pk, group='importer'
+                        )
+                        return
+
+            self.import_rows(chunk, checkpoint=processed)
+        finally:
+            rows.close()
+
+        # Mark the import task as "PROCESSING"
+        self.status = DataImportStatusCode.PROCESSING.value
+        self.save()
 
-            row = DataImportRow(session=self, row_data=row_data, row_index=idx)
+    def import_rows(self, rows: list, checkpoint: int) -> None:
+        """Extract, validate and write a chunk of data rows to the database.
+
+        Arguments:
+            rows: List of (unsaved) DataImportRow objects
+            checkpoint: Number of data file rows which have been processed, including this chunk
+        """
+        field_mapping = self.field_mapping
+        available_fields = self.available_fields()
 
+        for row in rows:
             row.extract_data(
                 field_mapping=field_mapping,
                 available_fields=available_fields,
                 commit=False,
             )
 
-            row.valid = row.validate(commit=False)
-            imported_rows.append(row)
+        self.validate_rows(rows)
 
-        # Perform database writes as a single operation
-        DataImportRow.objects.bulk_create(imported_rows)
+        # Write the rows and the checkpoint in a single transaction
+        with transaction.atomic():
+            DataImportRow.objects.bulk_create(rows)
+            self.progress = checkpoint
+            self.save(update_fields=['progress'])
 
-        # Mark the import task as "PROCESSING"
-        self.status = DataImportStatusCode.PROCESSING.value
-        self.save()
+    def validate_rows(self, rows: list) -> None:
+        """Validate the provided data rows against the linked serializer.
+
+        If the INVENTREE_IMPORT_WORKERS setting allows, rows are validated in parallel threads.
+        Rows are validated serially if worker threads cannot query the database
+        (e.g. SQLite, or from within an atomic block).
+        """
+        from common.settings import get_global_setting
+        from InvenTree.database import worker_threads_allowed
+
+        def validate(rows):
+            for row in rows:
+                row.valid = row.validate(commit=False)
+
+        try:
+            workers = int(get_global_setting('INVENTREE_IMPORT_WORKERS', 1))
+        except (TypeError, ValueError):
+            workers = 1
+
+        workers = min(workers, len(rows))
+
+        if workers <= 1 or not worker_threads_allowed():
+            validate(rows)
+            return
+
+        def validate_thread(rows):
+            try:
+                validate(rows)
+            finally:
+                # Each thread opens its own database connection
+                connections.close_all()
+
+        # Each thread runs in a copy of the current context (e.g. selected tenant)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, validate_thread, rows[idx::workers]
+                )
+                for idx in range(workers)
+            ]
+
+            for future in futures:
+                future.result()
 
     def check_complete(self) -> bool:
         """Check if the import session is complete."""
@@ -1,5 +1,8 @@
 """Data import operational functions."""
 
+import codecs
+import csv
+from collections.abc import Iterator
 from typing import Optional
 
 from django.core.exceptions import ValidationError
@@ -11,12 +14,15 @@ import tablib.core
 import InvenTree.helpers
 
 
-def load_data_file(data_file, file_format=None):
-    """Load data file into a tablib dataset.
+def get_file_format(data_file, file_format=None) -> str:
+    """Determine the format of the provided data file.
 
     Arguments:
-        data_file: django file object containing data to import (should be already opened!)
-        file_format: Format specifier for the data file
+        data_file: django file object containing data to import
+        file_format: Format specifier for the data file (optional)
+
+    Raises:
+        ValidationError: If the file format is not supported
     """
     # Introspect the file format based on the provided file
     if not file_format:
@@ -30,6 +36,11 @@ def load_data_file(data_file, file_format=None):
     if file_format not in InvenTree.helpers.GetExportFormats():
         raise ValidationError(_('Unsupported data file format'))
 
+    return file_format
+
+
+def open_data_file(data_file):
+    """Open the provided data file, and return the underlying file object (rewound)."""
     file_object = data_file.file
 
     if hasattr(file_object, 'open'):
@@ -37,13 +48,29 @@ def load_data_file(data_file, file_format=None):
 
     file_object.seek(0)
 
+    return file_object
+
+
+def load_data_file(data_file, file_format=None):
+    """Load data file into a tablib dataset.
+
+    Note: This loads the entire file into memory - use iter_data_file() for large files.
+
+    Arguments:
+        data_file: django file object containing data to import (should be already opened!)
+        file_format: Format specifier for the data file
+    """
+    file_format = get_file_format(data_file, file_format)
+
+    file_object = open_data_file(data_file)
+
     try:
         data = file_object.read()
     except OSError:
         raise ValidationError(_('Failed to open data file'))
 
     # Excel formats expect binary data
-    if file_format not in ['xls', 'xlsx']:
+    if file_format not in ['xls', 'xlsx'] and isinstance(data, bytes):
         data = data.decode()
 
     try:
@@ -70,19 +97,115 @@ def extract_column_names(data_file) -> list:
     Raises:
         ValidationError: If the data file is not in a valid format
     """
-    data = load_data_file(data_file)
+    rows = iter_data_file(data_file)
+
+    try:
+        headers = next(rows)
+    except StopIteration:
+        headers = []
+    finally:
+        rows.close()
+
+    return format_column_names(headers)
 
-    headers = []
 
-    for idx, header in enumerate(data.headers):
-        if header:
-            header = str(header).strip()
-            headers.append(header)
+def format_column_names(headers: list) -> list:
+    """Format the column names read from a data file.
+
+    - Column names are stripped of leading / trailing whitespace
+    - Empty column names are replaced with a default name
+    """
+    columns = []
+
+    for idx, header in enumerate(headers):
+        if header is not None and str(header).strip():
+            columns.append(str(header).strip())
         else:
             # If the header is empty, generate a default header
-            headers.append(f'Column {idx + 1}')
+            columns.append(f'Column {idx + 1}')
+
+    return columns
+
+
+def iter_data_file(data_file, file_format=None) -> Iterator[list]:
+    """Iterate through the rows of a data file, without loading the entire file into memory.
+
+    The first row yielded contains the column headers.
+    Data rows are padded to the length of the header row, matching the behavior of load_data_file().
+
+    Arguments:
+        data_file: django file object containing data to import
+        file_format: Format specifier for the data file
+
+    Raises:
+        ValidationError: If the data file cannot be read
+    """
+    file_format = get_file_format(data_file, file_format)
+
+    file_object = open_data_file(data_file)
+
+    if file_format == 'xlsx':
+        rows = iter_excel_rows(file_object)
+    else:
+        rows = iter_text_rows(file_object, '\t' if file_format == 'tsv' else ',')
+
+    width = None
+
+    try:
+        for row in rows:
+            if width is None:
+                width = len(row)
+            elif len(row) < width:
+                row = [*row, *([''] * (width - len(row)))]
+
+            yield row
+    except (csv.Error, UnicodeDecodeError):
+        raise ValidationError(_('Failed to read data file'))
+    finally:
+        rows.close()
+
+
+def iter_text_rows(file_object, delimiter: str = ',') -> Iterator[list]:
+    """Iterate through the rows of a delimited text (CSV / TSV) file.
+
+    Arguments:
+        file_object: Open file object (binary or text)
+        delimiter: Field delimiter character
+    """
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+
+    def lines():
+        for line in file_object:
+            yield decoder.decode(line) if isinstance(line, bytes) else line
+
+    for row in csv.reader(lines(), delimiter=delimiter):
+        # Skip blank lines
+        if row:
+            yield row
+
+
+def iter_excel_rows(file_object) -> Iterator[list]:
+    """Iterate through the rows of the active worksheet in an Excel file.
+
+    The workbook is opened in read-only mode, which streams the worksheet data.
+    """
+    import openpyxl
+
+    try:
+        workbook = openpyxl.load_workbook(file_object, read_only=True, data_only=True)
+    except Exception:
+        raise ValidationError(_('Failed to open data file'))
+
+    try:
+        for row in workbook.active.iter_rows(values_only=True):
+            yield list(row)
+    finally:
+        workbook.close()
+
 
-    return headers
+def count_data_rows(data_file, file_format=None) -> int:
+    """Return the number of data rows (excluding the header row) in a data file."""
+    return max(0, sum(1 for _row in iter_data_file(data_file, file_format)) - 1)
 
 
 def get_field_label(field) -> Optional[str]:
@@ -54,8 +54,10 @@ class DataImportSessionSerializer(InvenTreeModelSerializer):
             'field_filters',
             'row_count',
             'completed_row_count',
+            'progress',
+            'total',
         ]
-        read_only_fields = ['pk', 'user', 'status', 'columns']
+        read_only_fields = ['pk', 'user', 'status', 'columns', 'progress', 'total']
 
     def __init__(self, *args, **kwargs):
         """Override the constructor for the DataImportSession serializer."""
@@ -1,11 +1,18 @@
 """Unit tests for the 'importer' app."""
 
+import io
 import os
+from unittest import mock
 
 from django.core.files.base import ContentFile
 from django.urls import reverse
 
+import importer.operations
+from common.settings import set_global_setting
 from importer.models import DataImportRow, DataImportSession
+from importer.status_codes import DataImportStatusCode
+from tenancy.context import clear_current_tenant, set_current_tenant
+from tenancy.models import Tenant
 from InvenTree.unit_test import AdminTestCase, InvenTreeAPITestCase, InvenTreeTestCase
 
 
@@ -73,6 +80,85 @@ class ImporterTest(ImporterMixin, InvenTreeTestCase):
     def test_field_defaults(self):
         """Test default field values."""
 
+    def test_iter_data_file(self):
+        """Test that streamed file data matches the data loaded via tablib."""
+        data_file = self.helper_file('companies.csv')
+
+        dataset = importer.operations.load_data_file(data_file)
+        rows = list(importer.operations.iter_data_file(data_file))
+
+        self.assertEqual(rows[0], dataset.headers)
+        self.assertEqual(rows[1:], [list(row) for row in dataset])
+        self.assertEqual(importer.operations.count_data_rows(data_file), 12)
+
+        # Export to xlsx, and check that the streamed data matches
+        buffer = io.BytesIO(dataset.export('xlsx'))
+        xlsx_file = ContentFile(buffer.getvalue(), 'companies.xlsx')
+
+        xlsx_rows = list(importer.operations.iter_data_file(xlsx_file))
+
+        self.assertEqual(len(xlsx_rows), 13)
+        self.assertEqual(xlsx_rows[0], dataset.headers)
+        self.assertEqual(
+            importer.operations.extract_column_names(xlsx_file),
+            importer.operations.extract_column_names(data_file),
+        )
+
+    def test_import_chunks(self):
+        """Test that data is imported in chunks, and that an import can be resumed."""
+        # Imported companies are scoped to the current tenant
+        set_current_tenant(Tenant.objects.create(name='Importer', slug='importer'))
+        self.addCleanup(clear_current_tenant)
+
+        data_file = self.helper_file('companies.csv')
+
+        session = DataImportSession.objects.create(
+            data_file=data_file, model_type='company'
+        )
+
+        with mock.patch.object(DataImportSession, 'IMPORT_CHUNK_SIZE', 5):
+            session.import_data()
+
+        self.assertEqual(session.status, DataImportStatusCode.PROCESSING.value)
+        self.assertEqual(session.total, 12)
+        self.assertEqual(session.progress, 12)
+        self.assertEqual(session.rows.count(), 12)
+
+        # Simulate an import which was interrupted after the first chunk
+        first_chunk = set(
+            session.rows.filter(row_index__lt=5).values_list('pk', flat=True)
+        )
+        session.rows.filter(row_index__gte=8).delete()
+        session.status = DataImportStatusCode.IMPORTING.value
+        session.progress = 5
+        session.save()
+
+        with mock.patch.object(DataImportSession, 'IMPORT_CHUNK_SIZE', 5):
+            session.import_data()
+
+        self.assertEqual(session.status, DataImportStatusCode.PROCESSING.value)
+        self.assertEqual(session.progress, 12)
+        self.assertEqual(session.rows.count(), 12)
+
+        # Rows before the checkpoint have been retained
+        self.assertEqual(
+            first_chunk,
+            set(session.rows.filter(row_index__lt=5).values_list('pk', flat=True)),
+        )
+
+        for row in session.rows.all():
+            self.assertTrue(row.valid)
+
+        # Rows are validated serially within a transaction (and on SQLite)
+        set_global_setting('INVENTREE_IMPORT_WORKERS', 4)
+        rows = list(session.rows.all())
+
+        with mock.patch('importer.models.ThreadPoolExecutor') as executor:
+            session.validate_rows(rows)
+
+        executor.assert_not_called()
+        self.assertTrue(all(row.valid for row in rows))
+
 
 class ImportAPITest(ImporterMixin, InvenTreeAPITestCase):
     """End-to-end tests for the importer API."""
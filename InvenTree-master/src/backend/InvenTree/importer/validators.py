@@ -7,7 +7,7 @@ from django.utils.translation import gettext_lazy as _
 
 # Define maximum limits for imported file data
 IMPORTER_MAX_FILE_SIZE = 32 * 1024 * 1042
-IMPORTER_MAX_ROWS = 5000
+IMPORTER_MAX_ROWS = 250000
 IMPORTER_MAX_COLS = 1000
 
 
@@ -20,16 +20,23 @@ def validate_data_file(data_file):
     if filesize > IMPORTER_MAX_FILE_SIZE:
         raise ValidationError(_('Data file exceeds maximum size limit'))
 
-    dataset = importer.operations.load_data_file(data_file)
+    # Stream the file, rather than loading the entire dataset into memory
+    rows = importer.operations.iter_data_file(data_file)
 
-    if not dataset.headers or len(dataset.headers) == 0:
-        raise ValidationError(_('Data file contains no headers'))
+    try:
+        headers = next(rows, None)
 
-    if len(dataset.headers) > IMPORTER_MAX_COLS:
-        raise ValidationError(_('Data file contains too many columns'))
+        if not headers or len(headers) == 0:
+            raise ValidationError(_('Data file contains no headers'))
 
-    if len(dataset) > IMPORTER_MAX_ROWS:
-        raise ValidationError(_('Data file contains too many rows'))
+        if len(headers) > IMPORTER_MAX_COLS:
+            raise ValidationError(_('Data file contains too many columns'))
+
+        for idx, _row in enumerate(rows):
+            if idx >= IMPORTER_MAX_ROWS:
+                raise ValidationError(_('Data file contains too many rows'))
+    finally:
+        rows.close()
 
 
 def validate_importer_model_type(value):
@@ -0,0 +1,47 @@
+"""Custom management command to recalculate the total price of orders.
+
+- May be required after importing order data, or changing the default currency
+"""
+
+from django.core.management.base import BaseCommand
+
+import structlog
+
+logger = structlog.get_logger('inventree')
+
+
+class Command(BaseCommand):
+    """Recalculate the total price for all open orders."""
+
+    def add_arguments(self, parser):
+        """Add arguments for the command."""
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Recalculate the total price for closed orders as well',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Recalculate the total price for all open orders."""
+        from order.models import PurchaseOrder, ReturnOrder, SalesOrder
+        from order.status_codes import (
+            PurchaseOrderStatusGroups,
+            ReturnOrderStatusGroups,
+            SalesOrderStatusGroups,
+        )
+
+        models = [
+            (PurchaseOrder, PurchaseOrderStatusGroups.OPEN),
+            (SalesOrder, SalesOrderStatusGroups.OPEN),
+            (ReturnOrder, ReturnOrderStatusGroups.OPEN),
+        ]
+
+        for model, open_codes in models:
+            orders = model.objects.all()
+
+            if not kwargs.get('all', False):
+                orders = orders.filter(status__in=open_codes)
+
+            n = model.recalculate_total_prices(orders)
+
+            logger.info('Recalculated total price for %s %s objects', n, model.__name__)
@@ -16,7 +16,6 @@ from django.utils.translation import gettext_lazy as _
 
 import structlog
 from djmoney.contrib.exchange.exceptions import MissingRate
-from djmoney.contrib.exchange.models import convert_money
 from djmoney.money import Money
 from mptt.models import TreeForeignKey
 
@@ -31,7 +30,7 @@ import report.mixins
 import stock.models
 import users.models as UserModels
 from build.status_codes import BuildStatus
-from common.currency import currency_code_default
+from common.currency import convert_currency, currency_code_default, sum_money
 from common.notifications import InvenTreeNotificationBodies
 from common.settings import get_global_setting
 from company.models import Address, Company, Contact, SupplierPart
@@ -63,7 +62,19 @@ logger = structlog.get_logger('inventree')
 
 
 class TotalPriceMixin(models.Model):
-    """Mixin which provides 'total_price' field for an order."""
+    """Mixin which provides 'total_price' field for an order.
+
+    The total price is calculated in the database:
+    - Line totals are aggregated with a single query, grouped by currency
+    - Each currency subtotal is converted into the order currency once
+    - Changes to a single line item adjust the stored total incrementally
+    """
+
+    # Related names for the line items which contribute to the total price
+    TOTAL_PRICE_LINES = ['lines', 'extra_lines']
+
+    # Name of the field which links to the company for this order
+    COMPANY_FIELD = None
 
     class Meta:
         """Meta for MetadataMixin."""
@@ -137,47 +148,143 @@ class TotalPriceMixin(models.Model):
         if target_currency is None:
             target_currency = currency_code_default()
 
-        total = Money(0, target_currency)
-
         # Check if the order has been saved (otherwise we can't calculate the total price)
         if self.pk is None:
-            return total
+            return Money(0, target_currency)
 
-        # order items
-        for line in self.lines.all():
-            if not line.price:
-                continue
+        subtotals = self.line_subtotals([self.pk]).get(self.pk, [])
 
-            try:
-                total += line.quantity * convert_money(line.price, target_currency)
-            except MissingRate:
-                log_error('order.calculate_total_price')
-                logger.exception("Missing exchange rate for '%s'", target_currency)
+        return self.sum_subtotals(subtotals, target_currency)
 
-                # Return None to indicate the calculated price is invalid
-                return None
+    def adjust_total_price(self, removed=None, added=None):
+        """Adjust the total_price for this order, after a change to a single line item.
 
-        # extra items
-        for line in self.extra_lines.all():
-            if not line.price:
-                continue
+        Rather than recalculating the total for all lines, the difference is applied
+        to the stored total price. If this is not possible (e.g. the stored total is
+        invalid, or is in a different currency) the total price is recalculated.
 
-            try:
-                total += line.quantity * convert_money(line.price, target_currency)
-            except MissingRate:
-                # Record the error, try to press on
+        The total price is also recalculated if the line total is in a different currency
+        to the order, as a difference converted at the current exchange rate would drift
+        away from a total calculated over all lines.
+
+        Arguments:
+            removed: Line total (Money) which has been removed from the order
+            added: Line total (Money) which has been added to the order
+        """
+        target_currency = self.currency
+
+        if all(
+            str(value.currency) == target_currency
+            for value in [removed, added]
+            if value is not None
+        ):
+            delta = sum_money([added], target_currency) - sum_money(
+                [removed], target_currency
+            )
+        else:
+            delta = None
+
+        if delta is not None:
+            updated = (
+                type(self)
+                .objects.filter(
+                    pk=self.pk,
+                    total_price__isnull=False,
+                    total_price_currency=target_currency,
+                )
+                .update(total_price=F('total_price') + delta)
+            )
+
+            if updated:
+                self.refresh_from_db(fields=['total_price', 'total_price_currency'])
+                return
+
+        self.update_total_price()
+
+    @classmethod
+    def line_subtotals(cls, orders) -> dict:
+        """Aggregate the line totals for the provided orders, grouped by currency.
+
+        Arguments:
+            orders: Queryset (or list of primary keys) of orders
+
+        Returns:
+            A dict of {order ID: [Money, ...]}, with one subtotal per line model and currency
+        """
+        subtotals = {}
+
+        for relation in cls.TOTAL_PRICE_LINES:
+            line_model = cls._meta.get_field(relation).related_model
+            price_field = line_model.PRICE_FIELD
+            currency_field = f'{price_field}_currency'
+
+            rows = (
+                line_model.objects
+                .filter(order__in=orders)
+                .exclude(**{f'{price_field}__isnull': True})
+                .order_by()
+                .values('order', currency_field)
+                .annotate(
+                    total=Sum(
+                        F('quantity') * F(price_field),
+                        output_field=models.DecimalField(),
+                    )
+                )
+            )
+
+            for row in rows:
+                subtotals.setdefault(row['order'], []).append(
+                    Money(row['total'], row[currency_field])
+                )
+
+        return subtotals
 
-                log_error('order.calculate_total_price')
-                logger.exception("Missing exchange rate for '%s'", target_currency)
+    @staticmethod
+    def sum_subtotals(subtotals: list, target_currency: str) -> Optional[Money]:
+        """Sum the provided subtotals, converting each currency into the target currency once.
 
-                # Return None to indicate the calculated price is invalid
-                return None
+        Returns None if the currency conversion fails.
+        """
+        try:
+            total = sum_money(subtotals, target_currency)
+        except MissingRate:
+            log_error('order.calculate_total_price')
+            logger.exception("Missing exchange rate for '%s'", target_currency)
+
+            # Return None to indicate the calculated price is invalid
+            return None
 
         # set decimal-places
         total.decimal_places = 4
 
         return total
 
+    @classmethod
+    def recalculate_total_prices(cls, orders) -> int:
+        """Recalculate and save the total_price for each of the provided orders.
+
+        Line totals for all orders are aggregated up front,
+        and the orders are then updated in bulk.
+
+        Returns:
+            The number of orders which were updated
+        """
+        subtotals = cls.line_subtotals(orders)
+
+        updated = []
+
+        for instance in orders.select_related(cls.COMPANY_FIELD):
+            instance.total_price = cls.sum_subtotals(
+                subtotals.get(instance.pk, []), instance.currency
+            )
+            updated.append(instance)
+
+        cls.objects.bulk_update(
+            updated, ['total_price', 'total_price_currency'], batch_size=250
+        )
+
+        return len(updated)
+
 
 class BaseOrderReportContext(report.mixins.BaseReportContext):
     """Base context for all order models.
@@ -543,6 +650,7 @@ class PurchaseOrder(TotalPriceMixin, Order):
     """
 
     REFERENCE_PATTERN_SETTING = 'PURCHASEORDER_REFERENCE_PATTERN'
+    COMPANY_FIELD = 'supplier'
     REQUIRE_RESPONSIBLE_SETTING = 'PURCHASEORDER_REQUIRE_RESPONSIBLE'
     STATUS_CLASS = PurchaseOrderStatus
     UNLOCK_SETTING = 'PURCHASEORDER_EDIT_COMPLETED_ORDERS'
@@ -1035,7 +1143,7 @@ class PurchaseOrder(TotalPriceMixin, Order):
                 purchase_price = line.purchase_price / supplier_part.base_quantity(1)
 
                 if convert_purchase_price:
-                    purchase_price = convert_money(purchase_price, default_currency)
+                    purchase_price = convert_currency(purchase_price, default_currency)
             else:
                 purchase_price = None
 
@@ -1242,6 +1350,7 @@ class SalesOrder(TotalPriceMixin, Order):
     """A SalesOrder represents a list of goods shipped outwards to a customer."""
 
     REFERENCE_PATTERN_SETTING = 'SALESORDER_REFERENCE_PATTERN'
+    COMPANY_FIELD = 'customer'
     REQUIRE_RESPONSIBLE_SETTING = 'SALESORDER_REQUIRE_RESPONSIBLE'
     STATUS_CLASS = SalesOrderStatus
     UNLOCK_SETTING = 'SALESORDER_EDIT_COMPLETED_ORDERS'
@@ -1724,10 +1833,13 @@ class OrderLineItem(InvenTree.models.InvenTreeMetadataModel):
 
         abstract = True
 
+    # Name of the field which stores the unit price for this line item
+    PRICE_FIELD = 'price'
+
     def save(self, *args, **kwargs):
         """Custom save method for the OrderLineItem model.
 
-        Calls save method on the linked order
+        Adjusts the total price of the linked order
         """
         if self.order and self.order.check_locked():
             raise ValidationError({
@@ -1736,22 +1848,59 @@ class OrderLineItem(InvenTree.models.InvenTreeMetadataModel):
 
         update_order = kwargs.pop('update_order', True)
 
+        previous = None
+
+        if update_order and self.pk:
+            # Fetch the previous line total, to adjust the order total
+            previous = (
+                type(self)
+                .objects.filter(pk=self.pk)
+                .values(
+                    'order',
+                    'quantity',
+                    self.PRICE_FIELD,
+                    f'{self.PRICE_FIELD}_currency',
+                )
+                .first()
+            )
+
         super().save(*args, **kwargs)
+
         if update_order and self.order:
-            self.order.save()
+            if previous and previous['order'] != self.order.pk:
+                # Line item has been moved to a different order,
+                # so recalculate the totals for both the previous and the new order
+                order_model = type(self.order)
+                order_model.recalculate_total_prices(
+                    order_model.objects.filter(pk=previous['order'])
+                )
+                self.order.update_total_price()
+                return
+
+            removed = None
+
+            if previous and previous[self.PRICE_FIELD] is not None:
+                removed = Money(
+                    previous['quantity'] * previous[self.PRICE_FIELD],
+                    previous[f'{self.PRICE_FIELD}_currency'],
+                )
+
+            self.order.adjust_total_price(removed=removed, added=self.total_line_price)
 
     def delete(self, *args, **kwargs):
         """Custom delete method for the OrderLineItem model.
 
-        Calls save method on the linked order
+        Adjusts the total price of the linked order
         """
         if self.order and self.order.check_locked():
             raise ValidationError({
                 'non_field_errors': _('The order is locked and cannot be modified')
             })
 
+        removed = self.total_line_price
+
         super().delete(*args, **kwargs)
-        self.order.save()
+        self.order.adjust_total_price(removed=removed)
 
     quantity = RoundingDecimalField(
         verbose_name=_('Quantity'),
@@ -1862,6 +2011,8 @@ class PurchaseOrderLineItem(OrderLineItem):
 
         verbose_name = _('Purchase Order Line Item')
 
+    PRICE_FIELD = 'purchase_price'
+
     # Filter for determining if a particular PurchaseOrderLineItem is overdue
     OVERDUE_FILTER = (
         Q(received__lt=F('quantity'))
@@ -2067,6 +2218,8 @@ class SalesOrderLineItem(OrderLineItem):
 
         verbose_name = _('Sales Order Line Item')
 
+    PRICE_FIELD = 'sale_price'
+
     # Filter for determining if a particular SalesOrderLineItem is overdue
     OVERDUE_FILTER = (
         Q(shipped__lt=F('quantity'))
@@ -2640,6 +2793,7 @@ class ReturnOrder(TotalPriceMixin, Order):
     """
 
     REFERENCE_PATTERN_SETTING = 'RETURNORDER_REFERENCE_PATTERN'
+    COMPANY_FIELD = 'customer'
     REQUIRE_RESPONSIBLE_SETTING = 'RETURNORDER_REQUIRE_RESPONSIBLE'
     STATUS_CLASS = ReturnOrderStatus
     UNLOCK_SETTING = 'RETURNORDER_EDIT_COMPLETED_ORDERS'
@@ -2,10 +2,12 @@
 
 from datetime import datetime, timedelta
 from decimal import Decimal
+from unittest import mock
 
 import django.core.exceptions as django_exceptions
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.core.management import call_command
 from django.test import TestCase
 
 from djmoney.money import Money
@@ -468,6 +470,81 @@ class OrderTest(ExchangeRateMixin, PluginRegistryMixin, TestCase):
         self.assertEqual(item.purchase_price_currency, 'CAD')
         self.assertAlmostEqual(item.purchase_price.amount, Decimal(1.25), 3)
 
+    def test_total_price(self):
+        """Test calculation and incremental adjustment of the order total price."""
+        self.generate_exchange_rates()
+
+        order = PurchaseOrder.objects.get(pk=7)
+        order.order_currency = 'USD'
+        order.save()
+
+        self.assertEqual(order.total_price, Money(0, 'USD'))
+
+        line = PurchaseOrderExtraLine.objects.create(
+            order=order, quantity=10, price=Money(3, 'USD')
+        )
+        aud_line = PurchaseOrderExtraLine.objects.create(
+            order=order, quantity=3, price=Money(1.5, 'AUD')
+        )
+        PurchaseOrderExtraLine.objects.create(order=order, quantity=5, price=None)
+
+        order.refresh_from_db()
+        self.assertAlmostEqual(order.total_price.amount, Decimal(33), 3)
+
+        # Editing a single line adjusts the total incrementally
+        line.quantity = 20
+        line.save()
+
+        order.refresh_from_db()
+        self.assertAlmostEqual(order.total_price.amount, Decimal(63), 3)
+
+        # Editing a line in a different currency recalculates the total
+        with mock.patch.object(
+            PurchaseOrder,
+            'update_total_price',
+            autospec=True,
+            side_effect=PurchaseOrder.update_total_price,
+        ) as update:
+            line.save()
+            update.assert_not_called()
+
+            aud_line.save()
+            update.assert_any_call(order)
+
+        order.refresh_from_db()
+        self.assertAlmostEqual(order.total_price.amount, Decimal(63), 3)
+
+        # Moving a line to another order updates the totals of both orders
+        other = PurchaseOrder.objects.get(pk=2)
+        other.order_currency = 'USD'
+        other.update_total_price()
+        other_total = other.total_price.amount
+
+        line.order = other
+        line.save()
+
+        order.refresh_from_db()
+        other.refresh_from_db()
+        self.assertAlmostEqual(order.total_price.amount, Decimal(3), 3)
+        self.assertAlmostEqual(other.total_price.amount, other_total + 60, 3)
+
+        line.delete()
+        order.refresh_from_db()
+        self.assertAlmostEqual(order.total_price.amount, Decimal(3), 3)
+
+        # The incremental total matches a full recalculation
+        self.assertAlmostEqual(
+            order.calculate_total_price(target_currency='USD').amount, Decimal(3), 3
+        )
+
+        # Bulk recalculation of open orders
+        PurchaseOrder.objects.filter(pk=order.pk).update(total_price=None)
+
+        call_command('recalculate_order_totals')
+
+        order.refresh_from_db()
+        self.assertAlmostEqual(order.total_price.amount, Decimal(3), 3)
+
     def test_overdue_notification(self):
         """Test overdue purchase order notification.
 
@@ -1014,14 +1014,26 @@ class PartMixin(SerializerContextMixin):
     starred_parts = None
     is_create = False
 
+    # Set by the search API endpoint, to request lightweight results
+    search_mode = False
+
     def get_queryset(self, *args, **kwargs):
         """Return an annotated queryset object for the PartDetail endpoint."""
         queryset = super().get_queryset(*args, **kwargs)
 
-        queryset = part_serializers.PartSerializer.annotate_queryset(queryset)
+        if self.search_mode:
+            queryset = part_serializers.PartSerializer.annotate_search_queryset(
+                queryset
+            )
+        else:
+            # Stock quantities are calculated "live" if fresh data is requested
+            fresh = self.request is not None and str2bool(
+                self.request.query_params.get('fresh', False)
+            )
 
-        if str2bool(self.request.query_params.get('price_breaks', True)):
-            queryset = queryset.prefetch_related('salepricebreaks')
+            queryset = part_serializers.PartSerializer.annotate_queryset(
+                queryset, prefetch_fields=self.get_serializer_prefetches(), fresh=fresh
+            )
 
         return queryset
 
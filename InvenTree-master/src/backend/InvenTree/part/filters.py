@@ -32,7 +32,7 @@ from django.db.models import (
 from django.db.models.functions import Cast, Coalesce, Greatest
 from django.db.models.query import QuerySet
 
-from sql_util.utils import SubquerySum
+from sql_util.utils import SubqueryCount, SubquerySum
 
 import part.models
 import stock.models
@@ -308,6 +308,56 @@ def annotate_variant_quantity(subquery: Q, reference: str = 'quantity') -> Query
     )
 
 
+def stock_quantity_annotations() -> dict:
+    """Return the live subquery annotations for the stock and demand quantities of each part.
+
+    These are the quantities which are cached in the PartStockSummary table.
+    """
+    return {
+        'stock_item_count': SubqueryCount('stock_items'),
+        'in_stock': annotate_total_stock(),
+        'external_stock': annotate_total_stock(filter=Q(location__external=True)),
+        'variant_stock': annotate_variant_quantity(
+            variant_stock_query(), reference='quantity'
+        ),
+        'building': annotate_in_production_quantity(),
+        'scheduled_to_build': annotate_scheduled_to_build_quantity(),
+        'ordering': annotate_on_order_quantity(),
+        'allocated_to_build_orders': annotate_build_order_allocations(),
+        'allocated_to_sales_orders': annotate_sales_order_allocations(),
+        'required_for_build_orders': annotate_build_order_requirements(),
+        'required_for_sales_orders': annotate_sales_order_requirements(),
+    }
+
+
+def annotate_stock_quantities(queryset: QuerySet) -> QuerySet:
+    """Annotate a Part queryset with live stock and demand quantities.
+
+    Each quantity is calculated using a separate subquery for each part.
+    """
+    return queryset.annotate(**stock_quantity_annotations())
+
+
+def annotate_stock_summary(queryset: QuerySet) -> QuerySet:
+    """Annotate a Part queryset with cached stock and demand quantities.
+
+    - Quantities are read from the PartStockSummary table
+    - Parts with a missing (or outdated) stock summary fall back to the live subqueries
+    """
+    current = Q(
+        stock_summary__scheduled_for_update=False, stock_summary__updated__isnull=False
+    )
+
+    return queryset.annotate(**{
+        name: Case(
+            When(current, then=F(f'stock_summary__{name}')),
+            default=expression,
+            output_field=expression.output_field,
+        )
+        for name, expression in stock_quantity_annotations().items()
+    })
+
+
 def annotate_category_parts() -> QuerySet:
     """Construct a queryset annotation which returns the number of parts in a particular category.
 
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.9 on 2026-10-19 10:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('part', '0147_alter_partcategory_managers_part_tenant_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PartStockSummary',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('updated', models.DateTimeField(blank=True, help_text='Timestamp of last stock summary calculation', null=True, verbose_name='Updated')),
+                ('scheduled_for_update', models.BooleanField(default=False)),
+                ('stock_item_count', models.IntegerField(default=0, help_text='Number of stock items for this part', verbose_name='Stock Items')),
+                ('in_stock', models.DecimalField(decimal_places=5, default=0, help_text='Total quantity of this part in stock', max_digits=19, verbose_name='In Stock')),
+                ('external_stock', models.DecimalField(decimal_places=5, default=0, help_text='Total quantity of this part in external locations', max_digits=19, verbose_name='External Stock')),
+                ('variant_stock', models.DecimalField(decimal_places=5, default=0, help_text='Total quantity of variant parts in stock', max_digits=19, verbose_name='Variant Stock')),
+                ('building', models.DecimalField(decimal_places=5, default=0, help_text='Quantity of this part currently being in production', max_digits=19, verbose_name='Building')),
+                ('scheduled_to_build', models.DecimalField(decimal_places=5, default=0, help_text='Outstanding quantity of this part scheduled to be built', max_digits=19, verbose_name='Scheduled to Build')),
+                ('ordering', models.DecimalField(decimal_places=5, default=0, help_text='Outstanding quantity of this part on open purchase orders', max_digits=19, verbose_name='On Order')),
+                ('allocated_to_build_orders', models.DecimalField(decimal_places=5, default=0, help_text='Quantity of this part allocated to active build orders', max_digits=19, verbose_name='Allocated to Build Orders')),
+                ('allocated_to_sales_orders', models.DecimalField(decimal_places=5, default=0, help_text='Quantity of this part allocated to open sales orders', max_digits=19, verbose_name='Allocated to Sales Orders')),
+                ('required_for_build_orders', models.DecimalField(decimal_places=5, default=0, help_text='Quantity of this part required for active build orders', max_digits=19, verbose_name='Required for Build Orders')),
+                ('required_for_sales_orders', models.DecimalField(decimal_places=5, default=0, help_text='Quantity of this part required for open sales orders', max_digits=19, verbose_name='Required for Sales Orders')),
+                ('part', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stock_summary', to='part.part', verbose_name='Part')),
+            ],
+        ),
+    ]
@@ -10,7 +10,7 @@ import os
 import re
 from datetime import timedelta
 from decimal import Decimal, InvalidOperation
-from typing import cast
+from typing import Optional, cast
 
 from django.conf import settings
 from django.contrib.auth.models import User
@@ -29,7 +29,6 @@ from django.utils.translation import gettext_lazy as _
 import structlog
 from django_cleanup import cleanup
 from djmoney.contrib.exchange.exceptions import MissingRate
-from djmoney.contrib.exchange.models import convert_money
 from djmoney.money import Money
 from mptt.managers import TreeManager
 from mptt.models import TreeForeignKey
@@ -51,7 +50,7 @@ from tenancy.models import TenantScopedModel
 from tenancy.managers import TenantTreeManager
 from build import models as BuildModels
 from build.status_codes import BuildStatusGroups
-from common.currency import currency_code_default
+from common.currency import convert_currency, currency_code_default
 from common.icons import validate_icon
 from common.settings import get_global_setting
 from company.models import SupplierPart
@@ -69,6 +68,9 @@ from stock import models as StockModels
 
 logger = structlog.get_logger('inventree')
 
+# Maximum number of candidate serial numbers which may be rejected during a single allocation
+SERIAL_NUMBER_MAX_REJECTED = 1000
+
 
 class PartCategory(
     TenantScopedModel,
@@ -90,6 +92,9 @@ class PartCategory(
 
     EXTRA_PATH_FIELDS = ['icon']
 
+    # Tenant-aware manager used for all tree operations
+    _tree_manager = TenantTreeManager()
+
     class Meta:
         """Metaclass defines extra model properties."""
 
@@ -836,12 +841,82 @@ class Part(
                     'revision_of': _('Parent part must point to the same template')
                 })
 
+    def get_serial_number_stock(self) -> QuerySet:
+        """Return all stock items which share a serial number namespace with this Part.
+
+        - If SERIAL_NUMBER_GLOBALLY_UNIQUE is set, serial numbers are unique across all parts
+        - Otherwise, serial numbers are unique across this part "tree"
+        """
+        from stock.models import StockItem
+
+        if get_global_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False):
+            # Serial number must be unique across *all* parts
+            return StockItem.objects.all()
+
+        # Serial number must only be unique across this part "tree"
+        return StockItem.objects.filter(part__tree_id=self.tree_id)
+
+    def lock_serial_numbers(self) -> None:
+        """Lock the serial number namespace for this Part, until the end of the current transaction.
+
+        This prevents concurrent processes from allocating the same serial numbers.
+        Note: This must be called within a transaction.
+
+        - If SERIAL_NUMBER_GLOBALLY_UNIQUE is set, the setting itself is locked, as all parts share a namespace
+        - Otherwise, only the root part of this part "tree" is locked
+        """
+        if get_global_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False):
+            setting = common.models.InvenTreeSetting.get_setting_object(
+                'SERIAL_NUMBER_GLOBALLY_UNIQUE', cache=False
+            )
+
+            if setting and setting.pk:
+                list(
+                    common.models.InvenTreeSetting.objects
+                    .select_for_update()
+                    .filter(pk=setting.pk)
+                    .values_list('pk', flat=True)
+                )
+                return
+
+        list(
+            Part.objects
+            .select_for_update()
+            .filter(tree_id=self.tree_id, level=0)
+            .values_list('pk', flat=True)
+        )
+
+    def get_serial_number_plugins(self) -> list:
+        """Return the loaded plugins which implement serial number validation.
+
+        The plugin signatures are inspected once, so that a batch of serial numbers can be validated efficiently.
+
+        Returns:
+            A list of (plugin, accepts_stock_item) tuples
+        """
+        from plugin import PluginMixinEnum, registry
+
+        plugins = []
+
+        for plugin in registry.with_mixin(PluginMixinEnum.VALIDATION):
+            try:
+                if hasattr(plugin, 'validate_serial_number'):
+                    signature = inspect.signature(plugin.validate_serial_number)
+
+                    # 2024-08-21: New method signature accepts a 'stock_item' parameter
+                    plugins.append((plugin, 'stock_item' in signature.parameters))
+            except Exception:
+                log_error('validate_serial_number', plugin=plugin.slug)
+
+        return plugins
+
     def validate_serial_number(
         self,
         serial: str,
         stock_item=None,
         check_duplicates=True,
         raise_error=False,
+        plugins: Optional[list] = None,
         **kwargs,
     ):
         """Validate a serial number against this Part instance.
@@ -859,6 +934,7 @@ class Part(
             stock_item: (optional) A StockItem instance which has this serial number assigned (e.g. testing for duplicates)
             check_duplicates: If True, checks for duplicate serial numbers in the database.
             raise_error: If False, and ValidationError(s) will be handled
+            plugins: (optional) Pre-fetched list of validation plugins, as returned by get_serial_number_plugins
 
         Returns:
             True if serial number is 'valid' else False
@@ -868,27 +944,22 @@ class Part(
         """
         serial = str(serial).strip()
 
-        # First, throw the serial number against each of the loaded validation plugins
-        from plugin import PluginMixinEnum, registry
+        if plugins is None:
+            plugins = self.get_serial_number_plugins()
 
-        for plugin in registry.with_mixin(PluginMixinEnum.VALIDATION):
+        # First, throw the serial number against each of the loaded validation plugins
+        for plugin, with_stock_item in plugins:
             # Run the serial number through each custom validator
             # If the plugin returns 'True' we will skip any subsequent validation
 
             try:
-                result = False
-
-                if hasattr(plugin, 'validate_serial_number'):
-                    signature = inspect.signature(plugin.validate_serial_number)
-
-                    if 'stock_item' in signature.parameters:
-                        # 2024-08-21: New method signature accepts a 'stock_item' parameter
-                        result = plugin.validate_serial_number(
-                            serial, self, stock_item=stock_item
-                        )
-                    else:
-                        # Old method signature - does not accept a 'stock_item' parameter
-                        result = plugin.validate_serial_number(serial, self)
+                if with_stock_item:
+                    result = plugin.validate_serial_number(
+                        serial, self, stock_item=stock_item
+                    )
+                else:
+                    # Old method signature - does not accept a 'stock_item' parameter
+                    result = plugin.validate_serial_number(serial, self)
 
                 if result is True:
                     return True
@@ -911,17 +982,7 @@ class Part(
         if not check_duplicates:
             return
 
-        # from part.models import Part
-        from stock.models import StockItem
-
-        if get_global_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False):
-            # Serial number must be unique across *all* parts
-            parts = Part.objects.all()
-        else:
-            # Serial number must only be unique across this part "tree"
-            parts = Part.objects.filter(tree_id=self.tree_id)
-
-        stock = StockItem.objects.filter(part__in=parts, serial=serial)
+        stock = self.get_serial_number_stock().filter(serial=serial)
 
         if stock_item:
             # Exclude existing StockItem from query
@@ -941,41 +1002,123 @@ class Part(
             return True
 
     def find_conflicting_serial_numbers(self, serials: list) -> list:
-        """For a provided list of serials, return a list of those which are conflicting."""
-        # from part.models import Part
-        from stock.models import StockItem
-
-        conflicts = []
+        """For a provided list of serials, return a list of those which are conflicting.
 
+        - Duplicate serial numbers are found with a single database query
+        - Validation plugins are only resolved once for the entire batch
+        """
         # First, check for raw conflicts based on efficient database queries
-        if get_global_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False):
-            # Serial number must be unique across *all* parts
-            parts = Part.objects.all()
-        else:
-            # Serial number must only be unique across this part "tree"
-            parts = Part.objects.filter(tree_id=self.tree_id)
+        conflicts = list(
+            self
+            .get_serial_number_stock()
+            .filter(serial__in=serials)
+            .order_by('serial_int', 'serial')
+            .values_list('serial', flat=True)
+        )
 
-        items = StockItem.objects.filter(part__in=parts, serial__in=serials)
-        items = items.order_by('serial_int', 'serial')
+        plugins = self.get_serial_number_plugins()
 
-        for item in items:
-            conflicts.append(item.serial)
+        if not plugins:
+            # No plugins to check against
+            return conflicts
+
+        found = set(conflicts)
 
         for serial in serials:
-            if serial in conflicts:
+            if serial in found:
                 # Already found a conflict, no need to check further
                 continue
 
             try:
                 self.validate_serial_number(
-                    serial, raise_error=True, check_duplicates=False
+                    serial, raise_error=True, check_duplicates=False, plugins=plugins
                 )
             except ValidationError:
                 # Serial number is invalid (as determined by plugin)
                 conflicts.append(serial)
+                found.add(serial)
 
         return conflicts
 
+    def allocate_serial_numbers(self, quantity: int, partial: bool = False) -> list:
+        """Allocate the next available serial numbers for this Part.
+
+        - Candidate serial numbers are checked for conflicts in a single query per batch
+        - If called within a transaction, the serial number namespace is locked until the end of that transaction,
+          so the serial numbers are reserved for stock items created within the same transaction
+        - Otherwise, the serial numbers are only a suggestion, which concurrent callers may also receive
+          (conflicts are checked again when the stock items are created)
+
+        Arguments:
+            quantity: The number of serial numbers to allocate
+            partial: If True, return the serial numbers allocated so far (rather than raising an error)
+                if the required quantity cannot be generated
+
+        Returns:
+            A list of unique serial numbers
+
+        Raises:
+            ValidationError: If the required quantity of serial numbers cannot be generated,
+                or if more than SERIAL_NUMBER_MAX_REJECTED candidates are rejected
+        """
+        increment_serial = InvenTree.helpers.serial_number_incrementer(self)
+        plugins = self.get_serial_number_plugins()
+
+        serials = []
+        seen = set()
+
+        # A lock is only held (until the stock items are created) within an enclosing transaction
+        if transaction.get_connection().in_atomic_block:
+            self.lock_serial_numbers()
+
+        serial = self.get_latest_serial_number()
+
+        while len(serials) < quantity:
+            # Give up if too many candidates have been rejected (e.g. by a plugin)
+            if len(seen) - len(serials) >= SERIAL_NUMBER_MAX_REJECTED:
+                break
+
+            candidates = []
+
+            while len(candidates) < quantity - len(serials):
+                serial = increment_serial(serial)
+
+                # Exit if an empty or duplicated serial is generated
+                if not serial or serial in seen:
+                    break
+
+                seen.add(serial)
+                candidates.append(serial)
+
+            if not candidates:
+                break
+
+            existing = set(
+                self
+                .get_serial_number_stock()
+                .filter(serial__in=candidates)
+                .values_list('serial', flat=True)
+            )
+
+            for candidate in candidates:
+                if candidate in existing:
+                    continue
+
+                if plugins and (
+                    self.validate_serial_number(
+                        candidate, check_duplicates=False, plugins=plugins
+                    )
+                    is False
+                ):
+                    continue
+
+                serials.append(candidate)
+
+        if len(serials) < quantity and not partial:
+            raise ValidationError(_('Could not generate serial numbers'))
+
+        return serials
+
     def get_latest_serial_number(self, allow_plugins=True):
         """Find the 'latest' serial number for this Part.
 
@@ -1003,24 +1146,16 @@ class Part(
                     log_error('get_latest_serial_number', plugin=plugin.slug)
 
         # No plugin returned a result, so we will run the default query
-        stock = (
-            StockModels.StockItem.objects.all().exclude(serial=None).exclude(serial='')
-        )
-
-        # Generate a query for any stock items for this part variant tree with non-empty serial numbers
-        if not get_global_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False):
-            # Serial numbers are unique across part trees
-            stock = stock.filter(part__tree_id=self.tree_id)
-
-        # There are no matching StockItem objects (skip further tests)
-        if not stock.exists():
-            return None
-
-        # Sort in descending order
-        stock = stock.order_by('-serial_int', '-serial', '-pk')
+        # for any stock items in this serial number namespace with non-empty serial numbers
+        stock = self.get_serial_number_stock().exclude(serial=None).exclude(serial='')
 
-        # Return the first serial value
-        return stock[0].serial
+        # Sort in descending order, and return the first serial value
+        return (
+            stock
+            .order_by('-serial_int', '-serial', '-pk')
+            .values_list('serial', flat=True)
+            .first()
+        )
 
     def get_next_serial_number(self):
         """Return the 'next' serial number in sequence."""
@@ -2405,7 +2540,7 @@ class Part(
         currency = currency_code_default()
         try:
             prices = [
-                convert_money(item.purchase_price, currency).amount
+                convert_currency(item.purchase_price, currency).amount
                 for item in self.stock_items.all()
                 if item.purchase_price
             ]
@@ -2729,6 +2864,12 @@ def after_save_part(sender, instance: Part, created, **kwargs):
 
     from part import tasks as part_tasks
 
+    if instance and created and not InvenTree.ready.isImportingData():
+        # A new part has no stock or orders, so the stock summary is already up to date
+        PartStockSummary.objects.create(
+            part=instance, updated=InvenTree.helpers.current_time()
+        )
+
     if instance and not created and not InvenTree.ready.isImportingData():
         # Check part stock only if we are *updating* the part (not creating it)
 
@@ -2749,6 +2890,13 @@ def after_save_part(sender, instance: Part, created, **kwargs):
         )
 
 
+# Cache key used to prevent duplicate pricing updates being scheduled for a single part
+PRICING_UPDATE_KEY = 'part_pricing_update_{}'
+
+# Maximum time (seconds) that a pending pricing update for a part blocks new updates
+PRICING_UPDATE_TIMEOUT = 3600
+
+
 class PartPricing(common.models.MetaMixin):
     """Model for caching min/max pricing information for a particular Part.
 
@@ -2794,7 +2942,7 @@ class PartPricing(common.models.MetaMixin):
         target_currency = currency_code_default()
 
         try:
-            result = convert_money(money, target_currency)
+            result = convert_currency(money, target_currency)
         except MissingRate:
             logger.warning(
                 'No currency conversion rate available for %s -> %s',
@@ -2812,6 +2960,8 @@ class PartPricing(common.models.MetaMixin):
             counter: Recursion counter (used to prevent infinite recursion)
             refresh: If specified, the PartPricing object will be refreshed from the database
         """
+        from django.core.cache import cache
+
         import InvenTree.ready
 
         # If importing data, skip pricing update
@@ -2853,11 +3003,6 @@ class PartPricing(common.models.MetaMixin):
             )
             return
 
-        if self.scheduled_for_update:
-            # Ignore if the pricing is already scheduled to be updated
-            logger.debug('Pricing for %s already scheduled for update - skipping', p)
-            return
-
         if counter > self.MAX_PRICING_DEPTH:
             # Prevent infinite recursion / stack depth issues
             logger.debug(
@@ -2865,6 +3010,15 @@ class PartPricing(common.models.MetaMixin):
             )
             return
 
+        # Note: The scheduled_for_update flag is also set in bulk (by check_missing_pricing),
+        # so a separate marker is used to ignore duplicate requests for an individual update
+        key = PRICING_UPDATE_KEY.format(p.pk)
+
+        if not cache.add(key, True, PRICING_UPDATE_TIMEOUT):
+            # Ignore if the pricing is already scheduled to be updated
+            logger.debug('Pricing for %s already scheduled for update - skipping', p)
+            return
+
         try:
             self.scheduled_for_update = True
             self.save()
@@ -2883,13 +3037,14 @@ class PartPricing(common.models.MetaMixin):
 
         # Offload task to update the pricing
         # Force async, to prevent running in the foreground (unless in testing mode)
-        InvenTree.tasks.offload_task(
+        if not InvenTree.tasks.offload_task(
             part_tasks.update_part_pricing,
             self,
             counter=counter,
             force_async=background,
             group='pricing',
-        )
+        ):
+            cache.delete(key)
 
     def update_pricing(
         self,
@@ -2907,6 +3062,8 @@ class PartPricing(common.models.MetaMixin):
             previous_max: Previous maximum price (used to prevent further updates if unchanged)
 
         """
+        from django.core.cache import cache
+
         # If importing data, skip pricing update
         if InvenTree.ready.isImportingData():
             return
@@ -2921,6 +3078,9 @@ class PartPricing(common.models.MetaMixin):
             except PartPricing.DoesNotExist:
                 pass
 
+        # Mark any pending update as started, so that further changes are scheduled again
+        cache.delete(PRICING_UPDATE_KEY.format(self.part_id))
+
         self.update_bom_cost(save=False)
         self.update_purchase_cost(save=False)
         self.update_internal_cost(save=False)
@@ -3491,6 +3651,421 @@ class PartPricing(common.models.MetaMixin):
     )
 
 
+# Cache key used to coalesce scheduled refreshes of the part stock summary table
+STOCK_SUMMARY_REFRESH_KEY = 'part_stock_summary_refresh'
+
+# Maximum time (seconds) that a pending refresh of the part stock summary table blocks new refreshes
+STOCK_SUMMARY_REFRESH_TIMEOUT = 600
+
+# Number of parts to calculate the stock summary for in a single query
+STOCK_SUMMARY_BATCH_SIZE = 500
+
+
+class PartStockSummary(models.Model):
+    """Model for caching stock and demand quantities for a particular Part.
+
+    Calculating these quantities requires a large number of subqueries for each part,
+    which is prohibitively expensive when listing a large number of parts.
+    Instead, the quantities are pre-calculated and cached in this table:
+
+    - Entries are flagged for update whenever related stock items or orders are changed
+    - Flagged entries are recalculated (in bulk) by a background task
+    - Flagged (or missing) entries are calculated "on the fly" when parts are listed
+    - A periodic task recalculates all entries, to repair any drift
+    """
+
+    # Cached quantities, matching the annotations provided by part.filters.annotate_stock_quantities
+    QUANTITY_FIELDS = [
+        'stock_item_count',
+        'in_stock',
+        'external_stock',
+        'variant_stock',
+        'building',
+        'scheduled_to_build',
+        'ordering',
+        'allocated_to_build_orders',
+        'allocated_to_sales_orders',
+        'required_for_build_orders',
+        'required_for_sales_orders',
+    ]
+
+    @classmethod
+    def schedule_update(cls, parts) -> None:
+        """Flag the stock summary of the provided parts for update.
+
+        Stock for variant parts is rolled up into template parts, so any template parts are also flagged.
+        The flagged entries are recalculated once the current transaction is committed.
+
+        Arguments:
+            parts: Iterable of Part instances (or a Part queryset)
+        """
+        import InvenTree.ready
+
+        if InvenTree.ready.isImportingData() or InvenTree.ready.isRunningMigrations():
+            return
+
+        if not InvenTree.ready.canAppAccessDatabase(allow_test=True):
+            return
+
+        if isinstance(parts, QuerySet):
+            parts = parts.only('pk', 'tree_id', 'lft', 'rght', 'level')
+
+        part_ids = set()
+        variants = {}
+
+        for p in parts:
+            if p is None or p.pk is None:
+                continue
+
+            part_ids.add(p.pk)
+
+            if p.level:
+                variants.setdefault(p.tree_id, []).append(p)
+
+        if variants:
+            # Include any template parts above the variant parts
+            templates = Part._base_manager.filter(
+                tree_id__in=variants.keys(), rght__gt=F('lft') + 1
+            ).values_list('pk', 'tree_id', 'lft', 'rght')
+
+            for pk, tree_id, lft, rght in templates:
+                if any(lft < p.lft and rght > p.rght for p in variants[tree_id]):
+                    part_ids.add(pk)
+
+        if not part_ids:
+            return
+
+        if cls.objects.filter(part__pk__in=part_ids, scheduled_for_update=False).update(
+            scheduled_for_update=True
+        ):
+            transaction.on_commit(cls.offload_refresh)
+
+    @classmethod
+    def offload_refresh(cls) -> None:
+        """Offload a background refresh of any flagged entries, unless one is already pending."""
+        from django.core.cache import cache
+
+        import part.tasks as part_tasks
+
+        if not cache.add(
+            STOCK_SUMMARY_REFRESH_KEY, True, STOCK_SUMMARY_REFRESH_TIMEOUT
+        ):
+            # A refresh is already pending
+            return
+
+        if not InvenTree.tasks.offload_task(
+            part_tasks.refresh_stock_summaries, group='part'
+        ):
+            cache.delete(STOCK_SUMMARY_REFRESH_KEY)
+
+    @classmethod
+    def clear_refresh(cls) -> None:
+        """Mark any pending refresh of the stock summary table as started."""
+        from django.core.cache import cache
+
+        cache.delete(STOCK_SUMMARY_REFRESH_KEY)
+
+    @classmethod
+    def calculate(cls, part_ids) -> dict:
+        """Calculate the stock summary for the provided parts, with a single query.
+
+        Returns:
+            A dict of {part ID: {field: quantity}}
+        """
+        from part.filters import annotate_stock_quantities
+
+        rows = (
+            annotate_stock_quantities(Part._base_manager.filter(pk__in=part_ids))
+            .order_by()
+            .values('pk', *cls.QUANTITY_FIELDS)
+        )
+
+        return {row.pop('pk'): row for row in rows}
+
+    @classmethod
+    def refresh(cls, part_ids) -> int:
+        """Recalculate the stock summary for the provided parts.
+
+        - Any update flags are cleared before calculation, so that concurrent changes are flagged again
+        - Only entries which have changed are written to the database
+        - Missing entries are created
+
+        Returns:
+            The number of entries which were updated or created
+        """
+        cls.objects.filter(part__in=part_ids, scheduled_for_update=True).update(
+            scheduled_for_update=False
+        )
+
+        values = cls.calculate(part_ids)
+        now = InvenTree.helpers.current_time()
+
+        updated = []
+
+        for summary in cls.objects.filter(part__in=values.keys()):
+            quantities = values.pop(summary.part_id)
+
+            changed = summary.updated is None
+
+            for field, value in quantities.items():
+                value = Decimal(str(value or 0))
+
+                if getattr(summary, field) != value:
+                    setattr(summary, field, value)
+                    changed = True
+
+            if changed:
+                summary.updated = now
+                updated.append(summary)
+
+        created = [
+            cls(part_id=pk, updated=now, **quantities)
+            for pk, quantities in values.items()
+        ]
+
+        cls.objects.bulk_update(updated, [*cls.QUANTITY_FIELDS, 'updated'])
+        cls.objects.bulk_create(created, ignore_conflicts=True)
+
+        return len(updated) + len(created)
+
+    part = models.OneToOneField(
+        Part,
+        on_delete=models.CASCADE,
+        related_name='stock_summary',
+        verbose_name=_('Part'),
+    )
+
+    updated = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_('Updated'),
+        help_text=_('Timestamp of last stock summary calculation'),
+    )
+
+    scheduled_for_update = models.BooleanField(default=False)
+
+    stock_item_count = models.IntegerField(
+        default=0,
+        verbose_name=_('Stock Items'),
+        help_text=_('Number of stock items for this part'),
+    )
+
+    in_stock = models.DecimalField(
+        max_digits=19,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('In Stock'),
+        help_text=_('Total quantity of this part in stock'),
+    )
+
+    external_stock = models.DecimalField(
+        max_digits=19,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('External Stock'),
+        help_text=_('Total quantity of this part in external locations'),
+    )
+
+    variant_stock = models.DecimalField(
+        max_digits=19,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Variant Stock'),
+        help_text=_('Total quantity of variant parts in stock'),
+    )
+
+    building = models.DecimalField(
+        max_digits=19,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Building'),
+        help_text=_('Quantity of this part currently being in production'),
+    )
+
+    scheduled_to_build = models.DecimalField(
+        max_digits=19,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Scheduled to Build'),
+        help_text=_('Outstanding quantity of this part scheduled to be built'),
+    )
+
+    ordering = models.DecimalField(
+        max_digits=19,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('On Order'),
+        help_text=_('Outstanding quantity of this part on open purchase orders'),
+    )
+
+    allocated_to_build_orders = models.DecimalField(
+        max_digits=19,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Allocated to Build Orders'),
+        help_text=_('Quantity of this part allocated to active build orders'),
+    )
+
+    allocated_to_sales_orders = models.DecimalField(
+        max_digits=19,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Allocated to Sales Orders'),
+        help_text=_('Quantity of this part allocated to open sales orders'),
+    )
+
+    required_for_build_orders = models.DecimalField(
+        max_digits=19,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Required for Build Orders'),
+        help_text=_('Quantity of this part required for active build orders'),
+    )
+
+    required_for_sales_orders = models.DecimalField(
+        max_digits=19,
+        decimal_places=5,
+        default=0,
+        verbose_name=_('Required for Sales Orders'),
+        help_text=_('Quantity of this part required for open sales orders'),
+    )
+
+
+@receiver(post_save, sender='build.Build', dispatch_uid='build_stock_summary')
+@receiver(post_delete, sender='build.Build', dispatch_uid='build_delete_stock_summary')
+def update_build_stock_summary(sender, instance, **kwargs):
+    """Flag the stock summary of parts which are built or consumed by a build order."""
+    PartStockSummary.schedule_update(
+        Part._base_manager.filter(
+            Q(pk=instance.part_id)
+            | Q(used_in__build_lines__build=instance)
+            | Q(stock_items__allocations__build_line__build=instance)
+        ).distinct()
+    )
+
+
+@receiver(post_save, sender='build.BuildLine', dispatch_uid='build_line_stock_summary')
+@receiver(
+    post_delete,
+    sender='build.BuildLine',
+    dispatch_uid='build_line_delete_stock_summary',
+)
+def update_build_line_stock_summary(sender, instance, **kwargs):
+    """Flag the stock summary of the part required by a build order line."""
+    PartStockSummary.schedule_update(
+        Part._base_manager.filter(used_in=instance.bom_item_id)
+    )
+
+
+@receiver(post_save, sender='build.BuildItem', dispatch_uid='build_item_stock_summary')
+@receiver(
+    post_delete,
+    sender='build.BuildItem',
+    dispatch_uid='build_item_delete_stock_summary',
+)
+def update_build_item_stock_summary(sender, instance, **kwargs):
+    """Flag the stock summary of the part allocated to a build order."""
+    PartStockSummary.schedule_update(
+        Part._base_manager.filter(stock_items=instance.stock_item_id)
+    )
+
+
+@receiver(
+    post_save, sender='order.PurchaseOrder', dispatch_uid='purchase_order_stock_summary'
+)
+def update_purchase_order_stock_summary(sender, instance, **kwargs):
+    """Flag the stock summary of parts on a purchase order."""
+    PartStockSummary.schedule_update(
+        Part._base_manager.filter(
+            supplier_parts__purchase_order_line_items__order=instance
+        ).distinct()
+    )
+
+
+@receiver(
+    post_save,
+    sender='order.PurchaseOrderLineItem',
+    dispatch_uid='purchase_order_line_stock_summary',
+)
+@receiver(
+    post_delete,
+    sender='order.PurchaseOrderLineItem',
+    dispatch_uid='purchase_order_line_delete_stock_summary',
+)
+def update_purchase_order_line_stock_summary(sender, instance, **kwargs):
+    """Flag the stock summary of the part on a purchase order line."""
+    PartStockSummary.schedule_update(
+        Part._base_manager.filter(supplier_parts=instance.part_id)
+    )
+
+
+@receiver(
+    post_save, sender='company.SupplierPart', dispatch_uid='supplier_part_stock_summary'
+)
+def update_supplier_part_stock_summary(sender, instance, **kwargs):
+    """Flag the stock summary of the part linked to a supplier part (e.g. pack quantity changes)."""
+    PartStockSummary.schedule_update(Part._base_manager.filter(pk=instance.part_id))
+
+
+@receiver(
+    post_save, sender='order.SalesOrder', dispatch_uid='sales_order_stock_summary'
+)
+def update_sales_order_stock_summary(sender, instance, **kwargs):
+    """Flag the stock summary of parts required by (or allocated to) a sales order."""
+    PartStockSummary.schedule_update(
+        Part._base_manager.filter(
+            Q(sales_order_line_items__order=instance)
+            | Q(stock_items__sales_order_allocations__line__order=instance)
+        ).distinct()
+    )
+
+
+@receiver(
+    post_save,
+    sender='order.SalesOrderLineItem',
+    dispatch_uid='sales_order_line_stock_summary',
+)
+@receiver(
+    post_delete,
+    sender='order.SalesOrderLineItem',
+    dispatch_uid='sales_order_line_delete_stock_summary',
+)
+def update_sales_order_line_stock_summary(sender, instance, **kwargs):
+    """Flag the stock summary of the part required by a sales order line."""
+    PartStockSummary.schedule_update(Part._base_manager.filter(pk=instance.part_id))
+
+
+@receiver(
+    post_save,
+    sender='order.SalesOrderShipment',
+    dispatch_uid='sales_order_shipment_stock_summary',
+)
+def update_sales_order_shipment_stock_summary(sender, instance, **kwargs):
+    """Flag the stock summary of parts allocated to a sales order shipment."""
+    PartStockSummary.schedule_update(
+        Part._base_manager.filter(
+            stock_items__sales_order_allocations__shipment=instance
+        ).distinct()
+    )
+
+
+@receiver(
+    post_save,
+    sender='order.SalesOrderAllocation',
+    dispatch_uid='sales_order_allocation_stock_summary',
+)
+@receiver(
+    post_delete,
+    sender='order.SalesOrderAllocation',
+    dispatch_uid='sales_order_allocation_delete_stock_summary',
+)
+def update_sales_order_allocation_stock_summary(sender, instance, **kwargs):
+    """Flag the stock summary of the part allocated to a sales order."""
+    PartStockSummary.schedule_update(
+        Part._base_manager.filter(stock_items=instance.item_id)
+    )
+
+
 class PartStocktake(models.Model):
     """Model representing a 'stock history' entry for a particular Part.
 
@@ -15,7 +15,6 @@ from django.utils.translation import gettext_lazy as _
 
 import structlog
 from djmoney.contrib.exchange.exceptions import MissingRate
-from djmoney.contrib.exchange.models import convert_money
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 from sql_util.utils import SubqueryCount
@@ -675,39 +674,25 @@ class PartSerializer(
         return fields
 
     @staticmethod
-    def annotate_queryset(queryset):
+    def annotate_queryset(queryset, prefetch_fields=None, fresh: bool = False):
         """Add some extra annotations to the queryset.
 
         Performing database queries as efficiently as possible, to reduce database trips.
+
+        Arguments:
+            queryset: The Part queryset to annotate
+            prefetch_fields: Optional list of related fields required by the included serializer fields.
+                If not provided, related fields are prefetched for all optional serializer fields.
+            fresh: If True, stock quantities are calculated "live" rather than read from the PartStockSummary table
         """
-        queryset = queryset.prefetch_related('category', 'default_location')
+        if prefetch_fields is None:
+            prefetch_fields = PartSerializer.get_field_prefetches()
 
-        queryset = Part.annotate_parameters(queryset)
+        queryset = queryset.prefetch_related('category', *prefetch_fields)
 
         # Annotate with the total number of revisions
         queryset = queryset.annotate(revision_count=SubqueryCount('revisions'))
 
-        # Annotate with the total number of stock items
-        queryset = queryset.annotate(stock_item_count=SubqueryCount('stock_items'))
-
-        # Annotate with the total variant stock quantity
-        variant_query = part_filters.variant_stock_query()
-
-        queryset = queryset.annotate(
-            variant_stock=part_filters.annotate_variant_quantity(
-                variant_query, reference='quantity'
-            )
-        )
-
-        # Annotate with the total 'building' quantity
-        queryset = queryset.annotate(
-            building=part_filters.annotate_in_production_quantity()
-        )
-
-        queryset = queryset.annotate(
-            scheduled_to_build=part_filters.annotate_scheduled_to_build_quantity()
-        )
-
         # Annotate with the number of 'suppliers'
         queryset = queryset.annotate(
             suppliers=Coalesce(
@@ -717,12 +702,11 @@ class PartSerializer(
             )
         )
 
-        queryset = queryset.annotate(
-            ordering=part_filters.annotate_on_order_quantity(),
-            in_stock=part_filters.annotate_total_stock(),
-            allocated_to_sales_orders=part_filters.annotate_sales_order_allocations(),
-            allocated_to_build_orders=part_filters.annotate_build_order_allocations(),
-        )
+        # Annotate with stock, order and allocation quantities
+        if fresh:
+            queryset = part_filters.annotate_stock_quantities(queryset)
+        else:
+            queryset = part_filters.annotate_stock_summary(queryset)
 
         # Annotate the queryset with the 'total_in_stock' quantity
         # This is the 'in_stock' quantity summed with the 'variant_stock' quantity
@@ -732,12 +716,6 @@ class PartSerializer(
             )
         )
 
-        queryset = queryset.annotate(
-            external_stock=part_filters.annotate_total_stock(
-                filter=Q(location__external=True)
-            )
-        )
-
         # Annotate with the total 'available stock' quantity
         # This is the current stock, minus any allocations
         queryset = queryset.annotate(
@@ -753,15 +731,37 @@ class PartSerializer(
             )
         )
 
-        # Annotate with the total 'required for builds' quantity
         queryset = queryset.annotate(
-            required_for_build_orders=part_filters.annotate_build_order_requirements(),
-            required_for_sales_orders=part_filters.annotate_sales_order_requirements(),
+            category_default_location=part_filters.annotate_default_location(
+                'category__'
+            )
         )
 
+        return queryset
+
+    @staticmethod
+    def annotate_search_queryset(queryset):
+        """Add the minimal set of annotations required to display search results.
+
+        The more expensive annotations (allocations, requirements, etc) are skipped,
+        and the associated fields are returned as null values.
+        """
+        queryset = queryset.prefetch_related('category', 'default_location')
+
+        variant_query = part_filters.variant_stock_query()
+
         queryset = queryset.annotate(
-            category_default_location=part_filters.annotate_default_location(
-                'category__'
+            variant_stock=part_filters.annotate_variant_quantity(
+                variant_query, reference='quantity'
+            ),
+            building=part_filters.annotate_in_production_quantity(),
+            ordering=part_filters.annotate_on_order_quantity(),
+            in_stock=part_filters.annotate_total_stock(),
+        )
+
+        queryset = queryset.annotate(
+            total_in_stock=ExpressionWrapper(
+                F('in_stock') + F('variant_stock'), output_field=models.DecimalField()
             )
         )
 
@@ -793,6 +793,7 @@ class PartSerializer(
             source='default_location', many=False, read_only=True, allow_null=True
         ),
         filter_name='location_detail',
+        prefetch_fields=['default_location'],
     )
 
     category_name = serializers.CharField(
@@ -906,6 +907,7 @@ class PartSerializer(
         ),
         True,
         filter_name='pricing',
+        prefetch_fields=['pricing_data'],
     )
     pricing_max = enable_filter(
         InvenTree.serializers.InvenTreeMoneySerializer(
@@ -913,6 +915,7 @@ class PartSerializer(
         ),
         True,
         filter_name='pricing',
+        prefetch_fields=['pricing_data'],
     )
     pricing_updated = enable_filter(
         FilterableDateTimeField(
@@ -920,6 +923,7 @@ class PartSerializer(
         ),
         True,
         filter_name='pricing',
+        prefetch_fields=['pricing_data'],
     )
 
     parameters = enable_filter(
@@ -928,6 +932,7 @@ class PartSerializer(
         ),
         False,
         filter_name='parameters',
+        prefetch_fields=Part.PARAMETER_PREFETCH_FIELDS,
     )
 
     price_breaks = enable_filter(
@@ -936,6 +941,7 @@ class PartSerializer(
         ),
         False,
         filter_name='price_breaks',
+        prefetch_fields=['salepricebreaks'],
     )
 
     # Extra fields used only for creation of a new Part instance
@@ -1408,8 +1414,12 @@ class PartPricingSerializer(InvenTree.serializers.InvenTreeModelSerializer):
 
         if override_min is not None and override_max is not None:
             try:
-                override_min = convert_money(override_min, default_currency)
-                override_max = convert_money(override_max, default_currency)
+                override_min = common.currency.convert_currency(
+                    override_min, default_currency
+                )
+                override_max = common.currency.convert_currency(
+                    override_max, default_currency
+                )
             except MissingRate:
                 raise ValidationError(
                     _(
@@ -1,14 +1,144 @@
 """Stock history functionality."""
 
+from decimal import Decimal
+from typing import Optional
+
 import structlog
-from djmoney.contrib.exchange.models import convert_money
+from djmoney.contrib.exchange.exceptions import MissingRate
 from djmoney.money import Money
 
 logger = structlog.get_logger('inventree')
 
+# Number of stock history entries to create in a single query
+N_BULK_CREATE = 250
+
+
+def convert_amount(amount, source: str, target: str) -> Decimal:
+    """Convert an amount between currencies, using the cached exchange rates.
+
+    If no exchange rate is available, the amount is considered to be zero.
+    """
+    from common.currency import exchange_rate
+
+    if not amount:
+        return Decimal(0)
+
+    try:
+        return Decimal(amount) * exchange_rate(source, target)
+    except MissingRate:
+        return Decimal(0)
+
+
+def stock_summary(exclude_external: bool = False) -> dict:
+    """Calculate a summary of 'in stock' items for all parts, in a single aggregate query.
+
+    Stock for variant parts is also rolled up into each template part.
+
+    Returns:
+        A dict of {part ID: summary}, where each summary contains:
+        - item_count: Number of stock items
+        - quantity: Total stock quantity
+        - unpriced: Total stock quantity without a purchase price
+        - costs: Dict of {currency: total purchase cost}
+    """
+    from django.db.models import Count, DecimalField, F, Q, Sum
+
+    import part.models as part_models
+    import stock.models as stock_models
+
+    items = stock_models.StockItem.objects.filter(
+        stock_models.StockItem.IN_STOCK_FILTER
+    )
+
+    if exclude_external:
+        items = items.filter(external=False)
+
+    rows = (
+        items
+        .order_by()
+        .values('part', 'purchase_price_currency')
+        .annotate(
+            item_count=Count('pk'),
+            total_quantity=Sum('quantity'),
+            unpriced=Sum('quantity', filter=Q(purchase_price=None)),
+            total_cost=Sum(
+                F('purchase_price') * F('quantity'),
+                output_field=DecimalField(max_digits=30, decimal_places=6),
+            ),
+        )
+    )
+
+    # Map of variant parts to their template part
+    templates = dict(
+        part_models.Part.objects.filter(variant_of__isnull=False).values_list(
+            'pk', 'variant_of'
+        )
+    )
+
+    summary = {}
+
+    for row in rows:
+        part_id = row['part']
+
+        # Add the stock to this part, and any template parts above it
+        while part_id is not None:
+            entry = summary.setdefault(
+                part_id,
+                {
+                    'item_count': 0,
+                    'quantity': Decimal(0),
+                    'unpriced': Decimal(0),
+                    'costs': {},
+                },
+            )
+
+            entry['item_count'] += row['item_count']
+            entry['quantity'] += row['total_quantity'] or 0
+            entry['unpriced'] += row['unpriced'] or 0
+
+            if row['total_cost']:
+                currency = row['purchase_price_currency']
+                entry['costs'][currency] = (
+                    entry['costs'].get(currency, 0) + row['total_cost']
+                )
+
+            part_id = templates.get(part_id)
+
+    return summary
+
+
+def stock_cost(entry: dict, unit_cost: Optional[Money], currency: str) -> Money:
+    """Calculate the total cost of a stock summary entry, in the specified currency.
+
+    Stock without a purchase price is valued using the provided unit cost.
+    """
+    total = sum(
+        (
+            convert_amount(amount, code, currency)
+            for code, amount in entry['costs'].items()
+        ),
+        Decimal(0),
+    )
+
+    if unit_cost is not None and entry['unpriced']:
+        total += (
+            convert_amount(unit_cost.amount, str(unit_cost.currency), currency)
+            * entry['unpriced']
+        )
+
+    return Money(total, currency)
+
 
 def perform_stocktake() -> None:
-    """Generate stock history entries for all active parts."""
+    """Generate stock history entries for all active parts.
+
+    - Stock quantities and costs are calculated for all parts in a single aggregate query
+    - Currency conversion uses the cached table of exchange rates
+    - Parts which already have a stock history entry for today are skipped
+    - Entries are created in chunks, so an interrupted run can be resumed
+    """
+    from django.db.models import Exists, OuterRef
+
     import InvenTree.helpers
     import part.models as part_models
     from common.currency import currency_code_default
@@ -22,83 +152,80 @@ def perform_stocktake() -> None:
         'STOCKTAKE_EXCLUDE_EXTERNAL', False, cache=False
     )
 
-    active_parts = part_models.Part.objects.filter(active=True)
-
-    # New history entries to be created
-    history_entries = []
-
-    N_BULK_CREATE = 250
-
     base_currency = currency_code_default()
     today = InvenTree.helpers.current_date()
 
-    logger.info(
-        'Creating new stock history entries for %s active parts', active_parts.count()
+    # Active parts which do not yet have a stock history entry for today
+    part_ids = list(
+        part_models.Part.objects
+        .filter(active=True)
+        .exclude(
+            Exists(
+                part_models.PartStocktake.objects.filter(
+                    part=OuterRef('pk'), date__gte=today
+                )
+            )
+        )
+        .order_by('pk')
+        .values_list('pk', flat=True)
     )
 
-    for part in active_parts:
-        # Is there a recent stock history record for this part?
-        if part_models.PartStocktake.objects.filter(
-            part=part, date__gte=today
-        ).exists():
-            continue
-
-        pricing = part.pricing
+    if len(part_ids) == 0:
+        logger.info('No active parts require new stock history entries')
+        return
 
-        # Fetch all 'in stock' items for this part
-        stock_items = part.stock_entries(
-            in_stock=True, include_external=not exclude_external, include_variants=True
-        )
+    logger.info('Creating new stock history entries for %s active parts', len(part_ids))
+
+    summary = stock_summary(exclude_external=exclude_external)
+
+    empty = {
+        'item_count': 0,
+        'quantity': Decimal(0),
+        'unpriced': Decimal(0),
+        'costs': {},
+    }
+
+    for idx in range(0, len(part_ids), N_BULK_CREATE):
+        chunk = part_ids[idx : idx + N_BULK_CREATE]
+
+        # Fetch pricing information for this chunk of parts
+        pricing = {
+            row['part']: row
+            for row in part_models.PartPricing.objects.filter(part__in=chunk).values(
+                'part',
+                'overall_min',
+                'overall_min_currency',
+                'overall_max',
+                'overall_max_currency',
+            )
+        }
 
-        total_cost_min = Money(0, base_currency)
-        total_cost_max = Money(0, base_currency)
+        history_entries = []
 
-        total_quantity = 0
-        items_count = 0
+        for part_id in chunk:
+            entry = summary.get(part_id, empty)
 
-        for item in stock_items:
-            # Extract cost information
+            cost_min = cost_max = None
 
-            entry_cost_min = pricing.overall_min or pricing.overall_max
-            entry_cost_max = pricing.overall_max or pricing.overall_min
+            if price := pricing.get(part_id):
+                if price['overall_min'] is not None:
+                    cost_min = Money(
+                        price['overall_min'], price['overall_min_currency']
+                    )
 
-            if item.purchase_price is not None:
-                entry_cost_min = item.purchase_price
-                entry_cost_max = item.purchase_price
+                if price['overall_max'] is not None:
+                    cost_max = Money(
+                        price['overall_max'], price['overall_max_currency']
+                    )
 
-            try:
-                entry_cost_min = (
-                    convert_money(entry_cost_min, base_currency) * item.quantity
+            history_entries.append(
+                part_models.PartStocktake(
+                    part_id=part_id,
+                    item_count=entry['item_count'],
+                    quantity=entry['quantity'],
+                    cost_min=stock_cost(entry, cost_min or cost_max, base_currency),
+                    cost_max=stock_cost(entry, cost_max or cost_min, base_currency),
                 )
-                entry_cost_max = (
-                    convert_money(entry_cost_max, base_currency) * item.quantity
-                )
-            except Exception:
-                entry_cost_min = Money(0, base_currency)
-                entry_cost_max = Money(0, base_currency)
-
-            # Update total quantities
-            items_count += 1
-            total_quantity += item.quantity
-            total_cost_min += entry_cost_min
-            total_cost_max += entry_cost_max
-
-        # Add a new stocktake entry for this part
-        history_entries.append(
-            part_models.PartStocktake(
-                part=part,
-                item_count=items_count,
-                quantity=total_quantity,
-                cost_min=total_cost_min,
-                cost_max=total_cost_max,
             )
-        )
-
-        # Batch create stock history entries
-        if len(history_entries) >= N_BULK_CREATE:
-            part_models.PartStocktake.objects.bulk_create(history_entries)
-            history_entries = []
 
-    if len(history_entries) > 0:
-        # Save any remaining stocktake entries
         part_models.PartStocktake.objects.bulk_create(history_entries)
@@ -3,8 +3,11 @@
 from datetime import datetime, timedelta
 from typing import Optional
 
+from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.db.models import Model
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 import structlog
@@ -13,7 +16,7 @@ from opentelemetry import trace
 import common.currency
 import common.notifications
 import InvenTree.helpers_model
-from common.settings import get_global_setting
+from common.settings import get_global_setting, set_global_setting
 from InvenTree.tasks import (
     ScheduledTask,
     check_daily_holdoff,
@@ -25,6 +28,12 @@ from InvenTree.tasks import (
 tracer = trace.get_tracer(__name__)
 logger = structlog.get_logger('inventree')
 
+# Cache key used to prevent concurrent pricing refresh chains
+PRICING_REFRESH_KEY = 'part_pricing_refresh'
+
+# Maximum time (seconds) between batches before a pricing refresh chain is considered stalled
+PRICING_REFRESH_TIMEOUT = 3600
+
 
 @tracer.start_as_current_span('notify_low_stock')
 def notify_low_stock(part: Model):
@@ -244,7 +253,7 @@ def update_part_pricing(pricing: Model, counter: int = 0):
 
 @tracer.start_as_current_span('check_missing_pricing')
 @scheduled_task(ScheduledTask.DAILY)
-def check_missing_pricing(limit=250):
+def check_missing_pricing():
     """Check for parts with missing or outdated pricing information.
 
     Tests for the following conditions:
@@ -252,9 +261,11 @@ def check_missing_pricing(limit=250):
     - Pricing information is "old"
     - Pricing information is in the wrong currency
 
-    Arguments:
-        limit: Maximum number of parts to process at once
+    Any matching pricing entries are flagged for update (in bulk),
+    and then recalculated in batches by the refresh_scheduled_pricing task.
     """
+    from django.db.models import Q
+
     from part.models import Part, PartPricing
 
     # Find any parts which have 'old' pricing information
@@ -264,45 +275,225 @@ def check_missing_pricing(limit=250):
         # Task does not run if the interval is zero
         return
 
-    # Find parts for which pricing information has never been updated
-    results = PartPricing.objects.filter(updated=None)[:limit]
-
-    if results.count() > 0:
-        logger.info('Found %s parts with empty pricing', results.count())
+    # Create (and schedule) pricing information for any parts which do not have it
+    missing = Part.objects.filter(pricing_data=None).values_list('pk', flat=True)
 
-        for pp in results:
-            pp.schedule_for_update()
+    if created := PartPricing.objects.bulk_create(
+        [PartPricing(part_id=pk, scheduled_for_update=True) for pk in missing],
+        batch_size=1000,
+        ignore_conflicts=True,
+    ):
+        logger.info('Created pricing entries for %s parts', len(created))
 
     stale_date = datetime.now().date() - timedelta(days=days)
+    currency = common.currency.currency_code_default()
+
+    # Pricing which has never been calculated, is 'old', or is in the wrong currency
+    stale = Q(updated=None) | Q(updated__lte=stale_date) | ~Q(currency=currency)
 
-    results = PartPricing.objects.filter(updated__lte=stale_date)[:limit]
+    n_stale = PartPricing.objects.filter(stale, scheduled_for_update=False).update(
+        scheduled_for_update=True
+    )
 
-    if results.count() > 0:
-        logger.info('Found %s stale pricing entries', results.count())
+    if n_stale > 0:
+        logger.info('Scheduled pricing update for %s parts', n_stale)
 
-        for pp in results:
-            pp.schedule_for_update()
+    n_total = PartPricing.objects.filter(scheduled_for_update=True).count()
 
-    # Find any pricing data which is in the wrong currency
-    currency = common.currency.currency_code_default()
-    results = PartPricing.objects.exclude(currency=currency)
+    if n_total == 0:
+        return
+
+    if not cache.add(PRICING_REFRESH_KEY, True, PRICING_REFRESH_TIMEOUT):
+        # A refresh chain is already running, and will process the flagged entries
+        logger.info('Pricing refresh already in progress')
+        return
+
+    # Record progress of the pricing refresh
+    set_global_setting('_PRICING_REFRESH_TOTAL', n_total, None)
+    set_global_setting('_PRICING_REFRESH_COMPLETE', 0, None)
+
+    # Pricing calculations are performed in the background,
+    # unless the TESTING_PRICING flag is set
+    if not offload_task(
+        refresh_scheduled_pricing,
+        force_async=not settings.TESTING or not settings.TESTING_PRICING,
+        group='pricing',
+    ):
+        cache.delete(PRICING_REFRESH_KEY)
+
+
+@tracer.start_as_current_span('refresh_scheduled_pricing')
+def refresh_scheduled_pricing(batch: int = 0):
+    """Recalculate pricing for a batch of parts which are flagged for update.
+
+    If there are more parts remaining, another task is offloaded to process the next batch.
+    Progress is recorded in the '_PRICING_REFRESH_COMPLETE' and '_PRICING_REFRESH_TOTAL' settings.
+
+    The PRICING_REFRESH_KEY lock is held (and renewed by each batch) until the chain completes.
+
+    Arguments:
+        batch: The number of batches which have already been processed
+    """
+    from part.models import PartPricing
+
+    batch_size = int(get_global_setting('PRICING_UPDATE_BATCH_SIZE', 500))
+
+    queryset = PartPricing.objects.filter(scheduled_for_update=True).order_by('pk')
+
+    results = list(queryset.select_related('part')[:batch_size])
+
+    if len(results) == 0:
+        cache.delete(PRICING_REFRESH_KEY)
+        return
+
+    # Renew the lock for the duration of this batch
+    cache.set(PRICING_REFRESH_KEY, True, PRICING_REFRESH_TIMEOUT)
+
+    logger.info('Updating pricing for %s parts (batch %s)', len(results), batch + 1)
+
+    # Parts for which the pricing has changed
+    changed = []
+
+    for pricing in results:
+        previous = (pricing.overall_min, pricing.overall_max)
+
+        try:
+            # Parent assemblies and templates are flagged below, rather than each being offloaded
+            pricing.update_pricing(
+                cascade=False, previous_min=previous[0], previous_max=previous[1]
+            )
+        except Exception:
+            logger.exception('Failed to update pricing for part %s', pricing.part_id)
+            continue
+
+        if (pricing.overall_min, pricing.overall_max) != previous:
+            changed.append(pricing.part)
+
+    # Clear the update flag for any entries which could not be updated
+    PartPricing.objects.filter(
+        pk__in=[pricing.pk for pricing in results], scheduled_for_update=True
+    ).update(scheduled_for_update=False)
+
+    if changed and (n_parents := schedule_parent_pricing(changed)):
+        total = int(get_global_setting('_PRICING_REFRESH_TOTAL', 0, cache=False) or 0)
+        set_global_setting('_PRICING_REFRESH_TOTAL', total + n_parents, None)
 
-    if results.count() > 0:
-        logger.info('Found %s pricing entries in the wrong currency', results.count())
+    complete = int(get_global_setting('_PRICING_REFRESH_COMPLETE', 0, cache=False) or 0)
+    set_global_setting('_PRICING_REFRESH_COMPLETE', complete + len(results), None)
+
+    if not queryset.exists():
+        cache.delete(PRICING_REFRESH_KEY)
+        return
+
+    delay = int(get_global_setting('PRICING_UPDATE_BATCH_DELAY', 0))
+
+    if delay > 0 and not (settings.TESTING and settings.TESTING_PRICING):
+        # Rate limit consecutive batches by scheduling the next batch,
+        # rather than waiting (and possibly exceeding the worker timeout) within this task
+        from django_q.models import Schedule
+        from django_q.tasks import schedule
+
+        schedule(
+            'part.tasks.refresh_scheduled_pricing',
+            batch=batch + 1,
+            schedule_type=Schedule.ONCE,
+            next_run=timezone.now() + timedelta(seconds=delay),
+        )
+    elif not offload_task(
+        refresh_scheduled_pricing,
+        batch=batch + 1,
+        force_async=not settings.TESTING or not settings.TESTING_PRICING,
+        group='pricing',
+    ):
+        cache.delete(PRICING_REFRESH_KEY)
+
+
+def schedule_parent_pricing(parts: list) -> int:
+    """Flag the assemblies and templates which use the provided parts for a pricing update.
+
+    The flagged entries are updated (in bulk) by the refresh_scheduled_pricing task.
+
+    Returns:
+        The number of pricing entries which were newly flagged for update
+    """
+    from part.models import Part, PartPricing
+
+    parent_ids = set()
+
+    for part in parts:
+        parent_ids.update(p.pk for p in part.get_used_in())
+        parent_ids.update(
+            part.get_ancestors(include_self=False).values_list('pk', flat=True)
+        )
+
+    if not parent_ids:
+        return 0
+
+    # Create pricing information for any parents which do not have it
+    created = PartPricing.objects.bulk_create(
+        [
+            PartPricing(part_id=pk, scheduled_for_update=True)
+            for pk in Part.objects.filter(
+                pk__in=parent_ids, pricing_data=None
+            ).values_list('pk', flat=True)
+        ],
+        ignore_conflicts=True,
+    )
+
+    return len(created) + PartPricing.objects.filter(
+        part__in=parent_ids, scheduled_for_update=False
+    ).update(scheduled_for_update=True)
+
+
+@tracer.start_as_current_span('refresh_stock_summaries')
+def refresh_stock_summaries():
+    """Recalculate the stock summary for a batch of parts which are flagged for update.
+
+    This task is scheduled by PartStockSummary.schedule_update (once the triggering transaction is committed).
+    If there are more parts remaining, another task is offloaded to process the next batch.
+    """
+    from part.models import STOCK_SUMMARY_BATCH_SIZE, PartStockSummary
+
+    # Allow further refreshes to be scheduled
+    PartStockSummary.clear_refresh()
+
+    queryset = PartStockSummary.objects.filter(scheduled_for_update=True)
+
+    part_ids = list(
+        queryset.order_by('pk').values_list('part', flat=True)[
+            :STOCK_SUMMARY_BATCH_SIZE
+        ]
+    )
+
+    if len(part_ids) == 0:
+        return
+
+    n = PartStockSummary.refresh(part_ids)
+    logger.info('Updated stock summary for %s parts', n)
+
+    if queryset.exists():
+        PartStockSummary.offload_refresh()
+
+
+@tracer.start_as_current_span('check_stock_summaries')
+@scheduled_task(ScheduledTask.DAILY)
+def check_stock_summaries():
+    """Recalculate the stock summary for all parts.
+
+    Entries are normally updated when related stock items or orders change,
+    but some changes (e.g. bulk queryset updates) bypass these hooks.
+    This task repairs any drift, and creates any missing entries.
+    """
+    from part.models import STOCK_SUMMARY_BATCH_SIZE, Part, PartStockSummary
 
-        for pp in results:
-            pp.schedule_for_update()
+    part_ids = list(Part._base_manager.order_by('pk').values_list('pk', flat=True))
 
-    # Find any parts which do not have pricing information
-    results = Part.objects.filter(pricing_data=None)[:limit]
+    n = 0
 
-    if results.count() > 0:
-        logger.info('Found %s parts without pricing', results.count())
+    for idx in range(0, len(part_ids), STOCK_SUMMARY_BATCH_SIZE):
+        n += PartStockSummary.refresh(part_ids[idx : idx + STOCK_SUMMARY_BATCH_SIZE])
 
-        for p in results:
-            pricing = p.pricing
-            pricing.save()
-            pricing.schedule_for_update()
+    logger.info('Checked stock summary for %s parts (%s updated)', len(part_ids), n)
 
 
 @tracer.start_as_current_span('scheduled_stocktake_reports')
@@ -1,9 +1,13 @@
 """Unit tests for the PartCategory model."""
 
+from unittest import mock
+
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 
 from common.models import InvenTreeSetting, Parameter, ParameterTemplate
+from tenancy.context import clear_current_tenant, set_current_tenant
+from tenancy.models import Tenant
 
 from .models import Part, PartCategory
 
@@ -260,6 +264,135 @@ class CategoryTest(TestCase):
         tree_ids = set(tree_ids)
         self.assertEqual(len(tree_ids), 10)
 
+    def test_rename_path_string(self):
+        """Test that the pathstring of lower nodes is updated by prefix."""
+        top = PartCategory.objects.create(name='Top', description='Top level')
+        child = PartCategory.objects.create(name='Child', parent=top)
+        grandchild = PartCategory.objects.create(name='Grandchild', parent=child)
+
+        # Construct a deep tree, so that the lowest pathstring is truncated
+        parent = grandchild
+
+        for idx in range(26):
+            parent = PartCategory.objects.create(
+                name=chr(ord('A') + idx) * 10, parent=parent
+            )
+
+        top.refresh_from_db()
+        top.name = 'Renamed'
+        top.save()
+
+        for node in [child, grandchild, parent]:
+            node.refresh_from_db()
+            self.assertEqual(node.pathstring, node.construct_pathstring())
+
+        self.assertEqual(grandchild.pathstring, 'Renamed/Child/Grandchild')
+        self.assertLessEqual(len(parent.pathstring), 250)
+
+        # Deleting a node moves the lower nodes up to the parent
+        child.delete()
+        grandchild.refresh_from_db()
+        self.assertEqual(grandchild.pathstring, 'Renamed/Grandchild')
+
+        # Deleting a root node makes the lower nodes top-level
+        top.delete()
+        grandchild.refresh_from_db()
+        self.assertEqual(grandchild.pathstring, 'Grandchild')
+
+        parent.refresh_from_db()
+        self.assertEqual(parent.pathstring, parent.construct_pathstring())
+
+    def test_tenant_rebuild(self):
+        """Test that a tree rebuild only affects the trees of the current tenant."""
+        tenant_a = Tenant.objects.create(name='Tenant A', slug='tenant-a')
+        tenant_b = Tenant.objects.create(name='Tenant B', slug='tenant-b')
+
+        try:
+            set_current_tenant(tenant_a)
+            top_a = PartCategory.objects.create(name='Top A')
+            sub_a = PartCategory.objects.create(name='Sub A', parent=top_a)
+
+            set_current_tenant(tenant_b)
+            top_b = PartCategory.objects.create(name='Top B')
+            PartCategory.objects.create(name='Sub B', parent=top_b)
+        finally:
+            clear_current_tenant()
+
+        # Tree ID values are unique across all tenants
+        tree_ids = list(
+            PartCategory.objects.filter(parent=None).values_list('tree_id', flat=True)
+        )
+        self.assertEqual(len(tree_ids), len(set(tree_ids)))
+
+        def other_trees():
+            return list(
+                PartCategory.objects
+                .exclude(tenant=tenant_a)
+                .order_by('pk')
+                .values_list('pk', 'tree_id', 'lft', 'rght', 'level')
+            )
+
+        others = other_trees()
+
+        # Corrupt the tree structure for tenant A
+        PartCategory.objects.filter(tenant=tenant_a).update(lft=0, rght=0, level=5)
+
+        try:
+            set_current_tenant(tenant_a)
+            PartCategory._tree_manager.rebuild()
+        finally:
+            clear_current_tenant()
+
+        top_a.refresh_from_db()
+        sub_a.refresh_from_db()
+
+        self.assertEqual((top_a.lft, top_a.rght, top_a.level), (1, 4, 0))
+        self.assertEqual((sub_a.lft, sub_a.rght, sub_a.level), (2, 3, 1))
+        self.assertEqual(sub_a.tree_id, top_a.tree_id)
+
+        # The trees for other tenants have not been touched
+        self.assertEqual(other_trees(), others)
+
+    def test_schedule_tree_rebuild(self):
+        """Test that scheduled tree rebuilds are coalesced for each tree."""
+        tree_id = self.electronics.tree_id
+
+        # Without a background worker, the tree is rebuilt immediately
+        PartCategory.objects.filter(tree_id=tree_id).update(lft=0, rght=0)
+        PartCategory.schedule_tree_rebuild(tree_id)
+
+        self.electronics.refresh_from_db()
+        self.assertEqual(self.electronics.lft, 1)
+        self.assertGreater(self.electronics.rght, 2)
+
+        with (
+            mock.patch('InvenTree.status.is_worker_running', return_value=True),
+            mock.patch('InvenTree.tasks.offload_task', return_value=True) as offload,
+        ):
+            # Nothing is offloaded until the transaction is committed
+            with self.captureOnCommitCallbacks(execute=True):
+                PartCategory.schedule_tree_rebuild(tree_id, tree_id, None)
+                PartCategory.schedule_tree_rebuild(tree_id)
+                self.assertEqual(offload.call_count, 0)
+
+            self.assertEqual(offload.call_count, 1)
+
+            # The rebuild task is still pending
+            with self.captureOnCommitCallbacks(execute=True):
+                PartCategory.schedule_tree_rebuild(tree_id)
+
+            self.assertEqual(offload.call_count, 1)
+
+            # Once the task has started, a new rebuild can be scheduled
+            PartCategory.clear_tree_rebuild(tree_id)
+
+            with self.captureOnCommitCallbacks(execute=True):
+                PartCategory.schedule_tree_rebuild(tree_id)
+
+            self.assertEqual(offload.call_count, 2)
+
+        PartCategory.clear_tree_rebuild(tree_id)
+
     def test_category_tree(self):
         """Unit tests for the part category tree structure (MPTT).
 
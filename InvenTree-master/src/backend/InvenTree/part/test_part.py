@@ -13,6 +13,7 @@ from common.settings import get_global_setting, set_global_setting
 from InvenTree import version
 from InvenTree.templatetags import inventree_extras
 from InvenTree.unit_test import InvenTreeTestCase, addUserPermission
+from tenancy.models import Tenant
 
 from .models import (
     Part,
@@ -20,6 +21,7 @@ from .models import (
     PartCategoryStar,
     PartRelated,
     PartStar,
+    PartStockSummary,
     PartTestTemplate,
     rename_part_image,
 )
@@ -993,3 +995,124 @@ class PartStockHistoryTest(InvenTreeTestCase):
         N_STOCKTAKE = PartStocktake.objects.count()
         perform_stocktake()
         self.assertEqual(PartStocktake.objects.count(), N_STOCKTAKE)
+
+    def test_stock_history_values(self):
+        """Test that stock history entries match the stock for each part (including variants)."""
+        from part.models import Part
+        from part.stocktake import perform_stocktake
+
+        set_global_setting('STOCKTAKE_ENABLE', True)
+
+        perform_stocktake()
+
+        for p in Part.objects.filter(active=True):
+            entry = p.stocktakes.latest('pk')
+            items = p.stock_entries(in_stock=True, include_variants=True)
+
+            self.assertEqual(entry.item_count, items.count())
+            self.assertEqual(entry.quantity, p.get_stock_count(include_variants=True))
+            self.assertEqual(str(entry.cost_min.currency), 'USD')
+
+
+class PartStockSummaryTest(TestCase):
+    """Test the cached stock summary for each part."""
+
+    fixtures = ['category', 'part', 'location', 'stock']
+
+    def assertSummaryCorrect(self):
+        """Check that the cached quantities match the live quantities for all parts."""
+        from part.filters import annotate_stock_quantities, annotate_stock_summary
+
+        fields = ['pk', *PartStockSummary.QUANTITY_FIELDS]
+
+        live = annotate_stock_quantities(Part._base_manager.order_by('pk')).values(
+            *fields
+        )
+        cached = annotate_stock_summary(Part._base_manager.order_by('pk')).values(
+            *fields
+        )
+
+        self.assertEqual(len(live), len(cached))
+
+        for a, b in zip(live, cached):
+            for field in fields:
+                self.assertAlmostEqual(float(a[field]), float(b[field]))
+
+    def test_stock_summary(self):
+        """Test that stock changes are reflected in the stock summary."""
+        from part.tasks import check_stock_summaries, refresh_stock_summaries
+        from stock.models import StockItem
+
+        self.assertSummaryCorrect()
+
+        # Remove any entries created when loading fixture data
+        PartStockSummary.objects.all().delete()
+        self.assertSummaryCorrect()
+
+        check_stock_summaries()
+
+        self.assertEqual(PartStockSummary.objects.count(), Part._base_manager.count())
+        self.assertFalse(
+            PartStockSummary.objects.filter(scheduled_for_update=True).exists()
+        )
+        self.assertSummaryCorrect()
+
+        # Adjust the quantity of a stock item for a variant part
+        item = StockItem.objects.filter(part__level__gt=0).first()
+        variant = item.part
+        template = variant.get_ancestors().first()
+
+        item.tenant = Tenant.objects.create(name='Stock Tenant', slug='stock-tenant')
+        item.quantity += 100
+        item.save()
+
+        # The variant part and the template part are flagged for update
+        flagged = set(
+            PartStockSummary.objects.filter(scheduled_for_update=True).values_list(
+                'part', flat=True
+            )
+        )
+
+        self.assertIn(variant.pk, flagged)
+        self.assertIn(template.pk, flagged)
+
+        # Flagged entries fall back to the live quantities
+        self.assertSummaryCorrect()
+
+        refresh_stock_summaries()
+
+        self.assertFalse(
+            PartStockSummary.objects.filter(scheduled_for_update=True).exists()
+        )
+        self.assertEqual(
+            PartStockSummary.objects.get(part=variant).in_stock,
+            variant.get_stock_count(include_variants=False),
+        )
+        self.assertSummaryCorrect()
+
+        # Drift is repaired by the periodic check
+        PartStockSummary.objects.filter(part=variant).update(in_stock=0)
+        check_stock_summaries()
+        self.assertSummaryCorrect()
+
+        # Moving a stock item to a different part flags both parts for update
+        other = (
+            Part._base_manager
+            .filter(level=0, virtual=False)
+            .exclude(tree_id=variant.tree_id)
+            .first()
+        )
+
+        item.part = other
+        item.save()
+
+        flagged = set(
+            PartStockSummary.objects.filter(scheduled_for_update=True).values_list(
+                'part', flat=True
+            )
+        )
+
+        self.assertEqual(flagged, {other.pk, variant.pk, template.pk})
+
+        refresh_stock_summaries()
+        self.assertSummaryCorrect()
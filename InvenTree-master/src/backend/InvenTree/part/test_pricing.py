@@ -1,5 +1,7 @@
 """Unit tests for Part pricing calculations."""
 
+from unittest import mock
+
 from django.core.exceptions import ObjectDoesNotExist
 from django.test.utils import override_settings
 
@@ -11,9 +13,11 @@ import company.models
 import order.models
 import part.models
 import stock.models
-from common.settings import set_global_setting
+from common.settings import get_global_setting, set_global_setting
 from InvenTree.unit_test import InvenTreeTestCase
 from order.status_codes import PurchaseOrderStatus
+from tenancy.context import clear_current_tenant, set_current_tenant
+from tenancy.models import Tenant
 
 
 class PartPricingTests(InvenTreeTestCase):
@@ -545,3 +549,148 @@ class PartPricingTests(InvenTreeTestCase):
 
         self.assertEqual(A1.pricing.overall_min, Money(a_min, 'USD'))
         self.assertEqual(A1.pricing.overall_max, Money(a_max, 'USD'))
+
+
+class PricingRefreshTests(InvenTreeTestCase):
+    """Unit tests for the bulk refresh of part pricing."""
+
+    def refresh_progress(self):
+        """Return the (complete, total) progress of the pricing refresh."""
+        return tuple(
+            int(get_global_setting(key, cache=False))
+            for key in ['_PRICING_REFRESH_COMPLETE', '_PRICING_REFRESH_TOTAL']
+        )
+
+    @override_settings(TESTING_PRICING=True)
+    def test_refresh_pricing(self):
+        """Test that missing and stale pricing is refreshed in batches."""
+        from part.tasks import check_missing_pricing
+
+        set_current_tenant(Tenant.objects.create(name='Pricing', slug='pricing'))
+        self.addCleanup(clear_current_tenant)
+
+        for ii in range(60):
+            part.models.Part.objects.create(name=f'Part_{ii}', description='A part')
+
+        part.models.PartPricing.objects.all().delete()
+
+        # Process the pricing updates in small batches
+        set_global_setting('PRICING_UPDATE_BATCH_SIZE', 25)
+
+        check_missing_pricing()
+
+        pricing = part.models.PartPricing.objects.all()
+
+        self.assertEqual(pricing.count(), 60)
+        self.assertFalse(pricing.filter(scheduled_for_update=True).exists())
+
+        self.assertEqual(self.refresh_progress(), (60, 60))
+
+        # Pricing in the wrong currency is scheduled for update
+        pks = list(pricing.values_list('pk', flat=True)[:10])
+        pricing.filter(pk__in=pks).update(currency='NZD')
+
+        check_missing_pricing()
+
+        self.assertFalse(pricing.filter(currency='NZD').exists())
+        self.assertEqual(self.refresh_progress(), (10, 10))
+
+    @override_settings(TESTING_PRICING=True)
+    def test_refresh_assemblies(self):
+        """Test that assemblies are flagged in bulk when component pricing changes."""
+        from part.tasks import refresh_scheduled_pricing
+
+        set_current_tenant(Tenant.objects.create(name='Assembly', slug='assembly'))
+        self.addCleanup(clear_current_tenant)
+
+        assembly = part.models.Part.objects.create(
+            name='Assembly', description='An assembly', assembly=True
+        )
+        component = part.models.Part.objects.create(
+            name='Component', description='A component', component=True
+        )
+        part.models.BomItem.objects.create(
+            part=assembly, sub_part=component, quantity=2
+        )
+
+        pricing = component.pricing
+        pricing.save()
+
+        part.models.PartPricing.objects.update(scheduled_for_update=False)
+        part.models.PartPricing.objects.filter(pk=pricing.pk).update(
+            override_min=1,
+            override_min_currency='USD',
+            override_max=2,
+            override_max_currency='USD',
+            scheduled_for_update=True,
+        )
+
+        # No separate task is offloaded for each assembly
+        with mock.patch.object(
+            part.models.PartPricing, 'schedule_for_update'
+        ) as schedule:
+            refresh_scheduled_pricing()
+
+        schedule.assert_not_called()
+
+        pricing = part.models.PartPricing.objects.get(part=assembly)
+        self.assertFalse(pricing.scheduled_for_update)
+        self.assertEqual(pricing.overall_min, Money(2, 'USD'))
+        self.assertEqual(pricing.overall_max, Money(4, 'USD'))
+
+    @override_settings(TESTING_PRICING=True)
+    def test_refresh_lock(self):
+        """Test that only a single pricing refresh chain runs at a time."""
+        from django.core.cache import cache
+
+        from part.tasks import PRICING_REFRESH_KEY, check_missing_pricing
+
+        set_current_tenant(Tenant.objects.create(name='Lock', slug='lock'))
+        self.addCleanup(clear_current_tenant)
+
+        for ii in range(5):
+            part.models.Part.objects.create(name=f'Part_{ii}', description='A part')
+
+        part.models.PartPricing.objects.all().delete()
+
+        # A refresh chain is already in progress
+        cache.set(PRICING_REFRESH_KEY, True)
+        self.addCleanup(cache.delete, PRICING_REFRESH_KEY)
+
+        with mock.patch('part.tasks.offload_task') as offload:
+            check_missing_pricing()
+
+        offload.assert_not_called()
+
+        # Entries are flagged, to be processed by the running chain
+        pricing = part.models.PartPricing.objects.all()
+        self.assertEqual(pricing.filter(scheduled_for_update=True).count(), 5)
+
+        # The lock is released once the chain is complete
+        cache.delete(PRICING_REFRESH_KEY)
+        check_missing_pricing()
+
+        self.assertFalse(pricing.filter(scheduled_for_update=True).exists())
+        self.assertIsNone(cache.get(PRICING_REFRESH_KEY))
+
+    def test_schedule_flagged(self):
+        """Test that an explicit update is scheduled for entries flagged in bulk."""
+        set_current_tenant(Tenant.objects.create(name='Flagged', slug='flagged'))
+        self.addCleanup(clear_current_tenant)
+
+        prt = part.models.Part.objects.create(name='Part', description='A part')
+
+        pricing = prt.pricing
+        pricing.save()
+
+        part.models.PartPricing.objects.filter(pk=pricing.pk).update(
+            scheduled_for_update=True
+        )
+
+        with mock.patch('InvenTree.tasks.offload_task') as offload:
+            pricing.schedule_for_update()
+
+            # A second request is ignored until the update has started
+            pricing.schedule_for_update()
+
+        offload.assert_called_once()
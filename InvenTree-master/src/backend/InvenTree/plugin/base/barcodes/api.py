@@ -13,6 +13,7 @@ from rest_framework.generics import CreateAPIView
 from rest_framework.response import Response
 
 import common.models
+import common.tasks
 import InvenTree.permissions
 import order.models
 import plugin.base.barcodes.helper
@@ -23,6 +24,7 @@ from InvenTree.exceptions import log_error
 from InvenTree.filters import SEARCH_ORDER_FILTER
 from InvenTree.helpers import hash_barcode
 from InvenTree.mixins import ListAPI, RetrieveDestroyAPI
+from InvenTree.tasks import offload_task
 from plugin import PluginMixinEnum, registry
 from users.permissions import check_user_permission
 
@@ -37,20 +39,27 @@ class BarcodeView(CreateAPIView):
     # Default serializer class (can be overridden)
     serializer_class = barcode_serializers.BarcodeSerializer
 
-    def log_scan(self, request, response=None, result: bool = False):
+    def log_scan(
+        self, request, response=None, result: bool = False, barcode: str | None = None
+    ):
         """Log a barcode scan to the database.
 
         Arguments:
             request: HTTP request object
             response: Optional response data
             result: Boolean indicating success or failure of the scan
+            barcode: Scanned barcode data (optional, extracted from the request if not provided)
         """
         from common.models import BarcodeScanResult
 
         # Extract context data from the request
         context = {**request.GET.dict(), **request.POST.dict(), **request.data}
 
-        barcode = context.pop('barcode', '')
+        scanned_barcode = context.pop('barcode', '')
+        context.pop('barcodes', None)
+
+        if barcode is None:
+            barcode = scanned_barcode
 
         # Exit if storing barcode scans is disabled
         if not get_global_setting('BARCODE_STORE_RESULTS', backup=False, create=False):
@@ -76,28 +85,20 @@ class BarcodeView(CreateAPIView):
         if len(barcode) > BarcodeScanResult.BARCODE_SCAN_MAX_LEN:
             barcode = barcode[: BarcodeScanResult.BARCODE_SCAN_MAX_LEN]
 
+        user = getattr(request, 'user', None)
+
+        # Write the scan result in the background, so as not to delay the response
         try:
-            BarcodeScanResult.objects.create(
-                data=barcode,
-                user=request.user,
+            offload_task(
+                common.tasks.log_barcode_scan,
+                barcode,
+                user_id=user.pk if user and user.is_authenticated else None,
                 endpoint=request.path,
                 response=response,
                 result=result,
                 context=context,
+                group='barcode',
             )
-
-            # Ensure that we do not store too many scans
-            max_scans = int(get_global_setting('BARCODE_RESULTS_MAX_NUM', create=False))
-            num_scans = BarcodeScanResult.objects.count()
-
-            if num_scans > max_scans:
-                n = num_scans - max_scans
-                old_scan_ids = list(
-                    BarcodeScanResult.objects.all()
-                    .order_by('timestamp')
-                    .values_list('pk', flat=True)[:n]
-                )
-                BarcodeScanResult.objects.filter(pk__in=old_scan_ids).delete()
         except Exception:
             # Gracefully log error to database
             log_error(f'{self.__class__.__name__}.log_scan', scope='barcode')
@@ -152,6 +153,10 @@ class BarcodeView(CreateAPIView):
 
         for current_plugin in plugins:
             try:
+                # Skip plugins which cannot possibly match this barcode
+                if not current_plugin.match_barcode(barcode):
+                    continue
+
                 result = current_plugin.scan(barcode)
             except Exception:
                 log_error('BarcodeView.scan_barcode', plugin=current_plugin.slug)
@@ -220,6 +225,47 @@ class BarcodeScan(BarcodeView):
         return Response(response)
 
 
+class BarcodeScanBatch(BarcodeView):
+    """Endpoint for scanning multiple barcodes in a single request.
+
+    This is intended for handheld scanners which send scans in bursts.
+    Each barcode is resolved (as per the BarcodeScan endpoint),
+    and a list of results is returned in the same order as the provided barcodes.
+    Barcodes which cannot be matched return an 'error' entry, rather than failing the entire request.
+    """
+
+    serializer_class = barcode_serializers.BarcodeBatchSerializer
+
+    def create(self, request, *args, **kwargs):
+        """Scan each of the provided barcodes."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        barcodes = [
+            str(barcode).strip() for barcode in serializer.validated_data['barcodes']
+        ]
+
+        # Each unique barcode is only scanned once
+        responses = {}
+
+        for barcode in barcodes:
+            if barcode in responses:
+                continue
+
+            response = self.scan_barcode(barcode, request)
+
+            if response['plugin'] is None:
+                response['error'] = _('No match found for barcode data')
+            else:
+                response['success'] = _('Match found for barcode data')
+
+            self.log_scan(request, response, 'success' in response, barcode=barcode)
+
+            responses[barcode] = response
+
+        return Response({'results': [responses[barcode] for barcode in barcodes]})
+
+
 @extend_schema_view(
     post=extend_schema(responses={200: barcode_serializers.BarcodeSerializer})
 )
@@ -536,6 +582,9 @@ class BarcodePOReceive(BarcodeView):
 
         for current_plugin in plugins:
             try:
+                if not current_plugin.match_barcode(barcode):
+                    continue
+
                 result = current_plugin.scan_receive_item(
                     barcode,
                     request.user,
@@ -812,6 +861,8 @@ barcode_api_urls = [
             ),
         ]),
     ),
+    # Scan multiple barcodes in a single request
+    path('batch/', BarcodeScanBatch.as_view(), name='api-barcode-scan-batch'),
     # Generate a barcode for a database object
     path('generate/', BarcodeGenerate.as_view(), name='api-barcode-generate'),
     # Link a third-party barcode to an item (e.g. Part / StockItem / etc)
@@ -1,6 +1,8 @@
 """Helper functions for barcode generation."""
 
-from typing import cast
+from typing import Optional, cast
+
+from django.core.cache import cache as django_cache
 
 import structlog
 
@@ -9,6 +11,9 @@ from InvenTree.models import InvenTreeBarcodeMixin
 
 logger = structlog.get_logger('inventree')
 
+# Lifetime of cached barcode_hash -> (model, pk) resolutions (seconds)
+BARCODE_CACHE_TIMEOUT = 3600
+
 
 def cache(func):
     """Cache the result of a function, but do not cache falsy results."""
@@ -64,3 +69,78 @@ def get_supported_barcode_model_codes_map():
         model.barcode_model_type_code(): model
         for model in get_supported_barcode_models()
     }
+
+
+def barcode_cache_key(barcode_hash: str) -> str:
+    """Return the cache key for a barcode hash, scoped to the current tenant."""
+    from tenancy.context import get_current_tenant
+
+    tenant = get_current_tenant()
+
+    return f'barcode_hash:{tenant.pk if tenant else 0}:{barcode_hash}'
+
+
+def invalidate_barcode_hash(barcode_hash: Optional[str]):
+    """Remove any cached resolution for the provided barcode hash."""
+    if not barcode_hash:
+        return
+
+    try:
+        django_cache.delete(barcode_cache_key(barcode_hash))
+    except Exception:  # pragma: no cover
+        logger.warning('Failed to invalidate barcode cache for %s', barcode_hash)
+
+
+def lookup_barcode_hash(barcode_hash: str) -> Optional[InvenTreeBarcodeMixin]:
+    """Find the model instance which has been assigned the provided barcode hash.
+
+    Resolving an unknown hash requires a query against every supported model type,
+    so successful resolutions are cached as (model type, pk) pairs.
+    Cached entries are validated against the database before being returned,
+    and are invalidated whenever a barcode is assigned or unassigned.
+
+    Arguments:
+        barcode_hash: The hash of the scanned (third-party) barcode data
+
+    Returns:
+        The matching model instance, or None if no match is found
+    """
+    if not barcode_hash:
+        return None
+
+    key = barcode_cache_key(barcode_hash)
+
+    try:
+        cached = django_cache.get(key)
+    except Exception:  # pragma: no cover
+        cached = None
+
+    if cached:
+        model_type, pk = cached
+        model = get_supported_barcode_models_map().get(model_type, None)
+
+        if model is not None:
+            instance = model.objects.filter(pk=pk, barcode_hash=barcode_hash).first()
+
+            if instance is not None:
+                return instance
+
+        # The cached entry is stale
+        invalidate_barcode_hash(barcode_hash)
+
+    for model in get_supported_barcode_models():
+        instance = model.lookup_barcode(barcode_hash)
+
+        if instance is not None:
+            try:
+                django_cache.set(
+                    key,
+                    (model.barcode_model_type(), instance.pk),
+                    BARCODE_CACHE_TIMEOUT,
+                )
+            except Exception:  # pragma: no cover
+                pass
+
+            return instance
+
+    return None
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import re
+from typing import ClassVar
+
 from django.core.exceptions import ValidationError
 from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
@@ -27,6 +30,9 @@ class BarcodeMixin:
 
     ACTION_NAME = ''
 
+    # Optional (precompiled) pattern which any barcode scanned by this plugin must match
+    BARCODE_PATTERN: ClassVar[re.Pattern | None] = None
+
     class MixinMeta:
         """Meta options for this mixin."""
 
@@ -42,6 +48,22 @@ class BarcodeMixin:
         """Does this plugin have everything needed to process a barcode."""
         return True
 
+    def match_barcode(self, barcode_data) -> bool:
+        """Perform a quick check to determine if this plugin could match the provided barcode.
+
+        This method is called before scan(), and allows plugins to be skipped
+        without performing any expensive parsing or database lookups.
+
+        By default, the barcode data is checked against the BARCODE_PATTERN attribute (if provided).
+
+        Returns:
+            True if the barcode data should be passed to scan(), else False
+        """
+        if self.BARCODE_PATTERN is None:
+            return True
+
+        return self.BARCODE_PATTERN.match(str(barcode_data).strip()) is not None
+
     def scan(self, barcode_data):
         """Scan a barcode against this plugin.
 
@@ -102,6 +124,9 @@ class SupplierBarcodeMixin(BarcodeMixin):
     MANUFACTURER = 'manufacturer'
     MANUFACTURER_PART_NUMBER = 'manufacturer_part_number'
 
+    # Pattern for matching the header of an ISO/IEC 15434 (ECIA) 2D barcode
+    ECIA_BARCODE_PATTERN = re.compile(r'^>?\[\)>')
+
     def __init__(self):
         """Register mixin."""
         super().__init__()
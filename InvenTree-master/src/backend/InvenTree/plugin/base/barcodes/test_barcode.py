@@ -236,6 +236,66 @@ class BarcodeAPITest(InvenTreeAPITestCase):
             self.unassign_url, {'stockitem': 999999999}, expected_code=400
         )
 
+    def test_batch_scan(self):
+        """Test scanning multiple barcodes in a single request."""
+        url = reverse('api-barcode-scan-batch')
+
+        item = StockItem.objects.get(pk=522)
+        part = Part.objects.first()
+
+        # No barcodes provided
+        self.post(url, {'barcodes': []}, expected_code=400)
+
+        # Too many barcodes provided
+        self.post(url, {'barcodes': ['abc'] * 101}, expected_code=400)
+
+        barcodes = [
+            item.format_barcode(),
+            'not-a-real-barcode',
+            f'{{"part": {part.pk}}}',
+            item.format_barcode(),
+        ]
+
+        response = self.post(url, {'barcodes': barcodes}, expected_code=200)
+
+        results = response.data['results']
+        self.assertEqual(len(results), 4)
+
+        self.assertIn('success', results[0])
+        self.assertEqual(results[0]['stockitem']['pk'], item.pk)
+
+        self.assertIn('error', results[1])
+        self.assertIsNone(results[1]['plugin'])
+
+        self.assertIn('success', results[2])
+        self.assertEqual(results[2]['part']['pk'], part.pk)
+
+        # Duplicate barcodes return the same result
+        self.assertEqual(results[3], results[0])
+
+    def test_barcode_hash_cache(self):
+        """Test that cached barcode hash lookups are invalidated correctly."""
+        from plugin.base.barcodes.helper import lookup_barcode_hash
+
+        item = StockItem.objects.get(pk=522)
+        item.assign_barcode(barcode_data='CACHED-BARCODE')
+        barcode_hash = item.barcode_hash
+
+        self.assertEqual(lookup_barcode_hash(barcode_hash), item)
+
+        # Cached lookup does not query every model type again
+        with self.assertNumQueriesLessThan(3):
+            self.assertEqual(lookup_barcode_hash(barcode_hash), item)
+
+        # Unassigning the barcode invalidates the cached result
+        item.unassign_barcode()
+        self.assertIsNone(lookup_barcode_hash(barcode_hash))
+
+        # Re-assign the barcode to a different item
+        other = StockItem.objects.get(pk=521)
+        other.assign_barcode(barcode_data='CACHED-BARCODE')
+        self.assertEqual(lookup_barcode_hash(barcode_hash), other)
+
     def test_unassign_endpoint(self):
         """Test that the unassign endpoint works as expected."""
         invalid_keys = ['cat', 'dog', 'fish']
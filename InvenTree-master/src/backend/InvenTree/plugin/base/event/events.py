@@ -152,9 +152,11 @@ def allow_table_event(table_name):
     ignore_tables = [
         'common_notificationentry',
         'common_notificationmessage',
+        'common_searchentry',
         'common_webhookendpoint',
         'common_webhookmessage',
         'part_partpricing',
+        'part_partstocksummary',
         'part_partstocktake',
     ]
 
@@ -1,6 +1,7 @@
 """Plugin class for custom data exporting."""
 
 from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from typing import Optional
 
 from django.contrib.auth.models import User
@@ -22,6 +23,9 @@ class DataExportMixin:
 
     ExportOptionsSerializer = None
 
+    # Number of database records which are fetched (and serialized) at once
+    EXPORT_CHUNK_SIZE = 500
+
     class MixinMeta:
         """Meta options for this mixin."""
 
@@ -68,6 +72,10 @@ class DataExportMixin:
         """Update the headers for the data export.
 
         Allows for optional modification of the headers for the data export.
+        This method is called after all rows have been exported.
+
+        Note: If this method is overridden, exported rows are spooled to disk
+        until the export is complete, as the headers may depend on the exported data.
 
         Arguments:
             headers: The current headers for the export
@@ -83,6 +91,32 @@ class DataExportMixin:
         # The default implementation returns the queryset unchanged
         return queryset
 
+    def iterate_queryset(
+        self, queryset: QuerySet, chunk_size: Optional[int] = None
+    ) -> Iterator[list]:
+        """Iterate through a queryset in chunks, without caching the entire queryset.
+
+        Any prefetched relations are fetched separately for each chunk.
+
+        Arguments:
+            queryset: The queryset to iterate through
+            chunk_size: The number of records in each chunk (default = EXPORT_CHUNK_SIZE)
+
+        Returns: An iterator of lists of model instances
+        """
+        chunk_size = chunk_size or self.EXPORT_CHUNK_SIZE
+        chunk = []
+
+        for instance in queryset.iterator(chunk_size=chunk_size):
+            chunk.append(instance)
+
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
     def export_data(
         self,
         queryset: QuerySet,
@@ -91,12 +125,15 @@ class DataExportMixin:
         context: dict,
         output: DataOutput,
         **kwargs,
-    ) -> list:
+    ) -> Iterable[dict]:
         """Export data from the queryset.
 
         This method should be implemented by the plugin to provide
         the actual data export functionality.
 
+        Large exports should yield rows (rather than returning a list),
+        so that the exported data is not held in memory.
+
         Arguments:
             queryset: The queryset to export
             serializer_class: The serializer class to use for exporting the data
@@ -104,10 +141,11 @@ class DataExportMixin:
             context: Any custom context for the export (provided by the plugin serializer)
             output: The DataOutput object for the export
 
-        Returns: The exported data (a list of dict objects)
+        Returns: The exported data (an iterable of dict objects, e.g. a list or a generator)
         """
-        # The default implementation simply serializes the queryset
-        return serializer_class(queryset, many=True, exporting=True).data
+        # The default implementation serializes the queryset, one chunk at a time
+        for chunk in self.iterate_queryset(queryset):
+            yield from serializer_class(chunk, many=True, exporting=True).data
 
     def get_export_options_serializer(self, **kwargs) -> serializers.Serializer | None:
         """Return a serializer class with dynamic export options for this plugin.
@@ -7,6 +7,7 @@ Parsing an InvenTree barcode simply involves validating that the
 references model objects actually exist in the database.
 """
 
+import functools
 import json
 import re
 from typing import cast
@@ -20,6 +21,12 @@ from plugin import InvenTreePlugin
 from plugin.mixins import BarcodeMixin, SettingsMixin
 
 
+@functools.lru_cache(maxsize=8)
+def short_barcode_regex(prefix: str) -> re.Pattern:
+    """Return a compiled regex for matching short barcodes with the provided prefix."""
+    return re.compile(f'^{re.escape(prefix)}([0-9A-Z $%*+-.\\/:]{"{2}"})(\\d+)$')
+
+
 class InvenTreeInternalBarcodePlugin(SettingsMixin, BarcodeMixin, InvenTreePlugin):
     """Builtin BarcodePlugin for matching and generating internal barcodes."""
 
@@ -61,9 +68,7 @@ class InvenTreeInternalBarcodePlugin(SettingsMixin, BarcodeMixin, InvenTreePlugi
         # Attempt to match the barcode data against the short barcode format
         prefix = cast(str, self.get_setting('SHORT_BARCODE_PREFIX'))
         if type(barcode_data) is str and (
-            m := re.match(
-                f'^{re.escape(prefix)}([0-9A-Z $%*+-.\\/:]{"{2}"})(\\d+)$', barcode_data
-            )
+            m := short_barcode_regex(prefix).match(barcode_data)
         ):
             model_type_code, pk = m.groups()
 
@@ -90,7 +95,7 @@ class InvenTreeInternalBarcodePlugin(SettingsMixin, BarcodeMixin, InvenTreePlugi
 
         if type(barcode_data) is dict:
             barcode_dict = barcode_data
-        elif type(barcode_data) is str:
+        elif type(barcode_data) is str and barcode_data.lstrip().startswith('{'):
             try:
                 barcode_dict = json.loads(barcode_data)
             except json.JSONDecodeError:
@@ -122,16 +127,16 @@ class InvenTreeInternalBarcodePlugin(SettingsMixin, BarcodeMixin, InvenTreePlugi
         barcode_hash = hash_barcode(barcode_data)
 
         # If no "direct" hits are found, look for assigned third-party barcodes
-        for model in supported_models:
-            label = model.barcode_model_type()
+        instance = plugin.base.barcodes.helper.lookup_barcode_hash(barcode_hash)
 
-            instance = model.lookup_barcode(barcode_hash)
+        if instance is not None:
+            model = instance.__class__
+            label = model.barcode_model_type()
 
-            if instance is not None:
-                return {
-                    **self.format_matched_response(label, model, instance),
-                    'success': succcess_message,
-                }
+            return {
+                **self.format_matched_response(label, model, instance),
+                'success': succcess_message,
+            }
 
     def generate(self, model_instance: InvenTreeBarcodeMixin):
         """Generate a barcode for a given model instance."""
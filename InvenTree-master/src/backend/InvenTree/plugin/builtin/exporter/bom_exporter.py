@@ -1,5 +1,6 @@
 """Multi-level BOM exporter plugin."""
 
+from collections.abc import Iterator
 from decimal import Decimal
 from typing import Optional
 
@@ -190,23 +191,22 @@ class BomExporterPlugin(DataExportMixin, InvenTreePlugin):
         # Pre-fetch related data to reduce database queries
         queryset = self.prefetch_queryset(queryset)
 
-        self.bom_data = []
-
         # Run through each item in the queryset
-        for bom_item in queryset:
-            self.process_bom_row(bom_item, 1, **kwargs)
-
-        return self.bom_data
+        for bom_item in queryset.iterator(chunk_size=self.EXPORT_CHUNK_SIZE):
+            yield from self.process_bom_row(bom_item, 1, **kwargs)
 
     def process_bom_row(
         self, bom_item, level: int = 1, multiplier: Optional[Decimal] = None, **kwargs
-    ) -> list:
+    ) -> Iterator[dict]:
         """Process a single BOM row.
 
         Arguments:
             bom_item: The BomItem object to process
             level: The current level of export
             multiplier: The multiplier for the quantity (used for recursive calls)
+
+        Yields:
+            The exported row for this BOM item, followed by the rows for any sub-items
         """
         # Add this row to the output dataset
         row = self.serializer_class(bom_item, exporting=True).data
@@ -234,7 +234,7 @@ class BomExporterPlugin(DataExportMixin, InvenTreePlugin):
             total_quantity = Decimal(bom_item.quantity) * multiplier
             row['total_quantity'] = normalize(total_quantity)
 
-        self.bom_data.append(row)
+        yield row
 
         # If we have reached the maximum export level, return just this bom item
         if bom_item.sub_part.assembly and (
@@ -244,7 +244,7 @@ class BomExporterPlugin(DataExportMixin, InvenTreePlugin):
             sub_items = self.prefetch_queryset(sub_items)
 
             for item in sub_items.all():
-                self.process_bom_row(
+                yield from self.process_bom_row(
                     item,
                     level=level + 1,
                     multiplier=multiplier * bom_item.quantity,
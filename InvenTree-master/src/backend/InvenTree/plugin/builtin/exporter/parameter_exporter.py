@@ -75,24 +75,25 @@ class ParameterExporter(DataExportMixin, InvenTreePlugin):
         # Keep a dict of observed parameters against their primary key
         self.parameters = {}
 
-        # Serialize the queryset using DRF first
-        rows = self.serializer_class(
-            queryset, parameters=True, exporting=True, many=True
-        ).data
+        for chunk in self.iterate_queryset(queryset):
+            # Serialize each chunk of the queryset using DRF first
+            rows = self.serializer_class(
+                chunk, parameters=True, exporting=True, many=True
+            ).data
 
-        for row in rows:
-            # Extract the associated parameters from the serialized data
-            for parameter in row.get('parameters', []):
-                template_detail = parameter['template_detail']
-                template_id = template_detail['pk']
+            for row in rows:
+                # Extract the associated parameters from the serialized data
+                for parameter in row.get('parameters', []):
+                    template_detail = parameter['template_detail']
+                    template_id = template_detail['pk']
 
-                active = template_detail.get('enabled', True)
+                    active = template_detail.get('enabled', True)
 
-                if not active and self.exclude_inactive:
-                    continue
+                    if not active and self.exclude_inactive:
+                        continue
 
-                self.parameters[template_id] = template_detail['name']
+                    self.parameters[template_id] = template_detail['name']
 
-                row[f'parameter_{template_id}'] = parameter['data']
+                    row[f'parameter_{template_id}'] = parameter['data']
 
-        return rows
+                yield row
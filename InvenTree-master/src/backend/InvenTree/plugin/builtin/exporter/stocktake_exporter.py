@@ -125,12 +125,12 @@ class PartStocktakeExporter(DataExportMixin, InvenTreePlugin):
         include_external_items = context.get('export_include_external_items', False)
         include_variant_items = context.get('export_include_variant_items', False)
 
-        data = super().export_data(
+        rows = super().export_data(
             queryset, serializer_class, headers, context, output, **kwargs
         )
 
-        if export_pricing_data:
-            for row in data:
+        for row in rows:
+            if export_pricing_data:
                 quantity = Decimal(row.get('total_in_stock', 0))
 
                 if not include_external_items:
@@ -157,4 +157,4 @@ class PartStocktakeExporter(DataExportMixin, InvenTreePlugin):
                         pricing_max * quantity, rounding=10
                     )
 
-        return data
+            yield row
@@ -1,11 +1,94 @@
 """Unit test for the exporter plugins."""
 
+import io
+from collections import OrderedDict
+from decimal import Decimal
+from unittest import mock
+
 from django.urls import reverse
 
-from InvenTree.unit_test import InvenTreeAPITestCase
+import tablib
+
+from data_exporter.writers import RowSpool, get_export_writer
+from InvenTree.unit_test import InvenTreeAPITestCase, InvenTreeTestCase
+from plugin.builtin.exporter.inventree_exporter import InvenTreeExporter
 from plugin.registry import registry
 
 
+class ExportWriterTest(InvenTreeTestCase):
+    """Test the incremental export writers."""
+
+    fixtures = ['location', 'category']
+
+    HEADERS = ['ID', 'Name', 'Price']
+
+    ROWS = [[1, 'Widget', Decimal('1.50')], [2, 'Gadget, large', None], [3, 'A\nB', 0]]
+
+    def test_csv_writer(self):
+        """Test that CSV / TSV data is written correctly."""
+        for file_format in ['csv', 'tsv']:
+            writer = get_export_writer(file_format, self.HEADERS)
+            writer.write_rows(self.ROWS)
+
+            datafile = writer.close()
+            data = datafile.read().decode()
+            datafile.close()
+
+            dataset = tablib.Dataset().load(data, format=file_format)
+
+            self.assertEqual(dataset.headers, self.HEADERS)
+            self.assertEqual(len(dataset), 3)
+            self.assertEqual(dataset[1], ('2', 'Gadget, large', ''))
+            self.assertEqual(dataset[2][1], 'A\nB')
+
+    def test_xlsx_writer(self):
+        """Test that XLSX data is written correctly."""
+        writer = get_export_writer('xlsx', self.HEADERS)
+        writer.write_rows(self.ROWS)
+        writer.write_row([4, {'a': 1}, 'bad\x01char'])
+
+        datafile = writer.close()
+        dataset = tablib.Dataset().load(io.BytesIO(datafile.read()), format='xlsx')
+        datafile.close()
+
+        self.assertEqual(dataset.headers, self.HEADERS)
+        self.assertEqual(len(dataset), 4)
+        self.assertEqual(dataset[0], (1, 'Widget', 1.5))
+        self.assertEqual(dataset[3], (4, "{'a': 1}", 'badchar'))
+
+    def test_row_spool(self):
+        """Test that rows can be spooled to disk and read back."""
+        spool = RowSpool()
+        spool.extend(OrderedDict(pk=idx, name=f'Row {idx}') for idx in range(1000))
+
+        self.assertEqual(len(spool), 1000)
+
+        # Spooled rows can be iterated multiple times
+        for _ in range(2):
+            rows = list(spool)
+            self.assertEqual(len(rows), 1000)
+            self.assertEqual(rows[500], {'pk': 500, 'name': 'Row 500'})
+
+        spool.close()
+
+    def test_iterate_queryset(self):
+        """Test that querysets are exported in chunks."""
+        from part.models import PartCategory
+
+        plugin = InvenTreeExporter()
+        queryset = PartCategory.objects.all().order_by('pk')
+
+        with mock.patch.object(InvenTreeExporter, 'EXPORT_CHUNK_SIZE', 3):
+            chunks = list(plugin.iterate_queryset(queryset))
+
+        self.assertEqual(sum(len(chunk) for chunk in chunks), queryset.count())
+        self.assertTrue(all(len(chunk) <= 3 for chunk in chunks))
+        self.assertEqual(
+            [category.pk for chunk in chunks for category in chunk],
+            list(queryset.values_list('pk', flat=True)),
+        )
+
+
 class StocktakeExporterTest(InvenTreeAPITestCase):
     """Test the stocktake exporter plugin."""
 
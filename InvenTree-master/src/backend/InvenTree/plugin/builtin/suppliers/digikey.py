@@ -30,6 +30,9 @@ class DigiKeyPlugin(SupplierBarcodeMixin, SettingsMixin, InvenTreePlugin):
         }
     }
 
+    # Only ECIA 2D barcodes are supported
+    BARCODE_PATTERN = SupplierBarcodeMixin.ECIA_BARCODE_PATTERN
+
     def extract_barcode_fields(self, barcode_data) -> dict[str, str]:
         """Extract barcode fields from a DigiKey plugin."""
         return self.parse_ecia_barcode2d(barcode_data)
@@ -33,6 +33,8 @@ class LCSCPlugin(SupplierBarcodeMixin, SettingsMixin, InvenTreePlugin):
 
     LCSC_BARCODE_REGEX = re.compile(r'^{((?:[^:,]+:[^:,]*,)*(?:[^:,]+:[^:,]*))}$')
 
+    BARCODE_PATTERN = LCSC_BARCODE_REGEX
+
     # Custom field mapping for LCSC barcodes
     LCSC_FIELDS = {
         'pm': SupplierBarcodeMixin.MANUFACTURER_PART_NUMBER,
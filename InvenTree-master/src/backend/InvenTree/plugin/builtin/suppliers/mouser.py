@@ -29,6 +29,9 @@ class MouserPlugin(SupplierBarcodeMixin, SettingsMixin, InvenTreePlugin):
         }
     }
 
+    # Only ECIA 2D barcodes are supported
+    BARCODE_PATTERN = SupplierBarcodeMixin.ECIA_BARCODE_PATTERN
+
     def extract_barcode_fields(self, barcode_data: str) -> dict[str, str]:
         """Get supplier_part and barcode_fields from Mouser DataMatrix-Code."""
         barcode_fields = self.parse_ecia_barcode2d(barcode_data)
@@ -3,6 +3,7 @@
 import base64
 import io
 import logging
+import re
 
 from django.utils.translation import gettext_lazy as _
 
@@ -96,3 +97,47 @@ def encode_image_base64(image, img_format: str = 'PNG') -> str:
     img_str = base64.b64encode(buffered.getvalue())
 
     return f'data:image/{img_format};charset=utf-8;base64,' + img_str.decode()
+
+
+# Matches the content of the <body> element in a rendered HTML document
+BODY_PATTERN = re.compile(r'(<body[^>]*>)(.*)(</body>)', re.IGNORECASE | re.DOTALL)
+
+# Wrapper which forces each collated item to start on a new page
+COLLATED_PAGE_BREAK = '<div class="collated-page-break" style="break-before: page; page-break-before: always;"></div>'
+
+
+def collate_html(documents: list[str]) -> str:
+    """Combine multiple rendered HTML documents into a single HTML document.
+
+    All documents are expected to be rendered from the same template,
+    so the <head> (and any styles) of the first document is retained,
+    and the <body> content of each document is appended, separated by page breaks.
+
+    Arguments:
+        documents: List of rendered HTML documents
+
+    Returns:
+        str: A single HTML document containing the content of all provided documents
+    """
+    if not documents:
+        return ''
+
+    if len(documents) == 1:
+        return documents[0]
+
+    match = BODY_PATTERN.search(documents[0])
+
+    if not match:
+        # No <body> element found - simply join the documents together
+        return COLLATED_PAGE_BREAK.join(documents)
+
+    bodies = []
+
+    for document in documents:
+        body = BODY_PATTERN.search(document)
+        bodies.append(body.group(2) if body else document)
+
+    prefix = documents[0][: match.start(2)]
+    suffix = documents[0][match.end(2) :]
+
+    return prefix + COLLATED_PAGE_BREAK.join(bodies) + suffix
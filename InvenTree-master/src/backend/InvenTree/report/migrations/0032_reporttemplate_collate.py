@@ -0,0 +1,22 @@
+# Generated by Django 5.2.9 on 2026-10-19 05:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("report", "0031_reporttemplate_merge"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reporttemplate",
+            name="collate",
+            field=models.BooleanField(
+                default=False,
+                help_text="Render all selected items into a single document in one pass (not used when attaching reports to models)",
+                verbose_name="Collate",
+            ),
+        ),
+    ]
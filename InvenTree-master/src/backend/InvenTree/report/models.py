@@ -1,8 +1,10 @@
 """Report template model definitions."""
 
 import io
+import multiprocessing
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import date, datetime
 from typing import Optional, TypedDict, cast
 
@@ -26,6 +28,7 @@ import InvenTree.exceptions
 import InvenTree.helpers
 import InvenTree.models
 import report.helpers
+import report.render
 import report.validators
 from common.models import DataOutput, RenderChoices
 from common.settings import get_global_setting
@@ -277,11 +280,23 @@ class ReportTemplateBase(MetadataMixin, InvenTree.models.InvenTreeModel):
             bytes: PDF data
         """
         html = self.render_as_string(instance, request, context, **kwargs)
+
+        return self.render_pdf(html)
+
+    def render_pdf(self, html: str, cache: Optional[dict] = None) -> bytes:
+        """Convert a rendered HTML string to a PDF file.
+
+        Arguments:
+            html: The rendered HTML string
+            cache: Image cache, which can be shared between multiple documents (optional)
+
+        Returns:
+            bytes: PDF data
+        """
         if HTML is None:
             raise RuntimeError("WeasyPrint disabled/unavailable (INVENTREE_DISABLE_WEASYPRINT)")
-        pdf = HTML(string=html).write_pdf(pdf_forms=True)
 
-        return pdf
+        return HTML(string=html).write_pdf(pdf_forms=True, cache=cache)
 
     filename_pattern = models.CharField(
         default='output.pdf',
@@ -401,6 +416,14 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
         help_text=_('Render a single report against selected items'),
     )
 
+    collate = models.BooleanField(
+        default=False,
+        verbose_name=_('Collate'),
+        help_text=_(
+            'Render all selected items into a single document in one pass (not used when attaching reports to models)'
+        ),
+    )
+
     def get_report_size(self) -> str:
         """Return the printable page size for this report."""
         try:
@@ -469,6 +492,97 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
             except Exception:
                 InvenTree.exceptions.log_error('report_callback', plugin=plugin.slug)
 
+    def render_error(self, exc: Exception, output: DataOutput) -> ValidationError:
+        """Record a report rendering error against the provided DataOutput.
+
+        Arguments:
+            exc: The exception which was raised during rendering
+            output: The DataOutput object to mark as failed
+
+        Returns:
+            ValidationError: The error which should be raised to the caller
+        """
+        if isinstance(exc, TemplateDoesNotExist):
+            t_name = str(exc) or self.template
+            msg = f'Template file {t_name} does not exist'
+            output.mark_failure(error=msg)
+            return ValidationError(msg)
+
+        if isinstance(exc, TemplateSyntaxError):
+            msg = _('Template syntax error')
+            output.mark_failure(error=msg)
+            return ValidationError(f'{msg}: {exc!s}')
+
+        if isinstance(exc, ValidationError):
+            output.mark_failure(str(exc))
+            return exc
+
+        msg = _('Error rendering report')
+        output.mark_failure(error=msg)
+        return ValidationError(f'{msg}: {exc!s}')
+
+    def render_pdfs(
+        self, documents: list[str], cache: Optional[dict] = None, callback=None
+    ) -> list[bytes]:
+        """Convert multiple rendered HTML documents into separate PDF files.
+
+        If the REPORT_RENDER_WORKERS setting allows, documents are rendered in parallel,
+        in separate processes (as PDF conversion is bound by the GIL).
+        Note that the HTML documents must already be rendered,
+        as the worker processes do not access the database.
+
+        Arguments:
+            documents: List of rendered HTML documents
+            cache: Image cache, shared between all documents (optional)
+                - Worker processes each use a separate image cache instead
+            callback: Function which is called each time a document is rendered (optional)
+
+        Returns:
+            list[bytes]: PDF data for each document (in the same order as provided)
+        """
+        try:
+            workers = int(get_global_setting('REPORT_RENDER_WORKERS', 1))
+        except (TypeError, ValueError):
+            workers = 1
+
+        workers = min(workers, len(documents))
+
+        if workers <= 1 or HTML is None:
+            outputs = []
+
+            for html in documents:
+                outputs.append(self.render_pdf(html, cache=cache))
+
+                if callback:
+                    callback()
+
+            return outputs
+
+        outputs = [None] * len(documents)
+
+        # Worker processes are spawned, so they do not inherit any database connections
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=report.render.init_worker,
+        ) as executor:
+            futures = {
+                executor.submit(report.render.render_pdf, html): idx
+                for idx, html in enumerate(documents)
+            }
+
+            try:
+                for future in as_completed(futures):
+                    outputs[futures[future]] = future.result()
+
+                    if callback:
+                        callback()
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+
+        return outputs
+
     def print(self, items: list, request=None, output=None, **kwargs) -> DataOutput:
         """Print reports for a list of items against this template.
 
@@ -484,11 +598,13 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
             ValidationError: If there is an error during report printing
 
         Notes:
-            Currently, all items are rendered separately into PDF files,
-            and then combined into a single PDF file.
+            - If the template is marked as 'merge', a single report is rendered against all items
+            - If the template is marked as 'collate', each item is rendered into a single HTML document
+              (separated by page breaks), which is then converted to PDF in a single pass
+            - Otherwise, all items are rendered separately into PDF files (optionally in parallel),
+              and then combined into a single PDF file
 
             Further work is required to allow the following extended features:
-            - Render a single PDF file with the collated items (optional per template)
             - Render a raw file (do not convert to PDF) - allows for other file types
         """
         logger.info("Printing %s reports against template '%s'", len(items), self.name)
@@ -497,6 +613,9 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
 
         debug_mode = get_global_setting('REPORT_DEBUG_MODE', False)
 
+        # Collated output cannot be attached to individual model instances
+        collate = self.collate and not self.attach_to_model
+
         # Start with a default report name
         report_name: Optional[str] = None
 
@@ -518,6 +637,9 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
             output.progress = 0
             output.save()
 
+        # Images are loaded once, and shared between all rendered documents
+        image_cache = {}
+
         try:
             if self.merge:
                 base_context = super().base_context(request)
@@ -541,75 +663,83 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
 
                 try:
                     if debug_mode:
-                        report = self.render_as_string(instance, request, contexts)
+                        report_data = self.render_as_string(
+                            instance, request, contexts
+                        )
                     else:
-                        report = self.render(instance, request, contexts)
-                except TemplateDoesNotExist as e:
-                    t_name = str(e) or self.template
-                    msg = f'Template file {t_name} does not exist'
-                    output.mark_failure(error=msg)
-                    raise ValidationError(msg)
-                except TemplateSyntaxError as e:
-                    msg = _('Template syntax error')
-                    output.mark_failure(msg)
-                    raise ValidationError(f'{msg}: {e!s}')
-                except ValidationError as e:
-                    output.mark_failure(str(e))
-                    raise e
+                        report_data = self.render(instance, request, contexts)
                 except Exception as e:
-                    msg = _('Error rendering report')
-                    output.mark_failure(msg)
-                    raise ValidationError(f'{msg}: {e!s}')
+                    raise self.render_error(e, output)
 
-                outputs.append(report)
+                outputs.append(report_data)
                 self.handle_attachment(
-                    instance, report, report_name, request, debug_mode
+                    instance, report_data, report_name, request, debug_mode
                 )
-                self.notify_plugins(instance, report, request)
+                self.notify_plugins(instance, report_data, request)
 
                 # Update the progress of the report generation
-                output.progress += 1
-                output.save()
+                output.update_progress(output.total)
             else:
+                documents = []
+
+                # Rendering the HTML accounts for the first half of the progress,
+                # and converting to PDF accounts for the second half
+                rendered = 0
+                converted = 0
+
+                def report_progress():
+                    output.update_progress((rendered + converted) // 2)
+
+                def report_converted(count: int = 1):
+                    nonlocal converted
+                    converted += count
+                    report_progress()
+
                 for instance in items:
                     context = self.get_context(instance, request)
 
                     if report_name is None:
                         report_name = self.generate_filename(context)
 
-                    # Render the report output
+                    # Render the report to HTML
                     try:
-                        if debug_mode:
-                            report = self.render_as_string(instance, request, None)
-                        else:
-                            report = self.render(instance, request, None)
-                    except TemplateDoesNotExist as e:
-                        t_name = str(e) or self.template
-                        msg = f'Template file {t_name} does not exist'
-                        output.mark_failure(error=msg)
-                        raise ValidationError(msg)
-                    except TemplateSyntaxError as e:
-                        msg = _('Template syntax error')
-                        output.mark_failure(error=_('Template syntax error'))
-                        raise ValidationError(f'{msg}: {e!s}')
-                    except ValidationError as e:
-                        output.mark_failure(str(e))
-                        raise e
+                        documents.append(
+                            self.render_as_string(instance, request, context)
+                        )
                     except Exception as e:
-                        msg = _('Error rendering report')
-                        output.mark_failure(error=msg)
-                        raise ValidationError(f'{msg}: {e!s}')
+                        raise self.render_error(e, output)
 
-                    outputs.append(report)
+                    rendered += 1
+                    report_progress()
 
-                    self.handle_attachment(
-                        instance, report, report_name, request, debug_mode
-                    )
-                    self.notify_plugins(instance, report, request)
+                if collate:
+                    documents = [report.helpers.collate_html(documents)]
 
-                    # Update the progress of the report generation
-                    output.progress += 1
-                    output.save()
+                # Convert the rendered HTML documents to PDF
+                try:
+                    if debug_mode:
+                        outputs = documents
+                    elif collate:
+                        outputs = [self.render_pdf(documents[0], cache=image_cache)]
+                    else:
+                        outputs = self.render_pdfs(
+                            documents, cache=image_cache, callback=report_converted
+                        )
+                except Exception as e:
+                    raise self.render_error(e, output)
+
+                if collate:
+                    for instance in items:
+                        self.notify_plugins(instance, outputs[0], request)
+                else:
+                    for instance, report_data in zip(items, outputs):
+                        self.handle_attachment(
+                            instance, report_data, report_name, request, debug_mode
+                        )
+                        self.notify_plugins(instance, report_data, request)
+
+                # Update the progress of the report generation
+                report_converted(len(items) - converted)
 
         except Exception as exc:
             # Something went wrong during the report generation process
@@ -631,14 +761,17 @@ class ReportTemplate(TemplateUploadMixin, ReportTemplateBase):
         if debug_mode:
             data = '\n'.join(outputs)
             report_name = report_name.replace('.pdf', '.html')
+        elif len(outputs) == 1:
+            # Single output file - no need to merge
+            data = outputs[0]
         else:
             # Merge the outputs back together into a single PDF file
             pdf_writer = PdfWriter()
 
             try:
-                for report in outputs:
+                for report_data in outputs:
                     # Construct file object with raw PDF data
-                    report_file = io.BytesIO(report)
+                    report_file = io.BytesIO(report_data)
                     pdf_writer.append(report_file)
 
                 # Generate raw output
@@ -0,0 +1,24 @@
+"""Worker process functions for converting rendered reports to PDF.
+
+Note: This module must not import Django (or any application modules),
+as it is imported by freshly started worker processes.
+"""
+
+# Image cache of the current worker process
+image_cache: dict = {}
+
+
+def init_worker():
+    """Start a render worker process with an empty image cache."""
+    global image_cache
+    image_cache = {}
+
+
+def render_pdf(html: str) -> bytes:
+    """Convert a rendered HTML string to a PDF file.
+
+    The image cache is shared between all documents rendered by the same worker process.
+    """
+    from weasyprint import HTML  # type: ignore
+
+    return HTML(string=html).write_pdf(pdf_forms=True, cache=image_cache)
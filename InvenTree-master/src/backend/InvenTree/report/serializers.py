@@ -69,6 +69,7 @@ class ReportTemplateSerializer(ReportSerializerBase):
             'page_size',
             'landscape',
             'merge',
+            'collate',
         ]
 
     page_size = serializers.ChoiceField(
@@ -1,6 +1,7 @@
 """Custom template tags for report generation."""
 
 import base64
+import functools
 import logging
 import os
 from datetime import date, datetime
@@ -17,7 +18,6 @@ from django.utils.safestring import SafeString, mark_safe
 from django.utils.translation import gettext_lazy as _
 
 from djmoney.contrib.exchange.exceptions import MissingRate
-from djmoney.contrib.exchange.models import convert_money
 from djmoney.money import Money
 from PIL import Image
 
@@ -234,13 +234,6 @@ def uploaded_image(
     elif not exists:
         full_path = settings.STATIC_ROOT.joinpath('img', replacement_file).resolve()
 
-    # Load the image, check that it is valid
-    if full_path.exists() and full_path.is_file():
-        img = Image.open(full_path)
-    else:
-        # A placeholder image showing that the image is missing
-        img = Image.new('RGB', (64, 64), color='red')
-
     if width is not None:
         try:
             width = int(width)
@@ -253,6 +246,52 @@ def uploaded_image(
         except ValueError:
             height = None
 
+    if rotate is not None:
+        try:
+            rotate = int(rotate)
+        except ValueError:
+            rotate = None
+
+    # Load the image, check that it is valid
+    if full_path.exists() and full_path.is_file():
+        stat = full_path.stat()
+        return encode_image_file(
+            str(full_path), (stat.st_mtime_ns, stat.st_size), width, height, rotate
+        )
+
+    # A placeholder image showing that the image is missing
+    return encode_image_file(None, None, width, height, rotate)
+
+
+@functools.lru_cache(maxsize=128)
+def encode_image_file(
+    path: Optional[str],
+    revision: Optional[tuple],
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    rotate: Optional[int] = None,
+) -> str:
+    """Load, transform and encode an image file.
+
+    The encoded result is cached, as the same image (e.g. a company logo)
+    is typically rendered many times when printing a batch of reports.
+
+    Arguments:
+        path: Full path to the image file (or None for a placeholder image)
+        revision: File revision (modification time and size), used as part of the cache key
+        width: Optional width of the image
+        height: Optional height of the image
+        rotate: Optional rotation to apply to the image
+
+    Returns:
+        Base-64 encoded image data
+    """
+    if path:
+        img = Image.open(path)
+    else:
+        # A placeholder image showing that the image is missing
+        img = Image.new('RGB', (64, 64), color='red')
+
     if width is not None and height is not None:
         # Resize the image, width *and* height are provided
         img = img.resize((width, height))
@@ -269,16 +308,10 @@ def uploaded_image(
 
     # Optionally rotate the image
     if rotate is not None:
-        try:
-            rotate = int(rotate)
-            img = img.rotate(rotate)
-        except ValueError:
-            pass
+        img = img.rotate(rotate)
 
     # Return a base-64 encoded image
-    img_data = report.helpers.encode_image_base64(img)
-
-    return img_data
+    return report.helpers.encode_image_base64(img)
 
 
 @register.simple_tag()
@@ -658,7 +691,7 @@ def convert_currency(money: Money, currency: Optional[str] = None, **kwargs):
         )
 
     try:
-        converted = convert_money(money, currency)
+        converted = common.currency.convert_currency(money, currency)
     except MissingRate:
         # Re-throw error with more context
         raise ValidationError(
@@ -299,6 +299,79 @@ class ReportTest(InvenTreeAPITestCase):
         self.assertIsNotNone(output.output)
         self.assertTrue(output.output.name.endswith('.pdf'))
 
+    def test_print_parallel(self):
+        """Test that separate reports can be rendered using multiple workers."""
+        template = ReportTemplate.objects.filter(
+            enabled=True, model_type='stockitem', merge=False
+        ).first()
+
+        items = StockItem.objects.all()[0:4]
+
+        set_global_setting('REPORT_RENDER_WORKERS', 2)
+
+        output = template.print(items)
+
+        self.assertTrue(output.complete)
+        self.assertEqual(output.total, 4)
+        self.assertTrue(output.output.name.endswith('.pdf'))
+
+    def test_print_collate(self):
+        """Test that multiple items can be collated into a single document."""
+        template = ReportTemplate.objects.filter(
+            enabled=True, model_type='stockitem', merge=False
+        ).first()
+
+        template.collate = True
+        template.attach_to_model = False
+        template.save()
+
+        items = StockItem.objects.all()[0:5]
+
+        # In debug mode, the collated HTML document is returned
+        set_global_setting('REPORT_DEBUG_MODE', True)
+
+        output = template.print(items)
+
+        self.assertTrue(output.complete)
+        self.assertTrue(output.output.name.endswith('.html'))
+
+        with output.output.open('r') as f:
+            html_report = f.read()
+
+        # A single HTML document, with page breaks between each item
+        self.assertEqual(html_report.count('<head>'), 1)
+        self.assertEqual(html_report.count('<body>'), 1)
+        self.assertEqual(html_report.count('collated-page-break'), 4)
+
+        # Render the collated document to PDF
+        set_global_setting('REPORT_DEBUG_MODE', False)
+
+        output = template.print(items)
+
+        self.assertTrue(output.complete)
+        self.assertTrue(output.output.name.endswith('.pdf'))
+
+    def test_collate_html(self):
+        """Test the collate_html helper function."""
+        from report.helpers import collate_html
+
+        documents = [
+            f'<html><head><style>p {{}}</style></head><body class="x"><p>{idx}</p></body></html>'
+            for idx in range(3)
+        ]
+
+        self.assertEqual(collate_html([]), '')
+        self.assertEqual(collate_html(documents[:1]), documents[0])
+
+        html = collate_html(documents)
+
+        self.assertEqual(html.count('<head>'), 1)
+        self.assertEqual(html.count('<body class="x">'), 1)
+        self.assertEqual(html.count('collated-page-break'), 2)
+
+        for idx in range(3):
+            self.assertIn(f'<p>{idx}</p>', html)
+
 
 class LabelTest(InvenTreeAPITestCase):
     """Unit tests for label templates."""
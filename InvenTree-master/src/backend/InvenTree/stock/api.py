@@ -1023,10 +1023,21 @@ class StockApiMixin(SerializerContextMixin):
     serializer_class = StockSerializers.StockItemSerializer
     queryset = StockItem.objects.all()
 
+    # Set by the search API endpoint, to request lightweight results
+    search_mode = False
+
     def get_queryset(self, *args, **kwargs):
         """Annotate queryset."""
         queryset = super().get_queryset(*args, **kwargs)
-        queryset = StockSerializers.StockItemSerializer.annotate_queryset(queryset)
+
+        if self.search_mode:
+            queryset = StockSerializers.StockItemSerializer.annotate_search_queryset(
+                queryset
+            )
+        else:
+            queryset = StockSerializers.StockItemSerializer.annotate_queryset(
+                queryset, prefetch_fields=self.get_serializer_prefetches()
+            )
 
         return queryset
 
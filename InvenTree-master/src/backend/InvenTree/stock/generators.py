@@ -97,20 +97,9 @@ def generate_serial_number(part=None, quantity=1, **kwargs) -> Optional[str]:
 
     # If we are here, no plugins were available to generate a serial number
     # In this case, we will generate a simple serial number based on the provided part
-    sn = part.get_latest_serial_number()
-
-    serials = []
-
-    # Generate the required quantity of serial numbers
     # Note that this call gets passed through to the plugin system
-    while quantity > 0:
-        sn = InvenTree.helpers.increment_serial_number(sn, part=part)
-
-        # Exit if an empty or duplicated serial is generated
-        if not sn or sn in serials:
-            break
-
-        serials.append(sn)
-        quantity -= 1
+    # The serial numbers are only a suggestion, and are checked again when the stock items are created
+    # If the required quantity cannot be generated, the serial numbers generated so far are returned
+    serials = part.allocate_serial_numbers(quantity, partial=True)
 
     return ','.join(serials)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 from datetime import timedelta
 from decimal import Decimal, InvalidOperation
+from typing import Optional
 
 from django.conf import settings
 from django.contrib.auth.models import User
@@ -20,7 +21,6 @@ from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
 import structlog
-from djmoney.contrib.exchange.models import convert_money
 from mptt.managers import TreeManager
 from mptt.models import TreeForeignKey
 from taggit.managers import TaggableManager
@@ -34,9 +34,9 @@ import InvenTree.ready
 import InvenTree.tasks
 import order.models
 import report.mixins
-import stock.tasks
 from tenancy.models import TenantScopedModel
 from tenancy.managers import TenantManager, TenantTreeManager
+from common.currency import convert_currency
 from common.icons import validate_icon
 from common.settings import get_global_setting
 from company import models as CompanyModels
@@ -453,6 +453,9 @@ class StockItem(
 
     STATUS_CLASS = StockStatus
 
+    # Tenant-aware manager used for all tree operations
+    _tree_manager = TenantTreeManager()
+
     class Meta:
         """Model meta options."""
 
@@ -559,8 +562,10 @@ class StockItem(
         This method uses bulk_create to create multiple StockItem objects in a single query,
         which is much more efficient than creating them one-by-one.
 
-        However, it does not perform any validation checks on the provided serial numbers,
-        and also does not generate any "stock tracking entries".
+        The serial number namespace for the part is locked while the items are created,
+        and the provided serial numbers are checked against existing stock items in a single query.
+        However, no other validation checks are performed on the provided serial numbers,
+        and no "stock tracking entries" are generated.
 
         Note: This is an 'internal' function and should not be used by external code / plugins.
         """
@@ -627,14 +632,12 @@ class StockItem(
         # Force single quantity for each item
         data['quantity'] = 1
 
-        for serial in serials:
-            data['serial'] = serial
-
-            if serial is not None:
-                data['serial_int'] = StockItem.convert_serial_to_int(serial) or 0
-            else:
-                data['serial_int'] = 0
+        # Convert all serial numbers to integer values in a single pass
+        serial_ints = StockItem.convert_serials_to_int(serials)
 
+        for serial, serial_int in zip(serials, serial_ints):
+            data['serial'] = serial
+            data['serial_int'] = serial_int or 0
             data['tree_id'] = tree_id
 
             if not parent:
@@ -645,16 +648,33 @@ class StockItem(
             # Construct a new StockItem from the provided dict
             items.append(StockItem(**data))
 
-        # Create the StockItem objects in bulk
-        StockItem.objects.bulk_create(items)
+        with transaction.atomic():
+            # Reserve the serial numbers, by locking the serial number namespace for this part
+            part.lock_serial_numbers()
+
+            if conflicts := list(
+                part
+                .get_serial_number_stock()
+                .filter(serial__in=[serial for serial in serials if serial])
+                .values_list('serial', flat=True)
+            ):
+                raise ValidationError({
+                    'serial_numbers': _(
+                        'Stock item with this serial number already exists'
+                    )
+                    + ': '
+                    + ','.join(conflicts)
+                })
+
+            # Create the StockItem objects in bulk
+            StockItem.objects.bulk_create(items)
+
+        PartModels.PartStockSummary.schedule_update([part])
 
         # We will need to rebuild the stock item tree manually, due to the bulk_create operation
         if parent and parent.tree_id:
-            # Rebuild the tree structure for this StockItem tree
-            logger.info(
-                'Rebuilding StockItem tree structure for tree_id: %s', parent.tree_id
-            )
-            stock.tasks.rebuild_stock_item_tree(parent.tree_id)
+            # Schedule a rebuild of the tree structure for this StockItem tree
+            StockItem.schedule_tree_rebuild(parent.tree_id)
 
         # Fetch the new StockItem objects from the database
         items = StockItem.objects.filter(part=part, serial__in=serials)
@@ -669,17 +689,43 @@ class StockItem(
         return items
 
     @staticmethod
-    def convert_serial_to_int(serial: str) -> int | None:
+    def convert_serials_to_int(serials: list) -> list:
+        """Convert the provided list of serial numbers to integer values.
+
+        The validation plugins are resolved once for the entire batch of serial numbers.
+        """
+        from plugin import PluginMixinEnum, registry
+
+        plugins = registry.with_mixin(PluginMixinEnum.VALIDATION)
+
+        return [
+            StockItem.convert_serial_to_int(serial, plugins=plugins)
+            if serial is not None
+            else None
+            for serial in serials
+        ]
+
+    @staticmethod
+    def convert_serial_to_int(
+        serial: str, plugins: Optional[list] = None
+    ) -> int | None:
         """Convert the provided serial number to an integer value.
 
         This function hooks into the plugin system to allow for custom serial number conversion.
+
+        Arguments:
+            serial: The serial number to convert
+            plugins: (optional) Pre-fetched list of validation plugins
         """
         from plugin import PluginMixinEnum, registry
 
+        if plugins is None:
+            plugins = registry.with_mixin(PluginMixinEnum.VALIDATION)
+
         # First, let any plugins convert this serial number to an integer value
         # If a non-null value is returned (by any plugin) we will use that
 
-        for plugin in registry.with_mixin(PluginMixinEnum.VALIDATION):
+        for plugin in plugins:
             try:
                 serial_int = plugin.convert_serial_to_int(serial)
             except Exception:
@@ -813,6 +859,10 @@ class StockItem(
             try:
                 old = StockItem.objects.get(pk=self.pk)
 
+                if old.part_id != self.part_id:
+                    # Record the previous part, so that its stock summary is also updated
+                    self._previous_part_id = old.part_id
+
                 deltas = {}
 
                 # Status changed?
@@ -2185,7 +2235,7 @@ class StockItem(
             for price, qty in pricing_data[1:]:
                 # Attempt to convert the price to the base currency
                 try:
-                    price = convert_money(price, base_currency)
+                    price = convert_currency(price, base_currency)
                     total_price += price * qty
                     quantity += qty
                 except Exception:
@@ -2197,18 +2247,8 @@ class StockItem(
 
         self.save()
 
-        # Rebuild stock trees as required
-        rebuild_result = True
-        for tree_id in tree_ids:
-            if not stock.tasks.rebuild_stock_item_tree(tree_id, rebuild_on_fail=False):
-                rebuild_result = False
-
-        if not rebuild_result:
-            # If the rebuild failed, offload the task to a background worker
-            logger.warning(
-                'Failed to rebuild stock item tree during merge_stock_items operation, offloading task.'
-            )
-            InvenTree.tasks.offload_task(stock.tasks.rebuild_stock_items, group='stock')
+        # Schedule a rebuild of the affected stock trees
+        StockItem.schedule_tree_rebuild(*tree_ids)
 
     @transaction.atomic
     def splitStock(self, quantity, location=None, user=None, **kwargs):
@@ -2313,8 +2353,8 @@ class StockItem(
             stockitem=new_stock,
         )
 
-        # Rebuild the tree for this parent item
-        stock.tasks.rebuild_stock_item_tree(self.tree_id)
+        # Schedule a rebuild of the tree for this parent item
+        StockItem.schedule_tree_rebuild(self.tree_id)
 
         # Attempt to reload the new item from the database
         try:
@@ -2631,6 +2671,243 @@ class StockItem(
 
         return True
 
+    @classmethod
+    @transaction.atomic
+    def adjust_stock_items(
+        cls,
+        code: StockHistoryCode,
+        adjustments: list[dict],
+        user: User | None,
+        notes: str = '',
+        location: StockLocation | None = None,
+    ) -> list[StockItem]:
+        """Adjust multiple stock items as a single (set-based) operation.
+
+        Arguments:
+            code: The type of adjustment (STOCK_COUNT, STOCK_ADD, STOCK_REMOVE or STOCK_MOVE)
+            adjustments: List of dicts, each containing:
+                - item: The StockItem to adjust
+                - quantity: The quantity to count / add / remove / transfer
+                - Any optional transfer fields (batch, status, packaging)
+            user: The user performing the adjustment
+            notes: Optional notes for the stock tracking entries
+            location: Destination location (required for STOCK_MOVE)
+
+        Returns:
+            List of StockItem objects which were adjusted
+
+        This performs the same changes as the single item methods (stocktake, add_stock, take_stock, move),
+        but all items are validated before any changes are made, and changes are written in bulk:
+
+        - Stock items are updated with a single bulk_update query
+        - Stock tracking entries are created with a single bulk_create query
+        - A single event is triggered for the entire operation
+        - The post-save hooks (low stock notifications, pricing updates) run once per part
+
+        Note that the following are performed individually:
+        - Partial stock transfers (which split the stock item)
+        - Depleted items which are deleted
+        - Items for which saving has further side effects (plugin model events, or changes to search index fields)
+        """
+        import common.search
+        from plugin import PluginMixinEnum, registry
+        from plugin.base.event.events import allow_table_event
+
+        if code not in [
+            StockHistoryCode.STOCK_COUNT,
+            StockHistoryCode.STOCK_ADD,
+            StockHistoryCode.STOCK_REMOVE,
+            StockHistoryCode.STOCK_MOVE,
+        ]:
+            raise ValueError(f'Invalid stock adjustment code: {code}')
+
+        moving = code == StockHistoryCode.STOCK_MOVE
+
+        if moving and location is None:
+            raise ValidationError({'location': _('Destination location not specified')})
+
+        allow_out_of_stock_transfer = get_global_setting(
+            'STOCK_ALLOW_OUT_OF_STOCK_TRANSFER', backup_value=False, cache=False
+        )
+
+        # Plugin validation is only run if any validation plugins are active
+        validate_plugins = len(registry.with_mixin(PluginMixinEnum.VALIDATION)) > 0
+
+        # Pre-cache the custom status values (to reduce DB hits)
+        custom_status_codes = StockItem.STATUS_CLASS.custom_values()
+
+        # If plugin events are triggered for each saved item, all items must be saved individually
+        model_events = get_global_setting(
+            'ENABLE_PLUGINS_EVENTS', False
+        ) and allow_table_event(StockItem._meta.db_table)
+
+        # Fields which must be saved individually (to update the search index) if changed
+        indexed_fields = common.search.available_tracked_fields(StockItem)
+
+        today = InvenTree.helpers.current_date()
+
+        adjusted = {}
+        saved = {}
+        depleted = {}
+        splits = []
+        tracking = []
+
+        # First pass: calculate (and validate) all changes, without touching the database
+        for adjustment in adjustments:
+            item = adjustment['item']
+
+            original = {field: getattr(item, field) for field in indexed_fields}
+
+            try:
+                quantity = Decimal(adjustment.get('quantity', item.quantity))
+            except (InvalidOperation, TypeError, ValueError):
+                raise ValidationError({'quantity': _('Invalid quantity provided')})
+
+            if quantity < 0:
+                raise ValidationError({'quantity': _('Quantity must not be negative')})
+
+            tracking_code = code
+            deltas = {}
+
+            if moving:
+                if not allow_out_of_stock_transfer and not item.is_in_stock(
+                    check_status=False, check_in_production=False
+                ):
+                    raise ValidationError(
+                        _('StockItem cannot be moved as it is not in stock')
+                    )
+
+                if quantity <= 0:
+                    continue
+
+                if quantity < item.quantity:
+                    # Partial transfer - the stock item must be split
+                    splits.append((item, quantity, adjustment))
+                    continue
+
+                if location == item.location:
+                    tracking_code = StockHistoryCode.STOCK_UPDATE
+                else:
+                    deltas['location'] = location.pk
+
+                item.location = location
+                new_quantity = item.quantity
+            else:
+                # Cannot adjust the quantity of a serialized item
+                if item.serialized:
+                    continue
+
+                if code == StockHistoryCode.STOCK_COUNT:
+                    new_quantity = quantity
+                elif quantity <= 0:
+                    continue
+                elif code == StockHistoryCode.STOCK_ADD:
+                    new_quantity = item.quantity + quantity
+                else:
+                    new_quantity = max(item.quantity - quantity, 0)
+
+            status = adjustment.get('status', None) or adjustment.get(
+                'status_custom_key', None
+            )
+
+            if status and not item.compare_status(status):
+                item.set_status(status, custom_values=custom_status_codes)
+                deltas['status'] = status
+
+            if not moving:
+                if new_quantity == 0 and item.delete_on_deplete and item.can_delete():
+                    # This item will be deleted (no tracking entry required)
+                    depleted[item.pk] = item
+                    continue
+
+                item.quantity = new_quantity
+
+                if code == StockHistoryCode.STOCK_COUNT:
+                    deltas['quantity'] = float(new_quantity)
+                    item.stocktake_date = today
+                    item.stocktake_user = user
+                elif code == StockHistoryCode.STOCK_ADD:
+                    deltas['added'] = float(quantity)
+                    deltas['quantity'] = float(new_quantity)
+                else:
+                    deltas['removed'] = float(quantity)
+                    deltas['quantity'] = float(new_quantity)
+
+            # Optional fields which can be supplied for a stock adjustment
+            for field in ['batch', 'packaging']:
+                if field in adjustment:
+                    setattr(item, field, adjustment[field])
+                    deltas[field] = adjustment[field]
+
+            # Validate the adjusted item (as per StockItem.save)
+            item.clean()
+
+            if validate_plugins:
+                item.run_plugin_validation()
+
+            if model_events or any(
+                getattr(item, field) != value for field, value in original.items()
+            ):
+                saved[item.pk] = item
+            else:
+                adjusted[item.pk] = item
+
+            if entry := item.add_tracking_entry(
+                tracking_code, user, deltas=deltas, notes=notes, commit=False
+            ):
+                tracking.append(entry)
+
+        # Second pass: write all changes to the database
+        for item in depleted.values():
+            item.delete()
+
+        fields = ['status', 'status_custom_key', 'batch', 'packaging']
+
+        if moving:
+            fields += ['location']
+        else:
+            fields += ['quantity']
+
+        if code == StockHistoryCode.STOCK_COUNT:
+            fields += ['stocktake_date', 'stocktake_user']
+
+        StockItem.objects.bulk_update(adjusted.values(), fields)
+
+        # Note: The post-save hooks are run by the save() method
+        for item in saved.values():
+            item.save(add_note=False)
+
+        StockItemTracking.objects.bulk_create(tracking)
+
+        for item, quantity, adjustment in splits:
+            kwargs = {
+                field: adjustment[field]
+                for field in StockItem.optional_transfer_fields()
+                if field in adjustment
+            }
+
+            item.splitStock(
+                quantity, location, user, allow_production=True, notes=notes, **kwargs
+            )
+
+        # Run the post-save hooks once for each part
+        stock_items_updated({item.part for item in adjusted.values()})
+
+        items = [*adjusted.values(), *saved.values()]
+
+        # Trigger a single event for all adjusted items
+        if ids := [item.pk for item in items]:
+            if moving:
+                trigger_event(
+                    StockEvents.ITEMS_MOVED, ids=ids, new_location=location.pk
+                )
+            elif code == StockHistoryCode.STOCK_COUNT:
+                trigger_event(StockEvents.ITEMS_COUNTED, ids=ids)
+            else:
+                trigger_event(StockEvents.ITEMS_QUANTITY_UPDATED, ids=ids)
+
+        return items
+
     def __str__(self):
         """Human friendly name."""
         if self.part.trackable and self.serial:
@@ -2778,6 +3055,8 @@ def after_delete_stock_item(sender, instance: StockItem, **kwargs):
     if InvenTree.ready.isImportingData():
         return
 
+    PartModels.PartStockSummary.schedule_update([instance.part])
+
     if InvenTree.ready.canAppAccessDatabase(allow_test=True):
         # Run this check in the background
         InvenTree.tasks.offload_task(
@@ -2796,20 +3075,39 @@ def after_delete_stock_item(sender, instance: StockItem, **kwargs):
 @receiver(post_save, sender=StockItem, dispatch_uid='stock_item_post_save_log')
 def after_save_stock_item(sender, instance: StockItem, created, **kwargs):
     """Hook function to be executed after StockItem object is saved/updated."""
+    parts = [instance.part]
+
+    # If the item has been moved to a different part, the previous part is also updated
+    if previous_part_id := instance.__dict__.pop('_previous_part_id', None):
+        parts.extend(PartModels.Part._base_manager.filter(pk=previous_part_id))
+
+    stock_items_updated(parts)
+
+
+def stock_items_updated(parts):
+    """Run the post-save hooks for stock items associated with the provided parts.
+
+    Bulk operations (which do not send post_save signals) call this once for each affected part.
+    """
     from part import tasks as part_tasks
 
-    if not InvenTree.ready.isImportingData():
+    if InvenTree.ready.isImportingData():
+        return
+
+    PartModels.PartStockSummary.schedule_update(parts)
+
+    for part in parts:
         if InvenTree.ready.canAppAccessDatabase(allow_test=True):
             InvenTree.tasks.offload_task(
                 part_tasks.notify_low_stock_if_required,
-                instance.part.pk,
+                part.pk,
                 group='notification',
                 force_async=True,
             )
 
         if InvenTree.ready.canAppAccessDatabase(allow_test=settings.TESTING_PRICING):
-            if instance.part:
-                instance.part.schedule_pricing_update(create=True)
+            if part:
+                part.schedule_pricing_update(create=True)
 
 
 class StockItemTracking(InvenTree.models.InvenTreeModel):
@@ -2,6 +2,7 @@
 
 from datetime import timedelta
 from decimal import Decimal
+from functools import cached_property
 
 from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
@@ -423,6 +424,7 @@ class StockItemSerializer(
             allow_null=True,
         ),
         filter_name='path_detail',
+        prefetch_fields=['location'],
     )
 
     in_stock = serializers.BooleanField(read_only=True, label=_('In Stock'))
@@ -471,42 +473,27 @@ class StockItemSerializer(
         return instance
 
     @staticmethod
-    def annotate_queryset(queryset):
-        """Add some extra annotations to the queryset, performing database queries as efficiently as possible."""
+    def annotate_queryset(queryset, prefetch_fields=None):
+        """Add some extra annotations to the queryset, performing database queries as efficiently as possible.
+
+        Arguments:
+            queryset: The StockItem queryset to annotate
+            prefetch_fields: Optional list of related fields required by the included serializer fields.
+                If not provided, related fields are prefetched for all optional serializer fields.
+        """
+        if prefetch_fields is None:
+            prefetch_fields = StockItemSerializer.get_field_prefetches()
+
         queryset = queryset.prefetch_related(
-            'location',
-            'allocations',
             'sales_order',
-            'sales_order_allocations',
             'purchase_order',
-            Prefetch(
-                'part',
-                queryset=part_models.Part.objects.annotate(
-                    category_default_location=part_filters.annotate_default_location(
-                        'category__'
-                    )
-                ).prefetch_related(None),
-            ),
-            'parent',
-            'part__category',
-            'part__supplier_parts',
-            'part__supplier_parts__purchase_order_line_items',
-            'part__pricing_data',
-            'part__tags',
             'supplier_part',
-            'supplier_part__part',
-            'supplier_part__supplier',
             'supplier_part__manufacturer_part',
-            'supplier_part__manufacturer_part__manufacturer',
-            'supplier_part__manufacturer_part__tags',
-            'supplier_part__purchase_order_line_items',
-            'supplier_part__tags',
-            'test_results',
             'customer',
             'belongs_to',
-            'sales_order',
             'consumed_by',
             'tags',
+            *prefetch_fields,
         )
 
         # Annotate the queryset with the total allocated to sales orders
@@ -555,6 +542,29 @@ class StockItemSerializer(
 
         return queryset
 
+    @staticmethod
+    def annotate_search_queryset(queryset):
+        """Add the minimal set of annotations required to display search results.
+
+        Related objects which are not displayed are not prefetched,
+        and the (expensive) allocation and tracking counts are skipped.
+        """
+        queryset = queryset.prefetch_related(
+            'location', 'part', 'part__category', 'supplier_part', 'tags'
+        )
+
+        queryset = queryset.annotate(
+            expired=Case(
+                When(
+                    StockItem.EXPIRED_FILTER,
+                    then=Value(True, output_field=BooleanField()),
+                ),
+                default=Value(False, output_field=BooleanField()),
+            )
+        )
+
+        return queryset
+
     status_text = serializers.CharField(
         source='get_status_display', read_only=True, label=_('Status')
     )
@@ -587,6 +597,14 @@ class StockItemSerializer(
             allow_null=True,
         ),
         True,
+        prefetch_fields=[
+            'supplier_part__part',
+            'supplier_part__supplier',
+            'supplier_part__manufacturer_part__manufacturer',
+            'supplier_part__manufacturer_part__tags',
+            'supplier_part__purchase_order_line_items',
+            'supplier_part__tags',
+        ],
     )
 
     part_detail = enable_filter(
@@ -594,6 +612,21 @@ class StockItemSerializer(
             label=_('Part'), source='part', many=False, read_only=True, allow_null=True
         ),
         True,
+        prefetch_fields=[
+            lambda: Prefetch(
+                'part',
+                queryset=part_models.Part.objects.annotate(
+                    category_default_location=part_filters.annotate_default_location(
+                        'category__'
+                    )
+                ).prefetch_related(None),
+            ),
+            'part__category',
+            'part__supplier_parts',
+            'part__supplier_parts__purchase_order_line_items',
+            'part__pricing_data',
+            'part__tags',
+        ],
     )
 
     location_detail = enable_filter(
@@ -605,12 +638,14 @@ class StockItemSerializer(
             allow_null=True,
         ),
         True,
+        prefetch_fields=['location'],
     )
 
     tests = enable_filter(
         StockItemTestResultSerializer(
             source='test_results', many=True, read_only=True, allow_null=True
-        )
+        ),
+        prefetch_fields=['test_results'],
     )
 
     quantity = InvenTreeDecimalField()
@@ -1515,6 +1550,47 @@ def stock_item_adjust_status_options():
     return [(None, _('No Change')), *stock.status_codes.StockStatus.items(custom=True)]
 
 
+class StockAdjustmentItemListSerializer(serializers.ListSerializer):
+    """List serializer for the items within a stock adjustment request.
+
+    All of the referenced StockItem objects are fetched in a single query,
+    before the individual items are validated.
+    """
+
+    def to_internal_value(self, data):
+        """Pre-fetch the referenced StockItem objects."""
+        pks = set()
+
+        if isinstance(data, list):
+            for row in data:
+                try:
+                    pks.add(int(row.get('pk')))
+                except (AttributeError, TypeError, ValueError):
+                    continue
+
+        self.child.stock_items = (
+            StockItem.objects
+            .filter(pk__in=pks)
+            .select_related('part', 'location', 'sales_order')
+            .in_bulk()
+        )
+
+        return super().to_internal_value(data)
+
+
+class StockAdjustmentItemField(serializers.PrimaryKeyRelatedField):
+    """Primary key field which uses the StockItem objects pre-fetched by the parent list serializer."""
+
+    def to_internal_value(self, data):
+        """Return the pre-fetched StockItem, if available."""
+        stock_items = getattr(self.parent, 'stock_items', None) or {}
+
+        try:
+            return stock_items[int(data)]
+        except (KeyError, TypeError, ValueError):
+            return super().to_internal_value(data)
+
+
 class StockAdjustmentItemSerializer(serializers.Serializer):
     """Serializer for a single StockItem within a stock adjustment request.
 
@@ -1534,6 +1610,7 @@ class StockAdjustmentItemSerializer(serializers.Serializer):
         """Metaclass options."""
 
         fields = ['pk', 'quantity', 'batch', 'status', 'packaging']
+        list_serializer_class = StockAdjustmentItemListSerializer
 
     def __init__(self, *args, **kwargs):
         """Initialize the serializer."""
@@ -1542,9 +1619,19 @@ class StockAdjustmentItemSerializer(serializers.Serializer):
         self.require_in_stock = kwargs.pop('require_in_stock', True)
         self.require_non_zero = kwargs.pop('require_non_zero', False)
 
+        # StockItem objects pre-fetched by the list serializer
+        self.stock_items = {}
+
         super().__init__(*args, **kwargs)
 
-    pk = serializers.PrimaryKeyRelatedField(
+    @cached_property
+    def allow_out_of_stock_transfer(self) -> bool:
+        """Return True if out-of-stock items can be adjusted (read once per request)."""
+        return get_global_setting(
+            'STOCK_ALLOW_OUT_OF_STOCK_TRANSFER', backup_value=False, cache=False
+        )
+
+    pk = StockAdjustmentItemField(
         queryset=StockItem.objects.all(),
         many=False,
         allow_null=False,
@@ -1556,11 +1643,7 @@ class StockAdjustmentItemSerializer(serializers.Serializer):
     def validate_pk(self, stock_item: StockItem) -> StockItem:
         """Ensure the stock item is valid."""
         if self.require_in_stock == True:
-            allow_out_of_stock_transfer = get_global_setting(
-                'STOCK_ALLOW_OUT_OF_STOCK_TRANSFER', backup_value=False, cache=False
-            )
-
-            if not allow_out_of_stock_transfer and not stock_item.is_in_stock(
+            if not self.allow_out_of_stock_transfer and not stock_item.is_in_stock(
                 check_status=False, check_quantity=False, check_in_production=False
             ):
                 raise ValidationError(_('Stock item is not in stock'))
@@ -1616,6 +1699,9 @@ class StockAdjustmentSerializer(serializers.Serializer):
 
         fields = ['items', 'notes']
 
+    # The type of stock adjustment performed by this serializer
+    adjustment_code = None
+
     items = StockAdjustmentItemSerializer(many=True)
 
     notes = serializers.CharField(
@@ -1636,89 +1722,53 @@ class StockAdjustmentSerializer(serializers.Serializer):
 
         return data
 
+    def get_adjustments(self) -> list[dict]:
+        """Construct a list of stock adjustments from the validated data."""
+        adjustments = []
 
-class StockCountSerializer(StockAdjustmentSerializer):
-    """Serializer for counting stock items."""
+        for item in self.validated_data['items']:
+            adjustment = {'item': item['pk'], 'quantity': item['quantity']}
+
+            # Optional fields
+            for field_name in StockItem.optional_transfer_fields():
+                if field_value := item.get(field_name, None):
+                    adjustment[field_name] = field_value
+
+            adjustments.append(adjustment)
+
+        return adjustments
 
     def save(self):
-        """Count stock."""
+        """Perform the stock adjustment for all items in a single operation."""
         request = self.context['request']
 
         data = self.validated_data
-        items = data['items']
-        notes = data.get('notes', '')
 
-        with transaction.atomic():
-            for item in items:
-                stock_item = item['pk']
-                quantity = item['quantity']
+        StockItem.adjust_stock_items(
+            self.adjustment_code,
+            self.get_adjustments(),
+            request.user,
+            notes=data.get('notes', ''),
+            location=data.get('location', None),
+        )
 
-                # Optional fields
-                extra = {}
 
-                for field_name in StockItem.optional_transfer_fields():
-                    if field_value := item.get(field_name, None):
-                        extra[field_name] = field_value
+class StockCountSerializer(StockAdjustmentSerializer):
+    """Serializer for counting stock items."""
 
-                stock_item.stocktake(quantity, request.user, notes=notes, **extra)
+    adjustment_code = stock.status_codes.StockHistoryCode.STOCK_COUNT
 
 
 class StockAddSerializer(StockAdjustmentSerializer):
     """Serializer for adding stock to stock item(s)."""
 
-    def save(self):
-        """Add stock."""
-        request = self.context['request']
-
-        data = self.validated_data
-        notes = data.get('notes', '')
-
-        with transaction.atomic():
-            for item in data['items']:
-                stock_item = item['pk']
-                quantity = item['quantity']
-
-                if quantity is None or quantity <= 0:
-                    # Ignore in this case - no stock to add
-                    continue
-
-                # Optional fields
-                extra = {}
-
-                for field_name in StockItem.optional_transfer_fields():
-                    if field_value := item.get(field_name, None):
-                        extra[field_name] = field_value
-
-                stock_item.add_stock(quantity, request.user, notes=notes, **extra)
+    adjustment_code = stock.status_codes.StockHistoryCode.STOCK_ADD
 
 
 class StockRemoveSerializer(StockAdjustmentSerializer):
     """Serializer for removing stock from stock item(s)."""
 
-    def save(self):
-        """Remove stock."""
-        request = self.context['request']
-
-        data = self.validated_data
-        notes = data.get('notes', '')
-
-        with transaction.atomic():
-            for item in data['items']:
-                stock_item = item['pk']
-                quantity = item['quantity']
-
-                # Ignore in this case - no stock to remove
-                if quantity is None or quantity <= 0:
-                    continue
-
-                # Optional fields
-                extra = {}
-
-                for field_name in StockItem.optional_transfer_fields():
-                    if field_value := item.get(field_name, None):
-                        extra[field_name] = field_value
-
-                stock_item.take_stock(quantity, request.user, notes=notes, **extra)
+    adjustment_code = stock.status_codes.StockHistoryCode.STOCK_REMOVE
 
 
 class StockTransferSerializer(StockAdjustmentSerializer):
@@ -1729,6 +1779,8 @@ class StockTransferSerializer(StockAdjustmentSerializer):
 
         fields = ['items', 'notes', 'location']
 
+    adjustment_code = stock.status_codes.StockHistoryCode.STOCK_MOVE
+
     items = StockAdjustmentItemSerializer(many=True, require_non_zero=True)
 
     location = serializers.PrimaryKeyRelatedField(
@@ -1740,33 +1792,6 @@ class StockTransferSerializer(StockAdjustmentSerializer):
         help_text=_('Destination stock location'),
     )
 
-    def save(self):
-        """Transfer stock."""
-        request = self.context['request']
-
-        data = self.validated_data
-
-        items = data['items']
-        notes = data.get('notes', '')
-        location = data['location']
-
-        with transaction.atomic():
-            for item in items:
-                # Required fields
-                stock_item = item['pk']
-                quantity = item['quantity']
-
-                # Optional fields
-                kwargs = {}
-
-                for field_name in StockItem.optional_transfer_fields():
-                    if field_value := item.get(field_name, None):
-                        kwargs[field_name] = field_value
-
-                stock_item.move(
-                    location, notes, request.user, quantity=quantity, **kwargs
-                )
-
 
 class StockReturnSerializer(StockAdjustmentSerializer):
     """Serializer class for returning stock item(s) into stock."""
@@ -20,7 +20,7 @@ def rebuild_stock_items():
     logger.info('Rebuilding StockItem tree structure')
 
     try:
-        StockItem.objects.rebuild()
+        StockItem._tree_manager.rebuild()
     except Exception as e:
         # This is a critical error, explicitly report to sentry
         report_exception(e)
@@ -48,7 +48,7 @@ def rebuild_stock_item_tree(tree_id: int, rebuild_on_fail: bool = True) -> bool:
 
     if tree_id:
         try:
-            StockItem.objects.partial_rebuild(tree_id)
+            StockItem._tree_manager.partial_rebuild(tree_id)
             logger.info('Rebuilt StockItem tree for tree_id: %s', tree_id)
             return True
         except Exception as e:
@@ -63,5 +63,5 @@ def rebuild_stock_item_tree(tree_id: int, rebuild_on_fail: bool = True) -> bool:
             return False
     else:
         # No tree_id provided, so rebuild the entire tree
-        StockItem.objects.rebuild()
+        StockItem._tree_manager.rebuild()
         return True
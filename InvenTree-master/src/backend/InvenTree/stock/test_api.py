@@ -7,10 +7,13 @@ from enum import IntEnum
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from djmoney.money import Money
 from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
 
 import build.models
 import company.models
@@ -19,6 +22,7 @@ from common.models import InvenTreeCustomUserStateModel, InvenTreeSetting
 from common.settings import set_global_setting
 from InvenTree.unit_test import InvenTreeAPITestCase
 from part.models import Part, PartTestTemplate
+from stock.api import StockList, StockTransfer
 from stock.models import (
     StockItem,
     StockItemTestResult,
@@ -1021,6 +1025,35 @@ class StockItemListTest(StockAPITestCase):
             self.list_url, {'location_detail': True, 'tests': True}, max_query_count=35
         )
 
+    def test_prefetch_planner(self):
+        """Test that related fields are only prefetched for the requested detail fields."""
+
+        def count_queries(params):
+            request = APIRequestFactory().get('/api/stock/', params)
+            force_authenticate(request, user=self.user)
+
+            with CaptureQueriesContext(connection) as context:
+                response = StockList.as_view()(request)
+                response.render()
+
+            self.assertEqual(response.status_code, 200)
+            return len(context.captured_queries), response.data
+
+        n_full, full = count_queries({
+            'part_detail': True,
+            'location_detail': True,
+            'supplier_part_detail': True,
+            'tests': True,
+        })
+        n_slim, slim = count_queries({'part_detail': False, 'location_detail': False})
+
+        self.assertEqual(len(full), len(slim))
+        self.assertIn('part_detail', full[0])
+        self.assertNotIn('part_detail', slim[0])
+
+        # Part, location, supplier part and test result prefetches are skipped
+        self.assertLessEqual(n_slim, n_full - 10)
+
     def test_batch_generate_api(self):
         """Test helper API for batch management."""
         set_global_setting(
@@ -1858,6 +1891,52 @@ class StocktakeTest(StockAPITestCase):
             status_code=status.HTTP_400_BAD_REQUEST,
         )
 
+    def test_bulk_transfer(self):
+        """Test that stock transfers are performed in bulk."""
+        location = StockLocation.objects.filter(structural=False).first()
+
+        def transfer(items):
+            request = APIRequestFactory().post(
+                '/api/stock/transfer/',
+                {
+                    'items': [
+                        {'pk': item.pk, 'quantity': item.quantity} for item in items
+                    ],
+                    'location': location.pk,
+                    'notes': 'Bulk transfer',
+                },
+                format='json',
+            )
+            force_authenticate(request, user=self.user)
+
+            with CaptureQueriesContext(connection) as context:
+                response = StockTransfer.as_view()(request)
+
+            self.assertEqual(response.status_code, 201, response.data)
+            return len(context.captured_queries)
+
+        items = list(
+            StockItem.objects.filter(quantity__gt=0, customer=None).exclude(
+                location=location
+            )
+        )
+
+        self.assertGreaterEqual(len(items), 10)
+
+        n_tracking = StockItemTracking.objects.count()
+
+        n_few = transfer(items[:2])
+        n_many = transfer(items[2:10])
+
+        # The number of queries does not scale with the number of items
+        self.assertLessEqual(n_many, n_few + 6)
+
+        self.assertEqual(StockItemTracking.objects.count(), n_tracking + 10)
+
+        for item in items[:10]:
+            item.refresh_from_db()
+            self.assertEqual(item.location, location)
+
 
 class StockItemDeletionTest(StockAPITestCase):
     """Tests for stock item deletion via the API."""
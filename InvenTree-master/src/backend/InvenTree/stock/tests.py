@@ -1,10 +1,14 @@
 """Tests for stock app."""
 
 import datetime
+from unittest import mock
 
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.db.models import Sum
+from django.db.models.signals import post_save
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 from djmoney.money import Money
 
@@ -14,7 +18,9 @@ from company.models import Company
 from InvenTree.unit_test import AdminTestCase, InvenTreeTestCase
 from order.models import SalesOrder
 from part.models import Part, PartTestTemplate
+from stock.generators import generate_serial_number
 from stock.status_codes import StockHistoryCode, StockStatus
+from tenancy.models import Tenant
 
 from .models import (
     StockItem,
@@ -515,6 +521,111 @@ class StockTest(StockTestBase):
         # Test that negative quantity does nothing
         self.assertFalse(it.take_stock(-10, None))
 
+    def test_adjust_stock_items(self):
+        """Test bulk stock adjustment of multiple items."""
+        # Adjusted items are validated as per StockItem.save (which requires a tenant)
+        StockItem._base_manager.filter(pk__in=[1, 2, 100]).update(
+            tenant=Tenant.objects.create(name='Adjust', slug='adjust')
+        )
+
+        it = StockItem.objects.get(pk=2)
+        w1 = StockItem.objects.get(pk=100)
+        other = StockItem.objects.get(pk=1)
+
+        n_tracking = StockItemTracking.objects.count()
+
+        # Remove stock from multiple items
+        items = StockItem.adjust_stock_items(
+            StockHistoryCode.STOCK_REMOVE,
+            [{'item': it, 'quantity': 15}, {'item': w1, 'quantity': 30}],
+            None,
+            notes='Bulk removal',
+        )
+
+        self.assertEqual(len(items), 2)
+        self.assertEqual(StockItemTracking.objects.count(), n_tracking + 2)
+
+        it.refresh_from_db()
+        self.assertEqual(it.quantity, 4985)
+
+        track = StockItemTracking.objects.filter(item=it).latest('id')
+        self.assertEqual(track.tracking_type, StockHistoryCode.STOCK_REMOVE)
+        self.assertEqual(track.deltas['removed'], 15)
+        self.assertEqual(track.notes, 'Bulk removal')
+
+        w1.refresh_from_db()
+        self.assertEqual(w1.quantity, 0)
+
+        # Count stock, and update the status
+        StockItem.adjust_stock_items(
+            StockHistoryCode.STOCK_COUNT,
+            [{'item': it, 'quantity': 100, 'status': StockStatus.DAMAGED.value}],
+            None,
+        )
+
+        it.refresh_from_db()
+        self.assertEqual(it.quantity, 100)
+        self.assertEqual(it.status, StockStatus.DAMAGED.value)
+        self.assertIsNotNone(it.stocktake_date)
+
+        # Move multiple items to a new location
+        n_tracking = StockItemTracking.objects.count()
+
+        items = StockItem.adjust_stock_items(
+            StockHistoryCode.STOCK_MOVE,
+            [{'item': it, 'quantity': 100}, {'item': other, 'quantity': 4000}],
+            None,
+            location=self.drawer1,
+        )
+
+        self.assertEqual(len(items), 2)
+        self.assertEqual(StockItemTracking.objects.count(), n_tracking + 2)
+
+        for item in [it, other]:
+            item.refresh_from_db()
+            self.assertEqual(item.location, self.drawer1)
+
+        # Validation errors prevent *any* changes from being made
+        with self.assertRaises(ValidationError):
+            StockItem.adjust_stock_items(
+                StockHistoryCode.STOCK_ADD,
+                [{'item': it, 'quantity': 10}, {'item': other, 'quantity': -1}],
+                None,
+            )
+
+        it.refresh_from_db()
+        self.assertEqual(it.quantity, 100)
+
+        # Items are saved individually if a search index field is changed
+        saved = []
+
+        def on_save(sender, instance, **kwargs):
+            saved.append(instance.pk)
+
+        post_save.connect(on_save, sender=StockItem)
+        self.addCleanup(post_save.disconnect, on_save, sender=StockItem)
+
+        with mock.patch(
+            'common.search.available_tracked_fields', return_value={'location_id'}
+        ):
+            StockItem.adjust_stock_items(
+                StockHistoryCode.STOCK_MOVE,
+                [{'item': it, 'quantity': 100}],
+                None,
+                location=self.drawer2,
+            )
+            StockItem.adjust_stock_items(
+                StockHistoryCode.STOCK_ADD, [{'item': other, 'quantity': 10}], None
+            )
+
+        self.assertEqual(saved, [it.pk])
+
+        it.refresh_from_db()
+        self.assertEqual(it.location, self.drawer2)
+
+        with self.assertRaises(ValueError):
+            StockItem.adjust_stock_items(StockHistoryCode.EDITED, [], None)
+
     def test_deplete_stock(self):
         """Test depleted stock deletion."""
         w1 = StockItem.objects.get(pk=100)
@@ -923,6 +1034,76 @@ class VariantTest(StockTestBase):
         item.serial = int(n) + 2
         item.save()
 
+    def test_allocate_serial_numbers(self):
+        """Test allocation of the next available serial numbers for a part tree."""
+        InvenTreeSetting.set_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False, self.user)
+
+        chair = Part.objects.get(pk=10000)
+        variant = Part.objects.get(pk=10003)
+
+        serials = chair.allocate_serial_numbers(5)
+        self.assertEqual(serials, ['23', '24', '25', '26', '27'])
+
+        # Serial numbers are shared across the part tree
+        items = StockItem._create_serial_numbers(serials, part=variant)
+        self.assertEqual(items.count(), 5)
+        self.assertEqual(
+            sorted(items.values_list('serial_int', flat=True)), [23, 24, 25, 26, 27]
+        )
+
+        self.assertEqual(chair.get_latest_serial_number(), '27')
+        self.assertEqual(chair.allocate_serial_numbers(2), ['28', '29'])
+
+        # Existing serial numbers cannot be created again
+        with self.assertRaises(ValidationError):
+            StockItem._create_serial_numbers(['29', '27'], part=chair)
+
+        self.assertFalse(StockItem.objects.filter(serial='29').exists())
+
+        # Allocation fails (rather than looping indefinitely) if every candidate is rejected
+        with (
+            mock.patch.object(Part, 'get_serial_number_plugins', return_value=[None]),
+            mock.patch.object(Part, 'validate_serial_number', return_value=False),
+            self.assertRaises(ValidationError),
+        ):
+            chair.allocate_serial_numbers(3)
+
+        # The serial numbers which could be generated are returned for a partial allocation
+        sequence = {'27': '28', '28': '29'}
+
+        with mock.patch(
+            'InvenTree.helpers.serial_number_incrementer', return_value=sequence.get
+        ):
+            self.assertEqual(
+                chair.allocate_serial_numbers(3, partial=True), ['28', '29']
+            )
+            self.assertEqual(generate_serial_number(part=chair, quantity=3), '28,29')
+
+            with self.assertRaises(ValidationError):
+                chair.allocate_serial_numbers(3)
+
+        # Globally unique serial numbers lock the setting, rather than the part tree
+        InvenTreeSetting.set_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', True, self.user)
+
+        with CaptureQueriesContext(connection) as queries:
+            chair.lock_serial_numbers()
+
+        self.assertIn('common_inventreesetting', queries[-1]['sql'])
+        self.assertFalse(any('part_part' in query['sql'] for query in queries))
+
+        self.assertEqual(len(chair.allocate_serial_numbers(2)), 2)
+
+        InvenTreeSetting.set_setting('SERIAL_NUMBER_GLOBALLY_UNIQUE', False, self.user)
+
+        # Conflicts for a large batch of serial numbers
+        to_check = [str(x) for x in range(1, 1001)]
+        conflicts = chair.find_conflicting_serial_numbers(to_check)
+
+        self.assertEqual(
+            [int(x) for x in conflicts],
+            [1, 2, 3, 4, 5, 10, 11, 12, 20, 21, 22, 23, 24, 25, 26, 27],
+        )
+
 
 class StockLocationTreeTest(StockTestBase):
     """Unit test for the StockLocation tree structure."""
@@ -7,7 +7,8 @@ from rest_framework import authentication, exceptions
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from tenancy.context import set_current_tenant
-from tenancy.models import ServiceToken, Tenant, TenantDevice
+from tenancy.models import ServiceToken, TenantDevice
+from tenancy.resolver import Principal, resolve_principal
 
 logger = logging.getLogger('inventree')
 
@@ -26,39 +27,51 @@ class ServiceTokenUser(AnonymousUser):
 
 
 class TenantJWTAuthentication(JWTAuthentication):
-    """JWT authentication that attaches tenant context."""
+    """JWT authentication that attaches tenant context.
+
+    The token is verified once per request by the principal resolver,
+    which is shared with the tenant middleware.
+    """
 
     def authenticate(self, request):
         """Authenticate and set request.tenant from token claims."""
-        result = super().authenticate(request)
-        if result is None:
-            return None
+        principal = resolve_principal(request)
+
+        if principal is None or principal.kind != Principal.JWT:
+            # Defer to the default implementation, which reports why the token was rejected
+            return super().authenticate(request)
 
-        user, validated_token = result
-        self._attach_tenant(request, validated_token)
+        if principal.user is None:
+            principal.user = self.get_user(principal.token)
 
-        return (user, validated_token)
+        self._attach_tenant(request, principal)
 
-    def _attach_tenant(self, request, validated_token):
+        return (principal.user, principal.token)
+
+    def _attach_tenant(self, request, principal):
         """Set tenant and role from the token claims."""
-        tenant_id = validated_token.get('tenant_id')
+        tenant_id = principal.claims.get('tenant_id')
         if tenant_id is None:
             return
 
-        tenant = Tenant.objects.filter(id=tenant_id).first()
+        tenant = principal.tenant
         if tenant is None:
             logger.warning('JWT referenced unknown tenant_id=%s', tenant_id)
             return
 
         request.tenant = tenant
-        request.tenant_role = validated_token.get('role')
-        
+        request.tenant_role = principal.role
+
         # Verify device is still active if device_id is present
-        device_id = validated_token.get('device_id')
-        if device_id:
-            user = getattr(request, 'user', None)
-            if user and not TenantDevice.objects.filter(user=user, tenant=tenant, device_id=device_id).exists():
-                raise exceptions.AuthenticationFailed('Device session has been invalidated or expired')
+        if (
+            principal.device_id
+            and not TenantDevice.objects.filter(
+                user=principal.user, tenant=tenant, device_id=principal.device_id
+            ).exists()
+        ):
+            raise exceptions.AuthenticationFailed(
+                'Device session has been invalidated or expired'
+            )
 
         set_current_tenant(tenant)
 
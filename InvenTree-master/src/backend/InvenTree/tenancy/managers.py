@@ -1,6 +1,8 @@
 """Custom managers and querysets for tenant-aware models."""
 
+from django.core.exceptions import FieldDoesNotExist
 from django.db import models
+from django.db.models import F, Max
 
 from .context import get_current_tenant
 
@@ -42,14 +44,99 @@ try:
         pass
 
     class TenantTreeManager(TreeManager, TenantManager):
-        """Manager for tenant-aware MPTT models."""
+        """Manager for tenant-aware MPTT models.
+
+        The tree_id values are unique across the whole table,
+        and each tree belongs to a single tenant.
+        """
+
+        @property
+        def tenant_scoped(self) -> bool:
+            """Return True if the managed model has a tenant field."""
+            try:
+                self.model._meta.get_field('tenant')
+                return True
+            except FieldDoesNotExist:
+                return False
 
         def get_queryset(self):
             qs = TenantTreeQuerySet(self.model, using=self._db)
             tenant = get_current_tenant()
-            if tenant is not None:
+            if tenant is not None and self.tenant_scoped:
                 qs = qs.filter(tenant=tenant)
-            return qs
+            return qs.order_by(self.tree_id_attr, self.left_attr)
+
+        def rebuild(self, batch_size=1000, **filters) -> None:
+            """Rebuild the trees, scoped to the current tenant (if one is set)."""
+            tenant = get_current_tenant()
+
+            if tenant is None or filters or not self.tenant_scoped:
+                super().rebuild(batch_size=batch_size, **filters)
+            else:
+                self.rebuild_for_tenant(tenant, batch_size=batch_size)
+
+        rebuild.alters_data = True
+
+        def rebuild_for_tenant(self, tenant, batch_size=1000) -> None:
+            """Rebuild all trees which belong to the provided tenant.
+
+            A full rebuild renumbers every tree in the table from 1,
+            which would collide with the trees of other tenants.
+            Instead, the tree_id values already held by the tenant are reused,
+            and any additional trees are appended after the highest tree_id in the table.
+            """
+            self._find_out_rebuild_fields()
+
+            parents = self._get_parents(tenant=tenant)
+            children = self._get_children(tenant=tenant)
+
+            tree_ids = sorted(
+                self
+                ._mptt_filter(tenant=tenant)
+                .order_by()
+                .values_list(self.tree_id_attr, flat=True)
+                .distinct()
+            )
+
+            if len(parents) > len(tree_ids):
+                next_tree_id = self._get_next_tree_id()
+                tree_ids += range(
+                    next_tree_id, next_tree_id + len(parents) - len(tree_ids)
+                )
+
+            nodes_to_update = []
+
+            for parent, tree_id in zip(parents, tree_ids):
+                self._rebuild_helper(
+                    node=parent,
+                    left=1,
+                    tree_id=tree_id,
+                    children=children,
+                    nodes_to_update=nodes_to_update,
+                    level=0,
+                )
+
+            self.bulk_update(
+                nodes_to_update, self._rebuild_fields.values(), batch_size=batch_size
+            )
+
+        rebuild_for_tenant.alters_data = True
+
+        def _get_next_tree_id(self):
+            """Return the next unused tree_id, across all tenants."""
+            max_tree_id = self.tree_model._base_manager.aggregate(
+                max_tree_id=Max(self.tree_id_attr)
+            )['max_tree_id']
+
+            return (max_tree_id or 0) + 1
+
+        def _create_tree_space(self, target_tree_id, num_trees=1):
+            """Create space for a new tree, shifting the trees of all tenants."""
+            qs = self.tree_model._base_manager.filter(**{
+                f'{self.tree_id_attr}__gt': target_tree_id
+            })
+            self._mptt_update(qs, tree_id=F(self.tree_id_attr) + num_trees)
+            self.tree_model._mptt_track_tree_insertions(target_tree_id + 1, num_trees)
 
 except ImportError:
     pass
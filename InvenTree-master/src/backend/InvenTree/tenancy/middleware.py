@@ -1,16 +1,13 @@
 """Middleware to attach tenant context to each request."""
 
 import logging
-from typing import Optional
 
 from django.http import Http404, HttpResponseForbidden
 from django.utils.deprecation import MiddlewareMixin
-from rest_framework_simplejwt.backends import TokenBackend
-from rest_framework_simplejwt.exceptions import InvalidToken, TokenBackendError
-from rest_framework_simplejwt.settings import api_settings
 
 from .context import clear_current_tenant, set_current_tenant
-from .models import ServiceToken, Tenant, TenantUser
+from .models import Tenant, TenantUser
+from .resolver import Principal, get_tenant, resolve_principal
 from audit.utils import log_audit
 
 logger = logging.getLogger('inventree')
@@ -75,18 +72,6 @@ class SubdomainTenantMiddleware(MiddlewareMixin):
 class TenantContextMiddleware(MiddlewareMixin):
     """Load tenant information from JWT claims or headers."""
 
-    def __init__(self, get_response=None):
-        """Initialize token backend."""
-        super().__init__(get_response)
-        self.token_backend = TokenBackend(
-            algorithm=api_settings.ALGORITHM,
-            signing_key=api_settings.SIGNING_KEY,
-            verifying_key=api_settings.VERIFYING_KEY,
-            audience=api_settings.AUDIENCE,
-            issuer=api_settings.ISSUER,
-            leeway=api_settings.LEEWAY,
-        )
-
     def process_request(self, request):
         """Attach tenant to request and thread-local context."""
         # If a previous middleware (subdomain) already set tenant, respect it.
@@ -101,25 +86,20 @@ class TenantContextMiddleware(MiddlewareMixin):
         request.tenant = None
         request.tenant_user = None
         request.tenant_role = None
-        claims = self._decode_token(request)
+        principal = resolve_principal(request)
 
         tenant = None
         user_id = None
-        role = None
 
-        if claims:
-            tenant_id = claims.get('tenant_id')
-            user_id = claims.get(api_settings.USER_ID_CLAIM)
-            role = claims.get('role')
-            request.tenant_role = role
-
-            if tenant_id is not None:
-                tenant = self._get_tenant_from_identifier(tenant_id)
+        if principal is not None and principal.kind == Principal.JWT:
+            user_id = principal.user_id
+            request.tenant_role = principal.role
+            tenant = principal.tenant
 
         override_target = request.headers.get('X-Tenant-Override')
         if override_target:
             if self._can_override(user_id, override_target):
-                tenant = self._get_tenant_from_identifier(override_target)
+                tenant = get_tenant(override_target)
                 logger.info(
                     'Tenant override applied',
                     extra={
@@ -148,45 +128,12 @@ class TenantContextMiddleware(MiddlewareMixin):
         clear_current_tenant()
         return response
 
-    def _decode_token(self, request) -> Optional[dict]:
-        """Decode Authorization bearer token if present."""
-        header = request.headers.get('Authorization') or request.headers.get(
-            'authorization'
-        )
-        if not header:
-            return None
-
-        parts = header.split()
-        if len(parts) != 2 or parts[0].lower() != 'bearer':
-            return None
-
-        if parts[1].startswith(ServiceToken.TOKEN_PREFIX):
-            # Service tokens are handled by ServiceTokenAuthentication
-            return None
-
-        try:
-            return self.token_backend.decode(parts[1], verify=True)
-        except (InvalidToken, TokenBackendError) as exc:
-            logger.warning('Invalid auth token for tenant context: %s', exc)
-            return None
-
-    def _get_tenant_from_identifier(self, value) -> Optional[Tenant]:
-        """Lookup tenant by id or slug."""
-        if value is None:
-            return None
-
-        qs = Tenant.objects.all()
-        try:
-            return qs.filter(pk=int(value)).first()
-        except (TypeError, ValueError):
-            return qs.filter(slug=str(value)).first()
-
     def _can_override(self, user_id, target) -> bool:
         """Check if the user can override tenant context."""
         if user_id is None or target is None:
             return False
 
-        tenant = self._get_tenant_from_identifier(target)
+        tenant = get_tenant(target)
         if tenant is None:
             return False
 
@@ -0,0 +1,327 @@
+"""Resolve the authenticated principal for a request, in a single pass.
+
+The Authorization header is parsed and verified once per request. The result is
+stored on the request, and shared by the middleware and the DRF authentication classes.
+"""
+
+import copy
+import datetime
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from rest_framework_simplejwt.exceptions import TokenBackendError, TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+from InvenTree.cache import get_session_cache, set_session_cache
+from users.models import ApiToken
+
+from .models import ServiceToken, Tenant
+
+logger = logging.getLogger('inventree')
+
+# Maximum number of verified JWT signatures which are remembered (per process)
+JWT_CACHE_SIZE = 1024
+
+# Shared cache key which stores the current version of the API token cache
+API_TOKEN_VERSION_KEY = 'inventree-api-token-version'
+
+# Maximum age (seconds) of a cached API token
+API_TOKEN_MAX_AGE = 300
+
+# Maximum number of API tokens which are cached (per process)
+API_TOKEN_CACHE_SIZE = 1024
+
+
+@dataclass
+class Principal:
+    """The verified identity which made a request."""
+
+    JWT = 'jwt'
+    API_TOKEN = 'api_token'
+
+    kind: str
+    scheme: str
+    token: Any
+    user: Any = None
+    tenant: Optional[Tenant] = None
+    role: Optional[str] = None
+    device_id: Optional[str] = None
+
+    @property
+    def claims(self) -> dict:
+        """Return the claims of a JWT principal."""
+        if self.kind == self.JWT:
+            return self.token.payload
+        return {}
+
+    @property
+    def user_id(self):
+        """Return the ID of the authenticated user."""
+        if self.user is not None:
+            return self.user.pk
+        return self.claims.get(api_settings.USER_ID_CLAIM)
+
+
+@lru_cache(maxsize=JWT_CACHE_SIZE)
+def _verify_signature(raw_token: str) -> None:
+    """Verify the signature of a JWT.
+
+    Only successfully verified tokens are cached, so the signature of each token
+    is checked once per process. The token claims (e.g. expiry) are checked each time it is used.
+    """
+    from rest_framework_simplejwt.state import token_backend
+
+    token_backend.decode(raw_token, verify=True)
+
+
+def validate_jwt(raw_token: str):
+    """Return a validated token for the provided JWT value, or None if it is not valid."""
+    try:
+        _verify_signature(raw_token)
+    except TokenBackendError as exc:
+        logger.warning('Invalid auth token: %s', exc)
+        return None
+
+    for token_class in api_settings.AUTH_TOKEN_CLASSES:
+        try:
+            token = token_class(raw_token, verify=False)
+            token.verify()
+            return token
+        except TokenError:
+            continue
+
+    return None
+
+
+def get_tenant(value) -> Optional[Tenant]:
+    """Lookup tenant by id or slug."""
+    if value is None:
+        return None
+
+    qs = Tenant.objects.all()
+    try:
+        return qs.filter(pk=int(value)).first()
+    except (TypeError, ValueError):
+        return qs.filter(slug=str(value)).first()
+
+
+class ApiTokenCache:
+    """Process-level cache of API tokens, keyed by the token value.
+
+    - Each token (and its user) is loaded from the database with a single query
+    - All cached tokens are discarded when the version key in the shared cache changes
+    - The version key is changed whenever a token or user is saved or deleted,
+      so that revoked tokens are rejected immediately
+    - Tokens are only cached if the global cache is enabled, as a process-local
+      version key would not reach other processes when a token is revoked
+    """
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self.lock = threading.Lock()
+        self.version = None
+        self.tokens = OrderedDict()
+
+    def current_version(self) -> Optional[str]:
+        """Return the current version of the API token cache.
+
+        The version is read from the shared cache at most once per request.
+        """
+        version = get_session_cache(API_TOKEN_VERSION_KEY)
+
+        if version is None:
+            version = cache.get(API_TOKEN_VERSION_KEY)
+
+            if version is None:
+                cache.add(API_TOKEN_VERSION_KEY, uuid.uuid4().hex, None)
+                version = cache.get(API_TOKEN_VERSION_KEY)
+
+            set_session_cache(API_TOKEN_VERSION_KEY, version)
+
+        return version
+
+    def invalidate(self):
+        """Invalidate the cached API tokens for all processes."""
+        version = uuid.uuid4().hex
+
+        cache.set(API_TOKEN_VERSION_KEY, version, None)
+        set_session_cache(API_TOKEN_VERSION_KEY, version)
+
+        with self.lock:
+            self.version = None
+            self.tokens.clear()
+
+    def get(self, key: str) -> Optional[ApiToken]:
+        """Return the API token matching the provided key, or None.
+
+        A copy of the cached token is returned, so that any per-request state
+        (e.g. the permission cache of the user) is not shared between requests.
+        """
+        if not settings.GLOBAL_CACHE_ENABLED:
+            return ApiToken.objects.select_related('user').filter(key=key).first()
+
+        version = self.current_version()
+        now = time.monotonic()
+        token = None
+
+        with self.lock:
+            if version is None or version != self.version:
+                self.tokens.clear()
+                self.version = version
+
+            if entry := self.tokens.get(key):
+                if now - entry[1] < API_TOKEN_MAX_AGE:
+                    self.tokens.move_to_end(key)
+                    token = entry[0]
+                else:
+                    del self.tokens[key]
+
+        if token is None:
+            token = ApiToken.objects.select_related('user').filter(key=key).first()
+
+            if token is None:
+                return None
+
+            with self.lock:
+                # Do not store the token if the cache was invalidated in the meantime
+                if version is not None and version == self.version:
+                    self.tokens[key] = (token, now)
+
+                    while len(self.tokens) > API_TOKEN_CACHE_SIZE:
+                        self.tokens.popitem(last=False)
+
+        token = copy.copy(token)
+        token.user = copy.copy(token.user)
+
+        return token
+
+    def touch(self, token: ApiToken):
+        """Update the 'last seen' date of the provided token (at most once per day)."""
+        today = datetime.date.today()
+
+        if token.last_seen == today:
+            return
+
+        # Update the database directly, as a full save() would invalidate the cache
+        ApiToken.objects.filter(pk=token.pk).update(last_seen=today)
+        token.last_seen = today
+
+        with self.lock:
+            if entry := self.tokens.get(token.key):
+                entry[0].last_seen = today
+
+
+api_tokens = ApiTokenCache()
+
+
+@receiver(post_save, sender=ApiToken, dispatch_uid='api_token_cache_save')
+@receiver(post_delete, sender=ApiToken, dispatch_uid='api_token_cache_delete')
+@receiver(post_save, sender=get_user_model(), dispatch_uid='api_token_user_save')
+@receiver(post_delete, sender=get_user_model(), dispatch_uid='api_token_user_delete')
+def invalidate_api_tokens(sender, instance, **kwargs):
+    """Invalidate the API token cache when a token or user changes."""
+    update_fields = kwargs.get('update_fields')
+
+    # A user logging in does not affect any tokens
+    if update_fields and set(update_fields) == {'last_login'}:
+        return
+
+    api_tokens.invalidate()
+
+    # Invalidate again once committed, in case the old values were re-cached in the meantime
+    transaction.on_commit(api_tokens.invalidate)
+
+
+def get_authorization(request) -> Optional[tuple[str, str]]:
+    """Return the (scheme, credentials) pair from the Authorization header of a request."""
+    header = request.headers.get('Authorization')
+
+    if not header:
+        return None
+
+    parts = header.split()
+
+    if len(parts) != 2:
+        return None
+
+    return parts[0].lower().replace(':', ''), parts[1]
+
+
+def resolve_principal(request) -> Optional[Principal]:
+    """Return the verified principal for the provided request, or None.
+
+    The principal is resolved once, and stored on the underlying HttpRequest.
+    """
+    request = getattr(request, '_request', request)
+
+    if not hasattr(request, '_auth_principal'):
+        request._auth_principal = _resolve_principal(request)
+
+    return request._auth_principal
+
+
+def _resolve_principal(request) -> Optional[Principal]:
+    """Verify the credentials provided with a request."""
+    authorization = get_authorization(request)
+
+    if authorization is None:
+        return None
+
+    scheme, credentials = authorization
+
+    if scheme == 'bearer':
+        if credentials.startswith(ServiceToken.TOKEN_PREFIX):
+            # Service tokens are handled by ServiceTokenAuthentication
+            return None
+
+        if credentials.count('.') == 2:
+            return _resolve_jwt(scheme, credentials)
+
+    if scheme in ['token', 'bearer']:
+        return _resolve_api_token(scheme, credentials)
+
+    return None
+
+
+def _resolve_jwt(scheme: str, raw_token: str) -> Optional[Principal]:
+    """Resolve the principal for a JWT."""
+    token = validate_jwt(raw_token)
+
+    if token is None:
+        return None
+
+    return Principal(
+        kind=Principal.JWT,
+        scheme=scheme,
+        token=token,
+        tenant=get_tenant(token.get('tenant_id')),
+        role=token.get('role'),
+        device_id=token.get('device_id'),
+    )
+
+
+def _resolve_api_token(scheme: str, key: str) -> Optional[Principal]:
+    """Resolve the principal for an API token."""
+    token = api_tokens.get(key)
+
+    if token is None or not token.active or not token.user.is_active:
+        return None
+
+    api_tokens.touch(token)
+
+    return Principal(
+        kind=Principal.API_TOKEN, scheme=scheme, token=token, user=token.user
+    )
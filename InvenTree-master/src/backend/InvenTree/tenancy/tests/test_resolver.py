@@ -0,0 +1,103 @@
+"""Tests for the single-pass principal resolver."""
+
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase, override_settings
+
+from rest_framework_simplejwt.tokens import AccessToken
+
+from tenancy.models import Tenant, TenantUser
+from tenancy.resolver import Principal, _verify_signature, resolve_principal
+from users.models import ApiToken
+
+
+class PrincipalResolverTest(TestCase):
+    """Ensure credentials are verified once, and re-used."""
+
+    def setUp(self):
+        """Create user, tenant and token fixtures."""
+        self.factory = RequestFactory()
+        self.user = get_user_model().objects.create_user(
+            username='resolver', email='resolver@example.com', password='pass'
+        )
+        self.tenant = Tenant.objects.create(name='Resolver', slug='resolver')
+        TenantUser.objects.create(
+            user=self.user, tenant=self.tenant, role=TenantUser.Role.TENANT_USER
+        )
+
+    def build_request(self, authorization):
+        """Construct a request with the provided Authorization header."""
+        return self.factory.get('/', HTTP_AUTHORIZATION=authorization)
+
+    def test_jwt(self):
+        """A JWT is verified once, and provides the tenant claims."""
+        token = AccessToken.for_user(self.user)
+        token['tenant_id'] = self.tenant.id
+        token['role'] = TenantUser.Role.TENANT_USER
+
+        _verify_signature.cache_clear()
+
+        request = self.build_request(f'Bearer {token}')
+        principal = resolve_principal(request)
+
+        self.assertEqual(principal.kind, Principal.JWT)
+        self.assertEqual(principal.tenant, self.tenant)
+        self.assertEqual(principal.role, TenantUser.Role.TENANT_USER)
+        self.assertEqual(str(principal.user_id), str(self.user.pk))
+
+        # The principal is stored on the request
+        with self.assertNumQueries(0):
+            self.assertIs(resolve_principal(request), principal)
+
+        # The signature is not verified again for a new request
+        resolve_principal(self.build_request(f'Bearer {token}'))
+
+        info = _verify_signature.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+        # Invalid signatures are rejected
+        self.assertIsNone(
+            resolve_principal(self.build_request(f'Bearer {str(token)[:-2]}xx'))
+        )
+
+    @override_settings(GLOBAL_CACHE_ENABLED=True)
+    def test_api_token(self):
+        """API tokens are cached, until they are revoked."""
+        token = ApiToken.objects.create(user=self.user, name='resolver')
+
+        principal = resolve_principal(self.build_request(f'Token {token.key}'))
+
+        self.assertEqual(principal.kind, Principal.API_TOKEN)
+        self.assertEqual(principal.user, self.user)
+
+        token.refresh_from_db()
+        self.assertIsNotNone(token.last_seen)
+
+        # The token is now cached
+        with self.assertNumQueries(0):
+            principal = resolve_principal(self.build_request(f'Token {token.key}'))
+            self.assertEqual(principal.token.pk, token.pk)
+
+        # Revoking the token invalidates the cache
+        token.revoked = True
+        token.save()
+
+        self.assertIsNone(resolve_principal(self.build_request(f'Token {token.key}')))
+        self.assertIsNone(resolve_principal(self.build_request('Token inv-unknown')))
+
+    @override_settings(GLOBAL_CACHE_ENABLED=False)
+    def test_api_token_local_cache(self):
+        """API tokens are not cached without a shared cache."""
+        token = ApiToken.objects.create(user=self.user, name='resolver')
+
+        resolve_principal(self.build_request(f'Token {token.key}'))
+
+        # Each request loads the token from the database
+        with self.assertNumQueries(1):
+            principal = resolve_principal(self.build_request(f'Token {token.key}'))
+            self.assertEqual(principal.token.pk, token.pk)
+
+        # Revoking the token (e.g. from another process) takes effect immediately
+        ApiToken.objects.filter(pk=token.pk).update(revoked=True)
+
+        self.assertIsNone(resolve_principal(self.build_request(f'Token {token.key}')))
@@ -1,7 +1,5 @@
 """Custom token authentication class for InvenTree API."""
 
-import datetime
-
 from django.utils.translation import gettext_lazy as _
 
 from oauth2_provider.contrib.rest_framework import OAuth2Authentication
@@ -9,6 +7,7 @@ from rest_framework import exceptions
 from rest_framework.authentication import TokenAuthentication
 
 import users.models
+from tenancy.resolver import Principal, api_tokens, resolve_principal
 
 
 class ApiTokenAuthentication(TokenAuthentication):
@@ -21,10 +20,29 @@ class ApiTokenAuthentication(TokenAuthentication):
 
     model = users.models.ApiToken
 
+    def authenticate(self, request):
+        """Reuse the API token which has already been resolved for this request."""
+        principal = resolve_principal(request)
+
+        if (
+            principal is not None
+            and principal.kind == Principal.API_TOKEN
+            and principal.scheme == self.keyword.lower()
+        ):
+            return (principal.user, principal.token)
+
+        # Defer to the default implementation, which reports why the token was rejected
+        return super().authenticate(request)
+
     def authenticate_credentials(self, key):
         """Adds additional checks to the default token authentication method."""
-        # If this runs without error, then the token is valid (so far)
-        (user, token) = super().authenticate_credentials(key)
+        token = api_tokens.get(key)
+
+        if token is None:
+            raise exceptions.AuthenticationFailed(_('Invalid token.'))
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
 
         if token.revoked:
             raise exceptions.AuthenticationFailed(_('Token has been revoked'))
@@ -32,12 +50,9 @@ class ApiTokenAuthentication(TokenAuthentication):
         if token.expired:
             raise exceptions.AuthenticationFailed(_('Token has expired'))
 
-        if token.last_seen != datetime.date.today():
-            # Update the last-seen date
-            token.last_seen = datetime.date.today()
-            token.save()
+        api_tokens.touch(token)
 
-        return (user, token)
+        return (token.user, token)
 
 
 class ExtendedOAuth2Authentication(OAuth2Authentication):
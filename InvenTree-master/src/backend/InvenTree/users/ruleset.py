@@ -101,6 +101,7 @@ def get_ruleset_models() -> dict:
         RuleSetEnum.PART: [
             'part_part',
             'part_partpricing',
+            'part_partstocksummary',
             'part_bomitem',
             'part_bomitemsubstitute',
             'part_partsellpricebreak',
@@ -190,6 +191,7 @@ def get_ruleset_ignore() -> list[str]:
         'common_inventreecustomuserstatemodel',
         'common_selectionlistentry',
         'common_selectionlist',
+        'common_searchentry',
         'users_owner',
         'users_userprofile',  # User profile is handled in the serializer - only own user can change
         # Third-party tables
@@ -1,15 +1,145 @@
-"""Adapters for fetching inventory from external WWS connections."""
+"""Adapters for fetching inventory from external WWS connections.
 
+Each connection type is handled by a BaseAdapter subclass, which provides async fetch methods.
+Adapter requests are executed on a shared event loop (running in a background thread), so that
+HTTP clients - and their connection pools - are reused across requests:
+
+- A single httpx.AsyncClient is shared per host (using HTTP/2 where available)
+- Timeouts and retries are configured per connection, via config_json
+- Each lookup is limited by an overall deadline (including retries), so that a server
+  process is not blocked beyond the server worker timeout
+- Adapters may implement fetch_many() to fetch offers for multiple OEM numbers in a single request
+"""
+
+import asyncio
+import concurrent.futures
 import logging
-from typing import Any, Dict, List
+import os
+import threading
+from typing import Any, Coroutine, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
-import requests
 from django.utils import timezone
 
+import httpx
+
 from .models import WwsConnection
 
 logger = logging.getLogger('inventree')
 
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    HTTP2_AVAILABLE = False
+
+# Maximum number of concurrent requests to a single connection
+MAX_CONCURRENT_REQUESTS = 8
+
+# Maximum number of (pooled) connections to a single host
+MAX_CONNECTIONS_PER_HOST = 20
+
+# Defaults, which can be overridden via WwsConnection.config_json
+DEFAULT_TIMEOUT = 10
+DEFAULT_BATCH_TIMEOUT = 30
+DEFAULT_RETRIES = 2
+DEFAULT_RETRY_BACKOFF = 0.5
+
+# Overall time (seconds) allowed for a lookup against a single connection, including retries
+# This must be lower than the timeout of the server workers (30 seconds by default)
+DEFAULT_DEADLINE = 25
+
+# Additional time (seconds) to wait for timed out lookups to be cancelled
+DEADLINE_MARGIN = 2
+
+# Response status codes which are retried
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+
+class AdapterLoop:
+    """Event loop (running in a background thread) which executes adapter requests.
+
+    HTTP clients are bound to the event loop they were created in,
+    so a single long-lived loop allows connection pools to be shared between requests.
+    """
+
+    def __init__(self):
+        """Initialize the (lazily started) event loop."""
+        self.lock = threading.Lock()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.pid = None
+        self.clients: Dict[str, httpx.AsyncClient] = {}
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the running event loop, starting it if required (e.g. after a fork)."""
+        with self.lock:
+            if self.loop is None or self.loop.is_closed() or self.pid != os.getpid():
+                self.loop = asyncio.new_event_loop()
+                self.pid = os.getpid()
+                self.clients = {}
+
+                threading.Thread(target=self.loop.run_forever, name='wws-adapters', daemon=True).start()
+
+            return self.loop
+
+    def run(self, coro: Coroutine, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the event loop, and wait for the result.
+
+        Raises:
+            TimeoutError: If the result is not available within the timeout (the coroutine is cancelled)
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.get_loop())
+
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        """Return the shared client for the host of the provided URL.
+
+        Note: This must be called from within the event loop.
+        """
+        parts = urlsplit(url)
+        key = f'{parts.scheme}://{parts.netloc}'
+
+        client = self.clients.get(key)
+
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS_PER_HOST,
+                    max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+                ),
+            )
+            self.clients[key] = client
+
+        return client
+
+    async def close_clients(self):
+        """Close all shared clients."""
+        clients, self.clients = list(self.clients.values()), {}
+
+        for client in clients:
+            await client.aclose()
+
+    def close(self):
+        """Close all shared clients, and stop the event loop."""
+        with self.lock:
+            loop, self.loop = self.loop, None
+
+        if loop is None or loop.is_closed() or self.pid != os.getpid():
+            return
+
+        asyncio.run_coroutine_threadsafe(self.close_clients(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+
+adapter_loop = AdapterLoop()
+
 
 def normalize_offer(raw: dict, fallback_supplier: str) -> dict:
     """Normalize external offers into internal schema."""
@@ -24,60 +154,285 @@ def normalize_offer(raw: dict, fallback_supplier: str) -> dict:
     }
 
 
-def fetch_http_api(connection: WwsConnection, oem: str) -> List[dict]:
-    """Call http api endpoint."""
-    base = connection.base_url.rstrip('/')
-    endpoint = connection.config_json.get('inventory_path') or '/inventory'
-    url = f'{base}{endpoint}'
-    params = {'oem': oem}
-    headers = {}
-    if token := connection.auth_config_json.get('token'):
-        headers['Authorization'] = f'Bearer {token}'
-    response = requests.get(url, params=params, headers=headers, timeout=10)
-    response.raise_for_status()
-    data = response.json()
-    offers = data if isinstance(data, list) else data.get('offers', [])
-    return [normalize_offer(o, connection.base_url) for o in offers]
+class BaseAdapter:
+    """Base class for fetching offers from a WWS connection.
+
+    Subclasses must implement fetch(), and may implement fetch_many()
+    if offers for multiple OEM numbers can be fetched in a single request.
+    """
+
+    # Set if the adapter returns offers which already match the internal schema
+    normalized = False
+
+    def __init__(self, connection: WwsConnection):
+        """Initialize the adapter for the provided connection."""
+        self.connection = connection
+        self.config = connection.config_json or {}
+
+    @property
+    def timeout(self) -> float:
+        """Timeout (in seconds) for a single request."""
+        return float(self.config.get('timeout') or DEFAULT_TIMEOUT)
+
+    @property
+    def batch_timeout(self) -> float:
+        """Timeout (in seconds) for a batched request."""
+        return float(self.config.get('batch_timeout') or DEFAULT_BATCH_TIMEOUT)
+
+    @property
+    def retries(self) -> int:
+        """Number of times a failed request is retried."""
+        return int(self.config.get('retries', DEFAULT_RETRIES))
+
+    @property
+    def deadline(self) -> float:
+        """Overall time (in seconds) allowed for a lookup, including retries."""
+        return float(self.config.get('deadline') or DEFAULT_DEADLINE)
+
+    @property
+    def retry_backoff(self) -> float:
+        """Delay (in seconds) before the first retry, which doubles for each subsequent retry."""
+        return float(self.config.get('retry_backoff', DEFAULT_RETRY_BACKOFF))
+
+    @property
+    def supports_batch(self) -> bool:
+        """Return True if offers can be fetched for multiple OEM numbers in a single request."""
+        return type(self).fetch_many is not BaseAdapter.fetch_many
+
+    def normalize(self, offers: List[dict], normalized: bool = False) -> List[dict]:
+        """Convert offers into the internal schema.
+
+        Arguments:
+            offers: List of offers returned by the connection
+            normalized: Set if the payload declares that the offers are already normalized
+        """
+        if normalized or self.normalized or self.config.get('normalized'):
+            return offers
+
+        return [normalize_offer(offer, self.connection.base_url) for offer in offers]
+
+    async def fetch(self, oem: str) -> List[dict]:
+        """Fetch (normalized) offers for a single OEM number."""
+        raise NotImplementedError(f'{type(self).__name__} does not implement fetch()')
+
+    async def fetch_many(self, oems: List[str]) -> Dict[str, List[dict]]:
+        """Fetch (normalized) offers for multiple OEM numbers, in a single request."""
+        raise NotImplementedError(f'{type(self).__name__} does not implement fetch_many()')
+
+
+class HttpApiAdapter(BaseAdapter):
+    """Adapter for connections which provide an HTTP inventory API.
+
+    Supported config_json options:
+    - inventory_path: Endpoint for single OEM lookups (GET ?oem=...)
+    - inventory_batch_path: Endpoint for batched lookups (POST {"oems": [...]})
+    - timeout, batch_timeout, retries, retry_backoff, deadline: Request options
+    - normalized: Set if the API returns offers in the internal schema
+    """
+
+    @property
+    def supports_batch(self) -> bool:
+        """Batched requests are only supported if a batch endpoint is configured."""
+        return bool(self.config.get('inventory_batch_path'))
 
+    def url(self, path: str) -> str:
+        """Return the full URL for the provided endpoint."""
+        return f'{self.connection.base_url.rstrip("/")}{path}'
 
-def fetch_scraper(connection: WwsConnection, oem: str) -> List[dict]:
+    def headers(self) -> Dict[str, str]:
+        """Return the request headers for the connection."""
+        headers = {}
+        if token := (self.connection.auth_config_json or {}).get('token'):
+            headers['Authorization'] = f'Bearer {token}'
+        return headers
+
+    async def request(self, method: str, url: str, timeout: float, **kwargs) -> httpx.Response:
+        """Perform a request using the shared client for the host, retrying transient failures."""
+        client = adapter_loop.get_client(url)
+        attempt = 0
+
+        while True:
+            try:
+                response = await client.request(method, url, headers=self.headers(), timeout=timeout, **kwargs)
+
+                if response.status_code not in RETRY_STATUS_CODES or attempt >= self.retries:
+                    response.raise_for_status()
+                    return response
+            except httpx.TransportError:
+                if attempt >= self.retries:
+                    raise
+
+            await asyncio.sleep(self.retry_backoff * 2**attempt)
+            attempt += 1
+
+    async def fetch(self, oem: str) -> List[dict]:
+        """Call the inventory endpoint."""
+        url = self.url(self.config.get('inventory_path') or '/inventory')
+        response = await self.request('GET', url, timeout=self.timeout, params={'oem': oem})
+        data = response.json()
+
+        if isinstance(data, list):
+            return self.normalize(data)
+
+        return self.normalize(data.get('offers', []), data.get('normalized', False))
+
+    async def fetch_many(self, oems: List[str]) -> Dict[str, List[dict]]:
+        """Call the batch inventory endpoint.
+
+        The endpoint accepts {"oems": [...]}, and returns offers keyed by OEM number
+        (either directly, or under "results").
+        """
+        url = self.url(self.config['inventory_batch_path'])
+        response = await self.request('POST', url, timeout=self.batch_timeout, json={'oems': oems})
+        data = response.json()
+
+        if not isinstance(data, dict):
+            data = {}
+
+        results = data.get('results', data)
+        normalized = data.get('normalized', False) is True
+
+        return {oem: self.normalize(results.get(oem) or [], normalized) for oem in oems}
+
+
+class ScraperAdapter(BaseAdapter):
     """Stub scraper adapter."""
-    return []
+
+    async def fetch(self, oem: str) -> List[dict]:
+        """Scraping is not yet supported."""
+        return []
 
 
-def fetch_demo(connection: WwsConnection, oem: str) -> List[dict]:
+class DemoAdapter(BaseAdapter):
     """Return mock offers for demo connections."""
-    now = timezone.now()
-    base_price = connection.config_json.get('base_price', 100)
-    return [
-        {
-            'supplier_name': connection.config_json.get('supplier_name', 'Demo WWS'),
-            'price': base_price,
-            'currency': 'EUR',
-            'availability': 'in_stock',
-            'delivery_days': 2,
-            'sku': f'{oem}-DEMO',
-            'meta': {'generated_at': now.isoformat()},
-        }
-    ]
+
+    normalized = True
+
+    async def fetch(self, oem: str) -> List[dict]:
+        """Return a single mock offer."""
+        now = timezone.now()
+        base_price = self.config.get('base_price', 100)
+        return [
+            {
+                'supplier_name': self.config.get('supplier_name', 'Demo WWS'),
+                'price': base_price,
+                'currency': 'EUR',
+                'availability': 'in_stock',
+                'delivery_days': 2,
+                'sku': f'{oem}-DEMO',
+                'meta': {'generated_at': now.isoformat()},
+            }
+        ]
+
+    async def fetch_many(self, oems: List[str]) -> Dict[str, List[dict]]:
+        """Return mock offers for multiple OEM numbers."""
+        return {oem: await self.fetch(oem) for oem in oems}
 
 
 ADAPTERS = {
-    WwsConnection.ConnectionType.HTTP_API: fetch_http_api,
-    WwsConnection.ConnectionType.SCRAPER: fetch_scraper,
-    WwsConnection.ConnectionType.DEMO: fetch_demo,
+    WwsConnection.ConnectionType.HTTP_API: HttpApiAdapter,
+    WwsConnection.ConnectionType.SCRAPER: ScraperAdapter,
+    WwsConnection.ConnectionType.DEMO: DemoAdapter,
 }
 
 
-def fetch_offers_for_connection(connection: WwsConnection, oem: str) -> Dict[str, Any]:
-    """Fetch offers handling errors."""
-    adapter = ADAPTERS.get(connection.type)
+def get_adapter(connection: WwsConnection) -> Optional[BaseAdapter]:
+    """Return the adapter for the provided connection (if the connection type is supported)."""
+    adapter_class = ADAPTERS.get(connection.type)
+    return adapter_class(connection) if adapter_class else None
+
+
+async def fetch_many_async(connection: WwsConnection, oems: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch offers for multiple OEM numbers from a single connection, handling errors.
+
+    A single batched request is made if the adapter supports it,
+    otherwise the OEM numbers are requested concurrently.
+    Lookups which are not complete within the deadline of the adapter are cancelled.
+
+    Returns:
+        A dict of {oem: {'offers': [...], 'error': ...}}
+    """
+    if not oems:
+        return {}
+
+    adapter = get_adapter(connection)
+
     if adapter is None:
-        return {'offers': [], 'error': f'Unsupported type {connection.type}'}
+        return {oem: {'offers': [], 'error': f'Unsupported type {connection.type}'} for oem in oems}
 
     try:
-        offers = adapter(connection, oem)
-        return {'offers': offers, 'error': None}
-    except Exception as exc:  # pragma: no cover - network errors
-        logger.warning('Adapter failed for connection %s: %s', connection.id, exc)
-        return {'offers': [], 'error': str(exc)}
+        return await asyncio.wait_for(fetch_many_adapter(adapter, oems), timeout=adapter.deadline)
+    except asyncio.TimeoutError:
+        logger.warning('Adapter timed out for connection %s', connection.id)
+        return {oem: {'offers': [], 'error': 'Timed out'} for oem in oems}
+
+
+async def fetch_many_adapter(adapter: BaseAdapter, oems: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch offers for multiple OEM numbers using the provided adapter (see fetch_many_async)."""
+    connection = adapter.connection
+
+    if adapter.supports_batch and len(oems) > 1:
+        try:
+            offers = await adapter.fetch_many(oems)
+            return {oem: {'offers': offers.get(oem) or [], 'error': None} for oem in oems}
+        except Exception as exc:  # pragma: no cover - network errors
+            logger.warning('Batch adapter failed for connection %s: %s', connection.id, exc)
+            return {oem: {'offers': [], 'error': str(exc)} for oem in oems}
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def fetch_one(oem: str) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                return {'offers': await adapter.fetch(oem), 'error': None}
+            except Exception as exc:  # pragma: no cover - network errors
+                logger.warning('Adapter failed for connection %s: %s', connection.id, exc)
+                return {'offers': [], 'error': str(exc)}
+
+    results = await asyncio.gather(*(fetch_one(oem) for oem in oems))
+    return dict(zip(oems, results))
+
+
+def run_timeout(*connections: WwsConnection) -> float:
+    """Return the maximum time to wait for lookups against the provided connections."""
+    deadlines = [adapter.deadline for adapter in map(get_adapter, connections) if adapter]
+
+    return max(deadlines, default=0) + DEADLINE_MARGIN
+
+
+def fetch_offers_for_connection(connection: WwsConnection, oem: str) -> Dict[str, Any]:
+    """Fetch offers handling errors."""
+    return adapter_loop.run(fetch_many_async(connection, [oem]), timeout=run_timeout(connection))[oem]
+
+
+def fetch_many_for_connection(connection: WwsConnection, oems: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch offers for multiple OEM numbers from a single connection (see fetch_many_async)."""
+    return adapter_loop.run(fetch_many_async(connection, oems), timeout=run_timeout(connection))
+
+
+def fetch_many_for_connections(
+    oems: Dict[WwsConnection, List[str]],
+) -> Dict[Tuple[WwsConnection, str], Dict[str, Any]]:
+    """Fetch offers from multiple connections concurrently.
+
+    Arguments:
+        oems: A dict of {connection: [oem, ...]}
+
+    Returns:
+        A dict of {(connection, oem): {'offers': [...], 'error': ...}}
+    """
+    oems = {connection: items for connection, items in oems.items() if items}
+
+    if not oems:
+        return {}
+
+    async def fetch_all():
+        return await asyncio.gather(*(fetch_many_async(connection, items) for connection, items in oems.items()))
+
+    results = adapter_loop.run(fetch_all(), timeout=run_timeout(*oems))
+
+    return {
+        (connection, oem): result
+        for connection, connection_results in zip(oems, results)
+        for oem, result in connection_results.items()
+    }
@@ -1,8 +1,10 @@
 """API definitions for WWS."""
 
+import json
 from decimal import Decimal
-from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models, transaction
+from django.http import StreamingHttpResponse
 from django.urls import include, path
 from django.utils import timezone
 from rest_framework import filters, mixins, status, viewsets
@@ -15,11 +17,16 @@ from billing.models import Invoice, InvoiceLine
 from billing.serializers import InvoiceSerializer
 from outbox.utils import create_event
 from channels.models import Contact
+from InvenTree.helpers import str2bool
 from tenancy.permissions import IsTenantOrServiceToken
-from .adapters import fetch_offers_for_connection
-from .models import DealerSupplierSetting, Offer, Order, Supplier, WwsConnection, MerchantSettings
+from .models import Offer, Order, Supplier, WwsConnection, MerchantSettings, normalize_oem
+from .dealers import get_dealer_settings, update_dealer_settings
+from .offers import get_offers, iter_offers
+from .pricing import merchant_settings_defaults
 from .serializers import (
-    DealerSupplierSettingSerializer,
+    BotInventoryBatchSerializer,
+    DealerSupplierSettingUpdateSerializer,
+    OfferBulkCreateSerializer,
     OfferCreateSerializer,
     OfferSerializer,
     OrderCreateSerializer,
@@ -142,6 +149,26 @@ class OrderViewSet(TenantScopedViewSet):
         offer = serializer.save()
         return Response(OfferSerializer(offer).data, status=status.HTTP_201_CREATED)
 
+    @action(detail=True, methods=['post'], url_path='offers/bulk')
+    def bulk_offers(self, request, pk=None):
+        """Create or update multiple offers for an order (bot).
+
+        Accepts a list of offers (or {"offers": [...]}), with suppliers referenced by name.
+        Offers are keyed by (supplier, sku): existing offers are updated, and the stored offers are returned.
+        """
+        order = self.get_object()
+        data = request.data.get('offers') if isinstance(request.data, dict) else request.data
+
+        serializer = OfferBulkCreateSerializer(
+            data=data, many=True, context={'tenant': request.tenant, 'order': order}
+        )
+        serializer.is_valid(raise_exception=True)
+
+        with transaction.atomic():
+            offers = serializer.save()
+
+        return Response(OfferSerializer(offers, many=True).data, status=status.HTTP_201_CREATED)
+
     @action(detail=True, methods=['post'], url_path='offers/publish')
     def publish_offers(self, request, pk=None):
         """Publish offers for an order (dashboard)."""
@@ -245,28 +272,7 @@ class DealerSuppliersView(APIView):
         if tenant is None or str(tenant.id) != str(dealer_id):
             return Response({'detail': 'Forbidden'}, status=status.HTTP_403_FORBIDDEN)
 
-        settings_qs = (
-            DealerSupplierSetting.objects.select_related('supplier')
-            .filter(tenant=tenant)
-            .order_by('priority')
-        )
-
-        # Seed defaults if none exist
-        if not settings_qs.exists():
-            for idx, supplier in enumerate(Supplier.objects.filter(tenant=tenant)[:5]):
-                DealerSupplierSetting.objects.create(
-                    tenant=tenant,
-                    supplier=supplier,
-                    enabled=True,
-                    is_default=idx == 0,
-                    priority=(idx + 1) * 10,
-                )
-            settings_qs = DealerSupplierSetting.objects.select_related('supplier').filter(
-                tenant=tenant
-            )
-
-        serializer = DealerSupplierSettingSerializer(settings_qs, many=True)
-        return Response(serializer.data)
+        return Response(get_dealer_settings(tenant))
 
     def put(self, request, dealer_id):
         """Update supplier settings."""
@@ -276,25 +282,10 @@ class DealerSuppliersView(APIView):
 
         serializer = DealerSupplierSettingUpdateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        items = serializer.validated_data.get('items', [])
 
-        with transaction.atomic():
-            for item in items:
-                supplier_id = item.get('supplier_id') or item.get('supplier')
-                if supplier_id is None:
-                    continue
-                setting, _ = DealerSupplierSetting.objects.get_or_create(
-                    tenant=tenant, supplier_id=supplier_id, defaults={'priority': 10}
-                )
-                setting.enabled = bool(item.get('enabled', True))
-                setting.priority = int(item.get('priority', setting.priority or 10))
-                setting.is_default = bool(item.get('is_default', False))
-                setting.save()
+        update_dealer_settings(tenant, serializer.validated_data.get('items', []))
 
-        settings_qs = DealerSupplierSetting.objects.select_related('supplier').filter(
-            tenant=tenant
-        )
-        return Response(DealerSupplierSettingSerializer(settings_qs, many=True).data)
+        return Response(get_dealer_settings(tenant))
 
 
 class BotInventoryByOem(APIView):
@@ -308,35 +299,86 @@ class BotInventoryByOem(APIView):
         if tenant is None:
             return Response({'detail': 'Tenant required'}, status=status.HTTP_403_FORBIDDEN)
 
-        cache_key = f'bot_inv:{tenant.id}:{oem}'
-        cached = cache.get(cache_key)
-        if cached:
-            return Response(cached)
+        normalized = normalize_oem(oem)
+        if not normalized:
+            return Response({'detail': 'Invalid OEM number'}, status=status.HTTP_400_BAD_REQUEST)
 
-        offers = []
-        errors = []
-
-        connections = WwsConnection.objects.filter(tenant=tenant, is_active=True)
-        for connection in connections:
-            result = fetch_offers_for_connection(connection, oem)
-            offers.extend(result.get('offers') or [])
-            if result.get('error'):
-                errors.append({
-                    'connection_id': connection.id,
-                    'error': result['error'],
-                })
+        result = get_offers(tenant, normalized)
 
         payload = {
             'oem': oem,
             'oemNumber': oem,
-            'offers': offers,
+            'oemNormalized': normalized,
+            'offers': result['offers'],
             'generated_at': timezone.now().isoformat(),
-            'errors': errors,
+            'errors': result['errors'],
         }
-        cache.set(cache_key, payload, timeout=60)
         return Response(payload)
 
 
+class BotInventoryByOemBatch(APIView):
+    """Bot-facing endpoint to fetch offers for multiple OEM numbers.
+
+    OEM numbers are normalized and de-duplicated, and results are returned per OEM number.
+    Pass "stream": true (in the body or query) to receive each result as a separate
+    JSON line (application/x-ndjson), as soon as it is available.
+    """
+
+    permission_classes = [IsTenantOrServiceToken]
+
+    def post(self, request):
+        """Return normalized offers for each requested OEM number."""
+        tenant = getattr(request, 'tenant', None)
+        if tenant is None:
+            return Response({'detail': 'Tenant required'}, status=status.HTTP_403_FORBIDDEN)
+
+        serializer = BotInventoryBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = self.iter_results(tenant, serializer.validated_data['oems'])
+
+        stream = serializer.validated_data['stream'] or str2bool(
+            request.query_params.get('stream', False)
+        )
+
+        if stream:
+            return StreamingHttpResponse(
+                (json.dumps(result, cls=DjangoJSONEncoder) + '\n' for result in results),
+                content_type='application/x-ndjson',
+            )
+
+        return Response({
+            'results': list(results),
+            'generated_at': timezone.now().isoformat(),
+        })
+
+    def iter_results(self, tenant, oems):
+        """Yield the result for each requested OEM number."""
+        requested = {}
+
+        for oem in oems:
+            normalized = normalize_oem(oem)
+            if normalized:
+                requested.setdefault(normalized, oem)
+            else:
+                yield {
+                    'oem': oem,
+                    'oemNumber': oem,
+                    'oemNormalized': '',
+                    'offers': [],
+                    'errors': [{'connection_id': None, 'error': 'Invalid OEM number'}],
+                }
+
+        for normalized, result in iter_offers(tenant, list(requested)):
+            yield {
+                'oem': requested[normalized],
+                'oemNumber': requested[normalized],
+                'oemNormalized': normalized,
+                'offers': result['offers'],
+                'errors': result['errors'],
+            }
+
+
 class BotHealth(APIView):
     """Simple health endpoint for bot."""
 
@@ -366,35 +408,6 @@ class BotConfig(APIView):
         })
 
 
-DEFAULT_PRICE_PROFILES = [
-    {
-        'id': 'standard',
-        'name': 'Standard (Endkunde)',
-        'description': 'Standard-Verkaufspreis an Endkunden.',
-        'margin': 0.40,
-        'isDefault': True,
-    },
-    {
-        'id': 'workshop_basic',
-        'name': 'Werkstatt Basic',
-        'description': 'Rabattierter Preis für Mechaniker und kleine Werkstätten.',
-        'margin': 0.28,
-    },
-    {
-        'id': 'workshop_pro',
-        'name': 'Werkstatt Pro',
-        'description': 'Partnerkondition für größere Werkstätten und Betriebe.',
-        'margin': 0.22,
-    },
-    {
-        'id': 'partner',
-        'name': 'Händler / Partner',
-        'description': 'Niedrigere Marge für Händlerkollegen und B2B-Partner.',
-        'margin': 0.10,
-    },
-]
-
-
 class MerchantSettingsView(APIView):
     """Dashboard merchant settings endpoints. Get/Set merchant settings."""
 
@@ -406,12 +419,7 @@ class MerchantSettingsView(APIView):
              return Response({'detail': 'Tenant required'}, status=status.HTTP_403_FORBIDDEN)
         
         settings_obj, _ = MerchantSettings.objects.get_or_create(
-            tenant=tenant,
-            defaults={
-                'selected_shops': [],
-                'margin_percent': Decimal('0.00'),
-                'price_profiles': [],
-            },
+            tenant=tenant, defaults=merchant_settings_defaults()
         )
         return Response({
             'merchantId': str(tenant.id),
@@ -425,7 +433,9 @@ class MerchantSettingsView(APIView):
         if tenant is None:
             return Response({'detail': 'Tenant required'}, status=status.HTTP_403_FORBIDDEN)
             
-        settings_obj, _ = MerchantSettings.objects.get_or_create(tenant=tenant)
+        settings_obj, _ = MerchantSettings.objects.get_or_create(
+            tenant=tenant, defaults=merchant_settings_defaults()
+        )
         if 'selectedShops' in request.data:
             settings_obj.selected_shops = request.data.get('selectedShops') or []
         if 'marginPercent' in request.data:
@@ -453,11 +463,10 @@ class DashboardSummaryView(APIView):
         invoices_issued = Invoice.objects.filter(tenant=tenant, status='ISSUED').count()
         invoices_draft = Invoice.objects.filter(tenant=tenant, status='DRAFT').count()
         
-        # Margin stats
+        # Margin stats (covered by the tenant / status / margin index)
         margin_qs = Offer.objects.filter(
-            order__tenant=tenant,
-            status='published'
-        ).aggregate(avg_margin=models.Avg('meta_json__margin_percent'))
+            tenant=tenant, status=Offer.OfferStatus.PUBLISHED
+        ).aggregate(avg_margin=models.Avg('margin_percent'))
         avg_margin = margin_qs['avg_margin'] or 0.0
 
         # Estimate margin revenue from paid invoices (simplified)
@@ -580,6 +589,7 @@ api_urls = [
     path('', include(router.urls)),
     path('dealers/<int:dealer_id>/suppliers', DealerSuppliersView.as_view(), name='dealer-suppliers'),
     path('requests', RequestIntakeView.as_view(), name='request-intake'),
+    path('bot/inventory/by-oem', BotInventoryByOemBatch.as_view(), name='bot-inventory-by-oem-batch'),
     path('bot/inventory/by-oem/<str:oem>', BotInventoryByOem.as_view(), name='bot-inventory-by-oem'),
     path('bot/health', BotHealth.as_view(), name='bot-health'),
     path('bot/config', BotConfig.as_view(), name='bot-config'),
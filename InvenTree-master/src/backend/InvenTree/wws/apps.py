@@ -7,3 +7,7 @@ class WwsConfig(AppConfig):
     """Config for wws."""
 
     name = 'wws'
+
+    def ready(self):
+        """Connect signal handlers."""
+        from . import dealers, pricing  # noqa: F401
@@ -0,0 +1,177 @@
+"""Dealer supplier settings (which suppliers a tenant uses, and in which order).
+
+Each supplier receives default settings when it is created (or when its tenant is created),
+so the settings never need to be created when they are read. The first supplier of a tenant
+is the default supplier, and further suppliers are appended with increasing priority.
+The serialized settings of each tenant are cached, and invalidated whenever a setting or
+supplier changes.
+"""
+
+from typing import Iterable, List
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from tenancy.models import Tenant
+
+from .models import DealerSupplierSetting, Supplier, bulk_upsert
+
+# Cache key which stores the serialized settings of a tenant
+DEALER_SETTINGS_CACHE_KEY = 'wws_dealer_suppliers:{}'
+DEALER_SETTINGS_CACHE_TIMEOUT = 3600
+
+# Priority of the first setting of a tenant (further settings are seeded in steps of this size)
+DEFAULT_PRIORITY = 10
+
+# Fields which are updated when settings are submitted
+UPDATE_FIELDS = ['enabled', 'priority', 'is_default']
+
+
+def invalidate_dealer_settings(tenant_id):
+    """Remove the cached settings for a tenant."""
+    key = DEALER_SETTINGS_CACHE_KEY.format(tenant_id)
+    cache.delete(key)
+
+    # Invalidate again once committed, in case the old values were re-cached in the meantime
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def seed_dealer_settings(tenant, suppliers: Iterable[Supplier]):
+    """Create default settings for the provided suppliers.
+
+    - Settings are appended after the existing settings of the tenant, with increasing priority
+    - If the tenant has no settings yet, the first supplier becomes the default supplier
+    - Suppliers which already have settings are not affected
+    """
+    suppliers = list(suppliers)
+
+    if not suppliers:
+        return
+
+    existing = DealerSupplierSetting._base_manager.filter(tenant=tenant).aggregate(
+        count=Count('pk'), priority=Max('priority')
+    )
+
+    first_seed = existing['count'] == 0
+    priority = existing['priority'] or 0
+
+    DealerSupplierSetting.objects.bulk_create(
+        [
+            DealerSupplierSetting(
+                tenant=tenant,
+                supplier=supplier,
+                enabled=True,
+                priority=priority + (idx + 1) * DEFAULT_PRIORITY,
+                is_default=first_seed and idx == 0,
+            )
+            for idx, supplier in enumerate(suppliers)
+        ],
+        ignore_conflicts=True,
+    )
+
+    invalidate_dealer_settings(tenant.pk)
+
+
+def get_dealer_settings(tenant) -> List[dict]:
+    """Return the (cached) serialized settings for a tenant, ordered by priority."""
+    from .serializers import DealerSupplierSettingSerializer
+
+    key = DEALER_SETTINGS_CACHE_KEY.format(tenant.pk)
+    data = cache.get(key)
+
+    if data is None:
+        settings = (
+            DealerSupplierSetting._base_manager
+            .select_related('supplier')
+            .filter(tenant=tenant)
+            .order_by('priority', 'pk')
+        )
+
+        data = list(DealerSupplierSettingSerializer(settings, many=True).data)
+        cache.set(key, data, DEALER_SETTINGS_CACHE_TIMEOUT)
+
+    return data
+
+
+def update_dealer_settings(tenant, items: List[dict]):
+    """Create or update the settings for the provided suppliers, in a single upsert.
+
+    Arguments:
+        tenant: The tenant which owns the settings
+        items: List of {'supplier_id', 'enabled', 'priority', 'is_default'} dicts
+
+    Suppliers which do not belong to the tenant are ignored. If an item does not provide
+    a priority, the existing priority of the supplier is kept.
+    """
+    items = {item['supplier_id']: item for item in items}
+
+    # Fetch the existing priority of each supplier, which also restricts updates to the tenant
+    suppliers = dict(
+        Supplier._base_manager.filter(tenant=tenant, pk__in=items).values_list(
+            'pk', 'dealer_settings__priority'
+        )
+    )
+
+    settings = []
+
+    for supplier_id, item in items.items():
+        if supplier_id not in suppliers:
+            continue
+
+        priority = item.get('priority')
+
+        if priority is None:
+            priority = suppliers[supplier_id] or DEFAULT_PRIORITY
+
+        settings.append(
+            DealerSupplierSetting(
+                tenant=tenant,
+                supplier_id=supplier_id,
+                enabled=item['enabled'],
+                priority=priority,
+                is_default=item['is_default'],
+            )
+        )
+
+    if settings:
+        bulk_upsert(
+            DealerSupplierSetting,
+            settings,
+            unique_fields=['tenant', 'supplier'],
+            update_fields=UPDATE_FIELDS,
+        )
+
+    invalidate_dealer_settings(tenant.pk)
+
+
+@receiver(post_save, sender=Supplier, dispatch_uid='wws_dealer_supplier_save')
+def supplier_saved(sender, instance, created, raw=False, **kwargs):
+    """Seed default settings for a new supplier, and refresh the cached settings."""
+    if created and not raw and instance.tenant_id:
+        seed_dealer_settings(instance.tenant, [instance])
+    else:
+        invalidate_dealer_settings(instance.tenant_id)
+
+
+@receiver(post_save, sender=Tenant, dispatch_uid='wws_dealer_tenant_save')
+def tenant_saved(sender, instance, created, raw=False, **kwargs):
+    """Seed default settings for the existing suppliers of a new tenant."""
+    if created and not raw:
+        seed_dealer_settings(
+            instance, Supplier._base_manager.filter(tenant=instance).order_by('pk')
+        )
+
+
+@receiver(post_delete, sender=Supplier, dispatch_uid='wws_dealer_supplier_delete')
+@receiver(
+    post_save, sender=DealerSupplierSetting, dispatch_uid='wws_dealer_setting_save'
+)
+@receiver(
+    post_delete, sender=DealerSupplierSetting, dispatch_uid='wws_dealer_setting_delete'
+)
+def dealer_settings_changed(sender, instance, **kwargs):
+    """Invalidate the cached settings of a tenant."""
+    invalidate_dealer_settings(instance.tenant_id)
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.9 on 2026-10-19 11:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def normalize_order_oem(apps, schema_editor):
+    """Populate the normalized OEM number for existing orders."""
+    Order = apps.get_model('wws', 'Order')
+
+    orders = []
+
+    for order in Order.objects.exclude(oem='').only('pk', 'oem').iterator():
+        order.oem_normalized = ''.join(ch for ch in order.oem.upper() if ch.isalnum())
+        orders.append(order)
+
+    Order.objects.bulk_update(orders, ['oem_normalized'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('channels', '0002_alter_contact_tenant_alter_conversation_tenant_and_more'),
+        ('tenancy', '0004_tenant_max_devices_tenant_max_users_tenantdevice'),
+        ('wws', '0005_alter_dealersuppliersetting_tenant_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OfferCache',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('oem', models.CharField(help_text='Normalized OEM number', max_length=64)),
+                ('offers', models.JSONField(blank=True, default=list)),
+                ('error', models.TextField(blank=True, default='')),
+                ('fetched_at', models.DateTimeField(help_text='Time the offers were last fetched')),
+            ],
+            options={
+                'verbose_name': 'Offer Cache',
+                'verbose_name_plural': 'Offer Cache',
+            },
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='oem_normalized',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='wwsconnection',
+            name='cache_ttl',
+            field=models.PositiveIntegerField(default=3600, help_text='Time (seconds) for which offers fetched from this connection are cached'),
+        ),
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['tenant', 'sku'], name='wws_offer_tenant__7f385c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['tenant', 'oem_normalized'], name='wws_order_tenant__c8831d_idx'),
+        ),
+        migrations.AddField(
+            model_name='offercache',
+            name='connection',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='offer_cache', to='wws.wwsconnection'),
+        ),
+        migrations.AddField(
+            model_name='offercache',
+            name='tenant',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='tenancy.tenant'),
+        ),
+        migrations.AddIndex(
+            model_name='offercache',
+            index=models.Index(fields=['tenant', 'oem'], name='wws_offerca_tenant__91a35e_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='offercache',
+            unique_together={('connection', 'oem')},
+        ),
+        migrations.RunPython(normalize_order_oem, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:02
+
+from django.db import migrations
+from django.db.models import Case, Count, IntegerField, Value, When
+
+
+def remove_duplicate_offers(apps, schema_editor):
+    """Remove duplicate offers for the same (order, supplier, sku).
+
+    Published offers are kept in preference to drafts, and then the most recently updated offer.
+    """
+    Offer = apps.get_model('wws', 'Offer')
+
+    duplicates = (
+        Offer.objects.filter(supplier__isnull=False)
+        .values('order', 'supplier', 'sku')
+        .annotate(count=Count('pk'))
+        .filter(count__gt=1)
+    )
+
+    priority = Case(When(status='published', then=Value(0)), default=Value(1), output_field=IntegerField())
+
+    for duplicate in duplicates.iterator():
+        offers = Offer.objects.filter(
+            order=duplicate['order'], supplier=duplicate['supplier'], sku=duplicate['sku']
+        )
+
+        keep = offers.order_by(priority, '-updated_at', '-pk').values_list('pk', flat=True).first()
+
+        offers.exclude(pk=keep).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wws', '0006_offercache'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_offers, reverse_code=migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='offer',
+            unique_together={('order', 'supplier', 'sku')},
+        ),
+    ]
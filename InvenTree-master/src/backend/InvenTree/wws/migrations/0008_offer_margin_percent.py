@@ -0,0 +1,51 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:09
+
+from decimal import Decimal, InvalidOperation
+
+from django.db import migrations, models
+
+
+def copy_margin_percent(apps, schema_editor):
+    """Copy the margin of existing offers from meta_json into the margin_percent column."""
+    Offer = apps.get_model('wws', 'Offer')
+
+    offers = []
+    queryset = Offer.objects.filter(meta_json__has_key='margin_percent')
+
+    for offer in queryset.only('pk', 'meta_json').iterator():
+        value = offer.meta_json.get('margin_percent')
+
+        if value is None or isinstance(value, bool):
+            continue
+
+        try:
+            margin = Decimal(str(value)).quantize(Decimal('0.01'))
+        except (InvalidOperation, ValueError):
+            continue
+
+        if margin.is_finite() and abs(margin) < 100000:
+            offer.margin_percent = margin
+            offers.append(offer)
+
+    Offer.objects.bulk_update(offers, ['margin_percent'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenancy', '0004_tenant_max_devices_tenant_max_users_tenantdevice'),
+        ('wws', '0007_offer_unique_supplier_sku'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='margin_percent',
+            field=models.DecimalField(blank=True, decimal_places=2, help_text='Margin (percent) applied to the supplier price', max_digits=7, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='offer',
+            index=models.Index(fields=['tenant', 'status', 'margin_percent'], name='wws_offer_tenant__04986f_idx'),
+        ),
+        migrations.RunPython(copy_margin_percent, reverse_code=migrations.RunPython.noop),
+    ]
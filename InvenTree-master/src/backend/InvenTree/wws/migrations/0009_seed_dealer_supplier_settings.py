@@ -0,0 +1,58 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:18
+
+from django.db import migrations
+
+
+def seed_dealer_settings(apps, schema_editor):
+    """Create default dealer settings for tenants which do not have any.
+
+    Settings were previously created when the dealer suppliers were first viewed,
+    and are now created along with each supplier. Tenants which have already
+    configured their settings are not affected.
+    """
+    Supplier = apps.get_model('wws', 'Supplier')
+    DealerSupplierSetting = apps.get_model('wws', 'DealerSupplierSetting')
+
+    configured = DealerSupplierSetting.objects.values('tenant_id')
+
+    suppliers = (
+        Supplier.objects
+        .filter(tenant__isnull=False)
+        .exclude(tenant_id__in=configured)
+        .order_by('tenant_id', 'pk')
+        .values_list('pk', 'tenant_id')
+    )
+
+    settings = []
+    previous_tenant = None
+    idx = 0
+
+    for supplier_id, tenant_id in suppliers.iterator():
+        # The first supplier of each tenant is the default, with increasing priority thereafter
+        idx = idx + 1 if tenant_id == previous_tenant else 0
+        previous_tenant = tenant_id
+
+        settings.append(
+            DealerSupplierSetting(
+                tenant_id=tenant_id,
+                supplier_id=supplier_id,
+                enabled=True,
+                priority=(idx + 1) * 10,
+                is_default=idx == 0,
+            )
+        )
+
+    DealerSupplierSetting.objects.bulk_create(
+        settings, batch_size=500, ignore_conflicts=True
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wws', '0008_offer_margin_percent'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_dealer_settings, reverse_code=migrations.RunPython.noop),
+    ]
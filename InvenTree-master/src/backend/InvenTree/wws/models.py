@@ -1,13 +1,72 @@
 """Models for WWS domain (orders, offers, suppliers, connections)."""
 
+from datetime import timedelta
 from decimal import Decimal
 
-from django.db import models
+from django.db import connection, models, transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from tenancy.models import TenantScopedModel
 from channels.models import Contact
 
+# Maximum time (seconds) for which a failed supplier lookup is cached
+OFFER_CACHE_ERROR_TTL = 60
+
+
+def normalize_oem(value) -> str:
+    """Normalize an OEM number for lookups.
+
+    Formatting characters (whitespace, dashes, dots, slashes) are removed and letters
+    are upper-cased, so "1K0 615 301 AA" and "1k0-615-301-aa" both become "1K0615301AA".
+    """
+    return ''.join(ch for ch in str(value or '').upper() if ch.isalnum())
+
+
+def bulk_upsert(model, objs, unique_fields: list, update_fields: list) -> list:
+    """Insert the provided objects, updating existing rows which match the unique fields.
+
+    A single upsert query is used where the database supports a conflict target.
+    MySQL / MariaDB do not, so each object is upserted separately there.
+
+    Arguments:
+        model: The model class of the objects
+        objs: The (unsaved) objects to store
+        unique_fields: Fields which identify an existing row
+        update_fields: Fields which are updated when a row already exists
+
+    Returns:
+        The provided objects
+    """
+    objs = list(objs)
+
+    if connection.features.supports_update_conflicts_with_target:
+        return model._base_manager.bulk_create(
+            objs,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=update_fields,
+        )
+
+    def values(obj, names):
+        attnames = [model._meta.get_field(name).attname for name in names]
+        return {attname: getattr(obj, attname) for attname in attnames}
+
+    fields = [
+        field.name for field in model._meta.concrete_fields if not field.primary_key
+    ]
+
+    with transaction.atomic():
+        for obj in objs:
+            instance, _ = model._base_manager.update_or_create(
+                defaults=values(obj, update_fields),
+                create_defaults=values(obj, fields),
+                **values(obj, unique_fields),
+            )
+            obj.pk = instance.pk
+
+    return objs
+
 
 class MerchantSettings(TenantScopedModel):
     """Merchant (dashboard) preferences."""
@@ -48,6 +107,40 @@ class Supplier(TenantScopedModel):
         """Readable name."""
         return self.name
 
+    @classmethod
+    def resolve(cls, tenant, names) -> dict:
+        """Return the suppliers with the provided names, creating any which do not exist.
+
+        Existing suppliers are fetched in a single query, and missing suppliers are
+        created with a single bulk insert (which ignores suppliers created concurrently),
+        along with their default dealer settings.
+
+        Returns:
+            A dict of {name: supplier}
+        """
+        names = {name for name in names if name}
+
+        suppliers = {
+            supplier.name: supplier
+            for supplier in cls._base_manager.filter(tenant=tenant, name__in=names)
+        }
+
+        if missing := names - suppliers.keys():
+            cls.objects.bulk_create(
+                [cls(tenant=tenant, name=name) for name in missing],
+                ignore_conflicts=True,
+            )
+
+            created = cls._base_manager.filter(tenant=tenant, name__in=missing)
+            suppliers.update({supplier.name: supplier for supplier in created})
+
+            # Bulk inserts do not send signals, so seed the dealer settings here
+            from .dealers import seed_dealer_settings
+
+            seed_dealer_settings(tenant, created)
+
+        return suppliers
+
 
 class WwsConnection(TenantScopedModel):
     """Connection configuration for external WWS sources."""
@@ -65,6 +158,12 @@ class WwsConnection(TenantScopedModel):
     auth_config_json = models.JSONField(default=dict, blank=True)
     config_json = models.JSONField(default=dict, blank=True)
     is_active = models.BooleanField(default=True)
+    cache_ttl = models.PositiveIntegerField(
+        default=3600,
+        help_text=_(
+            'Time (seconds) for which offers fetched from this connection are cached'
+        ),
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -92,6 +191,7 @@ class Order(TenantScopedModel):
         Contact, on_delete=models.SET_NULL, null=True, blank=True, related_name='orders'
     )
     oem = models.CharField(max_length=64, blank=True)
+    oem_normalized = models.CharField(max_length=64, blank=True, editable=False)
     notes = models.TextField(blank=True)
     total_price = models.DecimalField(
         max_digits=12, decimal_places=2, default=Decimal('0.00')
@@ -106,11 +206,20 @@ class Order(TenantScopedModel):
         verbose_name = _('Order')
         verbose_name_plural = _('Orders')
         ordering = ['-created_at']
+        indexes = [models.Index(fields=['tenant', 'oem_normalized'])]
 
     def __str__(self):
         """Readable name."""
         return self.external_ref or f'Order {self.id}'
 
+    def save(self, *args, **kwargs):
+        """Keep the normalized OEM number in sync."""
+        self.oem_normalized = normalize_oem(self.oem)
+        if update_fields := kwargs.get('update_fields'):
+            if 'oem' in update_fields:
+                kwargs['update_fields'] = {*update_fields, 'oem_normalized'}
+        super().save(*args, **kwargs)
+
 
 class Offer(TenantScopedModel):
     """Offer returned by suppliers for an order."""
@@ -138,6 +247,13 @@ class Offer(TenantScopedModel):
     status = models.CharField(
         max_length=20, choices=OfferStatus.choices, default=OfferStatus.DRAFT
     )
+    margin_percent = models.DecimalField(
+        max_digits=7,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        help_text=_('Margin (percent) applied to the supplier price'),
+    )
     meta_json = models.JSONField(default=dict, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -148,6 +264,11 @@ class Offer(TenantScopedModel):
         verbose_name = _('Offer')
         verbose_name_plural = _('Offers')
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['tenant', 'sku']),
+            models.Index(fields=['tenant', 'status', 'margin_percent']),
+        ]
+        unique_together = ('order', 'supplier', 'sku')
 
     def __str__(self):
         """Readable name."""
@@ -171,3 +292,46 @@ class DealerSupplierSetting(TenantScopedModel):
         ordering = ['priority']
         verbose_name = _('Dealer Supplier Setting')
         verbose_name_plural = _('Dealer Supplier Settings')
+
+
+class OfferCache(TenantScopedModel):
+    """Offers fetched from a single WWS connection, for a normalized OEM number.
+
+    Entries are served until the TTL of the connection expires,
+    after which they are refreshed in the background (refer to wws.offers).
+    """
+
+    connection = models.ForeignKey(
+        WwsConnection, on_delete=models.CASCADE, related_name='offer_cache'
+    )
+    oem = models.CharField(max_length=64, help_text=_('Normalized OEM number'))
+    offers = models.JSONField(default=list, blank=True)
+    error = models.TextField(blank=True, default='')
+    fetched_at = models.DateTimeField(help_text=_('Time the offers were last fetched'))
+
+    class Meta:
+        """Meta options."""
+
+        verbose_name = _('Offer Cache')
+        verbose_name_plural = _('Offer Cache')
+        unique_together = ('connection', 'oem')
+        indexes = [models.Index(fields=['tenant', 'oem'])]
+
+    def __str__(self):
+        """Readable name."""
+        return f'{self.oem} ({self.connection_id})'
+
+    @property
+    def ttl(self) -> int:
+        """Return the time (seconds) for which this entry is valid.
+
+        Failed lookups are only cached briefly, so that the supplier is retried.
+        """
+        if self.error:
+            return min(self.connection.cache_ttl, OFFER_CACHE_ERROR_TTL)
+        return self.connection.cache_ttl
+
+    def is_expired(self, now=None) -> bool:
+        """Return True if the cached offers should be refreshed."""
+        now = now or timezone.now()
+        return self.fetched_at + timedelta(seconds=self.ttl) <= now
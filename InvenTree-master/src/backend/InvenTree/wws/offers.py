@@ -0,0 +1,190 @@
+"""Cached offer lookups by OEM number.
+
+Offers are fetched from each active WWS connection of a tenant, and stored in the
+OfferCache table against the normalized OEM number:
+
+- Fresh entries are served from the table, without contacting the supplier
+- Expired entries are served, and refreshed in the background
+- Missing entries are fetched from the supplier, and stored
+
+Lookups for multiple OEM numbers are batched: cached entries are loaded in a single query,
+and each connection receives a single request for all missing OEM numbers (where supported),
+with the connections queried concurrently.
+"""
+
+import logging
+from typing import Any, Dict, Iterator, List, Tuple
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from InvenTree.tasks import offload_task
+
+from .adapters import fetch_many_for_connections, fetch_offers_for_connection
+from .models import OfferCache, WwsConnection, bulk_upsert, normalize_oem
+
+logger = logging.getLogger('inventree')
+
+# Cache key which prevents duplicate refresh tasks for a single entry
+OFFER_REFRESH_KEY = 'wws_offer_refresh:{}'
+OFFER_REFRESH_TIMEOUT = 300
+
+
+def store_offers(connection: WwsConnection, oem: str, result: dict) -> OfferCache:
+    """Store the result of a supplier lookup in the offer cache."""
+    entry, _ = OfferCache.objects.update_or_create(
+        connection=connection,
+        oem=oem,
+        defaults={
+            'tenant_id': connection.tenant_id,
+            'offers': result.get('offers') or [],
+            'error': result.get('error') or '',
+            'fetched_at': timezone.now(),
+        },
+    )
+    entry.connection = connection
+    return entry
+
+
+def refresh_offers(connection: WwsConnection, oem: str) -> OfferCache:
+    """Fetch offers from the supplier, and update the offer cache."""
+    return store_offers(connection, oem, fetch_offers_for_connection(connection, oem))
+
+
+def schedule_refresh(entry: OfferCache):
+    """Refresh an expired offer cache entry in the background.
+
+    Concurrent requests for the same entry only schedule a single refresh.
+    """
+    from .tasks import refresh_offer_cache
+
+    key = OFFER_REFRESH_KEY.format(entry.pk)
+
+    if not cache.add(key, True, OFFER_REFRESH_TIMEOUT):
+        return
+
+    if not offload_task(refresh_offer_cache, entry.pk, group='wws'):
+        cache.delete(key)
+
+
+def connection_errors(entries: List[OfferCache]) -> List[dict]:
+    """Return the errors reported by the provided offer cache entries."""
+    return [
+        {'connection_id': entry.connection_id, 'error': entry.error}
+        for entry in entries
+        if entry.error
+    ]
+
+
+def store_many(results: Dict[Tuple[WwsConnection, str], dict]) -> Dict[Tuple[int, str], OfferCache]:
+    """Store the results of multiple supplier lookups in the offer cache, in a single query.
+
+    Arguments:
+        results: A dict of {(connection, oem): result}
+
+    Returns:
+        A dict of {(connection id, oem): entry}
+    """
+    now = timezone.now()
+
+    entries = {
+        (connection.id, oem): OfferCache(
+            tenant_id=connection.tenant_id,
+            connection=connection,
+            oem=oem,
+            offers=result.get('offers') or [],
+            error=result.get('error') or '',
+            fetched_at=now,
+        )
+        for (connection, oem), result in results.items()
+    }
+
+    bulk_upsert(
+        OfferCache,
+        entries.values(),
+        unique_fields=['connection', 'oem'],
+        update_fields=['offers', 'error', 'fetched_at'],
+    )
+
+    return entries
+
+
+def combine(oem: str, entries: List[OfferCache]) -> Dict[str, Any]:
+    """Combine the cached offers from multiple connections, for a single OEM number."""
+    offers = []
+
+    for entry in entries:
+        offers.extend(entry.offers)
+
+    return {'oem': oem, 'offers': offers, 'errors': connection_errors(entries)}
+
+
+def iter_offers(tenant, oems: List[str]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield the offers for multiple OEM numbers, from all active connections of a tenant.
+
+    - All cached entries are loaded in a single query
+    - OEM numbers which are cached for every connection are yielded first
+    - The remaining OEM numbers are fetched from the suppliers, and stored in a single query
+
+    Arguments:
+        tenant: The tenant to fetch offers for
+        oems: List of OEM numbers (which are normalized and de-duplicated)
+
+    Yields:
+        (normalized oem, result) tuples, where each result contains the combined 'offers' and any connection 'errors'
+    """
+    oems = list(dict.fromkeys(filter(None, map(normalize_oem, oems))))
+
+    if not oems:
+        return
+
+    connections = list(WwsConnection.objects.filter(tenant=tenant, is_active=True))
+    connections_by_id = {connection.id: connection for connection in connections}
+
+    now = timezone.now()
+    cached = {}
+
+    for entry in OfferCache.objects.filter(
+        tenant=tenant, oem__in=oems, connection__in=connections
+    ):
+        entry.connection = connections_by_id[entry.connection_id]
+        cached[entry.connection_id, entry.oem] = entry
+
+        if entry.is_expired(now):
+            schedule_refresh(entry)
+
+    missing = {connection: [] for connection in connections}
+    pending = []
+
+    for oem in oems:
+        complete = True
+
+        for connection in connections:
+            if (connection.id, oem) not in cached:
+                missing[connection].append(oem)
+                complete = False
+
+        if complete:
+            yield oem, combine(oem, [cached[connection.id, oem] for connection in connections])
+        else:
+            pending.append(oem)
+
+    if not pending:
+        return
+
+    cached.update(store_many(fetch_many_for_connections(missing)))
+
+    for oem in pending:
+        yield oem, combine(oem, [cached[connection.id, oem] for connection in connections])
+
+
+def get_offers(tenant, oem: str) -> Dict[str, Any]:
+    """Return the offers for an OEM number, from all active connections of a tenant.
+
+    Returns:
+        A dict containing the normalized 'oem', the combined 'offers' and any connection 'errors'
+    """
+    for _oem, result in iter_offers(tenant, [oem]):
+        return result
+
+    return {'oem': normalize_oem(oem), 'offers': [], 'errors': []}
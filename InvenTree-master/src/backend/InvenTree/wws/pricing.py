@@ -0,0 +1,222 @@
+"""Server-side pricing of offers, based on the merchant settings of a tenant.
+
+The margin and price profiles of each tenant are cached, and invalidated when the
+MerchantSettings are saved. Prices for a batch of offers are computed in a single pass,
+using one precomputed multiplier per profile.
+"""
+
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import Dict, Iterable, List, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import MerchantSettings
+
+# Cache key which stores the pricing configuration of a tenant
+PRICING_CACHE_KEY = 'wws_pricing:{}'
+PRICING_CACHE_TIMEOUT = 3600
+
+CENTS = Decimal('0.01')
+
+# Price profiles which are used if a merchant has not configured any
+DEFAULT_PRICE_PROFILES = [
+    {
+        'id': 'standard',
+        'name': 'Standard (Endkunde)',
+        'description': 'Standard-Verkaufspreis an Endkunden.',
+        'margin': 0.40,
+        'isDefault': True,
+    },
+    {
+        'id': 'workshop_basic',
+        'name': 'Werkstatt Basic',
+        'description': 'Rabattierter Preis für Mechaniker und kleine Werkstätten.',
+        'margin': 0.28,
+    },
+    {
+        'id': 'workshop_pro',
+        'name': 'Werkstatt Pro',
+        'description': 'Partnerkondition für größere Werkstätten und Betriebe.',
+        'margin': 0.22,
+    },
+    {
+        'id': 'partner',
+        'name': 'Händler / Partner',
+        'description': 'Niedrigere Marge für Händlerkollegen und B2B-Partner.',
+        'margin': 0.10,
+    },
+]
+
+# Margin (percent) for tenants without merchant settings, matching the default 'standard' profile
+DEFAULT_MARGIN_PERCENT = Decimal('40.00')
+
+
+def merchant_settings_defaults() -> dict:
+    """Return the default values for new MerchantSettings.
+
+    The default margin matches the default price profile, so that offers are priced
+    the same before and after the settings of a tenant are first created.
+    """
+    return {
+        'selected_shops': [],
+        'margin_percent': DEFAULT_MARGIN_PERCENT,
+        'price_profiles': [],
+    }
+
+
+def to_decimal(value, default: Optional[Decimal] = None) -> Optional[Decimal]:
+    """Convert a (JSON) value to a Decimal, returning the default if it is not numeric."""
+    if value is None or isinstance(value, bool):
+        return default
+
+    try:
+        result = Decimal(str(value))
+    except (InvalidOperation, ValueError):
+        return default
+
+    return result if result.is_finite() else default
+
+
+class PricingEngine:
+    """Compute sale prices from supplier prices, for a single tenant.
+
+    Attributes:
+        margin_percent: The default margin (percent) which is applied to new offers
+        profiles: Dict of {profile id: margin (fraction)} for each price profile
+    """
+
+    def __init__(self, margin_percent: Decimal, profiles: Dict[str, Decimal]):
+        """Precompute the price multiplier of each profile."""
+        self.margin_percent = margin_percent
+        self.profiles = profiles
+        self.multipliers = {key: 1 + margin for key, margin in profiles.items()}
+
+    @classmethod
+    def from_settings(cls, settings: Optional[MerchantSettings]) -> 'PricingEngine':
+        """Construct the engine from the merchant settings of a tenant (if they exist)."""
+        profiles = (
+            settings.price_profiles if settings else None
+        ) or DEFAULT_PRICE_PROFILES
+
+        margins = {}
+
+        for profile in profiles:
+            if not isinstance(profile, dict) or not profile.get('id'):
+                continue
+
+            margins[str(profile['id'])] = to_decimal(profile.get('margin'), Decimal(0))
+
+        if settings is not None:
+            margin_percent = to_decimal(settings.margin_percent, Decimal(0))
+        else:
+            margin_percent = DEFAULT_MARGIN_PERCENT
+
+        return cls(margin_percent, margins)
+
+    def to_cache(self) -> dict:
+        """Return a cacheable representation of the engine."""
+        return {
+            'margin_percent': str(self.margin_percent),
+            'profiles': {key: str(margin) for key, margin in self.profiles.items()},
+        }
+
+    @classmethod
+    def from_cache(cls, data: dict) -> 'PricingEngine':
+        """Construct the engine from its cached representation."""
+        return cls(
+            Decimal(data['margin_percent']),
+            {key: Decimal(margin) for key, margin in data['profiles'].items()},
+        )
+
+    def final_price(self, price, margin_percent: Optional[Decimal] = None) -> Decimal:
+        """Return the sale price for a supplier price.
+
+        Arguments:
+            price: The supplier price
+            margin_percent: Margin to apply (defaults to the margin of the tenant)
+        """
+        if margin_percent is None:
+            margin_percent = self.margin_percent
+
+        price = to_decimal(price, Decimal(0))
+
+        return (price * (1 + Decimal(margin_percent) / 100)).quantize(
+            CENTS, rounding=ROUND_HALF_UP
+        )
+
+    def profile_prices(self, prices: Iterable) -> List[Dict[str, Decimal]]:
+        """Return the price of each profile, for a batch of supplier prices.
+
+        Returns:
+            A list (in the same order as prices) of {profile id: price}
+        """
+        multipliers = list(self.multipliers.items())
+
+        return [
+            {
+                key: (price * multiplier).quantize(CENTS, rounding=ROUND_HALF_UP)
+                for key, multiplier in multipliers
+            }
+            for price in (to_decimal(price, Decimal(0)) for price in prices)
+        ]
+
+    def price_offers(self, offers: List):
+        """Annotate a batch of offers with their final and profile prices.
+
+        Sets 'final_price' and 'profile_prices' on each offer.
+        """
+        offers = list(offers)
+
+        for offer, prices in zip(
+            offers, self.profile_prices(offer.price for offer in offers)
+        ):
+            offer.final_price = self.final_price(offer.price, offer.margin_percent)
+            offer.profile_prices = prices
+
+        return offers
+
+
+def get_pricing(tenant) -> PricingEngine:
+    """Return the (cached) pricing engine for a tenant."""
+    tenant_id = getattr(tenant, 'pk', tenant)
+    key = PRICING_CACHE_KEY.format(tenant_id)
+
+    if data := cache.get(key):
+        return PricingEngine.from_cache(data)
+
+    settings = MerchantSettings._base_manager.filter(tenant_id=tenant_id).first()
+    engine = PricingEngine.from_settings(settings)
+
+    cache.set(key, engine.to_cache(), PRICING_CACHE_TIMEOUT)
+
+    return engine
+
+
+def price_offers(offers: Iterable) -> List:
+    """Annotate offers (from any number of tenants) with their final and profile prices."""
+    offers = list(offers)
+
+    for tenant_id in {offer.tenant_id for offer in offers}:
+        get_pricing(tenant_id).price_offers(
+            offer for offer in offers if offer.tenant_id == tenant_id
+        )
+
+    return offers
+
+
+def invalidate_pricing(tenant_id):
+    """Remove the cached pricing engine for a tenant."""
+    cache.delete(PRICING_CACHE_KEY.format(tenant_id))
+
+
+@receiver(post_save, sender=MerchantSettings, dispatch_uid='wws_pricing_save')
+@receiver(post_delete, sender=MerchantSettings, dispatch_uid='wws_pricing_delete')
+def merchant_settings_changed(sender, instance, **kwargs):
+    """Invalidate the cached pricing engine when the merchant settings change."""
+    invalidate_pricing(instance.tenant_id)
+
+    # Invalidate again once committed, in case the old values were re-cached in the meantime
+    transaction.on_commit(lambda: invalidate_pricing(instance.tenant_id))
@@ -1,10 +1,20 @@
 """Serializers for WWS domain."""
 
+from django.db import models
+
 from rest_framework import serializers
 
 from channels.serializers import ContactSerializer
 from tenancy.permissions import IsTenantMember
-from .models import DealerSupplierSetting, Offer, Order, Supplier, WwsConnection
+from .models import (
+    DealerSupplierSetting,
+    Offer,
+    Order,
+    Supplier,
+    WwsConnection,
+    bulk_upsert,
+)
+from .pricing import get_pricing, price_offers
 
 
 class SupplierSerializer(serializers.ModelSerializer):
@@ -26,19 +36,32 @@ class DealerSupplierSettingSerializer(serializers.ModelSerializer):
         fields = ['supplier', 'enabled', 'priority', 'is_default']
 
 
+class DealerSupplierSettingItemSerializer(serializers.Serializer):
+    """Settings submitted for a single supplier."""
+
+    supplier_id = serializers.IntegerField(required=False)
+    supplier = serializers.IntegerField(required=False, write_only=True)
+    enabled = serializers.BooleanField(default=True)
+    priority = serializers.IntegerField(required=False)
+    is_default = serializers.BooleanField(default=False)
+
+    def validate(self, attrs):
+        """Accept the supplier as either 'supplier_id' or 'supplier'."""
+        supplier = attrs.pop('supplier', None)
+        attrs.setdefault('supplier_id', supplier)
+        return attrs
+
+
 class DealerSupplierSettingUpdateSerializer(serializers.Serializer):
     """Update payload for dealer suppliers."""
 
     items = serializers.ListField(
-        child=serializers.DictField(child=serializers.CharField()), allow_empty=True
+        child=DealerSupplierSettingItemSerializer(), allow_empty=True
     )
 
-    def validate(self, attrs):
-        """Validate items."""
-        items = attrs.get('items', [])
-        if not isinstance(items, list):
-            raise serializers.ValidationError('items must be a list')
-        return attrs
+    def validate_items(self, items):
+        """Skip items which do not reference a supplier."""
+        return [item for item in items if item.get('supplier_id') is not None]
 
 
 class OrderSerializer(serializers.ModelSerializer):
@@ -98,8 +121,21 @@ class OrderCreateSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+class OfferListSerializer(serializers.ListSerializer):
+    """Serialize a list of offers, pricing all offers in a single pass."""
+
+    def to_representation(self, data):
+        """Compute the sale prices of all offers, before serializing them."""
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        return super().to_representation(price_offers(iterable))
+
+
 class OfferSerializer(serializers.ModelSerializer):
-    """Serializer for offers."""
+    """Serializer for offers.
+
+    Sale prices are computed from the merchant settings of the tenant:
+    finalPrice applies the margin of the offer, and profilePrices the margin of each price profile.
+    """
 
     supplierName = serializers.CharField(
         source='supplier.name', read_only=True, default=None
@@ -110,12 +146,21 @@ class OfferSerializer(serializers.ModelSerializer):
         source='price', max_digits=12, decimal_places=2, read_only=True
     )
     finalPrice = serializers.DecimalField(
-        source='price', max_digits=12, decimal_places=2, read_only=True
+        source='final_price', max_digits=12, decimal_places=2, read_only=True
+    )
+    marginPercent = serializers.DecimalField(
+        source='margin_percent', max_digits=7, decimal_places=2, read_only=True
+    )
+    profilePrices = serializers.DictField(
+        source='profile_prices',
+        child=serializers.DecimalField(max_digits=12, decimal_places=2),
+        read_only=True,
     )
     deliveryTimeDays = serializers.IntegerField(source='delivery_days', read_only=True)
 
     class Meta:
         model = Offer
+        list_serializer_class = OfferListSerializer
         fields = [
             'id',
             'orderId',
@@ -137,6 +182,8 @@ class OfferSerializer(serializers.ModelSerializer):
             'updated_at',
             'basePrice',
             'finalPrice',
+            'marginPercent',
+            'profilePrices',
         ]
         read_only_fields = [
             'id',
@@ -147,9 +194,18 @@ class OfferSerializer(serializers.ModelSerializer):
             'orderId',
             'basePrice',
             'finalPrice',
+            'marginPercent',
+            'profilePrices',
             'deliveryTimeDays',
         ]
 
+    def to_representation(self, instance):
+        """Price the offer (unless it was priced as part of a list)."""
+        if not hasattr(instance, 'profile_prices'):
+            price_offers([instance])
+
+        return super().to_representation(instance)
+
 
 class OfferCreateSerializer(serializers.ModelSerializer):
     """Create offers for an order."""
@@ -167,16 +223,123 @@ class OfferCreateSerializer(serializers.ModelSerializer):
             'brand',
             'product_url',
             'status',
+            'margin_percent',
             'meta_json',
         ]
 
     def create(self, validated_data):
-        """Attach tenant and order."""
+        """Attach tenant and order, replacing any existing offer with the same supplier and sku.
+
+        Offers without an explicit margin receive the current margin of the tenant.
+        """
         tenant = self.context['tenant']
         order = self.context['order']
         validated_data['tenant'] = tenant
         validated_data['order'] = order
-        return super().create(validated_data)
+
+        if validated_data.get('margin_percent') is None:
+            validated_data['margin_percent'] = get_pricing(tenant).margin_percent
+
+        if validated_data.get('supplier') is None:
+            return super().create(validated_data)
+
+        offer, _ = Offer.objects.update_or_create(
+            order=order,
+            supplier=validated_data.pop('supplier'),
+            sku=validated_data.pop('sku', ''),
+            defaults=validated_data,
+        )
+        return offer
+
+
+class OfferBulkListSerializer(serializers.ListSerializer):
+    """Store a list of offers for an order, in a constant number of queries."""
+
+    # Fields which are updated when an offer already exists
+    # (the publication status is managed from the dashboard)
+    UPDATE_FIELDS = [
+        'price',
+        'currency',
+        'availability',
+        'delivery_days',
+        'product_name',
+        'brand',
+        'product_url',
+        'margin_percent',
+        'meta_json',
+        'updated_at',
+    ]
+
+    def create(self, validated_data):
+        """Resolve suppliers by name, and upsert offers keyed by (order, supplier, sku).
+
+        Returns:
+            The stored offers, in the order they were provided
+        """
+        tenant = self.context['tenant']
+        order = self.context['order']
+
+        suppliers = Supplier.resolve(
+            tenant, [item['supplier_name'] for item in validated_data]
+        )
+        margin_percent = get_pricing(tenant).margin_percent
+
+        # Later offers replace earlier ones with the same key
+        offers = {}
+
+        for item in validated_data:
+            supplier = suppliers[item.pop('supplier_name')]
+
+            if item.get('margin_percent') is None:
+                item['margin_percent'] = margin_percent
+
+            offer = Offer(tenant=tenant, order=order, supplier=supplier, **item)
+            offers[supplier.pk, offer.sku] = offer
+
+        if not offers:
+            return []
+
+        bulk_upsert(
+            Offer,
+            offers.values(),
+            unique_fields=['order', 'supplier', 'sku'],
+            update_fields=self.UPDATE_FIELDS,
+        )
+
+        stored = {
+            (offer.supplier_id, offer.sku): offer
+            for offer in Offer._base_manager.filter(
+                order=order,
+                supplier__in=[offer.supplier for offer in offers.values()],
+                sku__in={offer.sku for offer in offers.values()},
+            ).select_related('supplier')
+        }
+
+        return [stored[key] for key in offers if key in stored]
+
+
+class OfferBulkCreateSerializer(serializers.ModelSerializer):
+    """Offer submitted by the bot, with the supplier referenced by name."""
+
+    supplier_name = serializers.CharField(max_length=255)
+
+    class Meta:
+        model = Offer
+        list_serializer_class = OfferBulkListSerializer
+        fields = [
+            'supplier_name',
+            'price',
+            'currency',
+            'availability',
+            'delivery_days',
+            'sku',
+            'product_name',
+            'brand',
+            'product_url',
+            'status',
+            'margin_percent',
+            'meta_json',
+        ]
 
 
 class WwsConnectionSerializer(serializers.ModelSerializer):
@@ -186,6 +349,7 @@ class WwsConnectionSerializer(serializers.ModelSerializer):
     isActive = serializers.BooleanField(source='is_active', required=False)
     authConfig = serializers.JSONField(source='auth_config_json', required=False)
     config = serializers.JSONField(source='config_json', required=False)
+    cacheTtl = serializers.IntegerField(source='cache_ttl', required=False, min_value=0)
 
     class Meta:
         model = WwsConnection
@@ -201,6 +365,8 @@ class WwsConnectionSerializer(serializers.ModelSerializer):
             'config',
             'is_active',
             'isActive',
+            'cache_ttl',
+            'cacheTtl',
             'created_at',
             'updated_at',
         ]
@@ -210,3 +376,14 @@ class WwsConnectionSerializer(serializers.ModelSerializer):
         """Attach tenant."""
         validated_data['tenant'] = self.context['tenant']
         return super().create(validated_data)
+
+
+class BotInventoryBatchSerializer(serializers.Serializer):
+    """Request payload for batch OEM inventory lookups."""
+
+    MAX_OEMS = 50
+
+    oems = serializers.ListField(
+        child=serializers.CharField(max_length=64), allow_empty=False, max_length=MAX_OEMS
+    )
+    stream = serializers.BooleanField(required=False, default=False)
@@ -0,0 +1,44 @@
+"""Background tasks for the WWS domain."""
+
+import logging
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from InvenTree.tasks import ScheduledTask, scheduled_task
+
+from .models import OfferCache
+
+logger = logging.getLogger('inventree')
+
+# Offer cache entries which have not been refreshed for this many days are removed
+OFFER_CACHE_RETENTION_DAYS = 7
+
+
+def refresh_offer_cache(entry_id: int):
+    """Refresh a single offer cache entry from its supplier."""
+    from .offers import OFFER_REFRESH_KEY, refresh_offers
+
+    cache.delete(OFFER_REFRESH_KEY.format(entry_id))
+
+    entry = OfferCache.objects.select_related('connection').filter(pk=entry_id).first()
+
+    if entry is None or not entry.connection.is_active:
+        return
+
+    if not entry.is_expired():
+        return
+
+    refresh_offers(entry.connection, entry.oem)
+
+
+@scheduled_task(ScheduledTask.DAILY)
+def cleanup_offer_cache():
+    """Remove offer cache entries which are no longer being requested."""
+    threshold = timezone.now() - timedelta(days=OFFER_CACHE_RETENTION_DAYS)
+
+    deleted, _ = OfferCache.objects.filter(fetched_at__lt=threshold).delete()
+
+    if deleted:
+        logger.info('Removed %s stale offer cache entries', deleted)
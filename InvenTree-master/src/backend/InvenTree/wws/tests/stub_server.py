@@ -0,0 +1,112 @@
+"""Local stub HTTP server, which stands in for a supplier inventory API in tests."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Serve the responses configured on the stub server, and record each request."""
+
+    # Keep connections alive, so that connection reuse can be observed
+    protocol_version = 'HTTP/1.1'
+
+    def handle_request(self):
+        """Record the request, and send the next configured response for its path."""
+        parts = urlsplit(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+
+        self.server.requests.append({
+            'method': self.command,
+            'path': parts.path,
+            'query': parse_qs(parts.query),
+            'json': json.loads(body) if body else None,
+            'headers': dict(self.headers),
+            'client': self.client_address,
+        })
+
+        status, data = self.server.next_response(parts.path)
+        content = json.dumps(data).encode()
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = handle_request
+    do_POST = handle_request
+
+    def log_message(self, format, *args):
+        """Suppress request logging."""
+
+
+class StubServer(ThreadingHTTPServer):
+    """HTTP server which returns preconfigured JSON responses.
+
+    Responses are configured per path, as a list of (status, data) tuples which are
+    returned in order (the last response is repeated once the list is exhausted).
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        """Bind to a free local port."""
+        super().__init__(('127.0.0.1', 0), StubRequestHandler)
+        self.lock = threading.Lock()
+        self.responses = {}
+        self.requests = []
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+    def respond(self, path: str, *responses):
+        """Set the responses for the provided path."""
+        with self.lock:
+            self.responses[path] = list(responses)
+
+    def next_response(self, path: str):
+        """Return the next response for the provided path."""
+        with self.lock:
+            responses = self.responses.get(path)
+
+            if not responses:
+                return 404, {'detail': 'Not found'}
+
+            return responses.pop(0) if len(responses) > 1 else responses[0]
+
+    def reset(self):
+        """Clear all configured responses and recorded requests."""
+        with self.lock:
+            self.responses = {}
+            self.requests = []
+
+
+class StubServerMixin:
+    """Test case mixin which runs a StubServer for the duration of the test class."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the stub server."""
+        super().setUpClass()
+
+        cls.server = StubServer()
+        thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the stub server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+        super().tearDownClass()
+
+    def setUp(self):
+        """Reset the stub server between tests."""
+        super().setUp()
+        self.server.reset()
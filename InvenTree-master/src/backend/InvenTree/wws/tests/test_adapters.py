@@ -0,0 +1,127 @@
+"""Tests for WWS connection adapters."""
+
+import asyncio
+import concurrent.futures
+import time
+
+from django.test import SimpleTestCase
+
+from wws.adapters import (
+    adapter_loop,
+    fetch_many_for_connection,
+    fetch_many_for_connections,
+    fetch_offers_for_connection,
+)
+from wws.models import WwsConnection
+from wws.tests.stub_server import StubServerMixin
+
+
+class HttpApiAdapterTests(StubServerMixin, SimpleTestCase):
+    """Run the http api adapter against a local stub server."""
+
+    def setUp(self):
+        """Reset the connection IDs."""
+        super().setUp()
+        self.ids = iter(range(1, 100))
+
+    def connection(self, **config):
+        """Return an (unsaved) http api connection to the stub server."""
+        return WwsConnection(
+            id=next(self.ids),
+            type=WwsConnection.ConnectionType.HTTP_API,
+            base_url=self.server.url,
+            config_json={'retry_backoff': 0, **config},
+            auth_config_json={'token': 'abc'},
+        )
+
+    def test_fetch(self):
+        """Offers are normalized, and the connection pool is shared per host."""
+        self.server.respond(
+            '/inventory',
+            (200, {'offers': [{'supplier': 'ACME', 'id': 'X1', 'price': 5}]}),
+        )
+
+        result = fetch_offers_for_connection(self.connection(), 'AAA111')
+        self.assertIsNone(result['error'])
+        self.assertEqual(result['offers'][0]['supplier_name'], 'ACME')
+        self.assertEqual(result['offers'][0]['sku'], 'X1')
+
+        fetch_offers_for_connection(self.connection(), 'BBB222')
+
+        first, second = self.server.requests
+        self.assertEqual(first['query'], {'oem': ['AAA111']})
+        self.assertEqual(first['headers']['Authorization'], 'Bearer abc')
+
+        # The second request re-uses the pooled connection
+        self.assertEqual(first['client'], second['client'])
+        self.assertIn(self.server.url, adapter_loop.clients)
+
+    def test_retries(self):
+        """Transient failures are retried, up to the configured number of retries."""
+        self.server.respond('/inventory', (503, {}), (503, {}), (200, []))
+
+        result = fetch_offers_for_connection(self.connection(retries=2), 'AAA111')
+        self.assertIsNone(result['error'])
+        self.assertEqual(len(self.server.requests), 3)
+
+        self.server.reset()
+        self.server.respond('/inventory', (503, {}), (200, []))
+
+        result = fetch_offers_for_connection(self.connection(retries=0), 'AAA111')
+        self.assertIn('503', result['error'])
+        self.assertEqual(len(self.server.requests), 1)
+
+        # Client errors are not retried
+        self.server.respond('/stock', (404, {}))
+
+        result = fetch_offers_for_connection(
+            self.connection(inventory_path='/stock'), 'AAA111'
+        )
+        self.assertIn('404', result['error'])
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_deadline(self):
+        """Retries are abandoned once the overall deadline has passed."""
+        self.server.respond('/inventory', (503, {}))
+
+        start = time.monotonic()
+
+        result = fetch_offers_for_connection(
+            self.connection(retries=10, retry_backoff=1, deadline=0.5), 'AAA111'
+        )
+        self.assertEqual(result['error'], 'Timed out')
+        self.assertLess(time.monotonic() - start, 2)
+
+        # Coroutines which exceed the timeout of the event loop are cancelled
+        with self.assertRaises(concurrent.futures.TimeoutError):
+            adapter_loop.run(asyncio.sleep(10), timeout=0.1)
+
+    def test_fetch_many(self):
+        """Batched lookups use a single request, and normalized payloads are passed through."""
+        offer = {'supplier_name': 'ACME', 'price': 5, 'sku': 'X1'}
+
+        self.server.respond(
+            '/batch', (200, {'normalized': True, 'results': {'AAA111': [offer]}})
+        )
+        self.server.respond('/inventory', (200, [{'sku': 'Y1'}]))
+
+        batched = self.connection(inventory_batch_path='/batch')
+        single = self.connection()
+
+        results = fetch_many_for_connection(batched, ['AAA111', 'BBB222'])
+        self.assertEqual(results['AAA111'], {'offers': [offer], 'error': None})
+        self.assertEqual(results['BBB222'], {'offers': [], 'error': None})
+
+        request = self.server.requests[0]
+        self.assertEqual(request['method'], 'POST')
+        self.assertEqual(request['json'], {'oems': ['AAA111', 'BBB222']})
+
+        # Connections without a batch endpoint are queried per OEM number
+        results = fetch_many_for_connections({
+            batched: ['AAA111'],
+            single: ['AAA111', 'BBB222'],
+        })
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[single, 'BBB222']['offers'][0]['sku'], 'Y1')
+        self.assertEqual(len(self.server.requests), 4)
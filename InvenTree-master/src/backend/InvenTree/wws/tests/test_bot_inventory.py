@@ -49,3 +49,141 @@ class BotInventoryTests(APITestCase):
         """Reject requests without tenant context."""
         resp = self.client.get('/api/bot/inventory/by-oem/abc')
         self.assertEqual(resp.status_code, 403)
+
+    def patch_demo_adapter(self):
+        """Record the OEM numbers requested from demo connections."""
+        from unittest import mock
+
+        from wws import adapters
+
+        requested = []
+
+        class RecordingAdapter(adapters.DemoAdapter):
+            async def fetch(self, oem):
+                requested.append(oem)
+                return await super().fetch(oem)
+
+            async def fetch_many(self, oems):
+                requested.append(list(oems))
+                return {oem: await super(RecordingAdapter, self).fetch(oem) for oem in oems}
+
+        patcher = mock.patch.dict(
+            adapters.ADAPTERS, {WwsConnection.ConnectionType.DEMO: RecordingAdapter}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        return requested
+
+    def test_normalized_offer_cache(self):
+        """Formatting variants of an OEM number are served from the offer cache."""
+        from datetime import timedelta
+
+        from wws.models import OfferCache, normalize_oem
+
+        self.assertEqual(normalize_oem('1k0-615.301 aa'), '1K0615301AA')
+
+        self.auth(self.tenant)
+        connection = WwsConnection.objects.create(
+            tenant=self.tenant,
+            type=WwsConnection.ConnectionType.DEMO,
+            base_url='http://demo',
+            cache_ttl=600,
+        )
+
+        requested = self.patch_demo_adapter()
+
+        resp = self.client.get('/api/bot/inventory/by-oem/1K0 615 301 AA')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()['oemNumber'], '1K0 615 301 AA')
+        self.assertEqual(resp.json()['oemNormalized'], '1K0615301AA')
+        self.assertEqual(len(requested), 1)
+
+        # A different formatting of the same OEM does not contact the supplier
+        resp = self.client.get('/api/bot/inventory/by-oem/1k0-615-301-aa')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()['offers'][0]['sku'], '1K0615301AA-DEMO')
+        self.assertEqual(len(requested), 1)
+
+        entry = OfferCache.objects.get(connection=connection, oem='1K0615301AA')
+        self.assertEqual(entry.tenant, self.tenant)
+
+        # Expired entries are served, and refreshed
+        fetched_at = entry.fetched_at - timedelta(seconds=601)
+        OfferCache.objects.filter(pk=entry.pk).update(fetched_at=fetched_at)
+
+        resp = self.client.get('/api/bot/inventory/by-oem/1K0615301AA')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.json()['offers']), 1)
+        self.assertEqual(len(requested), 2)
+
+        entry.refresh_from_db()
+        self.assertGreater(entry.fetched_at, fetched_at)
+
+        resp = self.client.get('/api/bot/inventory/by-oem/--')
+        self.assertEqual(resp.status_code, 400)
+
+        # Databases without a conflict target (MySQL) upsert each entry separately
+        from unittest import mock
+
+        from django.db import connection as db_connection
+
+        from wws.offers import store_many
+
+        with mock.patch.object(
+            db_connection.features, 'supports_update_conflicts_with_target', False
+        ):
+            store_many({
+                (connection, '1K0615301AA'): {'error': 'Timeout'},
+                (connection, '2K0615301AA'): {'offers': []},
+            })
+
+        entry.refresh_from_db()
+        self.assertEqual(entry.error, 'Timeout')
+        self.assertEqual(OfferCache.objects.filter(connection=connection).count(), 2)
+
+    def test_batch_lookup(self):
+        """Multiple OEM numbers are fetched with a single request per connection."""
+        import json
+
+        self.auth(self.tenant)
+        WwsConnection.objects.create(
+            tenant=self.tenant,
+            type=WwsConnection.ConnectionType.DEMO,
+            base_url='http://demo',
+        )
+
+        requested = self.patch_demo_adapter()
+        url = '/api/bot/inventory/by-oem'
+
+        self.client.get('/api/bot/inventory/by-oem/AAA-111')
+        self.assertEqual(requested, ['AAA111'])
+
+        oems = ['aaa 111', 'BBB-222', 'bbb222', 'CCC.333', '--']
+        resp = self.client.post(url, {'oems': oems}, format='json')
+        self.assertEqual(resp.status_code, 200)
+
+        results = resp.json()['results']
+        self.assertEqual(
+            [result['oemNormalized'] for result in results],
+            ['', 'AAA111', 'BBB222', 'CCC333'],
+        )
+        self.assertEqual(results[2]['oemNumber'], 'BBB-222')
+        self.assertEqual(results[3]['offers'][0]['sku'], 'CCC333-DEMO')
+
+        # Only the missing OEM numbers are requested, in a single batch
+        self.assertEqual(requested, ['AAA111', ['BBB222', 'CCC333']])
+
+        # Streamed results are returned as separate JSON lines
+        resp = self.client.post(url, {'oems': oems[:3], 'stream': True}, format='json')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp['Content-Type'], 'application/x-ndjson')
+
+        lines = b''.join(resp.streaming_content).decode().splitlines()
+        self.assertEqual(
+            [json.loads(line)['oemNormalized'] for line in lines], ['AAA111', 'BBB222']
+        )
+        self.assertEqual(len(requested), 2)
+
+        resp = self.client.post(url, {'oems': []}, format='json')
+        self.assertEqual(resp.status_code, 400)
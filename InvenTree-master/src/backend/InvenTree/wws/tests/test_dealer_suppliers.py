@@ -0,0 +1,172 @@
+"""Tests for dealer supplier settings."""
+
+import importlib
+from unittest import mock
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import connection
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from tenancy.models import Tenant, TenantUser
+from wws.dealers import get_dealer_settings, invalidate_dealer_settings
+from wws.models import DealerSupplierSetting, Supplier
+
+
+class DealerSupplierTests(APITestCase):
+    """Settings are seeded with each supplier, and cached per tenant."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='dealer', email='dealer@example.com', password='pass123'
+        )
+        self.tenant = Tenant.objects.create(name='Dealer', slug='dealer')
+        self.other = Tenant.objects.create(name='Other', slug='other')
+        TenantUser.objects.create(
+            user=self.user, tenant=self.tenant, role='TENANT_ADMIN', is_active=True
+        )
+        token = AccessToken.for_user(self.user)
+        token['tenant_id'] = self.tenant.id
+        token['role'] = 'TENANT_ADMIN'
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {str(token)}')
+
+        # Tenant IDs are re-used between tests
+        invalidate_dealer_settings(self.tenant.pk)
+
+        self.url = f'/api/dealers/{self.tenant.id}/suppliers'
+
+    def test_seed_and_cache(self):
+        """Suppliers receive default settings when created, and reads are cached."""
+        supplier = Supplier.objects.create(tenant=self.tenant, name='Sup A')
+        Supplier.resolve(self.tenant, ['Sup A', 'Sup B'])
+
+        settings = DealerSupplierSetting.objects.filter(tenant=self.tenant)
+        self.assertEqual(settings.count(), 2)
+        self.assertTrue(settings.get(supplier=supplier).enabled)
+
+        # The first supplier is the default, and further suppliers are appended
+        self.assertEqual(
+            list(settings.order_by('priority').values_list('priority', 'is_default')),
+            [(10, True), (20, False)],
+        )
+
+        resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(
+            {item['supplier']['name'] for item in resp.json()}, {'Sup A', 'Sup B'}
+        )
+
+        with self.assertNumQueries(0):
+            get_dealer_settings(self.tenant)
+
+        # Changing a supplier invalidates the cached settings
+        supplier.name = 'Sup C'
+        supplier.save()
+
+        names = {item['supplier']['name'] for item in self.client.get(self.url).json()}
+        self.assertEqual(names, {'Sup B', 'Sup C'})
+
+    def test_update(self):
+        """Submitted settings are upserted, and only apply to suppliers of the tenant."""
+        first = Supplier.objects.create(tenant=self.tenant, name='Sup A')
+        second = Supplier.objects.create(tenant=self.tenant, name='Sup B')
+        foreign = Supplier.objects.create(tenant=self.other, name='Sup X')
+
+        DealerSupplierSetting.objects.filter(supplier=second).delete()
+        self.client.get(self.url)
+
+        resp = self.client.put(
+            self.url,
+            {
+                'items': [
+                    {'supplier_id': str(first.pk), 'enabled': 'false', 'priority': 5},
+                    {'supplier': second.pk, 'is_default': True},
+                    {'supplier_id': foreign.pk, 'enabled': False},
+                    {'enabled': True},
+                ]
+            },
+            format='json',
+        )
+        self.assertEqual(resp.status_code, 200)
+
+        data = resp.json()
+        self.assertEqual(
+            [item['supplier']['id'] for item in data], [first.pk, second.pk]
+        )
+        self.assertFalse(data[0]['enabled'])
+        self.assertEqual(data[0]['priority'], 5)
+        self.assertTrue(data[1]['is_default'])
+        self.assertEqual(data[1]['priority'], 10)
+
+        self.assertTrue(DealerSupplierSetting.objects.get(supplier=foreign).enabled)
+
+        # Omitted priorities are kept
+        self.client.put(
+            self.url,
+            {'items': [{'supplier_id': first.pk, 'enabled': True}]},
+            format='json',
+        )
+
+        setting = DealerSupplierSetting.objects.get(supplier=first)
+        self.assertTrue(setting.enabled)
+        self.assertEqual(setting.priority, 5)
+        self.assertTrue(self.client.get(self.url).json()[0]['enabled'])
+
+        # Databases without a conflict target (MySQL) upsert each setting separately
+        DealerSupplierSetting.objects.filter(supplier=second).delete()
+
+        with mock.patch.object(
+            connection.features, 'supports_update_conflicts_with_target', False
+        ):
+            self.client.put(
+                self.url,
+                {
+                    'items': [
+                        {'supplier_id': first.pk, 'enabled': False},
+                        {'supplier_id': second.pk, 'enabled': True, 'priority': 7},
+                    ]
+                },
+                format='json',
+            )
+
+        self.assertFalse(DealerSupplierSetting.objects.get(supplier=first).enabled)
+        self.assertEqual(DealerSupplierSetting.objects.get(supplier=second).priority, 7)
+
+    def test_seed_migration(self):
+        """The data migration only seeds tenants which have no settings."""
+        migration = importlib.import_module(
+            'wws.migrations.0009_seed_dealer_supplier_settings'
+        )
+
+        first = Supplier.objects.create(tenant=self.tenant, name='Sup A')
+        second = Supplier.objects.create(tenant=self.tenant, name='Sup B')
+        configured = Supplier.objects.create(tenant=self.other, name='Sup X')
+        Supplier.objects.create(tenant=self.other, name='Sup Y')
+
+        # One tenant has deliberately configured only some of its suppliers
+        DealerSupplierSetting.objects.all().delete()
+        DealerSupplierSetting.objects.create(
+            tenant=self.other, supplier=configured, priority=5
+        )
+
+        migration.seed_dealer_settings(apps, None)
+
+        settings = DealerSupplierSetting.objects.filter(tenant=self.tenant)
+        self.assertEqual(
+            list(
+                settings.order_by('priority').values_list(
+                    'supplier', 'priority', 'is_default'
+                )
+            ),
+            [(first.pk, 10, True), (second.pk, 20, False)],
+        )
+
+        self.assertEqual(
+            list(
+                DealerSupplierSetting.objects.filter(tenant=self.other).values_list(
+                    'supplier', flat=True
+                )
+            ),
+            [configured.pk],
+        )
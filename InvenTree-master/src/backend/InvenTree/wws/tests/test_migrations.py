@@ -0,0 +1,45 @@
+"""Unit tests for the 'wws' data migrations."""
+
+from datetime import timedelta
+
+from django.utils import timezone
+
+from django_test_migrations.contrib.unittest_case import MigratorTestCase
+
+
+class TestOfferDuplicateMigration(MigratorTestCase):
+    """Test that duplicate offers are removed before the unique constraint is added."""
+
+    migrate_from = ('wws', '0006_offercache')
+    migrate_to = ('wws', '0007_offer_unique_supplier_sku')
+
+    def prepare(self):
+        """Create duplicate offers for the same (order, supplier, sku)."""
+        Order = self.old_state.apps.get_model('wws', 'order')
+        Supplier = self.old_state.apps.get_model('wws', 'supplier')
+        Offer = self.old_state.apps.get_model('wws', 'offer')
+
+        order = Order.objects.create()
+        supplier = Supplier.objects.create(name='Supplier')
+
+        # A published offer is kept in preference to a more recent draft
+        self.published = Offer.objects.create(
+            order=order, supplier=supplier, sku='A1', status='published'
+        ).pk
+        Offer.objects.create(order=order, supplier=supplier, sku='A1', status='draft')
+
+        # Otherwise, the most recently updated offer is kept
+        self.updated = Offer.objects.create(order=order, supplier=supplier, sku='B1').pk
+        Offer.objects.create(order=order, supplier=supplier, sku='B1')
+        Offer.objects.filter(pk=self.updated).update(
+            updated_at=timezone.now() + timedelta(hours=1)
+        )
+
+    def test_duplicates_removed(self):
+        """Test that a single offer remains for each (order, supplier, sku)."""
+        Offer = self.new_state.apps.get_model('wws', 'offer')
+
+        self.assertEqual(
+            set(Offer.objects.values_list('pk', flat=True)),
+            {self.published, self.updated},
+        )
@@ -1,5 +1,8 @@
 """Tests for WWS orders and offers."""
 
+from decimal import Decimal
+from unittest import mock
+
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient, APITestCase
 
@@ -71,6 +74,76 @@ class WwsOrderApiTests(APITestCase):
         self.assertEqual(resp.json()['orderId'], order.id)
         self.assertEqual(Offer.objects.filter(order=order).count(), 1)
 
+    def test_bulk_offers(self):
+        """Offers are upserted in bulk, in a constant number of queries."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        self.auth(self.tenant)
+        Supplier.objects.create(tenant=self.tenant, name='Sup A')
+        order = Order.objects.create(tenant=self.tenant, status='new')
+        url = f'/api/orders/{order.id}/offers/bulk/'
+
+        offers = [
+            {'supplier_name': 'Sup A', 'sku': 'A1', 'price': '10.00'},
+            {'supplier_name': 'Sup B', 'sku': 'B1', 'price': '12.00'},
+            {'supplier_name': 'Sup B', 'sku': 'B2', 'price': '14.00'},
+        ]
+
+        resp = self.client.post(url, offers, format='json')
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual([offer['sku'] for offer in resp.json()], ['A1', 'B1', 'B2'])
+        self.assertEqual(resp.json()[1]['supplierName'], 'Sup B')
+        self.assertEqual(Supplier.objects.filter(tenant=self.tenant).count(), 2)
+
+        # Existing offers are updated, and duplicates in the payload are collapsed
+        offers[0]['price'] = '9.00'
+        offers.append({'supplier_name': 'Sup A', 'sku': 'A1', 'price': '8.00'})
+
+        with CaptureQueriesContext(connection) as small:
+            resp = self.client.post(url, {'offers': offers}, format='json')
+
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(len(resp.json()), 3)
+        self.assertEqual(Offer.objects.filter(order=order).count(), 3)
+        self.assertEqual(
+            Offer.objects.get(order=order, sku='A1').price, Decimal('8.00')
+        )
+
+        offers = [
+            {'supplier_name': f'Sup {idx % 5}', 'sku': f'X{idx}', 'price': '1.00'}
+            for idx in range(40)
+        ]
+        self.client.post(url, offers, format='json')
+
+        with CaptureQueriesContext(connection) as large:
+            resp = self.client.post(url, offers, format='json')
+
+        self.assertEqual(len(resp.json()), 40)
+        self.assertEqual(len(large), len(small))
+
+        # Invalid offers are rejected
+        resp = self.client.post(url, [{'sku': 'Z1'}], format='json')
+        self.assertEqual(resp.status_code, 400)
+
+        # Databases without a conflict target (MySQL) upsert each offer separately
+        offers = [
+            {'supplier_name': 'Sup A', 'sku': 'A1', 'price': '7.00'},
+            {'supplier_name': 'Sup C', 'sku': 'C1', 'price': '5.00'},
+        ]
+
+        with mock.patch.object(
+            connection.features, 'supports_update_conflicts_with_target', False
+        ):
+            resp = self.client.post(url, offers, format='json')
+
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual([offer['sku'] for offer in resp.json()], ['A1', 'C1'])
+        self.assertEqual(Offer.objects.filter(order=order).count(), 44)
+        self.assertEqual(
+            Offer.objects.get(order=order, sku='A1').price, Decimal('7.00')
+        )
+
     def test_connections_test_endpoint(self):
         """Test endpoint returns ok."""
         self.auth(self.tenant)
@@ -0,0 +1,122 @@
+"""Tests for server-side offer pricing."""
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from tenancy.models import Tenant, TenantUser
+from wws.models import MerchantSettings, Offer, Order, Supplier
+from wws.pricing import get_pricing, invalidate_pricing
+
+
+class PricingTests(APITestCase):
+    """Offer prices are computed from the (cached) merchant settings."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='pricing', email='pricing@example.com', password='pass123'
+        )
+        self.tenant = Tenant.objects.create(name='Pricing', slug='pricing')
+        TenantUser.objects.create(
+            user=self.user, tenant=self.tenant, role='TENANT_ADMIN', is_active=True
+        )
+        token = AccessToken.for_user(self.user)
+        token['tenant_id'] = self.tenant.id
+        token['role'] = 'TENANT_ADMIN'
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {str(token)}')
+
+        self.supplier = Supplier.objects.create(tenant=self.tenant, name='Supp')
+        self.order = Order.objects.create(tenant=self.tenant, status='new')
+
+        # Tenant IDs are re-used between tests
+        invalidate_pricing(self.tenant.pk)
+
+    def test_pricing_engine(self):
+        """The engine is cached, and invalidated when the settings are saved."""
+        # Default profiles apply until the merchant saves their settings
+        engine = get_pricing(self.tenant)
+        self.assertEqual(engine.margin_percent, Decimal(40))
+        self.assertEqual(
+            engine.profile_prices([Decimal('10.00'), '2.5'])[1]['partner'],
+            Decimal('2.75'),
+        )
+
+        settings = MerchantSettings.objects.create(
+            tenant=self.tenant,
+            margin_percent=Decimal('25.00'),
+            price_profiles=[
+                {'id': 'retail', 'margin': 0.5, 'isDefault': True},
+                {'id': 'trade', 'margin': '0.1'},
+                {'name': 'Invalid'},
+            ],
+        )
+
+        with self.assertNumQueries(1):
+            engine = get_pricing(self.tenant)
+            get_pricing(self.tenant.pk)
+
+        self.assertEqual(engine.margin_percent, Decimal(25))
+        self.assertEqual(list(engine.profiles), ['retail', 'trade'])
+        self.assertEqual(engine.final_price(Decimal('9.99')), Decimal('12.49'))
+
+        settings.margin_percent = Decimal('10.00')
+        settings.save()
+
+        self.assertEqual(get_pricing(self.tenant).margin_percent, Decimal(10))
+
+    def test_default_margin(self):
+        """Viewing the merchant settings does not change the margin of a tenant."""
+        self.assertEqual(get_pricing(self.tenant).margin_percent, Decimal(40))
+
+        resp = self.client.get('/api/dashboard/merchant/settings/')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()['marginPercent'], 40.0)
+
+        self.assertTrue(MerchantSettings.objects.filter(tenant=self.tenant).exists())
+        self.assertEqual(get_pricing(self.tenant).margin_percent, Decimal(40))
+
+    def test_offer_prices(self):
+        """Offers are stored with the tenant margin, and serialized with their sale prices."""
+        self.client.post(
+            '/api/dashboard/merchant/settings/',
+            {
+                'marginPercent': 20,
+                'priceProfiles': [{'id': 'retail', 'margin': 0.3, 'isDefault': True}],
+            },
+            format='json',
+        )
+
+        resp = self.client.post(
+            f'/api/orders/{self.order.id}/offers/bulk/',
+            [
+                {'supplier_name': 'Supp', 'sku': 'A1', 'price': '10.00'},
+                {
+                    'supplier_name': 'Supp',
+                    'sku': 'A2',
+                    'price': '20.00',
+                    'margin_percent': '5',
+                },
+            ],
+            format='json',
+        )
+        self.assertEqual(resp.status_code, 201)
+
+        first, second = resp.json()
+        self.assertEqual(first['marginPercent'], '20.00')
+        self.assertEqual(first['finalPrice'], '12.00')
+        self.assertEqual(first['profilePrices'], {'retail': '13.00'})
+        self.assertEqual(second['finalPrice'], '21.00')
+
+        offer = Offer.objects.get(order=self.order, sku='A1')
+        self.assertEqual(offer.margin_percent, Decimal('20.00'))
+
+        # Margin analytics use the margin column
+        Offer.objects.filter(order=self.order).update(
+            status=Offer.OfferStatus.PUBLISHED
+        )
+
+        resp = self.client.get('/api/dashboard/summary/')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()['avgMargin'], 12.5)
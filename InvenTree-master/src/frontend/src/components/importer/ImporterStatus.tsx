@@ -3,6 +3,7 @@ import { Center, Loader, Stack } from '@mantine/core';
 import { useInterval } from '@mantine/hooks';
 import { useMemo } from 'react';
 
+import { ProgressBar } from '@lib/components/ProgressBar';
 import { ModelType } from '@lib/enums/ModelType';
 import type { ImportSessionState } from '../../hooks/UseImportSession';
 import { StylishText } from '../items/StylishText';
@@ -35,7 +36,16 @@ export default function ImporterStatus({
     <Center style={{ height: '100%' }}>
       <Stack gap='xs' align='center' justify='center'>
         <StylishText size='lg'>{statusText}</StylishText>
-        <Loader />
+        {session.sessionData?.total > 0 ? (
+          <ProgressBar
+            value={session.sessionData?.progress ?? 0}
+            maximum={session.sessionData?.total}
+            progressLabel
+            animated
+          />
+        ) : (
+          <Loader />
+        )}
       </Stack>
     </Center>
   );
@@ -27,6 +27,12 @@ function ReportTemplateTable() {
               <YesNoButton value={instance.merge} />
             )
           },
+          collate: {
+            label: t`Collate`,
+            modelRenderer: (instance: any) => (
+              <YesNoButton value={instance.collate} />
+            )
+          },
           attach_to_model: {
             label: t`Attach to Model`,
             modelRenderer: (instance: any) => (
@@ -68,7 +68,10 @@ export default function SystemSettings() {
               'INVENTREE_DELETE_ERRORS_DAYS',
               'INVENTREE_DELETE_NOTIFICATIONS_DAYS',
               'INVENTREE_DELETE_EMAIL_DAYS',
-              'INVENTREE_PROTECT_EMAIL_LOG'
+              'INVENTREE_PROTECT_EMAIL_LOG',
+              'INVENTREE_IMPORT_WORKERS',
+              'INVENTREE_SEARCH_WORKERS',
+              'INVENTREE_SEARCH_TIMEOUT'
             ]}
           />
         )
@@ -144,7 +147,9 @@ export default function SystemSettings() {
                 'PRICING_DECIMAL_PLACES_MIN',
                 'PRICING_DECIMAL_PLACES',
                 'PRICING_AUTO_UPDATE',
-                'PRICING_UPDATE_DAYS'
+                'PRICING_UPDATE_DAYS',
+                'PRICING_UPDATE_BATCH_SIZE',
+                'PRICING_UPDATE_BATCH_DELAY'
               ]}
             />
             <br />
@@ -181,7 +186,8 @@ export default function SystemSettings() {
               'REPORT_ENABLE',
               'REPORT_DEFAULT_PAGE_SIZE',
               'REPORT_DEBUG_MODE',
-              'REPORT_LOG_ERRORS'
+              'REPORT_LOG_ERRORS',
+              'REPORT_RENDER_WORKERS'
             ]}
           />
         )